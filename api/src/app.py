@@ -10,13 +10,28 @@ import logging
 from flask import Flask, jsonify
 from flask_sqlalchemy.extension import current_app
 from flask_sqlalchemy.record_queries import get_recorded_queries
-from flasgger import Swagger
 from flaskBcrypt import flask_bcrypt
 
-from commands import test
+from commands import (
+    test,
+    seed,
+    bench,
+    loadtest,
+    profile_startup,
+    swagger_build,
+    archive,
+    restore,
+    maintenance,
+    streaks,
+)
 from config import config
 from database import db
-from utils.db import get_connection_url
+from utils.cache import init_cache
+from utils.db import get_connection_url, get_replica_urls
+from utils.invalidators import register_invalidators
+from utils.pool import InstrumentedQueuePool, instrument
+from utils.replicas import REPLICA_BIND_PREFIX
+from utils.swagger import init_swagger
 from route.activationCodeRoute import activation_code_route
 from route.apiRoute import api_route
 from route.userRoute import user_route
@@ -30,6 +45,7 @@ from route.rangeViewRoute import range_view_route
 from route.notificationRoute import notification_route
 from route.teamRoute import team_route
 from route.typeRoute import type_route
+from route.metricsRoute import metrics_route
 
 
 def create_app(config_name) -> Flask:
@@ -53,9 +69,20 @@ def create_app(config_name) -> Flask:
     application.register_blueprint(notification_route)
     application.register_blueprint(team_route)
     application.register_blueprint(type_route)
+    application.register_blueprint(metrics_route)
 
     application.config["SQLALCHEMY_DATABASE_URI"] = get_connection_url()
+    application.config["SQLALCHEMY_BINDS"] = {
+        f"{REPLICA_BIND_PREFIX}{index}": url
+        for index, url in enumerate(
+            get_replica_urls(application.config["SQLALCHEMY_DATABASE_URI"])
+        )
+    }
     application.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    application.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+        "poolclass": InstrumentedQueuePool,
+        **application.config.get("SQLALCHEMY_ENGINE_OPTIONS", {}),
+    }
     application.config["SQLALCHEMY_RECORD_QUERIES"] = True
     application.config["SLOW_DB_QUERY_TIME"] = 0.5
 
@@ -69,9 +96,25 @@ def create_app(config_name) -> Flask:
     root_logger.addHandler(file_handler)
 
     db.init_app(application)
+
+    with application.app_context():
+        for engine in db.engines.values():
+            instrument(engine)
+
     flask_bcrypt.init_app(application)
+    init_cache(application)
+    register_invalidators()
 
     application.cli.add_command(test)
+    application.cli.add_command(seed)
+    application.cli.add_command(bench)
+    application.cli.add_command(loadtest)
+    application.cli.add_command(profile_startup)
+    application.cli.add_command(swagger_build)
+    application.cli.add_command(archive)
+    application.cli.add_command(restore)
+    application.cli.add_command(maintenance)
+    application.cli.add_command(streaks)
 
     # Custom Error Handling
     @application.errorhandler(400)
@@ -214,42 +257,8 @@ def create_app(config_name) -> Flask:
 flask_env = os.getenv("FLASK_ENV") or "local"
 app = create_app(flask_env)
 
-swagger_config = {
-    "headers": [],
-    "specs": [
-        {
-            "endpoint": "apispec_1",
-            "route": "/apispec_1.json",
-            "rule_filter": lambda rule: True,
-            "model_filter": lambda tag: True,
-        }
-    ],
-    "static_url_path": "/flasgger_static",
-    "swagger_ui": True,
-    "specs_route": "/swagger",
-}
-
-swagger_template = {
-    "swagger": "2.0",
-    "info": {
-        "title": "SaintsXCTF API",
-        "description": "Documentation for the second version of the SaintsXCTF API",
-        "contact": {
-            "responsibleDeveloper": "Andrew Jarombek",
-            "email": "andrew@jarombek.com",
-            "url": "https://jarombek.com",
-        },
-        "version": "2.0.0",
-    },
-    "host": "localhost:5000",
-    "basePath": "/",
-    "securityDefinitions": {
-        "bearerAuth": {"type": "apiKey", "name": "Authorization", "in": "header"}
-    },
-    "schemes": ["http", "https"],
-}
-
-swagger = Swagger(app, config=swagger_config, template=swagger_template)
+if app.config["SWAGGER_ENABLED"]:
+    swagger = init_swagger(app)
 
 
 @app.after_request
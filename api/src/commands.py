@@ -4,14 +4,27 @@ Author: Andrew Jarombek
 Date: 6/22/2019
 """
 
+import json
 import os
 import sys
+import time
 import unittest
+from urllib.parse import urlparse
 
 import coverage
 import click
+from flask import current_app
 from flask.cli import with_appcontext
 
+from config import LoadTestConfig
+from utils import archive as archive_rows
+from utils import bench as bench_suite
+from utils import loadTest as load_test
+from utils import maintenance as maintenance_jobs
+from utils import startup, streaks as streak_jobs, swagger
+from utils.seed import clear_seed_data, generate
+from utils.stubServices import StubService
+
 cov = None
 if os.environ.get("FLASK_COVERAGE"):
     cov = coverage.coverage(
@@ -47,3 +60,351 @@ def test():
         cov.erase()
 
     sys.exit(len(result.errors + result.failures))
+
+
+@click.command()
+@click.option("--users", default=1000, help="Number of users to create.")
+@click.option("--teams", default=10, help="Number of teams to create.")
+@click.option("--groups-per-team", default=4, help="Number of groups in each team.")
+@click.option("--logs", default=200000, help="Total number of exercise logs.")
+@click.option("--comments", default=50000, help="Total number of comments.")
+@click.option("--notifications", default=20000, help="Total number of notifications.")
+@click.option("--days", default=1095, help="Number of days of exercise history.")
+@click.option(
+    "--multi-team-rate",
+    default=0.25,
+    help="Fraction of users who are members of multiple teams.",
+)
+@click.option("--batch-size", default=5000, help="Rows inserted per statement.")
+@click.option("--random-seed", default=26, help="Seed for repeatable data sets.")
+@click.option(
+    "--clear/--no-clear",
+    default=True,
+    help="Remove data from a previous seed run before generating new data.",
+)
+@with_appcontext
+def seed(  # pylint: disable=too-many-arguments
+    users,
+    teams,
+    groups_per_team,
+    logs,
+    comments,
+    notifications,
+    days,
+    multi_team_rate,
+    batch_size,
+    random_seed,
+    clear,
+):
+    """
+    Create a Flask command for populating the database with synthetic data.  Execute with 'flask seed' from a
+    command line.  Every seeded user has the password 'seedpassword'.
+    """
+    if clear:
+        clear_seed_data()
+
+    start = time.perf_counter()
+    counts = generate(
+        users=users,
+        teams=teams,
+        groups_per_team=groups_per_team,
+        logs=logs,
+        comments=comments,
+        notifications=notifications,
+        days=days,
+        multi_team_rate=multi_team_rate,
+        batch_size=batch_size,
+        random_seed=random_seed,
+    )
+    elapsed = time.perf_counter() - start
+
+    for table, count in counts.items():
+        print(f"{table}: {count} rows")
+
+    print(f"Seeded {sum(counts.values())} rows in {elapsed:.1f}s")
+
+
+@click.command()
+@click.option("--iterations", default=50, help="Measured calls of each benchmark.")
+@click.option("--warmup", default=5, help="Calls of each benchmark before measuring.")
+@click.option(
+    "--only",
+    multiple=True,
+    help="Run benchmarks whose names contain this text.  Can be repeated.",
+)
+@click.option("--micro/--no-micro", default=True, help="Run micro-benchmarks.")
+@click.option("--macro/--no-macro", default=True, help="Run endpoint benchmarks.")
+@click.option(
+    "--output", default="bench-results.json", help="File to write results to."
+)
+@click.option("--baseline", default=None, help="Results file to compare against.")
+@with_appcontext
+def bench(  # pylint: disable=too-many-arguments
+    iterations, warmup, only, micro, macro, output, baseline
+):
+    """
+    Create a Flask command for benchmarking the hot endpoints against seeded data.  Execute with 'flask bench' from
+    a command line after running 'flask seed'.
+    """
+    results = bench_suite.run(
+        iterations=iterations,
+        warmup=warmup,
+        only=list(only),
+        micro=micro,
+        macro=macro,
+    )
+    bench_suite.write_results(results, path=output, baseline_path=baseline)
+
+    for name, change in results.get("baseline", {}).get("change_percent", {}).items():
+        print(f"{name}: p50 {change['p50']}%, p99 {change['p99']}% vs. baseline")
+
+    print(f"Results written to {output}")
+
+
+@click.command()
+@click.option(
+    "--target", default="http://localhost:5000", help="Base URL of the API instance."
+)
+@click.option("--rps", default=50.0, help="Requests sent each second.")
+@click.option("--duration", default=60.0, help="Length of the load test in seconds.")
+@click.option(
+    "--users", default=100, help="Number of seeded users to send requests as."
+)
+@click.option(
+    "--max-in-flight", default=200, help="Maximum requests awaiting a response."
+)
+@click.option("--timeout", default=30.0, help="Seconds to wait for each response.")
+@click.option(
+    "--collection",
+    default=None,
+    help="Postman collection to replay.  Defaults to the collection in the repository root.",
+)
+@click.option(
+    "--output", default="loadtest-results.json", help="File to write results to."
+)
+@click.option("--random-seed", default=28, help="Seed for a repeatable traffic mix.")
+@with_appcontext
+def loadtest(  # pylint: disable=too-many-arguments
+    target,
+    rps,
+    duration,
+    users,
+    max_in_flight,
+    timeout,
+    collection,
+    output,
+    random_seed,
+):
+    """
+    Create a Flask command for load testing a running API instance with the requests in the Postman collection.
+    Execute with 'flask loadtest' from a command line after running 'flask seed'.  The API instance must use the
+    'loadtest' configuration, which points it at the stand-in services started by this command.
+    """
+    if collection is None:
+        collection = os.path.join(
+            current_app.root_path, "..", "..", "SaintsXCTF.postman_collection.json"
+        )
+
+    services = [
+        StubService(port=urlparse(url).port).start()
+        for url in (LoadTestConfig.AUTH_URL, LoadTestConfig.FUNCTION_URL)
+    ]
+
+    try:
+        results = load_test.run(
+            collection_path=collection,
+            target=target,
+            rps=rps,
+            duration=duration,
+            users=users,
+            max_in_flight=max_in_flight,
+            timeout=timeout,
+            random_seed=random_seed,
+        )
+    finally:
+        for service in services:
+            service.stop()
+
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
+
+    for name, route in results["results"]["routes"].items():
+        print(
+            f"{name}: {route['throughput_rps']} req/s, p50 {route['latency_ms']['p50']}ms, "
+            f"p95 {route['latency_ms']['p95']}ms, p99 {route['latency_ms']['p99']}ms, "
+            f"{route['errors']} errors"
+        )
+
+    total = results["results"]["total"]
+    print(
+        f"Total: {total['throughput_rps']} req/s (target {rps}), "
+        f"p99 {total['latency_ms']['p99']}ms, {total['errors']} errors"
+    )
+    print(f"Results written to {output}")
+
+
+@click.command()
+@click.option("--runs", default=3, help="Number of fresh interpreters to start.")
+@click.option("--top", default=15, help="Number of slowest imports to show.")
+def profile_startup(runs, top):
+    """
+    Create a Flask command for profiling the startup time of an API worker.  Execute with 'flask profile-startup'
+    from a command line.
+    """
+    results = startup.profile(runs=runs, top=top)
+
+    print(f"Startup (median of {runs}): {results['wall_ms']:.1f}ms")
+
+    print("\nImports made by app.py:")
+    for entry in results["top_level_imports"]:
+        print(f"  {entry['cumulative_ms']:9.1f}ms  {entry['module']}")
+
+    print("\nSlowest modules (excluding nested imports):")
+    for entry in results["slowest_modules"]:
+        print(f"  {entry['self_ms']:9.1f}ms  {entry['module']}")
+
+    connection = results["connection_url"]
+    print(
+        f"\nDatabase connection URL: {connection['uncached_ms']:.1f}ms uncached, "
+        f"{connection['cached_ms']:.1f}ms cached"
+    )
+
+
+@click.command()
+@click.option(
+    "--output",
+    default=None,
+    help="File to write the specification to.  Defaults to the file served by the API.",
+)
+@with_appcontext
+def swagger_build(output):
+    """
+    Create a Flask command for compiling the Open API (Swagger) specification from the documentation of every route.
+    Execute with 'flask swagger-build' from a command line when building the API.
+    """
+    path = swagger.write_spec(current_app, path=output)
+    print(f"API specification written to {path}")
+
+
+@click.command()
+@click.option(
+    "--days", default=365, help="Days that rows stay soft deleted before archiving."
+)
+@click.option("--batch-size", default=1000, help="Rows archived in each transaction.")
+@click.option("--pause", default=0.1, help="Seconds to wait between batches.")
+@click.option(
+    "--table",
+    "tables",
+    multiple=True,
+    type=click.Choice(archive_rows.ARCHIVED_TABLE_NAMES),
+    help="Only archive rows from this table.  Can be repeated.",
+)
+@with_appcontext
+def archive(days, batch_size, pause, tables):
+    """
+    Create a Flask command for moving soft deleted rows to archive tables.  Execute with 'flask archive' from a
+    command line, usually on a schedule.
+    """
+    start = time.perf_counter()
+    counts = archive_rows.archive(
+        retention_days=days, batch_size=batch_size, pause=pause, tables=list(tables)
+    )
+    elapsed = time.perf_counter() - start
+
+    for table, count in counts.items():
+        print(f"{table}: {count} rows archived")
+
+    print(f"Archived {sum(counts.values())} rows in {elapsed:.1f}s")
+
+
+@click.command()
+@click.argument("table", type=click.Choice(archive_rows.ARCHIVED_TABLE_NAMES))
+@click.argument("keys", nargs=-1, required=True)
+@with_appcontext
+def restore(table, keys):
+    """
+    Create a Flask command for restoring archived rows to their original table.  Execute with
+    'flask restore <table> <key>...' from a command line.  Columns of composite keys are separated by commas.
+    """
+    try:
+        parsed_keys = archive_rows.parse_keys(
+            archive_rows.get_archived_table(table), keys
+        )
+    except ValueError as error:
+        raise click.BadParameter(str(error), param_hint="KEYS")
+
+    counts = archive_rows.restore(table, parsed_keys)
+
+    for name, count in counts.items():
+        print(f"{name}: {count} rows restored")
+
+
+@click.command()
+@click.option("--batch-size", default=500, help="Rows removed in each transaction.")
+@click.option("--pause", default=0.5, help="Seconds to wait between batches.")
+@click.option(
+    "--max-rows",
+    default=None,
+    type=int,
+    help="Most rows removed from each table.  Defaults to every expired row.",
+)
+@click.option(
+    "--notification-days", default=365, help="Days that notifications are kept."
+)
+@click.option(
+    "--archive/--delete",
+    "to_archive",
+    default=False,
+    help="Move activation codes and notifications to archive tables instead of deleting them.",
+)
+@click.option(
+    "--table",
+    "tables",
+    multiple=True,
+    type=click.Choice(maintenance_jobs.MAINTENANCE_TASKS),
+    help="Only remove rows from this table.  Can be repeated.",
+)
+@with_appcontext
+def maintenance(  # pylint: disable=too-many-arguments
+    batch_size, pause, max_rows, notification_days, to_archive, tables
+):
+    """
+    Create a Flask command for removing expired forgot password codes, expired activation codes, and old
+    notifications.  Execute with 'flask maintenance' from a command line, or schedule 'python maintenance.py'.
+    """
+    start = time.perf_counter()
+    counts = maintenance_jobs.run(
+        batch_size=batch_size,
+        pause=pause,
+        max_rows=max_rows,
+        notification_days=notification_days,
+        archive=to_archive,
+        tasks=list(tables),
+    )
+    elapsed = time.perf_counter() - start
+
+    for line in maintenance_jobs.report(counts, elapsed, to_archive):
+        print(line)
+
+
+@click.command()
+@click.option(
+    "--user",
+    "usernames",
+    multiple=True,
+    help="Username to rebuild streaks for.  Can be repeated.  Defaults to every user.",
+)
+@click.option("--batch-size", default=100, help="Users rebuilt in each transaction.")
+@click.option("--pause", default=0.1, help="Seconds to wait between batches.")
+@with_appcontext
+def streaks(usernames, batch_size, pause):
+    """
+    Create a Flask command for rebuilding training streaks from exercise logs.  Streaks are updated as logs are
+    written, so this repairs streaks which drifted or were never computed.  Execute with 'flask streaks' from a command
+    line.
+    """
+    start = time.perf_counter()
+    count = streak_jobs.recompute(
+        usernames=list(usernames), batch_size=batch_size, pause=pause
+    )
+    print(f"Rebuilt streaks for {count} users in {time.perf_counter() - start:.1f}s")
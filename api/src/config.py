@@ -4,41 +4,138 @@ Author: Andrew Jarombek
 Date: 6/23/2019
 """
 
+import os
+
 
 class LocalConfig:
     ENV = "local"
     AUTH_URL = "http://saints-xctf-auth:5000"
     FUNCTION_URL = "https://dev.fn.saintsxctf.com"
+    SWAGGER_ENABLED = True
+    CACHE_BACKEND = "memory"
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": 5,
+        "max_overflow": 5,
+        "pool_timeout": 10,
+        "pool_recycle": 3600,
+        "pool_pre_ping": True,
+    }
 
 
 class LocalTestConfig:
     ENV = "localtest"
     AUTH_URL = "http://saints-xctf-auth:5000"
     FUNCTION_URL = "http://saints-xctf-fn:5000"
+    SWAGGER_ENABLED = True
+    # Tests read data immediately after changing it, so responses aren't cached.
+    CACHE_BACKEND = "none"
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": 5,
+        "max_overflow": 5,
+        "pool_timeout": 10,
+        "pool_recycle": 3600,
+        "pool_pre_ping": True,
+    }
 
 
 class CICDTestConfig:
     ENV = "cicdtest"
     AUTH_URL = "http://auth:5000"
     FUNCTION_URL = "http://functions:5000"
+    SWAGGER_ENABLED = True
+    # Tests read data immediately after changing it, so responses aren't cached.
+    CACHE_BACKEND = "none"
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": 5,
+        "max_overflow": 5,
+        "pool_timeout": 10,
+        "pool_recycle": 3600,
+        "pool_pre_ping": True,
+    }
 
 
 class TestConfig:
     ENV = "test"
     AUTH_URL = "http://localhost:5000"
     FUNCTION_URL = "https://dev.fn.saintsxctf.com"
+    SWAGGER_ENABLED = True
+    # Tests read data immediately after changing it, so responses aren't cached.
+    CACHE_BACKEND = "none"
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": 5,
+        "max_overflow": 5,
+        "pool_timeout": 10,
+        "pool_recycle": 3600,
+        "pool_pre_ping": True,
+    }
+
+
+class LoadTestConfig:
+    ENV = "loadtest"
+    AUTH_URL = "http://localhost:5011"
+    FUNCTION_URL = "http://localhost:5012"
+    SWAGGER_ENABLED = True
+    CACHE_BACKEND = "uwsgi"
+    # Matches the production pool, so load tests measure the capacity of production workers.
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": 2,
+        "max_overflow": 3,
+        "pool_timeout": 5,
+        "pool_recycle": 900,
+        "pool_pre_ping": True,
+    }
 
 
 class DevelopmentConfig:
     ENV = "dev"
     AUTH_URL = "https://dev.auth.saintsxctf.com"
     FUNCTION_URL = "https://dev.fn.saintsxctf.com"
+    SWAGGER_ENABLED = True
+    # The uWSGI cache is shared by the workers on a host.  Set CACHE_BACKEND to 'redis' to share it between hosts.
+    CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "uwsgi")
+    CACHE_REDIS_URL = os.environ.get("CACHE_REDIS_URL")
+    # Concurrent requests for the same snapshot wait on one computation.  A worker's lock expires after
+    # CACHE_LOCK_TIMEOUT seconds in case it dies, and waiting workers give up after CACHE_LOCK_WAIT seconds.
+    CACHE_LOCK_TIMEOUT = 30
+    CACHE_LOCK_WAIT = 10
+    # Each uWSGI worker handles one request at a time, so a small pool per worker is sufficient.  Connections are
+    # pinged before use and recycled before RDS or network hardware drops them while idle.
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": 2,
+        "max_overflow": 3,
+        "pool_timeout": 5,
+        "pool_recycle": 900,
+        "pool_pre_ping": True,
+    }
+    # Reads are routed to replicas listed in DB_REPLICA_HOSTS unless they fall this many seconds behind the primary.
+    DB_REPLICA_MAX_LAG = 5
+    DB_REPLICA_LAG_CHECK_INTERVAL = 10
 
 
 class ProductionConfig:
     ENV = "prod"
     AUTH_URL = "https://auth.saintsxctf.com"
     FUNCTION_URL = "https://fn.saintsxctf.com"
+    SWAGGER_ENABLED = os.environ.get("SWAGGER_ENABLED") == "true"
+    # The uWSGI cache is shared by the workers on a host.  Set CACHE_BACKEND to 'redis' to share it between hosts.
+    CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "uwsgi")
+    CACHE_REDIS_URL = os.environ.get("CACHE_REDIS_URL")
+    # Concurrent requests for the same snapshot wait on one computation.  A worker's lock expires after
+    # CACHE_LOCK_TIMEOUT seconds in case it dies, and waiting workers give up after CACHE_LOCK_WAIT seconds.
+    CACHE_LOCK_TIMEOUT = 30
+    CACHE_LOCK_WAIT = 10
+    # Each uWSGI worker handles one request at a time, so a small pool per worker is sufficient.  Connections are
+    # pinged before use and recycled before RDS or network hardware drops them while idle.
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": 2,
+        "max_overflow": 3,
+        "pool_timeout": 5,
+        "pool_recycle": 900,
+        "pool_pre_ping": True,
+    }
+    # Reads are routed to replicas listed in DB_REPLICA_HOSTS unless they fall this many seconds behind the primary.
+    DB_REPLICA_MAX_LAG = 5
+    DB_REPLICA_LAG_CHECK_INTERVAL = 10
 
 
 config = {
@@ -46,6 +143,7 @@ config = {
     "localtest": LocalTestConfig,
     "cicdtest": CICDTestConfig,
     "test": TestConfig,
+    "loadtest": LoadTestConfig,
     "development": DevelopmentConfig,
     "production": ProductionConfig,
 }
@@ -4,6 +4,8 @@ Author: Andrew Jarombek
 Date: 8/6/2019
 """
 
+from typing import Optional
+
 from sqlalchemy.engine.cursor import ResultProxy
 from sqlalchemy.schema import Column
 from database import db
@@ -45,15 +47,15 @@ class ActivationCodeDao:
         return result.first()
 
     @staticmethod
-    def add_activation_code(new_code: Code) -> bool:
+    def add_activation_code(new_code: Code) -> Optional[Code]:
         """
         Add an activation code to the database.
         :param new_code: Object representing an activation code for a user.
-        :return: True if the code is inserted into the database, False otherwise.
+        :return: The inserted code, or None if the code isn't inserted into the database.
         """
         # pylint: disable=no-member
         db.session.add(new_code)
-        return BasicDao.safe_commit()
+        return new_code if BasicDao.safe_commit(new_code) else None
 
     @staticmethod
     def delete_code(activation_code: str) -> bool:
@@ -4,27 +4,92 @@ Author: Andrew Jarombek
 Date: 6/23/2019
 """
 
+from typing import Any, List, Optional
+
 from flask import current_app
+from sqlalchemy import inspect
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.util import identity_key
 
 from database import db
+from utils.events import dispatch_pending, discard_pending
+from utils.replicas import mark_write
 
 
 class BasicDao:
     @staticmethod
-    def safe_commit() -> bool:
+    def safe_commit(*entities, refresh: Optional[List[str]] = None) -> bool:
         """
-        Safely attempt to commit changes to MySQL.  Rollback in case of a failure.
+        Safely attempt to commit changes to MySQL.  Rollback in case of a failure.  Later reads in the same request
+        use the primary database, so they see the committed changes.  Events published during the transaction are
+        delivered after a successful commit and discarded after a rollback.
+        :param entities: ORM objects which are returned to the caller after the commit.  They are flushed and then
+        detached from the session, so their state (including auto-increment keys assigned by the INSERT) isn't
+        expired by the commit and doesn't need to be selected from MySQL again.
+        :param refresh: Attributes of the entities to read back from MySQL after the flush, such as generated columns
+        or values which MySQL converts from the form they were given in.
         :return: True if the commit was successful, False if a rollback occurred.
         """
+        mark_write()
+
         try:
             # pylint: disable=no-member
+            if entities:
+                db.session.flush()
+
+                for entity in entities:
+                    if inspect(entity).session is not None:
+                        if refresh:
+                            db.session.refresh(entity, refresh)
+
+                        db.session.expunge(entity)
+
             db.session.commit()
             current_app.logger.info("SQL Safely Committed")
-            return True
         except SQLAlchemyError as error:
             # pylint: disable=no-member
             db.session.rollback()
+            discard_pending()
             current_app.logger.error("SQL Commit Failed!  Rolling back...")
             current_app.logger.error(error.args)
             return False
+
+        dispatch_pending()
+        return True
+
+    @staticmethod
+    def safe_flush() -> bool:
+        """
+        Safely attempt to send pending changes to MySQL before the transaction is committed, for example to get the
+        auto-increment keys of new rows.  Rollback in case of a failure, discarding the events published during the
+        transaction.
+        :return: True if the flush was successful, False if a rollback occurred.
+        """
+        try:
+            # pylint: disable=no-member
+            db.session.flush()
+        except SQLAlchemyError as error:
+            # pylint: disable=no-member
+            db.session.rollback()
+            discard_pending()
+            current_app.logger.error("SQL Flush Failed!  Rolling back...")
+            current_app.logger.error(error.args)
+            return False
+
+        return True
+
+    @staticmethod
+    def loaded_entity(model: type, primary_key: Any) -> Optional[Any]:
+        """
+        Find an ORM object which is already loaded in the session's identity map, without querying MySQL.
+        :param model: The ORM model class of the object.
+        :param primary_key: The primary key of the object.
+        :return: The loaded object, or None if it isn't in the session or its state was expired.
+        """
+        # pylint: disable=no-member
+        entity = db.session.identity_map.get(identity_key(model, primary_key))
+
+        if entity is None or inspect(entity).expired_attributes:
+            return None
+
+        return entity
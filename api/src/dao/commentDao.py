@@ -5,6 +5,7 @@ Date: 7/3/2019
 """
 
 from datetime import datetime
+from typing import Optional
 
 from sqlalchemy import desc
 
@@ -54,15 +55,16 @@ class CommentDao:
         )
 
     @staticmethod
-    def add_comment(new_comment: Comment) -> bool:
+    def add_comment(new_comment: Comment) -> Optional[Comment]:
         """
         Add a comment for an exercise log to the database.
         :param new_comment: Object representing a comment for an exercise log.
-        :return: True if the comment is inserted into the database, False otherwise.
+        :return: The inserted comment with its comment_id populated, or None if the comment isn't inserted into the
+        database.
         """
         # pylint: disable=no-member
         db.session.add(new_comment)
-        return BasicDao.safe_commit()
+        return new_comment if BasicDao.safe_commit(new_comment) else None
 
     @staticmethod
     def update_comment(comment: Comment) -> bool:
@@ -9,10 +9,13 @@ from typing import List
 from database import db
 from model.Flair import Flair
 from dao.basicDao import BasicDao
+from utils.events import publish, UserChanged
+from utils.replicas import read_only
 
 
 class FlairDao:
     @staticmethod
+    @read_only
     def get_flair_by_username(username: str) -> List[Flair]:
         """
         Get the all the flairs bound to a user
@@ -48,4 +51,5 @@ class FlairDao:
         """
         # pylint: disable=no-member
         db.session.add(flair)
+        publish(UserChanged(username=flair.username))
         return BasicDao.safe_commit()
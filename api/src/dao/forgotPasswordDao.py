@@ -12,6 +12,7 @@ from sqlalchemy.engine.cursor import ResultProxy
 from database import db
 from dao.basicDao import BasicDao
 from model.ForgotPassword import ForgotPassword
+from utils.events import publish, UserChanged
 
 
 class ForgotPasswordDao:
@@ -57,6 +58,7 @@ class ForgotPasswordDao:
         """
         # pylint: disable=no-member
         db.session.add(code)
+        publish(UserChanged(username=code.username))
         return BasicDao.safe_commit()
 
     @staticmethod
@@ -67,6 +69,11 @@ class ForgotPasswordDao:
         :return: True if the deletion was successful without error, False otherwise.
         """
         # pylint: disable=no-member
+        previous = db.session.execute(
+            "SELECT username FROM forgotpassword WHERE forgot_code=:forgot_code AND deleted IS FALSE",
+            {"forgot_code": code},
+        ).first()
+
         db.session.execute(
             """
             DELETE FROM forgotpassword 
@@ -75,4 +82,8 @@ class ForgotPasswordDao:
             """,
             {"forgot_code": code},
         )
+
+        if previous is not None:
+            publish(UserChanged(username=previous.username))
+
         return BasicDao.safe_commit()
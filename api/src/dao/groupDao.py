@@ -15,6 +15,7 @@ from dao.basicDao import BasicDao
 from model.Group import Group
 from utils import dates
 from utils.literals import WeekStart
+from utils.replicas import read_only
 
 
 class GroupDao:
@@ -61,6 +62,7 @@ class GroupDao:
         return result.first()
 
     @staticmethod
+    @read_only
     def get_newest_log_date(group_name: str) -> Optional[Row]:
         """
         Get the date of the newest exercise log in the group
@@ -82,12 +84,13 @@ class GroupDao:
         return result.first()
 
     @staticmethod
+    @read_only
     def get_group_leaderboard(
         group_id: int, interval: str = None, week_start: WeekStart = "monday"
     ) -> ResultProxy:
         """
         Get exercise statistics from users in a specific group.  These statistics are used to build a leaderboard in the
-        application.
+        application.  Running paces are in seconds per mile, and the average pace is weighted by distance.
         :param group_id: The unique id for the group.
         :param interval: A string representing a time interval (week, month, or year).
         :param week_start: Day of the week that is used to signify the start of the week.
@@ -107,7 +110,12 @@ class GroupDao:
                     COALESCE(SUM(CASE WHEN type = 'run' THEN miles END), 0) AS miles_run,
                     COALESCE(SUM(CASE WHEN type = 'bike' THEN miles END), 0) AS miles_biked,
                     COALESCE(SUM(CASE WHEN type = 'swim' THEN miles END), 0) AS miles_swam,
-                    COALESCE(SUM(CASE WHEN type NOT IN ('run', 'bike', 'swim') THEN miles END), 0) AS miles_other 
+                    COALESCE(SUM(CASE WHEN type NOT IN ('run', 'bike', 'swim') THEN miles END), 0) AS miles_other,
+                    ROUND(
+                        SUM(CASE WHEN type = 'run' AND time_seconds > 0 AND miles > 0 THEN time_seconds END) /
+                        SUM(CASE WHEN type = 'run' AND time_seconds > 0 AND miles > 0 THEN miles END)
+                    ) AS average_pace_run,
+                    MIN(CASE WHEN type = 'run' AND time_seconds > 0 AND miles > 0 THEN pace_seconds END) AS best_pace_run
                 FROM logs 
                 INNER JOIN groupmembers ON logs.username = groupmembers.username 
                 WHERE group_id = :group_id 
@@ -131,7 +139,12 @@ class GroupDao:
                 COALESCE(SUM(CASE WHEN type = 'run' THEN miles END), 0) AS miles_run,
                 COALESCE(SUM(CASE WHEN type = 'bike' THEN miles END), 0) AS miles_biked,
                 COALESCE(SUM(CASE WHEN type = 'swim' THEN miles END), 0) AS miles_swam,
-                COALESCE(SUM(CASE WHEN type NOT IN ('run', 'bike', 'swim') THEN miles END), 0) AS miles_other 
+                COALESCE(SUM(CASE WHEN type NOT IN ('run', 'bike', 'swim') THEN miles END), 0) AS miles_other,
+                ROUND(
+                    SUM(CASE WHEN type = 'run' AND time_seconds > 0 AND miles > 0 THEN time_seconds END) /
+                    SUM(CASE WHEN type = 'run' AND time_seconds > 0 AND miles > 0 THEN miles END)
+                ) AS average_pace_run,
+                MIN(CASE WHEN type = 'run' AND time_seconds > 0 AND miles > 0 THEN pace_seconds END) AS best_pace_run
             FROM logs 
             INNER JOIN groupmembers ON logs.username = groupmembers.username 
             WHERE group_id = :group_id 
@@ -14,6 +14,8 @@ from database import db
 from model.GroupMember import GroupMember
 from model.TeamGroup import TeamGroup
 from dao.basicDao import BasicDao
+from utils.events import publish, GroupMembershipChanged
+from utils.replicas import read_only
 
 
 class GroupMemberDao:
@@ -62,6 +64,7 @@ class GroupMemberDao:
         )
 
     @staticmethod
+    @read_only
     def get_user_groups(username: str) -> ResultProxy:
         """
         Get information about all the groups a user is a member of
@@ -81,6 +84,25 @@ class GroupMemberDao:
             {"username": username},
         )
 
+    @staticmethod
+    def get_user_group_history(username: str) -> ResultProxy:
+        """
+        Get every group a user is or was a member of, along with the team each group belongs to.
+        :param username: Unique identifier for the user
+        :return: A list of groups
+        """
+        # pylint: disable=no-member
+        return db.session.execute(
+            """
+            SELECT DISTINCT `groups`.id, `groups`.group_name, teamgroups.team_name
+            FROM groupmembers 
+            INNER JOIN `groups` ON `groups`.id=groupmembers.group_id 
+            INNER JOIN teamgroups ON teamgroups.group_id=`groups`.id
+            WHERE username=:username
+            """,
+            {"username": username},
+        )
+
     @staticmethod
     def get_user_groups_in_team(username: str, team_name: str) -> ResultProxy:
         """
@@ -186,6 +208,7 @@ class GroupMemberDao:
                 "user": user,
             },
         )
+        publish(GroupMembershipChanged(group_id=group_id, username=username))
         return BasicDao.safe_commit()
 
     @staticmethod
@@ -4,17 +4,47 @@ Author: Andrew Jarombek
 Date: 7/3/2019
 """
 
-from typing import Optional
+from typing import Dict, List, Optional
 
+from sqlalchemy import bindparam, text
 from sqlalchemy.engine.cursor import ResultProxy
+from sqlalchemy.engine.result import Result
 from sqlalchemy.engine.row import Row
 
 from dao.basicDao import BasicDao
+from dao.personalRecordDao import PersonalRecordDao
+from dao.streakDao import StreakDao
 from database import db
 from model.Log import Log
 from utils import dates
-from utils.literals import WeekStart
+from utils.literals import Granularity, WeekStart
+from utils.events import publish, LogChanged
 from utils.exerciseFilters import generate_exercise_filter_sql_query
+from utils.replicas import read_only
+
+# Columns of an exercise log which are read back from MySQL after the log is written.  MySQL normalizes the values
+# the client sent (TIME, FLOAT, and integer columns) and generates the seconds columns, so the returned log matches a
+# log selected with get_log_by_id().
+PERSISTED_COLUMNS = [
+    "name",
+    "location",
+    "date",
+    "type",
+    "distance",
+    "metric",
+    "time",
+    "miles",
+    "pace",
+    "time_seconds",
+    "pace_seconds",
+    "feel",
+    "description",
+    "time_created",
+    "deleted",
+]
+
+# The innodb_autoinc_lock_mode of each database, read once per process.
+autoinc_lock_modes: Dict[str, int] = {}
 
 
 class LogDao:
@@ -36,6 +66,7 @@ class LogDao:
         return Log.query.filter_by(log_id=log_id).filter(Log.deleted.is_(False)).first()
 
     @staticmethod
+    @read_only
     def get_user_miles(username: str) -> Optional[Row]:
         """
         Get the total exercise miles for a user
@@ -55,6 +86,7 @@ class LogDao:
         return result.first()
 
     @staticmethod
+    @read_only
     def get_user_miles_by_type(username: str, exercise_type: str) -> Optional[Row]:
         """
         Get the total miles of a certain exercise for a user
@@ -76,6 +108,7 @@ class LogDao:
         return result.first()
 
     @staticmethod
+    @read_only
     def get_user_miles_interval(
         username: str, interval: str = None, week_start: WeekStart = "monday"
     ) -> Optional[Row]:
@@ -116,6 +149,7 @@ class LogDao:
         return result.first()
 
     @staticmethod
+    @read_only
     def get_user_miles_interval_by_type(
         username: str,
         exercise_type: str,
@@ -163,6 +197,7 @@ class LogDao:
         return result.first()
 
     @staticmethod
+    @read_only
     def get_user_avg_feel(username: str) -> Optional[Row]:
         """
         Retrieve the average feel statistic for a user
@@ -182,6 +217,7 @@ class LogDao:
         return result.first()
 
     @staticmethod
+    @read_only
     def get_user_avg_feel_interval(
         username: str, interval: str = None, week_start: WeekStart = "monday"
     ) -> Optional[Row]:
@@ -221,6 +257,64 @@ class LogDao:
         return result.first()
 
     @staticmethod
+    @read_only
+    def get_user_paces(
+        username: str,
+        exercise_type: str = None,
+        week_start: WeekStart = "monday",
+    ) -> Optional[Row]:
+        """
+        Get the average and best pace of a user of all time and in the past year, month, and week, in a single query.
+        Each interval is a conditional aggregate over the user's logs, and paces are aggregated from the integer
+        seconds columns of the logs, so no times are converted per row.  Average paces are weighted by distance.
+        :param username: Unique identifier for a user
+        :param exercise_type: Type of exercise to filter the logs by.  Defaults to every type of exercise.
+        :param week_start: An option for which day is used as the start of the week.
+        Both 'monday' and 'sunday' are valid options.
+        :return: The average pace and best pace in seconds per mile, in the columns 'average' and 'best' for all time
+        and 'average_past_<interval>' and 'best_past_<interval>' for each interval.
+        """
+        intervals = ["year", "month", "week"]
+        params = {
+            interval: dates.get_start_date_interval(
+                interval=interval, week_start=week_start
+            )
+            for interval in intervals
+        }
+
+        columns = ",".join(
+            f"""
+                ROUND(
+                    SUM(IF(date >= :{interval}, time_seconds, NULL)) / SUM(IF(date >= :{interval}, miles, NULL))
+                ) AS average_past_{interval},
+                MIN(IF(date >= :{interval}, pace_seconds, NULL)) AS best_past_{interval}"""
+            for interval in intervals
+        )
+
+        filters = ""
+
+        if exercise_type is not None:
+            filters += " AND type=:exercise_type"
+
+        # pylint: disable=no-member
+        result: ResultProxy = db.session.execute(
+            f"""
+            SELECT 
+                ROUND(SUM(time_seconds) / SUM(miles)) AS average,
+                MIN(pace_seconds) AS best,{columns}
+            FROM logs 
+            WHERE username=:username
+            AND time_seconds > 0
+            AND miles > 0
+            AND deleted IS FALSE
+            {filters}
+            """,
+            {**params, "username": username, "exercise_type": exercise_type},
+        )
+        return result.first()
+
+    @staticmethod
+    @read_only
     def get_group_miles(group_name: str) -> Optional[Row]:
         """
         Get the total exercise miles for all the users in a group.
@@ -243,6 +337,7 @@ class LogDao:
         return result.first()
 
     @staticmethod
+    @read_only
     def get_group_miles_interval(
         group_name: str, interval: str = None, week_start: WeekStart = "monday"
     ) -> Optional[Row]:
@@ -290,6 +385,7 @@ class LogDao:
         return result.first()
 
     @staticmethod
+    @read_only
     def get_group_miles_interval_by_type(
         group_name: str,
         exercise_type: str,
@@ -348,6 +444,7 @@ class LogDao:
         return result.first()
 
     @staticmethod
+    @read_only
     def get_group_avg_feel(group_name: str) -> Optional[Row]:
         """
         Retrieve the average feel statistic for a group.
@@ -370,6 +467,7 @@ class LogDao:
         return result.first()
 
     @staticmethod
+    @read_only
     def get_group_avg_feel_interval(
         group_name: str, interval: str = None, week_start: WeekStart = "monday"
     ) -> Optional[Row]:
@@ -416,6 +514,7 @@ class LogDao:
         return result.first()
 
     @staticmethod
+    @read_only
     def get_log_feed(limit: int, offset: int, username: str) -> ResultProxy:
         """
         Retrieve a collection of logs.  The logs returned depend upon which teams the user making the
@@ -446,6 +545,7 @@ class LogDao:
         )
 
     @staticmethod
+    @read_only
     def get_log_feed_count() -> ResultProxy:
         """
         Calculate the number of logs in the log feed.
@@ -459,6 +559,7 @@ class LogDao:
         )
 
     @staticmethod
+    @read_only
     def get_user_log_feed(username: str, limit: int, offset: int) -> ResultProxy:
         """
         Retrieve a collection of logs by a user
@@ -480,6 +581,7 @@ class LogDao:
         )
 
     @staticmethod
+    @read_only
     def get_user_log_feed_count(username: str) -> ResultProxy:
         """
         Calculate the number of logs in a users log collection.
@@ -497,6 +599,7 @@ class LogDao:
         )
 
     @staticmethod
+    @read_only
     def get_group_log_feed(group_id: int, limit: int, offset: int) -> ResultProxy:
         """
         Retrieve a collection of logs by a group
@@ -523,6 +626,7 @@ class LogDao:
         )
 
     @staticmethod
+    @read_only
     def get_group_log_feed_count(group_id: int) -> ResultProxy:
         """
         Calculate the number of logs in a groups log collection.
@@ -543,32 +647,50 @@ class LogDao:
         )
 
     @staticmethod
-    def get_range_view(types: list, start: str, end: str) -> ResultProxy:
+    @read_only
+    def get_range_view(
+        types: list,
+        start: str,
+        end: str,
+        granularity: Granularity = "day",
+        week_start: WeekStart = "monday",
+    ) -> ResultProxy:
         """
         Get exercise log statistics over a date range.
         :param types: Types of exercise logs to filter by.
         :param start: The first date to include in the range.
         :param end: The last date to include in the range.
-        :return: A list of exercise miles and feel statistics for each day a log exists.
+        :param granularity: The length of time that logs are grouped by: 'day', 'week', 'month', or 'year'.
+        :param week_start: An option for which day is used as the start of the week.
+        Both 'monday' and 'sunday' are valid options.
+        :return: A list of exercise miles and feel statistics for each day (or week, month, or year) a log exists.
         """
         type_query = generate_exercise_filter_sql_query(types)
+        period = dates.get_period_containing_sql("date", granularity, week_start)
         # pylint: disable=no-member
         return db.session.execute(
             f"""
-            SELECT date, SUM(miles) AS miles, CAST(AVG(feel) AS UNSIGNED) AS feel 
+            SELECT {period} AS date, SUM(miles) AS miles, CAST(AVG(feel) AS UNSIGNED) AS feel 
             FROM logs 
             WHERE date >= :start 
             AND date <= :end
             AND deleted IS FALSE
             AND {type_query}
-            GROUP BY date
+            GROUP BY {period}
+            ORDER BY date
             """,
             {"start": start, "end": end},
         )
 
     @staticmethod
-    def get_user_range_view(
-        username: str, types: list, start: str, end: str
+    @read_only
+    def get_user_range_view(  # pylint: disable=too-many-arguments
+        username: str,
+        types: list,
+        start: str,
+        end: str,
+        granularity: Granularity = "day",
+        week_start: WeekStart = "monday",
     ) -> ResultProxy:
         """
         Get exercise log statistics for a user over a date range.
@@ -576,27 +698,38 @@ class LogDao:
         :param types: Types of exercise logs to filter by.
         :param start: The first date to include in the range.
         :param end: The last date to include in the range.
-        :return: A list of exercise miles and feel statistics for each day a log exists.
+        :param granularity: The length of time that logs are grouped by: 'day', 'week', 'month', or 'year'.
+        :param week_start: An option for which day is used as the start of the week.
+        Both 'monday' and 'sunday' are valid options.
+        :return: A list of exercise miles and feel statistics for each day (or week, month, or year) a log exists.
         """
         type_query = generate_exercise_filter_sql_query(types)
+        period = dates.get_period_containing_sql("date", granularity, week_start)
         # pylint: disable=no-member
         return db.session.execute(
             f"""
-            SELECT date, SUM(miles) AS miles, CAST(AVG(feel) AS UNSIGNED) AS feel 
+            SELECT {period} AS date, SUM(miles) AS miles, CAST(AVG(feel) AS UNSIGNED) AS feel 
             FROM logs 
             WHERE username=:username 
             AND deleted IS FALSE
             AND date >= :start 
             AND date <= :end
             AND {type_query}
-            GROUP BY date
+            GROUP BY {period}
+            ORDER BY date
             """,
             {"username": username, "start": start, "end": end},
         )
 
     @staticmethod
-    def get_group_range_view(
-        group_id: int, types: list, start: str, end: str
+    @read_only
+    def get_group_range_view(  # pylint: disable=too-many-arguments
+        group_id: int,
+        types: list,
+        start: str,
+        end: str,
+        granularity: Granularity = "day",
+        week_start: WeekStart = "monday",
     ) -> ResultProxy:
         """
         Get exercise log statistics for a group over a date range.
@@ -604,13 +737,17 @@ class LogDao:
         :param types: Types of exercise logs to filter by.
         :param start: The first date to include in the range.
         :param end: The last date to include in the range.
-        :return: A list of exercise miles and feel statistics for each day a log exists.
+        :param granularity: The length of time that logs are grouped by: 'day', 'week', 'month', or 'year'.
+        :param week_start: An option for which day is used as the start of the week.
+        Both 'monday' and 'sunday' are valid options.
+        :return: A list of exercise miles and feel statistics for each day (or week, month, or year) a log exists.
         """
         type_query = generate_exercise_filter_sql_query(types)
+        period = dates.get_period_containing_sql("date", granularity, week_start)
         # pylint: disable=no-member
         return db.session.execute(
             f"""
-            SELECT date, SUM(miles) AS miles, CAST(AVG(feel) AS UNSIGNED) AS feel 
+            SELECT {period} AS date, SUM(miles) AS miles, CAST(AVG(feel) AS UNSIGNED) AS feel 
             FROM logs 
             INNER JOIN groupmembers 
             ON logs.username=groupmembers.username 
@@ -620,30 +757,302 @@ class LogDao:
             AND date >= :start 
             AND date <= :end
             AND {type_query}
-            GROUP BY date
+            GROUP BY {period}
+            ORDER BY date
             """,
             {"group_id": group_id, "start": start, "end": end},
         )
 
     @staticmethod
-    def add_log(new_log: Log) -> bool:
+    @read_only
+    def get_users_range_view(  # pylint: disable=too-many-arguments
+        usernames: List[str],
+        types: list,
+        start: str,
+        end: str,
+        granularity: Granularity = "day",
+        week_start: WeekStart = "monday",
+    ) -> ResultProxy:
+        """
+        Get exercise log statistics for many users over a date range in a single query, so that users can be compared.
+        :param usernames: Unique identifiers for the users.
+        :param types: Types of exercise logs to filter by.
+        :param start: The first date to include in the range.
+        :param end: The last date to include in the range.
+        :param granularity: The length of time that logs are grouped by: 'day', 'week', 'month', or 'year'.
+        :param week_start: An option for which day is used as the start of the week.
+        Both 'monday' and 'sunday' are valid options.
+        :return: Exercise miles and feel statistics for each user and day (or week, month, or year) a log exists,
+        ordered by username and date.
         """
-        Add an exercise log to the database.
+        type_query = generate_exercise_filter_sql_query(types)
+        period = dates.get_period_containing_sql("date", granularity, week_start)
+        # pylint: disable=no-member
+        return db.session.execute(
+            text(f"""
+                SELECT username, {period} AS date, SUM(miles) AS miles, CAST(AVG(feel) AS UNSIGNED) AS feel 
+                FROM logs 
+                WHERE username IN :usernames 
+                AND deleted IS FALSE
+                AND date >= :start 
+                AND date <= :end
+                AND {type_query}
+                GROUP BY username, {period}
+                ORDER BY username, date
+                """).bindparams(bindparam("usernames", expanding=True)),
+            {"usernames": usernames, "start": start, "end": end},
+        )
+
+    @staticmethod
+    @read_only
+    def get_group_leaders_range_view(  # pylint: disable=too-many-arguments
+        group_id: int,
+        types: list,
+        start: str,
+        end: str,
+        top: int,
+        after: int = 0,
+        limit: int = 20,
+        granularity: Granularity = "day",
+        week_start: WeekStart = "monday",
+    ) -> ResultProxy:
+        """
+        Get exercise log statistics over a date range for the members of a group who exercised the most miles in the
+        range.  Members are ranked in a derived table which only keeps the page of members being compared, and their
+        statistics are grouped in the same query.
+        :param group_id: Unique identifier for a group.
+        :param types: Types of exercise logs to filter by.
+        :param start: The first date to include in the range.
+        :param end: The last date to include in the range.
+        :param top: The number of group members to compare.
+        :param after: Only include members ranked below this position, for pagination.
+        :param limit: The maximum number of members to include.
+        :param granularity: The length of time that logs are grouped by: 'day', 'week', 'month', or 'year'.
+        :param week_start: An option for which day is used as the start of the week.
+        Both 'monday' and 'sunday' are valid options.
+        :return: Exercise miles and feel statistics for each member and day (or week, month, or year) a log exists,
+        ordered by the members' ranks and date.
+        """
+        type_query = generate_exercise_filter_sql_query(types)
+        period = dates.get_period_containing_sql("date", granularity, week_start)
+        # pylint: disable=no-member
+        return db.session.execute(
+            f"""
+            SELECT 
+                logs.username, 
+                {period} AS date, 
+                SUM(miles) AS miles, 
+                CAST(AVG(feel) AS UNSIGNED) AS feel 
+            FROM logs 
+            INNER JOIN (
+                SELECT logs.username, SUM(miles) AS total 
+                FROM logs 
+                INNER JOIN groupmembers 
+                ON logs.username=groupmembers.username 
+                WHERE group_id=:group_id 
+                AND status='accepted' 
+                AND logs.deleted IS FALSE
+                AND groupmembers.deleted IS FALSE
+                AND date >= :start 
+                AND date <= :end
+                AND {type_query}
+                GROUP BY logs.username
+                ORDER BY total DESC, logs.username
+                LIMIT :count OFFSET :after
+            ) AS leaders 
+            ON logs.username=leaders.username 
+            WHERE logs.deleted IS FALSE
+            AND date >= :start 
+            AND date <= :end
+            AND {type_query}
+            GROUP BY leaders.total, logs.username, {period}
+            ORDER BY leaders.total DESC, logs.username, date
+            """,
+            {
+                "group_id": group_id,
+                "start": start,
+                "end": end,
+                "after": after,
+                "count": max(min(after + limit, top) - after, 0),
+            },
+        )
+
+    @staticmethod
+    @read_only
+    def stream_logs(
+        username: Optional[str] = None,
+        group_id: Optional[int] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> Result:
+        """
+        Retrieve exercise logs through a server-side cursor, so rows are sent from MySQL in batches as they are
+        consumed instead of being loaded into memory at once.
+        :param username: Unique identifier for a user whose logs are retrieved.
+        :param group_id: Unique identifier for a group whose members' logs are retrieved.
+        :param start: The first date to include.
+        :param end: The last date to include.
+        :param batch_size: The number of rows fetched from the cursor at a time.
+        :return: The result of the query, which must be consumed before the database session is closed.
+        """
+        joins = ""
+        filters = []
+
+        if group_id is not None:
+            joins = "INNER JOIN groupmembers ON logs.username=groupmembers.username"
+            filters.append(
+                "group_id=:group_id AND status='accepted' AND groupmembers.deleted IS FALSE"
+            )
+        if username is not None:
+            filters.append("logs.username=:username")
+        if start is not None:
+            filters.append("date >= :start")
+        if end is not None:
+            filters.append("date <= :end")
+
+        filter_query = "".join(f"AND {query} " for query in filters)
+
+        # pylint: disable=no-member
+        return db.session.execute(
+            f"""
+            SELECT log_id,logs.username,first,last,name,location,date,type,
+                    distance,metric,miles,time,pace,feel,description 
+            FROM logs 
+            {joins}
+            WHERE logs.deleted IS FALSE 
+            {filter_query}
+            ORDER BY date, log_id
+            """,
+            {"username": username, "group_id": group_id, "start": start, "end": end},
+            execution_options={"stream_results": True},
+        ).yield_per(batch_size)
+
+    @staticmethod
+    def add_log(new_log: Log) -> Optional[Log]:
+        """
+        Add an exercise log to the database.  The log becomes a personal record of the user in the same transaction
+        if it beats their existing records, and it extends the user's streaks.
         :param new_log: Object representing an exercise log for a user.
-        :return: True if the log is inserted into the database, False otherwise.
+        :return: The inserted log with its log_id populated, or None if the log isn't inserted into the database.
         """
         # pylint: disable=no-member
         db.session.add(new_log)
-        return BasicDao.safe_commit()
+
+        if not BasicDao.safe_flush():
+            return None
+
+        if new_log.miles:
+            PersonalRecordDao.add_log_records(new_log.log_id)
+
+        StreakDao.add_log_streak(new_log.log_id)
+
+        publish(LogChanged(username=new_log.username, date=new_log.date))
+        return (
+            new_log
+            if BasicDao.safe_commit(new_log, refresh=PERSISTED_COLUMNS)
+            else None
+        )
+
+    @staticmethod
+    def add_logs(new_logs: List[Log]) -> Optional[List[int]]:
+        """
+        Add many exercise logs to the database in a single transaction.  The logs are sent to MySQL in a single
+        multi-row INSERT statement instead of one statement per log, and only the new logs compete for personal
+        records and extend streaks.  If MySQL might not give the rows of a multi-row INSERT consecutive ids, the logs
+        are inserted one at a time instead, so their ids are known.
+        :param new_logs: Objects representing exercise logs.
+        :return: The log_id of each inserted log in the order they were given, or None if the logs aren't inserted
+        into the database.
+        """
+        if len(new_logs) == 0:
+            return []
+
+        if not LogDao.consecutive_insert_ids():
+            # pylint: disable=no-member
+            db.session.add_all(new_logs)
+
+            if not BasicDao.safe_flush():
+                return None
+
+            log_ids = [log.log_id for log in new_logs]
+        else:
+            # pylint: disable=no-member
+            result: ResultProxy = db.session.execute(
+                Log.__table__.insert().values(
+                    [
+                        {
+                            "username": log.username,
+                            "first": log.first,
+                            "last": log.last,
+                            "name": log.name,
+                            "location": log.location,
+                            "date": log.date,
+                            "type": log.type,
+                            "distance": log.distance,
+                            "metric": log.metric,
+                            "miles": log.miles,
+                            "time": log.time,
+                            "pace": log.pace,
+                            "feel": log.feel,
+                            "description": log.description,
+                            "time_created": log.time_created,
+                            "deleted": log.deleted,
+                            "created_date": log.created_date,
+                            "created_user": log.created_user,
+                            "created_app": log.created_app,
+                        }
+                        for log in new_logs
+                    ]
+                )
+            )
+
+            # The rows of a multi-row INSERT are given consecutive ids, starting with the id returned by
+            # LAST_INSERT_ID().
+            log_ids = list(range(result.lastrowid, result.lastrowid + len(new_logs)))
+
+        PersonalRecordDao.add_logs_records(log_ids)
+        StreakDao.add_logs_streak(log_ids)
+
+        for username in {log.username for log in new_logs}:
+            publish(LogChanged(username=username))
+
+        return log_ids if BasicDao.safe_commit() else None
 
     @staticmethod
-    def update_log(log: Log) -> bool:
+    def consecutive_insert_ids() -> bool:
         """
-        Update a log in the database.
+        Determine whether MySQL gives the rows of a multi-row INSERT consecutive auto-increment ids.  This holds for
+        the 'traditional' and 'consecutive' innodb_autoinc_lock_mode (0 and 1, the default in MySQL 5.7), but not for
+        the 'interleaved' lock mode (2, the default in MySQL 8.0).  The lock mode is read once per process.
+        :return: True if the ids of a multi-row INSERT are consecutive, False otherwise.
+        """
+        key = str(db.engine.url)
+
+        if key not in autoinc_lock_modes:
+            # pylint: disable=no-member
+            autoinc_lock_modes[key] = db.session.execute(
+                "SELECT @@innodb_autoinc_lock_mode"
+            ).scalar()
+
+        return autoinc_lock_modes[key] in (0, 1)
+
+    @staticmethod
+    def update_log(log: Log) -> Optional[Log]:
+        """
+        Update a log in the database.  If the log was already loaded in this session, the loaded object is refreshed
+        with the updated columns and returned instead of selecting the whole log again.  Personal records held by the
+        log are rebuilt in case it got slower or shorter, and then the log competes for records with its new values.
+        Streaks are updated if the date or length of the log changed.
         :param log: Object representing an updated log.
-        :return: True if the log is updated in the database, False otherwise.
+        :return: The updated log, or None if the log isn't updated in the database.
         """
         # pylint: disable=no-member
+        previous: Optional[Row] = db.session.execute(
+            "SELECT username, date, miles FROM logs WHERE log_id=:log_id AND deleted IS FALSE FOR UPDATE",
+            {"log_id": log.log_id},
+        ).first()
+
         db.session.execute(
             """
             UPDATE logs SET 
@@ -676,7 +1085,28 @@ class LogDao:
                 "log_id": log.log_id,
             },
         )
-        return BasicDao.safe_commit()
+        PersonalRecordDao.remove_log_records(log.log_id)
+        PersonalRecordDao.add_log_records(log.log_id)
+
+        if previous is not None and (
+            str(previous.date) != str(log.date) or previous.miles != log.miles
+        ):
+            StreakDao.update_log_streak(
+                log.log_id, previous.username, previous.date, previous.miles
+            )
+
+        publish(LogChanged(username=log.username, date=log.date, log_id=log.log_id))
+
+        updated_log: Optional[Log] = BasicDao.loaded_entity(Log, log.log_id)
+
+        if updated_log is None:
+            return LogDao.get_log_by_id(log.log_id) if BasicDao.safe_commit() else None
+
+        return (
+            updated_log
+            if BasicDao.safe_commit(updated_log, refresh=PERSISTED_COLUMNS)
+            else None
+        )
 
     @staticmethod
     def delete_log(log_id: int) -> bool:
@@ -686,16 +1116,30 @@ class LogDao:
         :return: True if the deletion was successful without error, False otherwise.
         """
         # pylint: disable=no-member
+        previous: Optional[Row] = db.session.execute(
+            "SELECT username, date, miles FROM logs WHERE log_id=:log_id AND deleted IS FALSE",
+            {"log_id": log_id},
+        ).first()
+
         db.session.execute(
             "DELETE FROM logs WHERE log_id=:log_id AND deleted IS FALSE",
             {"log_id": log_id},
         )
+        PersonalRecordDao.remove_log_records(log_id)
+
+        if previous is not None:
+            StreakDao.update_log_streak(
+                log_id, previous.username, previous.date, previous.miles
+            )
+            publish(LogChanged(username=previous.username, log_id=log_id))
+
         return BasicDao.safe_commit()
 
     @staticmethod
     def soft_delete_log(log: Log) -> bool:
         """
-        Soft Delete an exercise log from the database.
+        Soft Delete an exercise log from the database.  Personal records held by the log are given to the next best
+        logs, and the user's streaks are updated without the log.
         :param log: Object representing a log to soft delete.
         :return: True if the soft deletion was successful without error, False otherwise.
         """
@@ -720,4 +1164,7 @@ class LogDao:
                 "deleted_app": log.deleted_app,
             },
         )
+        PersonalRecordDao.remove_log_records(log.log_id)
+        StreakDao.update_log_streak(log.log_id, log.username, log.date, log.miles)
+        publish(LogChanged(username=log.username, date=log.date, log_id=log.log_id))
         return BasicDao.safe_commit()
@@ -5,11 +5,20 @@ Author: Andrew Jarombek
 Date: 7/3/2019
 """
 
+from collections import Counter
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import bindparam, text
 from sqlalchemy.engine.cursor import ResultProxy
 
 from database import db
 from dao.basicDao import BasicDao
 from model.Notification import Notification
+from model.NotificationCount import NotificationCount
+from utils import dates
+from utils.events import publish, NotificationsChanged
+from utils.replicas import read_only
 
 
 class NotificationDao:
@@ -39,35 +48,250 @@ class NotificationDao:
         )
 
     @staticmethod
+    @read_only
     def get_notification_by_username(username: str) -> ResultProxy:
         """
         Retrieve all the notifications for a user from the past two weeks
         :param username: Unique identifier for a user
         :return: A list of notifications
         """
+        # The start of the window is computed once instead of on every row, and 'deleted = FALSE' (which is equivalent
+        # to 'deleted IS FALSE' for this column) lets MySQL use the (username, deleted, time) index.
         # pylint: disable=no-member
         return db.session.execute(
             """
             SELECT * FROM notifications 
             WHERE username=:username 
-            AND time >= CURDATE() - INTERVAL DAYOFWEEK(CURDATE()) + 13 DAY 
+            AND deleted = FALSE
+            AND time >= :since 
+            ORDER BY time DESC, notification_id DESC
+            """,
+            {"username": username, "since": dates.get_notification_window_start()},
+        )
+
+    @staticmethod
+    @read_only
+    def get_notification_inbox(
+        username: str, limit: int, before: Optional[Tuple[datetime, int]] = None
+    ) -> ResultProxy:
+        """
+        Retrieve a page of a user's notifications, newest first.  Pages are found with the (username, deleted, time)
+        index instead of an offset, so every page costs the same to retrieve.
+        :param username: Unique identifier for a user.
+        :param limit: The maximum number of notifications to return.
+        :param before: The time and id of the last notification on the previous page, or None for the first page.
+        :return: A list of notifications.
+        """
+        before_query = ""
+        if before is not None:
+            before_query = """
+                AND (time < :before_time OR (time = :before_time AND notification_id < :before_id))
+            """
+
+        # pylint: disable=no-member
+        return db.session.execute(
+            f"""
+            SELECT * FROM notifications 
+            WHERE username=:username 
+            AND deleted = FALSE
+            {before_query}
+            ORDER BY time DESC, notification_id DESC
+            LIMIT :limit
+            """,
+            {
+                "username": username,
+                "limit": limit,
+                "before_time": before[0] if before else None,
+                "before_id": before[1] if before else None,
+            },
+        )
+
+    @staticmethod
+    @read_only
+    def get_unread_count(username: str) -> int:
+        """
+        Retrieve the number of unread notifications for a user.  The count is maintained as notifications change, and
+        is counted from the notifications table for users whose count isn't stored.
+        :param username: Unique identifier for a user.
+        :return: The number of notifications the user hasn't viewed.
+        """
+        count: Optional[NotificationCount] = NotificationCount.query.filter_by(
+            username=username
+        ).first()
+
+        if count is not None:
+            return count.unread
+
+        # pylint: disable=no-member
+        return db.session.execute(
+            """
+            SELECT COUNT(*) FROM notifications 
+            WHERE username=:username 
+            AND viewed='N' 
             AND deleted IS FALSE
-            ORDER BY time DESC
             """,
             {"username": username},
+        ).scalar()
+
+    @staticmethod
+    def adjust_unread_counts(usernames: List[str], change: int) -> None:
+        """
+        Change the number of unread notifications for many users by the same amount in a single UPDATE statement.
+        :param usernames: Unique identifiers for users.
+        :param change: The number of notifications which became unread (or read, if negative) for each user.
+        """
+        statement = text("""
+            UPDATE notificationcounts 
+            SET unread=GREATEST(CAST(unread AS SIGNED) + :change, 0) 
+            WHERE username IN :usernames
+            """).bindparams(bindparam("usernames", expanding=True))
+
+        # pylint: disable=no-member
+        db.session.execute(statement, {"usernames": usernames, "change": change})
+
+    @staticmethod
+    def adjust_unread_count(username: str, change: int) -> None:
+        """
+        Change the number of unread notifications for a user as part of the current transaction.  Users whose count
+        isn't stored are skipped, since their count is computed when it is requested.
+        :param username: Unique identifier for a user.
+        :param change: The number of notifications which became unread (or read, if negative).
+        """
+        # pylint: disable=no-member
+        db.session.execute(
+            """
+            UPDATE notificationcounts 
+            SET unread=GREATEST(CAST(unread AS SIGNED) + :change, 0) 
+            WHERE username=:username
+            """,
+            {"username": username, "change": change},
         )
 
     @staticmethod
-    def add_notification(new_notification: Notification) -> bool:
+    def add_notification(new_notification: Notification) -> Optional[Notification]:
         """
         Add a notification for a user to the database.
         :param new_notification: Object representing a notification for a user.
-        :return: True if the notification is inserted into the database, False otherwise.
+        :return: The inserted notification with its notification_id populated, or None if the notification isn't
+        inserted into the database.
         """
         # pylint: disable=no-member
         db.session.add(new_notification)
+
+        if new_notification.viewed == "N" and not new_notification.deleted:
+            NotificationDao.adjust_unread_count(new_notification.username, 1)
+
+        publish(NotificationsChanged(username=new_notification.username))
+        return new_notification if BasicDao.safe_commit(new_notification) else None
+
+    @staticmethod
+    def add_notifications(new_notifications: List[Notification]) -> bool:
+        """
+        Add many notifications to the database in a single transaction.  The notifications are sent to MySQL in
+        multi-row INSERT statements instead of one statement per notification.
+        :param new_notifications: Objects representing notifications for users.
+        :return: True if every notification is inserted into the database, False otherwise.
+        """
+        if len(new_notifications) == 0:
+            return True
+
+        # pylint: disable=no-member
+        db.session.execute(
+            """
+            INSERT INTO notifications (
+                username, time, link, viewed, description, deleted, created_date, created_user, created_app
+            ) VALUES (
+                :username, :time, :link, :viewed, :description, :deleted, :created_date, :created_user, :created_app
+            )
+            """,
+            [
+                {
+                    "username": notification.username,
+                    "time": notification.time,
+                    "link": notification.link,
+                    "viewed": notification.viewed,
+                    "description": notification.description,
+                    "deleted": notification.deleted,
+                    "created_date": notification.created_date,
+                    "created_user": notification.created_user,
+                    "created_app": notification.created_app,
+                }
+                for notification in new_notifications
+            ],
+        )
+
+        unread = Counter(
+            notification.username
+            for notification in new_notifications
+            if notification.viewed == "N" and not notification.deleted
+        )
+
+        # Users with the same number of new notifications have their counts updated together.
+        for change in set(unread.values()):
+            NotificationDao.adjust_unread_counts(
+                [username for username, count in unread.items() if count == change],
+                change,
+            )
+
+        for username in {notification.username for notification in new_notifications}:
+            publish(NotificationsChanged(username=username))
+
         return BasicDao.safe_commit()
 
+    @staticmethod
+    def mark_viewed(
+        username: str,
+        notification_ids: Optional[List[int]] = None,
+        before: Optional[datetime] = None,
+    ) -> Optional[int]:
+        """
+        Mark many of a user's notifications as viewed in a single UPDATE statement.
+        :param username: Unique identifier for the user who received the notifications.
+        :param notification_ids: Unique identifiers of the notifications to mark as viewed.
+        :param before: Mark all the notifications sent at or before this time as viewed.  Used if no notification ids
+        are given.
+        :return: The number of notifications which were marked as viewed, or None if the update failed.
+        """
+        if notification_ids is not None:
+            if len(notification_ids) == 0:
+                return 0
+
+            selection = "AND notification_id IN :notification_ids"
+        else:
+            selection = "AND time <= :before"
+
+        statement = text(f"""
+            UPDATE notifications 
+            SET viewed='Y', modified_date=:modified_date, modified_app='saints-xctf-api' 
+            WHERE username=:username 
+            AND deleted = FALSE 
+            AND viewed='N' 
+            {selection}
+            """)
+
+        if notification_ids is not None:
+            statement = statement.bindparams(
+                bindparam("notification_ids", expanding=True)
+            )
+
+        # pylint: disable=no-member
+        result = db.session.execute(
+            statement,
+            {
+                "username": username,
+                "notification_ids": notification_ids,
+                "before": before,
+                "modified_date": datetime.now(),
+            },
+        )
+        viewed = result.rowcount
+
+        if viewed > 0:
+            NotificationDao.adjust_unread_count(username, -viewed)
+            publish(NotificationsChanged(username=username))
+
+        return viewed if BasicDao.safe_commit() else None
+
     @staticmethod
     def update_notification(notification: Notification) -> bool:
         """
@@ -77,18 +301,31 @@ class NotificationDao:
         :return: True if the notification is updated in the database, False otherwise.
         """
         # pylint: disable=no-member
-        db.session.execute(
+        result = db.session.execute(
             """
             UPDATE notifications 
             SET viewed=:viewed
             WHERE notification_id=:notification_id
             AND deleted IS FALSE
+            AND viewed <> :viewed
             """,
             {
                 "notification_id": notification.notification_id,
                 "viewed": notification.viewed,
             },
         )
+
+        if result.rowcount > 0:
+            username = db.session.execute(
+                "SELECT username FROM notifications WHERE notification_id=:notification_id",
+                {"notification_id": notification.notification_id},
+            ).scalar()
+
+            NotificationDao.adjust_unread_count(
+                username, 1 if notification.viewed == "N" else -1
+            )
+            publish(NotificationsChanged(username=username))
+
         return BasicDao.safe_commit()
 
     @staticmethod
@@ -98,6 +335,8 @@ class NotificationDao:
         :param notification_id: ID which uniquely identifies the notification.
         :return: True if the deletion was successful without error, False otherwise.
         """
+        NotificationDao.remove_from_unread_count(notification_id=notification_id)
+
         # pylint: disable=no-member
         db.session.execute(
             "DELETE FROM notifications WHERE notification_id=:notification_id AND deleted IS FALSE",
@@ -112,6 +351,10 @@ class NotificationDao:
         :param notification: Object representing a notification to soft delete.
         :return: True if the soft deletion was successful without error, False otherwise.
         """
+        NotificationDao.remove_from_unread_count(
+            notification_id=notification.notification_id
+        )
+
         # pylint: disable=no-member
         db.session.execute(
             """
@@ -134,3 +377,27 @@ class NotificationDao:
             },
         )
         return BasicDao.safe_commit()
+
+    @staticmethod
+    def remove_from_unread_count(notification_id: int) -> None:
+        """
+        Remove a notification which is about to be deleted from its user's unread count, if it hasn't been viewed.
+        :param notification_id: ID which uniquely identifies the notification.
+        """
+        # pylint: disable=no-member
+        notification = db.session.execute(
+            """
+            SELECT username, viewed FROM notifications 
+            WHERE notification_id=:notification_id 
+            AND deleted IS FALSE
+            """,
+            {"notification_id": notification_id},
+        ).first()
+
+        if notification is None:
+            return
+
+        if notification["viewed"] == "N":
+            NotificationDao.adjust_unread_count(notification["username"], -1)
+
+        publish(NotificationsChanged(username=notification["username"]))
@@ -0,0 +1,154 @@
+"""
+PersonalRecord data access from the SaintsXCTF MySQL database.  Contains each user's fastest exercises at standard
+distances and longest exercises, which are kept up to date as exercise logs change.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+from typing import List, Optional
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.engine.cursor import ResultProxy
+
+from database import db
+from model.PersonalRecord import PersonalRecord
+from utils.records import LONGEST, record_buckets_sql
+from utils.replicas import read_only
+
+# Logs joined with the range of lengths for each record that they compete for.  Records at standard distances need
+# a time, while the longest exercise only needs a distance.
+RECORD_CANDIDATES_SQL = f"""
+    SELECT
+        logs.username, logs.type, buckets.category, logs.log_id, logs.date, logs.miles,
+        logs.time_seconds AS seconds
+    FROM logs
+    INNER JOIN ({record_buckets_sql()}) AS buckets
+    ON logs.miles > buckets.low
+    AND (buckets.high IS NULL OR logs.miles <= buckets.high)
+    AND (buckets.category = '{LONGEST}' OR logs.time_seconds > 0)
+    WHERE logs.deleted IS FALSE
+"""
+
+
+def compete_for_records_sql(filters: str) -> str:
+    """
+    Create a statement which makes logs personal records in every category where they beat the existing record.
+    Candidates are inserted from the best to the worst, and MySQL applies ON DUPLICATE KEY UPDATE one row at a time,
+    so each record ends up with the best candidate (and the earliest one if several are tied).
+    :param filters: SQL conditions which limit the logs competing for records, starting with AND.
+    :return: An INSERT ... SELECT statement.
+    """
+    # The log_id column is assigned first, so the remaining columns only change if the log took the record.
+    return f"""
+        INSERT INTO personalrecords (username, type, category, log_id, date, miles, seconds)
+        SELECT * FROM ({RECORD_CANDIDATES_SQL} {filters}) AS candidates
+        ORDER BY IF(category='{LONGEST}', -miles, seconds), date, log_id
+        ON DUPLICATE KEY UPDATE
+            log_id=IF(
+                IF(
+                    personalrecords.category='{LONGEST}',
+                    VALUES(miles) > personalrecords.miles,
+                    VALUES(seconds) < personalrecords.seconds
+                ),
+                VALUES(log_id),
+                personalrecords.log_id
+            ),
+            date=IF(personalrecords.log_id=VALUES(log_id), VALUES(date), personalrecords.date),
+            miles=IF(personalrecords.log_id=VALUES(log_id), VALUES(miles), personalrecords.miles),
+            seconds=IF(personalrecords.log_id=VALUES(log_id), VALUES(seconds), personalrecords.seconds)
+    """
+
+
+class PersonalRecordDao:
+    @staticmethod
+    @read_only
+    def get_personal_records(username: str) -> List[PersonalRecord]:
+        """
+        Retrieve all the personal records for a user.  Records are looked up by the primary key, so the cost doesn't
+        depend on the number of logs a user has.
+        :param username: Unique identifier for a user.
+        :return: A list of personal records.
+        """
+        return (
+            PersonalRecord.query.filter_by(username=username)
+            .order_by(PersonalRecord.type, PersonalRecord.category)
+            .all()
+        )
+
+    @staticmethod
+    def add_log_records(log_id: int) -> None:
+        """
+        Make an exercise log a personal record for every category where it beats the existing record, as part of the
+        current transaction.
+        :param log_id: Unique identifier for an exercise log which was created or updated.
+        """
+        PersonalRecordDao.add_logs_records([log_id])
+
+    @staticmethod
+    def add_logs_records(log_ids: List[int]) -> None:
+        """
+        Make many exercise logs personal records in every category where they beat the existing record, in a single
+        statement as part of the current transaction.
+        :param log_ids: Unique identifiers for exercise logs which were created or updated.
+        """
+        if len(log_ids) == 0:
+            return
+
+        statement = text(
+            compete_for_records_sql("AND logs.log_id IN :log_ids")
+        ).bindparams(bindparam("log_ids", expanding=True))
+
+        # pylint: disable=no-member
+        db.session.execute(statement, {"log_ids": log_ids})
+
+    @staticmethod
+    def rebuild_records(
+        username: str,
+        exercise_type: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> None:
+        """
+        Find a user's personal records from all their exercise logs, as part of the current transaction.  This is
+        used when a log which held a record is changed or deleted, so the next best log takes its place.
+        :param username: Unique identifier for a user.
+        :param exercise_type: Only rebuild records for this type of exercise.  Defaults to every type.
+        :param category: Only rebuild records in this category.  Defaults to every category.
+        """
+        filters = "AND logs.username=:username"
+        record_filters = "username=:username"
+
+        if exercise_type is not None:
+            filters += " AND logs.type=:type"
+            record_filters += " AND type=:type"
+
+        if category is not None:
+            filters += " AND buckets.category=:category"
+            record_filters += " AND category=:category"
+
+        params = {"username": username, "type": exercise_type, "category": category}
+
+        # pylint: disable=no-member
+        db.session.execute(
+            f"DELETE FROM personalrecords WHERE {record_filters}", params
+        )
+        db.session.execute(compete_for_records_sql(filters), params)
+
+    @staticmethod
+    def remove_log_records(log_id: int) -> None:
+        """
+        Replace the personal records held by an exercise log with the next best logs, as part of the current
+        transaction.  Call this after the log is updated or soft deleted.
+        :param log_id: Unique identifier for an exercise log.
+        """
+        # pylint: disable=no-member
+        records: ResultProxy = db.session.execute(
+            "SELECT username, type, category FROM personalrecords WHERE log_id=:log_id",
+            {"log_id": log_id},
+        ).fetchall()
+
+        for record in records:
+            PersonalRecordDao.rebuild_records(
+                username=record.username,
+                exercise_type=record.type,
+                category=record.category,
+            )
@@ -0,0 +1,432 @@
+"""
+Streak data access from the SaintsXCTF MySQL database.  Contains each user's streak of consecutive days with an
+exercise log and the number of weeks they exercised over a mileage threshold.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+from datetime import date, timedelta
+from itertools import groupby
+from typing import List, Optional, Set
+
+from sqlalchemy import bindparam, text
+
+from database import db
+from model.Streak import Streak
+from utils import dates
+from utils.replicas import read_only
+from utils.streaks import (
+    WEEKLY_MILES_THRESHOLD,
+    add_day,
+    extend_streaks,
+    remove_day,
+)
+
+
+class StreakDao:
+    @staticmethod
+    @read_only
+    def get_streak(username: str) -> Optional[Streak]:
+        """
+        Retrieve the streaks for a user.  Streaks are created with each user and maintained as logs change, so they
+        are never computed when requested.
+        :param username: Unique identifier for a user.
+        :return: The user's streaks, or None if the user has no streaks (which are described as empty streaks).
+        """
+        return Streak.query.filter_by(username=username).first()
+
+    @staticmethod
+    def compute_streak(username: str) -> Optional[Streak]:
+        """
+        Compute a user's streaks from all their exercise logs.  The days with a log are read in order and grouped into
+        streaks in Python, and the weeks over the mileage threshold are counted in SQL.
+        :param username: Unique identifier for a user.
+        :return: The user's streaks, which aren't added to the session, or None if there is no user with this username.
+        """
+        # pylint: disable=no-member
+        user = db.session.execute(
+            "SELECT COALESCE(week_start, 'monday') AS week_start FROM users WHERE username=:username",
+            {"username": username},
+        ).first()
+
+        if user is None:
+            return None
+
+        days = db.session.execute(
+            """
+            SELECT DISTINCT date FROM logs
+            WHERE username=:username
+            AND deleted IS FALSE
+            ORDER BY date
+            """,
+            {"username": username},
+        )
+        current_streak, longest_streak, last_date = extend_streaks(
+            0, 0, None, (row[0] for row in days)
+        )
+
+        week = dates.get_week_containing_sql("date", user.week_start)
+        weeks_over = db.session.execute(
+            f"""
+            SELECT COUNT(*) FROM (
+                SELECT SUM(miles) AS miles FROM logs
+                WHERE username=:username AND deleted IS FALSE
+                GROUP BY {week}
+            ) AS weeks
+            WHERE miles >= :threshold
+            """,
+            {"username": username, "threshold": WEEKLY_MILES_THRESHOLD},
+        ).scalar()
+
+        return Streak(
+            username=username,
+            week_start=user.week_start,
+            current_streak=current_streak,
+            longest_streak=longest_streak,
+            last_date=last_date,
+            weeks_over=weeks_over,
+        )
+
+    @staticmethod
+    def add_log_streak(log_id: int) -> None:
+        """
+        Update a user's streaks with a new exercise log, as part of the current transaction.
+        :param log_id: Unique identifier for an exercise log which was created.
+        """
+        StreakDao.add_logs_streak([log_id])
+
+    @staticmethod
+    def add_logs_streak(log_ids: List[int]) -> None:
+        """
+        Update the streaks of users with new exercise logs, as part of the current transaction.  Only the days of the
+        logs and the weeks containing them are read.  If a log is on a new day before the end of a user's latest
+        streak, it could join two older streaks, so that user's streaks are rebuilt instead.
+        :param log_ids: Unique identifiers for exercise logs which were created.
+        """
+        if len(log_ids) == 0:
+            return
+
+        # pylint: disable=no-member
+        logs = db.session.execute(
+            text("""
+                SELECT
+                    logs.username, logs.date, logs.miles,
+                    COALESCE(users.week_start, 'monday') AS week_start,
+                    streaks.week_start AS streak_week_start,
+                    streaks.current_streak, streaks.longest_streak, streaks.last_date, streaks.weeks_over
+                FROM logs
+                INNER JOIN users ON users.username = logs.username
+                LEFT JOIN streaks ON streaks.username = logs.username
+                WHERE logs.log_id IN :log_ids
+                AND logs.deleted IS FALSE
+                ORDER BY logs.username, logs.date
+                FOR UPDATE
+                """).bindparams(bindparam("log_ids", expanding=True)),
+            {"log_ids": log_ids},
+        ).fetchall()
+
+        for username, user_logs in groupby(logs, key=lambda log: log.username):
+            user_logs = list(user_logs)
+            streak = user_logs[0]
+
+            if (
+                streak.streak_week_start is None
+                or streak.streak_week_start != streak.week_start
+            ):
+                StreakDao.rebuild_streak(username)
+                continue
+
+            logged_days = db.session.execute(
+                text("""
+                    SELECT DISTINCT date FROM logs
+                    WHERE username=:username
+                    AND date IN :days
+                    AND log_id NOT IN :log_ids
+                    AND deleted IS FALSE
+                    """).bindparams(
+                    bindparam("days", expanding=True),
+                    bindparam("log_ids", expanding=True),
+                ),
+                {
+                    "username": username,
+                    "days": list({log.date for log in user_logs}),
+                    "log_ids": log_ids,
+                },
+            )
+            new_days = sorted(
+                {log.date for log in user_logs} - {row[0] for row in logged_days}
+            )
+
+            if streak.last_date is not None and any(
+                day < streak.last_date for day in new_days
+            ):
+                StreakDao.rebuild_streak(username)
+                continue
+
+            current_streak, longest_streak, last_date = extend_streaks(
+                streak.current_streak, streak.longest_streak, streak.last_date, new_days
+            )
+
+            weeks_over = streak.weeks_over
+            weeks = [
+                dates.get_week_containing(log.date, streak.week_start)
+                for log in user_logs
+                if log.miles
+            ]
+
+            if weeks:
+                week = dates.get_week_containing_sql("date", streak.week_start)
+                week_miles = db.session.execute(
+                    text(f"""
+                        SELECT
+                            COALESCE(SUM(IF(log_id IN :log_ids, 0, miles)), 0) AS miles_before,
+                            COALESCE(SUM(miles), 0) AS miles_after
+                        FROM logs
+                        WHERE username=:username
+                        AND date >= :start
+                        AND date < :end
+                        AND deleted IS FALSE
+                        GROUP BY {week}
+                        """).bindparams(bindparam("log_ids", expanding=True)),
+                    {
+                        "username": username,
+                        "start": min(weeks),
+                        "end": max(weeks) + timedelta(days=7),
+                        "log_ids": log_ids,
+                    },
+                )
+
+                weeks_over += sum(
+                    1
+                    for row in week_miles
+                    if row.miles_before < WEEKLY_MILES_THRESHOLD <= row.miles_after
+                )
+
+            db.session.execute(
+                """
+                UPDATE streaks SET
+                    current_streak=:current_streak,
+                    longest_streak=:longest_streak,
+                    last_date=:last_date,
+                    weeks_over=:weeks_over
+                WHERE username=:username
+                """,
+                {
+                    "username": username,
+                    "current_streak": current_streak,
+                    "longest_streak": longest_streak,
+                    "last_date": last_date,
+                    "weeks_over": weeks_over,
+                },
+            )
+
+    @staticmethod
+    def update_log_streak(
+        log_id: int,
+        username: str,
+        previous_date: date,
+        previous_miles: Optional[float],
+    ) -> None:
+        """
+        Update a user's streaks after an exercise log was changed or deleted, as part of the current transaction.  Only
+        the days around the log's previous and current dates and the weeks containing them are read.  If the change
+        could shorten the longest streak or end the latest streak earlier, the user's streaks are rebuilt instead.
+        :param log_id: Unique identifier for an exercise log which was updated, deleted, or soft deleted.
+        :param username: Unique identifier for the user who owns the log.
+        :param previous_date: The date of the log before it was changed.
+        :param previous_miles: The length of the log in miles before it was changed.
+        """
+        # pylint: disable=no-member
+        streak = db.session.execute(
+            """
+            SELECT
+                streaks.week_start, streaks.current_streak, streaks.longest_streak, streaks.last_date,
+                streaks.weeks_over, COALESCE(users.week_start, 'monday') AS user_week_start
+            FROM streaks
+            INNER JOIN users ON users.username = streaks.username
+            WHERE streaks.username=:username
+            FOR UPDATE
+            """,
+            {"username": username},
+        ).first()
+
+        if streak is None or streak.week_start != streak.user_week_start:
+            StreakDao.rebuild_streak(username)
+            return
+
+        log = db.session.execute(
+            "SELECT date, miles FROM logs WHERE log_id=:log_id AND deleted IS FALSE",
+            {"log_id": log_id},
+        ).first()
+        current_date = None if log is None else log.date
+
+        current_streak = streak.current_streak
+        longest_streak = streak.longest_streak
+        last_date = streak.last_date
+
+        if current_date != previous_date:
+            days = StreakDao.days_around(
+                log_id, username, previous_date, longest_streak
+            )
+
+            if previous_date not in days:
+                streaks = remove_day(
+                    current_streak, longest_streak, last_date, previous_date, days
+                )
+
+                if streaks is None:
+                    StreakDao.rebuild_streak(username)
+                    return
+
+                current_streak, longest_streak, last_date = streaks
+
+            if current_date is not None:
+                days = StreakDao.days_around(
+                    log_id, username, current_date, longest_streak
+                )
+
+                if current_date not in days:
+                    current_streak, longest_streak, last_date = add_day(
+                        current_streak, longest_streak, last_date, current_date, days
+                    )
+
+        weeks_over = streak.weeks_over
+        weeks = {
+            dates.get_week_containing(day, streak.week_start)
+            for day in (previous_date, current_date)
+            if day is not None
+        }
+
+        for week in weeks:
+            week_miles = db.session.execute(
+                """
+                SELECT
+                    COALESCE(SUM(IF(log_id=:log_id, 0, miles)), 0) AS other_miles,
+                    COALESCE(SUM(miles), 0) AS miles_after
+                FROM logs
+                WHERE username=:username
+                AND date >= :start
+                AND date < :end
+                AND deleted IS FALSE
+                """,
+                {
+                    "log_id": log_id,
+                    "username": username,
+                    "start": week,
+                    "end": week + timedelta(days=7),
+                },
+            ).first()
+
+            miles_before = week_miles.other_miles
+            if dates.get_week_containing(previous_date, streak.week_start) == week:
+                miles_before += previous_miles or 0
+
+            if miles_before < WEEKLY_MILES_THRESHOLD <= week_miles.miles_after:
+                weeks_over += 1
+            elif week_miles.miles_after < WEEKLY_MILES_THRESHOLD <= miles_before:
+                weeks_over -= 1
+
+        db.session.execute(
+            """
+            UPDATE streaks SET
+                current_streak=:current_streak,
+                longest_streak=:longest_streak,
+                last_date=:last_date,
+                weeks_over=:weeks_over
+            WHERE username=:username
+            """,
+            {
+                "username": username,
+                "current_streak": current_streak,
+                "longest_streak": longest_streak,
+                "last_date": last_date,
+                "weeks_over": weeks_over,
+            },
+        )
+
+    @staticmethod
+    def days_around(log_id: int, username: str, day: date, longest: int) -> Set[date]:
+        """
+        Get the days with an exercise log around a day, far enough on either side to find where any streak touching
+        the day starts and ends.
+        :param log_id: Unique identifier for an exercise log to leave out.
+        :param username: Unique identifier for a user.
+        :param day: The day to look around.
+        :param longest: The length of the user's longest streak in days.
+        :return: Days with an exercise log other than the one left out.
+        """
+        # pylint: disable=no-member
+        days = db.session.execute(
+            """
+            SELECT DISTINCT date FROM logs
+            WHERE username=:username
+            AND date BETWEEN :start AND :end
+            AND log_id <> :log_id
+            AND deleted IS FALSE
+            """,
+            {
+                "username": username,
+                "start": day - timedelta(days=longest + 1),
+                "end": day + timedelta(days=longest + 1),
+                "log_id": log_id,
+            },
+        )
+        return {row[0] for row in days}
+
+    @staticmethod
+    def rebuild_streak(username: str) -> None:
+        """
+        Compute a user's streaks from all their exercise logs and store them, as part of the current transaction.
+        This is used when a user's streaks weren't built yet or were built with a different first day of the week,
+        and when a change to a log could shorten a streak beyond the days around it.
+        :param username: Unique identifier for a user.
+        """
+        streak: Optional[Streak] = StreakDao.compute_streak(username)
+
+        if streak is None:
+            return
+
+        # pylint: disable=no-member
+        db.session.execute(
+            """
+            INSERT INTO streaks (username, week_start, current_streak, longest_streak, last_date, weeks_over)
+            VALUES (:username, :week_start, :current_streak, :longest_streak, :last_date, :weeks_over)
+            ON DUPLICATE KEY UPDATE
+                week_start=VALUES(week_start),
+                current_streak=VALUES(current_streak),
+                longest_streak=VALUES(longest_streak),
+                last_date=VALUES(last_date),
+                weeks_over=VALUES(weeks_over)
+            """,
+            {
+                "username": streak.username,
+                "week_start": streak.week_start,
+                "current_streak": streak.current_streak,
+                "longest_streak": streak.longest_streak,
+                "last_date": streak.last_date,
+                "weeks_over": streak.weeks_over,
+            },
+        )
+
+    @staticmethod
+    def sync_week_start(username: str) -> None:
+        """
+        Rebuild a user's streaks if they were computed with a different first day of the week than the user has now,
+        as part of the current transaction.
+        :param username: Unique identifier for a user.
+        """
+        # pylint: disable=no-member
+        changed = db.session.execute(
+            """
+            SELECT EXISTS(
+                SELECT 1 FROM streaks
+                INNER JOIN users ON users.username = streaks.username
+                WHERE streaks.username=:username
+                AND streaks.week_start <> COALESCE(users.week_start, 'monday')
+            )
+            """,
+            {"username": username},
+        ).scalar()
+
+        if changed:
+            StreakDao.rebuild_streak(username)
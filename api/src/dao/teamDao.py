@@ -11,10 +11,12 @@ from sqlalchemy import or_
 from model.Team import Team
 from model.TeamGroup import TeamGroup
 from model.Group import Group
+from utils.cache import cached
 
 
 class TeamDao:
     @staticmethod
+    @cached("teams", ttl=600, tags=["teams"])
     def get_teams() -> List[Team]:
         """
         Get a list of all the teams in the database.
@@ -15,10 +15,13 @@ from database import db
 from dao.basicDao import BasicDao
 from model.TeamMember import TeamMember
 from model.GroupMember import GroupMember
+from utils.events import publish, MembershipsChanged
+from utils.replicas import read_only
 
 
 class TeamMemberDao:
     @staticmethod
+    @read_only
     def get_user_teams(username: str) -> ResultProxy:
         """
         Get information about all the teams a user is a member of
@@ -371,4 +374,5 @@ class TeamMemberDao:
                 groups_left_dict,
             )
 
+        publish(MembershipsChanged(username=username))
         return BasicDao.safe_commit()
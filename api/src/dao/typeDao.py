@@ -7,10 +7,12 @@ Date: 12/8/2022
 from typing import List
 
 from model.Type import Type
+from utils.cache import cached
 
 
 class TypeDao:
     @staticmethod
+    @cached("types", ttl=3600, tags=["types"])
     def get_types() -> List[Type]:
         """
         Get a list of all the exercise types in the database.
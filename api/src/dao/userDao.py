@@ -4,13 +4,17 @@ Author: Andrew Jarombek
 Date: 6/16/2019
 """
 
-from typing import List
+from typing import List, Optional
 
 from sqlalchemy.orm import defer
 
 from database import db
 from dao.basicDao import BasicDao
+from dao.streakDao import StreakDao
+from model.NotificationCount import NotificationCount
+from model.Streak import Streak
 from model.User import User
+from utils.events import publish, UserChanged
 
 
 class UserDao:
@@ -51,15 +55,27 @@ class UserDao:
         )
 
     @staticmethod
-    def add_user(user: User) -> bool:
+    def add_user(user: User) -> Optional[User]:
         """
-        Add a user if it has a valid activation code.
+        Add a user if it has a valid activation code.  New users start with no unread notifications and empty
+        streaks.
         :param user: Object representing a user for the application.
-        :return: True if the user is inserted into the database, False otherwise.
+        :return: The inserted user, or None if the user isn't inserted into the database.
         """
         # pylint: disable=no-member
         db.session.add(user)
-        return BasicDao.safe_commit()
+        db.session.add(NotificationCount(username=user.username, unread=0))
+        db.session.add(
+            Streak(
+                username=user.username,
+                week_start=user.week_start or "monday",
+                current_streak=0,
+                longest_streak=0,
+                last_date=None,
+                weeks_over=0,
+            )
+        )
+        return user if BasicDao.safe_commit(user) else None
 
     @staticmethod
     def update_user(username: str, user: User) -> bool:
@@ -98,6 +114,8 @@ class UserDao:
                 "username": username,
             },
         )
+        StreakDao.sync_week_start(username)
+        publish(UserChanged(username=username))
         return BasicDao.safe_commit()
 
     @staticmethod
@@ -150,6 +168,17 @@ class UserDao:
         db.session.execute(
             "DELETE FROM teammembers WHERE username=:username", {"username": username}
         )
+        db.session.execute(
+            "DELETE FROM streaks WHERE username=:username", {"username": username}
+        )
+        db.session.execute(
+            "DELETE FROM notificationcounts WHERE username=:username",
+            {"username": username},
+        )
+        db.session.execute(
+            "DELETE FROM personalrecords WHERE username=:username",
+            {"username": username},
+        )
         # pylint: disable=no-member
         db.session.execute(
             "DELETE FROM users WHERE username=:username", {"username": username}
@@ -6,4 +6,6 @@ Date: 6/29/2019
 
 from flask_sqlalchemy import SQLAlchemy
 
-db = SQLAlchemy()
+from utils.replicas import RoutingSession
+
+db = SQLAlchemy(session_options={"class_": RoutingSession})
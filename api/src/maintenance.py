@@ -0,0 +1,14 @@
+"""
+Entry point for the scheduled maintenance job, which removes expired rows from the database.  Run it with
+'python maintenance.py' from a cron job or a Kubernetes CronJob.  It accepts the same options as 'flask maintenance'.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+from app import app
+from commands import maintenance
+
+if __name__ == "__main__":
+    with app.app_context():
+        # pylint: disable=no-value-for-parameter
+        maintenance.main(prog_name="maintenance.py")
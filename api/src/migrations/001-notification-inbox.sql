@@ -0,0 +1,26 @@
+-- Index notifications for the paginated inbox and keep a count of unread notifications for each user.
+-- Author: Andrew Jarombek
+-- Date: 10/19/2026
+
+ALTER TABLE notifications
+ADD INDEX notifications_username_deleted_time_index (username, deleted, time);
+
+CREATE TABLE IF NOT EXISTS notificationcounts(
+    username        VARCHAR(20)          NOT NULL PRIMARY KEY,
+    unread          INT DEFAULT 0        NOT NULL
+);
+
+ALTER TABLE notificationcounts
+ADD CONSTRAINT notificationcounts_username_fk
+FOREIGN KEY (username) REFERENCES users(username);
+
+-- Store a count for every user, so reading a count never has to create one.  New users are given a count of zero when
+-- they are created, and users without a stored count have it computed from the notifications table when it's read.
+INSERT INTO notificationcounts (username, unread)
+SELECT users.username, COUNT(notifications.notification_id) FROM users
+LEFT JOIN notifications
+ON notifications.username = users.username
+AND notifications.viewed = 'N'
+AND notifications.deleted IS FALSE
+GROUP BY users.username
+ON DUPLICATE KEY UPDATE unread = VALUES(unread);
@@ -0,0 +1,18 @@
+-- Create archive tables for soft deleted rows.  The tables have the same columns and indexes as the tables they archive
+-- rows from, plus the time that each row was archived.
+-- Author: Andrew Jarombek
+-- Date: 10/19/2026
+
+CREATE TABLE IF NOT EXISTS codes_archive LIKE codes;
+CREATE TABLE IF NOT EXISTS comments_archive LIKE comments;
+CREATE TABLE IF NOT EXISTS groupmembers_archive LIKE groupmembers;
+CREATE TABLE IF NOT EXISTS logs_archive LIKE logs;
+CREATE TABLE IF NOT EXISTS notifications_archive LIKE notifications;
+CREATE TABLE IF NOT EXISTS teammembers_archive LIKE teammembers;
+
+ALTER TABLE codes_archive ADD COLUMN archived_date DATETIME NOT NULL;
+ALTER TABLE comments_archive ADD COLUMN archived_date DATETIME NOT NULL;
+ALTER TABLE groupmembers_archive ADD COLUMN archived_date DATETIME NOT NULL;
+ALTER TABLE logs_archive ADD COLUMN archived_date DATETIME NOT NULL;
+ALTER TABLE notifications_archive ADD COLUMN archived_date DATETIME NOT NULL;
+ALTER TABLE teammembers_archive ADD COLUMN archived_date DATETIME NOT NULL;
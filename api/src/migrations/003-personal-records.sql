@@ -0,0 +1,60 @@
+-- Keep each user's fastest exercise at standard distances and longest exercise, so that personal records don't
+-- require a scan of every log.
+-- Author: Andrew Jarombek
+-- Date: 10/19/2026
+
+CREATE TABLE IF NOT EXISTS personalrecords(
+    username      VARCHAR(20)          NOT NULL,
+    type          VARCHAR(40)          NOT NULL,
+    category      VARCHAR(10)          NOT NULL,
+    log_id        INT                  NOT NULL,
+    date          DATE                 NOT NULL,
+    miles         FLOAT                NOT NULL,
+    seconds       INT                  NULL,
+    PRIMARY KEY (username, type, category)
+);
+
+ALTER TABLE personalrecords
+ADD CONSTRAINT personalrecords_username_fk
+FOREIGN KEY (username) REFERENCES users(username);
+
+ALTER TABLE personalrecords
+ADD INDEX personalrecords_log_id_index (log_id);
+
+-- Existing logs compete for records once.  Afterwards, records are updated by the API as logs change.  The ranges of
+-- lengths for each record match RECORD_DISTANCES and RECORD_TOLERANCE in utils/records.py.  Candidates are inserted
+-- from the best to the worst, and a later candidate only replaces a record if it beats it, so each record ends up with
+-- the best log (and the earliest one if several are tied) without window functions, which MySQL 5.7 doesn't support.
+INSERT INTO personalrecords (username, type, category, log_id, date, miles, seconds)
+SELECT * FROM (
+    SELECT
+        logs.username, logs.type, buckets.category, logs.log_id, logs.date, logs.miles,
+        TIME_TO_SEC(logs.time) AS seconds
+    FROM logs
+    INNER JOIN (
+        SELECT 'mile' AS category, 0.97 AS low, 1.03 AS high UNION ALL
+        SELECT '5k', 3.0134, 3.1998 UNION ALL
+        SELECT '10k', 6.0268, 6.3996 UNION ALL
+        SELECT 'half', 12.715, 13.5015 UNION ALL
+        SELECT 'full', 25.43, 27.003 UNION ALL
+        SELECT 'longest', 0.0, NULL
+    ) AS buckets
+    ON logs.miles > buckets.low
+    AND (buckets.high IS NULL OR logs.miles <= buckets.high)
+    AND (buckets.category = 'longest' OR TIME_TO_SEC(logs.time) > 0)
+    WHERE logs.deleted IS FALSE
+) AS candidates
+ORDER BY IF(category='longest', -miles, seconds), date, log_id
+ON DUPLICATE KEY UPDATE
+    log_id=IF(
+        IF(
+            personalrecords.category='longest',
+            VALUES(miles) > personalrecords.miles,
+            VALUES(seconds) < personalrecords.seconds
+        ),
+        VALUES(log_id),
+        personalrecords.log_id
+    ),
+    date=IF(personalrecords.log_id=VALUES(log_id), VALUES(date), personalrecords.date),
+    miles=IF(personalrecords.log_id=VALUES(log_id), VALUES(miles), personalrecords.miles),
+    seconds=IF(personalrecords.log_id=VALUES(log_id), VALUES(seconds), personalrecords.seconds);
@@ -0,0 +1,20 @@
+-- Store the time and pace of exercise logs as integer seconds, so that pace statistics are aggregated without
+-- converting each TIME value.  The columns are generated by MySQL, so adding them fills in every existing log and
+-- later inserts and updates keep them in sync.
+-- Author: Andrew Jarombek
+-- Date: 10/19/2026
+
+ALTER TABLE logs
+ADD COLUMN time_seconds INT AS (TIME_TO_SEC(time)) STORED AFTER pace,
+ADD COLUMN pace_seconds INT AS (TIME_TO_SEC(pace)) STORED AFTER time_seconds;
+
+ALTER TABLE logs
+ADD INDEX logs_username_type_pace_seconds_index (username, type, pace_seconds);
+
+ALTER TABLE logs
+ADD INDEX logs_username_date_time_seconds_index (username, date, time_seconds);
+
+-- Archived logs keep the same columns, so they can be restored.
+ALTER TABLE logs_archive
+ADD COLUMN time_seconds INT AS (TIME_TO_SEC(time)) STORED AFTER pace,
+ADD COLUMN pace_seconds INT AS (TIME_TO_SEC(pace)) STORED AFTER time_seconds;
@@ -0,0 +1,73 @@
+-- Keep each user's training streaks, so that they don't require a walk through every log date.  This migration builds
+-- the streaks of every user from their existing logs.  The 'flask streaks' command rebuilds them again if they drift.
+-- Author: Andrew Jarombek
+-- Date: 10/19/2026
+
+CREATE TABLE IF NOT EXISTS streaks(
+    username       VARCHAR(20)          NOT NULL PRIMARY KEY,
+    week_start     VARCHAR(15)          NOT NULL,
+    current_streak INT DEFAULT 0        NOT NULL,
+    longest_streak INT DEFAULT 0        NOT NULL,
+    last_date      DATE                 NULL,
+    weeks_over     INT DEFAULT 0        NOT NULL
+);
+
+ALTER TABLE streaks
+ADD CONSTRAINT streaks_username_fk
+FOREIGN KEY (username) REFERENCES users(username);
+
+-- Every user starts with an empty streak.  Afterwards, streaks are created with new users and updated by the API as
+-- logs change.
+INSERT INTO streaks (username, week_start, current_streak, longest_streak, last_date, weeks_over)
+SELECT username, COALESCE(week_start, 'monday'), 0, 0, NULL, 0 FROM users
+ON DUPLICATE KEY UPDATE
+    week_start=VALUES(week_start),
+    current_streak=0,
+    longest_streak=0,
+    last_date=NULL,
+    weeks_over=0;
+
+-- Days with a log are inserted in order, and each day extends the latest streak if it follows the streak's last day or
+-- starts a new streak otherwise, matching extend_streaks() in utils/streaks.py.  The assignments are evaluated from
+-- left to right, so the longest streak sees the updated latest streak.  This builds the streaks without window
+-- functions, which MySQL 5.7 doesn't support.
+INSERT INTO streaks (username, week_start, current_streak, longest_streak, last_date, weeks_over)
+SELECT * FROM (
+    SELECT DISTINCT
+        logs.username, COALESCE(users.week_start, 'monday') AS week_start, 1 AS current_streak,
+        1 AS longest_streak, logs.date AS last_date, 0 AS weeks_over
+    FROM logs
+    INNER JOIN users ON users.username = logs.username
+    WHERE logs.deleted IS FALSE
+) AS days
+ORDER BY username, last_date
+ON DUPLICATE KEY UPDATE
+    current_streak=IF(
+        VALUES(last_date) = DATE_ADD(streaks.last_date, INTERVAL 1 DAY),
+        streaks.current_streak + 1,
+        1
+    ),
+    longest_streak=GREATEST(streaks.longest_streak, streaks.current_streak),
+    last_date=VALUES(last_date);
+
+-- Weeks start on each user's week_start day, matching get_week_containing_sql() in utils/dates.py.  The threshold
+-- matches WEEKLY_MILES_THRESHOLD in utils/streaks.py.
+UPDATE streaks
+INNER JOIN (
+    SELECT username, COUNT(*) AS weeks_over FROM (
+        SELECT logs.username, SUM(logs.miles) AS miles
+        FROM logs
+        INNER JOIN users ON users.username = logs.username
+        WHERE logs.deleted IS FALSE
+        GROUP BY
+            logs.username,
+            IF(
+                users.week_start = 'sunday',
+                DATE_SUB(logs.date, INTERVAL DAYOFWEEK(logs.date) - 1 DAY),
+                DATE_SUB(logs.date, INTERVAL WEEKDAY(logs.date) DAY)
+            )
+    ) AS weeks
+    WHERE miles >= 15.0
+    GROUP BY username
+) AS totals ON totals.username = streaks.username
+SET streaks.weeks_over = totals.weeks_over;
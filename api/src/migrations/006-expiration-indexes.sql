@@ -0,0 +1,13 @@
+-- Index the columns which the maintenance job uses to find expired rows, so each batch reads the oldest rows from an
+-- index instead of scanning the table.
+-- Author: Andrew Jarombek
+-- Date: 10/19/2026
+
+ALTER TABLE forgotpassword
+ADD INDEX forgotpassword_expires_index (expires);
+
+ALTER TABLE codes
+ADD INDEX codes_expiration_date_index (expiration_date);
+
+ALTER TABLE notifications
+ADD INDEX notifications_time_index (time);
@@ -4,7 +4,7 @@ Author: Andrew Jarombek
 Date: 6/22/2019
 """
 
-from sqlalchemy import Column
+from sqlalchemy import Column, Computed
 
 from app import db
 from model.Metric import Metric
@@ -62,6 +62,8 @@ class Log(db.Model):
     miles = Column(db.FLOAT, index=True)
     time = Column(db.TIME, index=True)
     pace = Column(db.TIME)
+    time_seconds = Column(db.INT, Computed("TIME_TO_SEC(time)", persisted=True))
+    pace_seconds = Column(db.INT, Computed("TIME_TO_SEC(pace)", persisted=True))
     feel = Column(db.INT, nullable=False, index=True)
     description = Column(db.VARCHAR(1000))
     time_created = Column(db.DATETIME, nullable=False)
@@ -33,6 +33,11 @@ class Notification(db.Model):
         self.deleted_app = notification.get("deleted_app")
 
     __tablename__ = "notifications"
+    __table_args__ = (
+        db.Index(
+            "notifications_username_deleted_time_index", "username", "deleted", "time"
+        ),
+    )
 
     # Data Columns
     notification_id = Column(db.INT, autoincrement=True, primary_key=True)
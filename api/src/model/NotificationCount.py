@@ -0,0 +1,25 @@
+"""
+NotificationCount ORM model for the 'notificationcounts' table in the SaintsXCTF MySQL database.  Holds the number of
+unread notifications for each user, which is maintained as notifications are created, viewed, and deleted.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+from sqlalchemy import Column
+
+from app import db
+
+
+class NotificationCount(db.Model):
+    __tablename__ = "notificationcounts"
+
+    username = Column(db.VARCHAR(20), db.ForeignKey("users.username"), primary_key=True)
+    unread = Column(db.INT, nullable=False, default=0)
+
+    def __repr__(self):
+        """
+        String representation of a user's unread notification count.  This representation is meant to be
+        machine-readable.
+        :return: The unread notification count in string form.
+        """
+        return f"<NotificationCount '{self.username}': {self.unread}>"
@@ -0,0 +1,30 @@
+"""
+PersonalRecord ORM model for the 'personalrecords' table in the SaintsXCTF MySQL database.  Holds each user's fastest
+exercise at standard distances and longest exercise, for each type of exercise.  Records are maintained as exercise
+logs are created, updated, and deleted.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+from sqlalchemy import Column
+
+from app import db
+
+
+class PersonalRecord(db.Model):
+    __tablename__ = "personalrecords"
+
+    username = Column(db.VARCHAR(20), db.ForeignKey("users.username"), primary_key=True)
+    type = Column(db.VARCHAR(40), primary_key=True)
+    category = Column(db.VARCHAR(10), primary_key=True)
+    log_id = Column(db.INT, nullable=False, index=True)
+    date = Column(db.DATE, nullable=False)
+    miles = Column(db.FLOAT, nullable=False)
+    seconds = Column(db.INT)
+
+    def __repr__(self):
+        """
+        String representation of a personal record.  This representation is meant to be machine-readable.
+        :return: The personal record in string form.
+        """
+        return f"<PersonalRecord '{self.username}' {self.type} {self.category}: {self.log_id}>"
@@ -0,0 +1,29 @@
+"""
+Streak ORM model for the 'streaks' table in the SaintsXCTF MySQL database.  Holds each user's streak of consecutive days
+with an exercise log and the number of weeks they exercised over a mileage threshold.  Streaks are maintained as
+exercise logs are created, updated, and deleted.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+from sqlalchemy import Column
+
+from app import db
+
+
+class Streak(db.Model):
+    __tablename__ = "streaks"
+
+    username = Column(db.VARCHAR(20), db.ForeignKey("users.username"), primary_key=True)
+    week_start = Column(db.VARCHAR(15), nullable=False)
+    current_streak = Column(db.INT, nullable=False, default=0)
+    longest_streak = Column(db.INT, nullable=False, default=0)
+    last_date = Column(db.DATE)
+    weeks_over = Column(db.INT, nullable=False, default=0)
+
+    def __repr__(self):
+        """
+        String representation of a user's streaks.  This representation is meant to be machine-readable.
+        :return: The streaks in string form.
+        """
+        return f"<Streak '{self.username}': {self.current_streak} days, {self.weeks_over} weeks>"
@@ -6,6 +6,7 @@ Date: 8/5/2019
 """
 
 from datetime import datetime, timedelta
+from typing import Optional
 
 from flask import (
     Blueprint,
@@ -174,14 +175,11 @@ def activation_code_post() -> Response:
     code_to_add.deleted_user = None
     code_to_add.deleted = False
 
-    code_added_successfully: bool = ActivationCodeDao.add_activation_code(
+    code_added: Optional[Code] = ActivationCodeDao.add_activation_code(
         new_code=code_to_add
     )
 
-    if code_added_successfully:
-        code_added: Code = ActivationCodeDao.get_activation_code(
-            code=code_to_add.activation_code
-        )
+    if code_added is not None:
         code_added_dict: dict = CodeData(code_added).__dict__
 
         response = jsonify(
@@ -66,6 +66,7 @@ def links() -> Response:
             "group": "/v2/groups/links",
             "log_feed": "/v2/log_feed/links",
             "log": "/v2/logs/links",
+            "metrics": "/v2/metrics/links",
             "notification": "/v2/notifications/links",
             "range_view": "/v2/range_view/links",
             "team": "/v2/teams/links",
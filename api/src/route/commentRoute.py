@@ -5,6 +5,7 @@ Date: 7/12/2019
 """
 
 from datetime import datetime
+from typing import Optional
 
 from flask import (
     Blueprint,
@@ -222,12 +223,11 @@ def comment_post():
     comment_to_add.deleted_user = None
     comment_to_add.deleted = False
 
-    comment_added_successfully: bool = CommentDao.add_comment(
+    comment_added: Optional[Comment] = CommentDao.add_comment(
         new_comment=comment_to_add
     )
 
-    if comment_added_successfully:
-        comment_added = CommentDao.get_comment_by_id(comment_to_add.comment_id)
+    if comment_added is not None:
         comment_added_dict: dict = CommentData(comment_added).__dict__
 
         response = jsonify(
@@ -22,6 +22,7 @@ from sqlalchemy.engine.cursor import ResultProxy
 from sqlalchemy.engine.row import Row
 
 from decorators import auth_required
+from utils.cache import cached
 from utils.jwt import get_claims
 from model.Group import Group
 from model.GroupData import GroupData
@@ -832,6 +833,12 @@ def group_members_by_group_id_and_username_delete(
     return response
 
 
+@cached(
+    "group_statistics",
+    ttl=60,
+    stale_ttl=300,
+    tags=lambda group_id: [f"group:{group_id}"],
+)
 def group_statistics_by_id_get(group_id: str) -> Response:
     """
     Get statistics of a group based on the group id.
@@ -861,6 +868,11 @@ def group_statistics_by_id_get(group_id: str) -> Response:
     return response
 
 
+@cached(
+    "group_leaderboards",
+    ttl=60,
+    tags=lambda group_id, interval=None: [f"group:{group_id}"],
+)
 def group_leaderboard_get(group_id: str, interval: str) -> Response:
     """
     Get stats of users in a group based on the group id.  These stats are used to build a leaderboard.
@@ -917,6 +929,10 @@ def group_leaderboard_get(group_id: str, interval: str) -> Response:
             "miles_biked": entry.miles_biked,
             "miles_swam": entry.miles_swam,
             "miles_other": entry.miles_other,
+            "average_pace_run": (
+                None if entry.average_pace_run is None else int(entry.average_pace_run)
+            ),
+            "best_pace_run": entry.best_pace_run,
         }
         for entry in leaderboard
     ]
@@ -931,6 +947,13 @@ def group_leaderboard_get(group_id: str, interval: str) -> Response:
     return response
 
 
+@cached(
+    "group_snapshots",
+    ttl=60,
+    stale_ttl=300,
+    single_flight=True,
+    tags=lambda team_name, group_name: [f"group:{team_name}/{group_name}"],
+)
 def group_snapshot_by_group_name_get(team_name: str, group_name: str) -> Response:
     """
     Get a snapshot about a group based on the group name.
@@ -4,7 +4,11 @@ Author: Andrew Jarombek
 Date: 7/6/2019
 """
 
+import csv
+import io
+import json
 from datetime import datetime
+from typing import Iterator, List, Optional, Set, Tuple
 
 from flask import (
     Blueprint,
@@ -15,20 +19,66 @@ from flask import (
     url_for,
     Response,
     current_app,
+    stream_with_context,
 )
 from flasgger import swag_from
+from defusedxml import DefusedXmlException
+from defusedxml.ElementTree import ParseError
 
 from decorators import auth_required
 from dao.logDao import LogDao
 from dao.commentDao import CommentDao
+from dao.groupMemberDao import GroupMemberDao
+from dao.typeDao import TypeDao
+from dao.userDao import UserDao
+from model.GroupMember import GroupMember
 from model.Log import Log
+from model.User import User
 from model.LogData import LogData
 from model.CommentData import CommentData
-from utils.logs import to_miles, calculate_mile_pace
+from utils.logs import to_miles, calculate_mile_pace, is_valid_time, is_too_long_time
+from utils.logsBatch import normalize_logs
+from utils.activityImport import parse_activities
 from utils.jwt import get_claims
 
 log_route = Blueprint("log_route", __name__, url_prefix="/v2/logs")
 
+# The maximum number of exercise logs created in a single batch request.
+MAX_BATCH_SIZE = 1000
+
+NDJSON_MIMETYPES = {"application/x-ndjson", "application/ndjson"}
+METRICS = {"miles", "kilometers", "meters"}
+
+# Formats of activity files which can be imported, and the feel of imported exercise logs if the file doesn't have one.
+ACTIVITY_FORMATS = {"gpx", "tcx", "csv"}
+ACTIVITY_MIMETYPES = {
+    "application/gpx+xml": "gpx",
+    "application/vnd.garmin.tcx+xml": "tcx",
+    "text/csv": "csv",
+    "application/vnd.ant.fit": "fit",
+}
+DEFAULT_IMPORT_FEEL = 6
+
+# Formats of exercise log exports, and the columns in the order they are exported.
+EXPORT_FORMATS = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+EXPORT_COLUMNS = [
+    "log_id",
+    "username",
+    "first",
+    "last",
+    "name",
+    "location",
+    "date",
+    "type",
+    "distance",
+    "metric",
+    "miles",
+    "time",
+    "pace",
+    "feel",
+    "description",
+]
+
 
 @log_route.route("", methods=["GET", "POST"])
 @auth_required()
@@ -110,6 +160,51 @@ def log_soft_with_id(log_id) -> Response:
     return abort(404)
 
 
+@log_route.route("/batch", methods=["POST"])
+@auth_required()
+@swag_from("swagger/logRoute/logBatchPost.yml", methods=["POST"])
+def logs_batch() -> Response:
+    """
+    Endpoint for creating many exercise logs at once.
+    :return: JSON representation of the result of creating each exercise log.
+    """
+    if request.method == "POST":
+        """[POST] /v2/logs/batch"""
+        return logs_batch_post()
+
+    return abort(404)
+
+
+@log_route.route("/import", methods=["POST"])
+@auth_required()
+@swag_from("swagger/logRoute/logImportPost.yml", methods=["POST"])
+def logs_import() -> Response:
+    """
+    Endpoint for creating exercise logs from GPX, TCX, and CSV activity files.
+    :return: JSON with the result of each exercise log in the files.
+    """
+    if request.method == "POST":
+        """[POST] /v2/logs/import"""
+        return logs_import_post()
+
+    return abort(404)
+
+
+@log_route.route("/export", methods=["GET"])
+@auth_required()
+@swag_from("swagger/logRoute/logExportGet.yml", methods=["GET"])
+def logs_export() -> Response:
+    """
+    Endpoint for exporting exercise logs as NDJSON or CSV.
+    :return: A streamed response with one exercise log per line.
+    """
+    if request.method == "GET":
+        """[GET] /v2/logs/export"""
+        return logs_export_get()
+
+    return abort(404)
+
+
 @log_route.route("/links", methods=["GET"])
 @swag_from("swagger/logRoute/logLinks.yml", methods=["GET"])
 def log_links() -> Response:
@@ -249,11 +344,9 @@ def logs_post() -> Response:
     log_to_add.deleted_user = None
     log_to_add.deleted = False
 
-    log_added_successfully = LogDao.add_log(new_log=log_to_add)
-
-    if log_added_successfully:
-        log_added: Log = LogDao.get_log_by_id(log_id=log_to_add.log_id)
+    log_added: Optional[Log] = LogDao.add_log(new_log=log_to_add)
 
+    if log_added is not None:
         log_dict: dict = LogData(log_added).__dict__
 
         if log_dict.get("date") is not None:
@@ -279,6 +372,170 @@ def logs_post() -> Response:
     return response
 
 
+def logs_batch_post() -> Response:
+    """
+    Create many exercise logs in a single transaction.  The request body is either a JSON array of logs or newline
+    delimited JSON (NDJSON) with one log per line.  Valid logs are created even if other logs in the request are
+    invalid, and the result for each log is returned in the order they were sent.
+    :return: A response object for the POST API request.
+    """
+    logs_data, error = parse_log_batch()
+
+    if error is not None:
+        response = jsonify(
+            {
+                "self": "/v2/logs/batch",
+                "added": 0,
+                "failed": 0,
+                "results": None,
+                "error": error,
+            }
+        )
+        response.status_code = 400
+        return response
+
+    jwt_claims: dict = get_claims(request)
+    jwt_username = jwt_claims.get("sub")
+
+    return add_log_batch(logs_data, jwt_username, self_link="/v2/logs/batch")
+
+
+def logs_import_post() -> Response:
+    """
+    Create exercise logs from activity files exported by GPS watches and exercise apps.  Files are either uploaded
+    as multipart form data, with the format taken from each file's extension, or sent as the request body with the
+    format in the 'format' query parameter or the Content-Type header.  Each track in a GPX file, activity in a TCX file,
+    and row in a CSV file becomes an exercise log.
+    :return: A response object for the POST API request.
+    """
+    jwt_claims: dict = get_claims(request)
+    jwt_username = jwt_claims.get("sub")
+
+    def error_response(error: str) -> Response:
+        response = jsonify(
+            {
+                "self": "/v2/logs/import",
+                "added": 0,
+                "failed": 0,
+                "results": None,
+                "error": error,
+            }
+        )
+        response.status_code = 400
+        return response
+
+    files, error = get_activity_files()
+
+    if error is not None:
+        return error_response(error)
+
+    user: User = UserDao.get_user_by_username(username=jwt_username)
+    exercise_type = request.args.get("type")
+    feel = request.args.get("feel", default=DEFAULT_IMPORT_FEEL, type=int)
+
+    logs_data = []
+
+    for filename, stream, file_format in files:
+        try:
+            for log_data in parse_activities(stream, file_format, exercise_type):
+                log_data["username"] = jwt_username
+                log_data["first"] = user.first if user else None
+                log_data["last"] = user.last if user else None
+
+                if log_data.get("feel") is None:
+                    log_data["feel"] = feel
+
+                logs_data.append(log_data)
+
+                if len(logs_data) > MAX_BATCH_SIZE:
+                    return error_response(
+                        f"an import can contain at most {MAX_BATCH_SIZE} exercise logs"
+                    )
+        except (ParseError, DefusedXmlException, UnicodeDecodeError, csv.Error):
+            current_app.logger.info(f"Unable to parse the activity file {filename}")
+            return error_response(
+                f"unable to parse the {file_format.upper()} file {filename}"
+            )
+
+    if len(logs_data) == 0:
+        return error_response("the files don't contain any activities")
+
+    return add_log_batch(logs_data, jwt_username, self_link="/v2/logs/import")
+
+
+def logs_export_get() -> Response:
+    """
+    Export exercise logs for a user or group, optionally within a date range.  Logs are read from a server-side
+    cursor and written to the response as they are read, so memory use doesn't depend on the number of logs exported.
+    Only accepted members of a group can export its exercise logs.
+    :return: A streamed response for the GET API request.
+    """
+    username = request.args.get("username")
+    group_id = request.args.get("group_id", type=int)
+    start = request.args.get("start")
+    end = request.args.get("end")
+    file_format = request.args.get("format", default="ndjson")
+
+    error = None
+
+    if username is None and group_id is None:
+        error = "either 'username' or 'group_id' is required"
+
+    if file_format not in EXPORT_FORMATS:
+        error = "'format' must be either ndjson or csv"
+
+    for date in [start, end]:
+        if date is not None:
+            try:
+                datetime.strptime(date, "%Y-%m-%d")
+            except ValueError:
+                error = "'start' and 'end' must be formatted as YYYY-MM-DD"
+
+    if error is not None:
+        response = jsonify({"self": "/v2/logs/export", "error": error})
+        response.status_code = 400
+        return response
+
+    if group_id is not None:
+        jwt_claims: dict = get_claims(request)
+        jwt_username = jwt_claims.get("sub")
+
+        membership: GroupMember = GroupMemberDao.get_group_member(
+            group_id=group_id, username=jwt_username
+        )
+
+        if membership is None or membership.status != "accepted":
+            current_app.logger.info(
+                f"User {jwt_username} is not authorized to export the exercise logs of group {group_id}."
+            )
+            response = jsonify(
+                {
+                    "self": "/v2/logs/export",
+                    "error": f"User {jwt_username} is not authorized to export the exercise logs of group "
+                    f"{group_id}.",
+                }
+            )
+            response.status_code = 403
+            return response
+
+    current_app.logger.info(
+        f"Exporting exercise logs as {file_format} (username: {username}, group_id: {group_id}, start: {start}, "
+        f"end: {end})"
+    )
+
+    rows = LogDao.stream_logs(
+        username=username, group_id=group_id, start=start, end=end
+    )
+
+    response = Response(
+        stream_with_context(export_logs(rows, file_format)),
+        mimetype=EXPORT_FORMATS[file_format],
+    )
+    response.headers["Content-Disposition"] = f"attachment; filename=logs.{file_format}"
+    response.status_code = 200
+    return response
+
+
 def log_by_id_get(log_id) -> Response:
     """
     Get a single exercise log based on a unique ID.
@@ -379,11 +636,9 @@ def log_by_id_put(log_id) -> Response:
         new_log.modified_date = datetime.now()
         new_log.modified_app = "saints-xctf-api"
 
-        is_updated: bool = LogDao.update_log(new_log)
-
-        if is_updated:
-            updated_log: Log = LogDao.get_log_by_id(log_id=new_log.log_id)
+        updated_log: Optional[Log] = LogDao.update_log(new_log)
 
+        if updated_log is not None:
             log_dict: dict = LogData(updated_log).__dict__
 
             if log_dict.get("date") is not None:
@@ -614,6 +869,21 @@ def log_links_get() -> Response:
                     "verb": "POST",
                     "description": "Create a new exercise log.",
                 },
+                {
+                    "link": "/v2/logs/batch",
+                    "verb": "POST",
+                    "description": "Create many exercise logs in a single request.",
+                },
+                {
+                    "link": "/v2/logs/import",
+                    "verb": "POST",
+                    "description": "Create exercise logs from GPX, TCX, and CSV activity files.",
+                },
+                {
+                    "link": "/v2/logs/export",
+                    "verb": "GET",
+                    "description": "Export the exercise logs of a user, group, or date range as NDJSON or CSV.",
+                },
                 {
                     "link": "/v2/logs/<log_id>",
                     "verb": "GET",
@@ -639,3 +909,257 @@ def log_links_get() -> Response:
     )
     response.status_code = 200
     return response
+
+
+"""
+Helper Methods
+"""
+
+
+def add_log_batch(logs_data: list, jwt_username: str, self_link: str) -> Response:
+    """
+    Validate exercise logs and create the valid ones in a single transaction.
+    :param logs_data: Exercise logs from the request.
+    :param jwt_username: Username of the user making the request.
+    :param self_link: Link to the endpoint which received the request.
+    :return: A response object with the result of each exercise log, in the order they were given.
+    """
+    exercise_types = {exercise_type.type for exercise_type in TypeDao.get_types()}
+    now = datetime.now()
+
+    logs_to_add: List[Log] = []
+    added_results = []
+    results = []
+
+    for index, log_data in enumerate(logs_data):
+        error = validate_batch_log(log_data, jwt_username, exercise_types)
+
+        if error is not None:
+            results.append({"index": index, "added": False, "error": error})
+            continue
+
+        log_to_add: Log = Log(log_data)
+        log_to_add.time_created = now
+        log_to_add.created_date = now
+        log_to_add.created_app = "saints-xctf-api"
+        log_to_add.created_user = None
+        log_to_add.deleted = False
+
+        logs_to_add.append(log_to_add)
+        added_results.append({"index": index, "added": True, "date": log_to_add.date})
+        results.append(added_results[-1])
+
+    # Compute pace and miles based on time, metric, and distance for all the logs at once
+    normalize_logs(logs_to_add)
+
+    current_app.logger.info(
+        f"User {jwt_username} is uploading {len(logs_to_add)} exercise logs."
+    )
+
+    log_ids: Optional[List[int]] = LogDao.add_logs(new_logs=logs_to_add)
+
+    if log_ids is None:
+        for result in added_results:
+            result["added"] = False
+            result["error"] = "failed to create the log"
+
+        response = jsonify(
+            {
+                "self": self_link,
+                "added": 0,
+                "failed": len(results),
+                "results": results,
+                "error": "failed to create the logs",
+            }
+        )
+        response.status_code = 500
+        return response
+
+    for result, log_id in zip(added_results, log_ids):
+        result["log_id"] = log_id
+
+    response = jsonify(
+        {
+            "self": self_link,
+            "added": len(logs_to_add),
+            "failed": len(results) - len(logs_to_add),
+            "results": results,
+        }
+    )
+    response.status_code = 200 if len(logs_to_add) > 0 else 400
+    return response
+
+
+def parse_log_batch() -> Tuple[Optional[list], Optional[str]]:
+    """
+    Parse the exercise logs in the body of a batch request.
+    :return: A list of exercise logs, or an error message if the request body isn't a valid batch.
+    """
+    if request.mimetype in NDJSON_MIMETYPES:
+        logs_data = []
+        for line in request.get_data(as_text=True).splitlines():
+            if not line.strip():
+                continue
+
+            try:
+                logs_data.append(json.loads(line))
+            except ValueError:
+                logs_data.append(None)
+    else:
+        logs_data = request.get_json(silent=True)
+
+        if not isinstance(logs_data, list):
+            return (
+                None,
+                "the request body must be a JSON array or NDJSON of exercise logs",
+            )
+
+    if len(logs_data) == 0:
+        return None, "the request body doesn't contain any exercise logs"
+
+    if len(logs_data) > MAX_BATCH_SIZE:
+        return None, f"a batch can contain at most {MAX_BATCH_SIZE} exercise logs"
+
+    return logs_data, None
+
+
+def validate_batch_log(
+    log_data, username: str, exercise_types: Set[str]
+) -> Optional[str]:
+    """
+    Validate an exercise log in a batch request.
+    :param log_data: An exercise log from the request body.
+    :param username: Username of the user making the request.
+    :param exercise_types: Valid types of exercise.
+    :return: An error message, or None if the exercise log is valid.
+    """
+    if not isinstance(log_data, dict):
+        return "the exercise log must be a JSON object"
+
+    if None in [
+        log_data.get("username"),
+        log_data.get("first"),
+        log_data.get("last"),
+        log_data.get("date"),
+        log_data.get("type"),
+        log_data.get("feel"),
+    ]:
+        return "'username', 'first', 'last', 'date', 'type', and 'feel' are required fields"
+
+    if log_data.get("username") != username:
+        return f"User {username} is not authorized to upload an exercise log for user {log_data.get('username')}."
+
+    try:
+        datetime.strptime(str(log_data.get("date")), "%Y-%m-%d")
+    except ValueError:
+        return "'date' must be formatted as YYYY-MM-DD"
+
+    if log_data.get("type") not in exercise_types:
+        return f"'{log_data.get('type')}' is not a valid exercise type"
+
+    feel = log_data.get("feel")
+    if not isinstance(feel, int) or isinstance(feel, bool) or not 1 <= feel <= 10:
+        return "'feel' must be an integer between 1 and 10"
+
+    distance = log_data.get("distance")
+    if distance is not None and (
+        not isinstance(distance, (int, float))
+        or isinstance(distance, bool)
+        or distance < 0
+    ):
+        return "'distance' must be a non-negative number"
+
+    if log_data.get("metric") is not None and log_data.get("metric") not in METRICS:
+        return "'metric' must be one of miles, kilometers, or meters"
+
+    if is_too_long_time(log_data.get("time")):
+        return "'time' can't be longer than 99:59:59"
+
+    if log_data.get("time") is not None and not is_valid_time(log_data.get("time")):
+        return "'time' must be formatted as HH:MM:SS, MM:SS, or SS"
+
+    return None
+
+
+def get_activity_files() -> Tuple[List[tuple], Optional[str]]:
+    """
+    Find the activity files in an import request.  Uploaded files are streamed from temporary storage rather than
+    read into memory.
+    :return: A list of (filename, stream, format) tuples, or an error message if the files can't be imported.
+    """
+    if request.files:
+        files = []
+        for upload in request.files.getlist("file"):
+            filename = upload.filename or "file"
+            extension = filename.rsplit(".", 1)[-1].lower() if "." in filename else None
+            file_format = request.args.get("format") or extension
+
+            if file_format == "fit":
+                return (
+                    [],
+                    "FIT files aren't supported, export the activity as a GPX or TCX file instead",
+                )
+
+            if file_format not in ACTIVITY_FORMATS:
+                return [], f"{filename} isn't a GPX, TCX, or CSV file"
+
+            files.append((filename, upload.stream, file_format))
+
+        if len(files) == 0:
+            return [], "activity files must be uploaded in the 'file' field"
+
+        return files, None
+
+    file_format = request.args.get("format") or ACTIVITY_MIMETYPES.get(request.mimetype)
+
+    if file_format == "fit":
+        return (
+            [],
+            "FIT files aren't supported, export the activity as a GPX or TCX file instead",
+        )
+
+    if file_format not in ACTIVITY_FORMATS:
+        return (
+            [],
+            "the request must contain a GPX, TCX, or CSV file.  Use the 'format' query parameter or Content-Type header "
+            "to specify the format of the request body",
+        )
+
+    return [("body", request.stream, file_format)], None
+
+
+def export_logs(rows, file_format: str) -> Iterator[str]:
+    """
+    Write exercise logs as NDJSON or CSV.  Rows are written in chunks to avoid sending many small writes to the
+    client.
+    :param rows: The result of a query for exercise logs.
+    :param file_format: Either 'ndjson' or 'csv'.
+    :return: A generator of chunks of the exported file.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    if file_format == "csv":
+        writer.writerow(EXPORT_COLUMNS)
+
+    for partition in rows.partitions():
+        for row in partition:
+            log = {column: row[column] for column in EXPORT_COLUMNS}
+
+            for column in ["date", "time", "pace"]:
+                if log.get(column) is not None:
+                    log[column] = str(log[column])
+
+            if file_format == "csv":
+                writer.writerow([log.get(column) for column in EXPORT_COLUMNS])
+            else:
+                buffer.write(json.dumps(log))
+                buffer.write("\n")
+
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    remaining = buffer.getvalue()
+    if remaining:
+        yield remaining
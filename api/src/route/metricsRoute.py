@@ -0,0 +1,85 @@
+"""
+Metrics routes in the SaintsXCTF API.  Used to monitor the health of API workers.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+from flask import Blueprint, Response, abort, request, jsonify
+from flasgger import swag_from
+
+from database import db
+from decorators import auth_required
+from utils.pool import pool_status
+
+metrics_route = Blueprint("metrics_route", __name__, url_prefix="/v2/metrics")
+
+
+@metrics_route.route("/pool", methods=["GET"])
+@auth_required()
+@swag_from("swagger/metricsRoute/poolGet.yml", methods=["GET"])
+def pool() -> Response:
+    """
+    Endpoint for the state of the database connection pool in the worker handling the request.
+    :return: JSON representation of connection pool configuration, state, and metrics.
+    """
+    if request.method == "GET":
+        """[GET] /v2/metrics/pool"""
+        return pool_get()
+
+    return abort(404)
+
+
+@metrics_route.route("/links", methods=["GET"])
+@swag_from("swagger/metricsRoute/metricsLinks.yml", methods=["GET"])
+def metrics_links() -> Response:
+    """
+    Endpoint for information about the metrics API endpoints.
+    :return: Metadata about the metrics API.
+    """
+    if request.method == "GET":
+        """[GET] /v2/metrics/links"""
+        return metrics_links_get()
+
+    return abort(404)
+
+
+def pool_get() -> Response:
+    """
+    Retrieve the state of the database connection pools for the primary database and any read replicas.  Each uWSGI
+    worker has its own pools, so the response includes the process id of the worker.
+    :return: A response object for the GET API request.
+    """
+    response = jsonify(
+        {
+            "self": "/v2/metrics/pool",
+            "pool": pool_status(db.engine),
+            "replicas": {
+                key: pool_status(engine)
+                for key, engine in db.engines.items()
+                if key is not None
+            },
+        }
+    )
+    response.status_code = 200
+    return response
+
+
+def metrics_links_get() -> Response:
+    """
+    Get all the other metrics API endpoints.
+    :return: A response object for the GET API request
+    """
+    response = jsonify(
+        {
+            "self": "/v2/metrics/links",
+            "endpoints": [
+                {
+                    "link": "/v2/metrics/pool",
+                    "verb": "GET",
+                    "description": "Get the state of the database connection pool in an API worker.",
+                }
+            ],
+        }
+    )
+    response.status_code = 200
+    return response
@@ -6,6 +6,7 @@ Date: 8/6/2019
 """
 
 from datetime import datetime
+from typing import Optional
 
 from flask import (
     Blueprint,
@@ -23,12 +24,17 @@ from decorators import auth_required
 from utils.jwt import get_claims
 from model.Notification import Notification
 from model.NotificationData import NotificationData
+from model.GroupMember import GroupMember
 from dao.notificationDao import NotificationDao
+from dao.groupMemberDao import GroupMemberDao
 
 notification_route = Blueprint(
     "notification_route", __name__, url_prefix="/v2/notifications"
 )
 
+# The maximum number of notifications marked as viewed by id in a single request.
+MAX_BULK_NOTIFICATIONS = 1000
+
 
 @notification_route.route("", methods=["GET", "POST"])
 @auth_required()
@@ -110,6 +116,37 @@ def notification_soft_by_id(notification_id) -> Response:
     return abort(404)
 
 
+@notification_route.route("/viewed", methods=["PUT"])
+@auth_required()
+@swag_from("swagger/notificationRoute/notificationsViewedPut.yml", methods=["PUT"])
+def notifications_viewed() -> Response:
+    """
+    Endpoint for marking many of a user's notifications as viewed.
+    :return: JSON with the number of notifications marked as viewed.
+    """
+    if request.method == "PUT":
+        """[PUT] /v2/notifications/viewed"""
+        return notifications_viewed_put()
+
+    return abort(404)
+
+
+@notification_route.route("/group/<group_id>", methods=["POST"])
+@auth_required()
+@swag_from("swagger/notificationRoute/notificationGroupPost.yml", methods=["POST"])
+def notifications_group(group_id) -> Response:
+    """
+    Endpoint for sending a notification to every member of a group.
+    :param group_id: Unique id which identifies a group.
+    :return: JSON with the users who were sent the notification.
+    """
+    if request.method == "POST":
+        """[POST] /v2/notifications/group/<group_id>"""
+        return notifications_group_post(group_id)
+
+    return abort(404)
+
+
 @notification_route.route("/links", methods=["GET"])
 @swag_from("swagger/notificationRoute/notificationLinks.yml", methods=["GET"])
 def notification_links() -> Response:
@@ -202,14 +239,11 @@ def notification_post() -> Response:
     notification_to_add.deleted_user = None
     notification_to_add.deleted = False
 
-    notification_added_successfully = NotificationDao.add_notification(
+    notification_added: Optional[Notification] = NotificationDao.add_notification(
         new_notification=notification_to_add
     )
 
-    if notification_added_successfully:
-        notification_added = NotificationDao.get_notification_by_id(
-            notification_to_add.notification_id
-        )
+    if notification_added is not None:
         notification_dict = NotificationData(notification_added).__dict__
         notification_dict["time"] = str(notification_dict["time"])
 
@@ -235,6 +269,204 @@ def notification_post() -> Response:
     return response
 
 
+def notifications_viewed_put() -> Response:
+    """
+    Mark many of the current user's notifications as viewed.  The request body contains either a list of
+    notification ids or a time, in which case every notification sent at or before that time is marked as viewed.
+    :return: A response object for the PUT API request.
+    """
+    body: dict = request.get_json(silent=True)
+
+    def error_response(error: str) -> Response:
+        response = jsonify(
+            {
+                "self": "/v2/notifications/viewed",
+                "updated": False,
+                "viewed": 0,
+                "error": error,
+            }
+        )
+        response.status_code = 400
+        return response
+
+    if not isinstance(body, dict) or (
+        body.get("notification_ids") is None and body.get("before") is None
+    ):
+        return error_response("either 'notification_ids' or 'before' is required")
+
+    notification_ids = body.get("notification_ids")
+    before = None
+
+    if notification_ids is not None:
+        if not isinstance(notification_ids, list) or not all(
+            isinstance(notification_id, int) and not isinstance(notification_id, bool)
+            for notification_id in notification_ids
+        ):
+            return error_response("'notification_ids' must be a list of integers")
+
+        if len(notification_ids) > MAX_BULK_NOTIFICATIONS:
+            return error_response(
+                f"at most {MAX_BULK_NOTIFICATIONS} notifications can be marked as viewed at once"
+            )
+    else:
+        try:
+            before = datetime.fromisoformat(str(body.get("before")))
+        except ValueError:
+            return error_response(
+                "'before' must be formatted as YYYY-MM-DD or YYYY-MM-DD HH:MM:SS"
+            )
+
+    jwt_claims: dict = get_claims(request)
+    jwt_username = jwt_claims.get("sub")
+
+    viewed = NotificationDao.mark_viewed(
+        username=jwt_username, notification_ids=notification_ids, before=before
+    )
+
+    if viewed is None:
+        response = jsonify(
+            {
+                "self": "/v2/notifications/viewed",
+                "updated": False,
+                "viewed": 0,
+                "error": "failed to mark the notifications as viewed",
+            }
+        )
+        response.status_code = 500
+        return response
+
+    current_app.logger.info(
+        f"User {jwt_username} marked {viewed} notifications as viewed."
+    )
+
+    response = jsonify(
+        {
+            "self": "/v2/notifications/viewed",
+            "updated": True,
+            "viewed": viewed,
+            "unread": NotificationDao.get_unread_count(username=jwt_username),
+        }
+    )
+    response.status_code = 200
+    return response
+
+
+def notifications_group_post(group_id) -> Response:
+    """
+    Send a notification to every accepted member of a group, except for the user sending it.  The notifications are
+    created in a single transaction.
+    :param group_id: Unique id which identifies a group.
+    :return: A response object for the POST API request.
+    """
+    group_id = int(group_id)
+    notification_data: dict = request.get_json(silent=True)
+
+    if not isinstance(notification_data, dict) or not notification_data.get(
+        "description"
+    ):
+        response = jsonify(
+            {
+                "self": f"/v2/notifications/group/{group_id}",
+                "added": 0,
+                "usernames": None,
+                "error": "'description' is a required field",
+            }
+        )
+        response.status_code = 400
+        return response
+
+    exclude = notification_data.get("exclude") or []
+
+    if not isinstance(exclude, list) or not all(
+        isinstance(username, str) for username in exclude
+    ):
+        response = jsonify(
+            {
+                "self": f"/v2/notifications/group/{group_id}",
+                "added": 0,
+                "usernames": None,
+                "error": "'exclude' must be a list of usernames",
+            }
+        )
+        response.status_code = 400
+        return response
+
+    jwt_claims: dict = get_claims(request)
+    jwt_username = jwt_claims.get("sub")
+
+    membership: GroupMember = GroupMemberDao.get_group_member(
+        group_id=group_id, username=jwt_username
+    )
+
+    if membership is None or membership.status != "accepted":
+        current_app.logger.info(
+            f"User {jwt_username} is not authorized to notify the members of group {group_id}."
+        )
+        response = jsonify(
+            {
+                "self": f"/v2/notifications/group/{group_id}",
+                "added": 0,
+                "usernames": None,
+                "error": f"User {jwt_username} is not authorized to notify the members of group {group_id}.",
+            }
+        )
+        response.status_code = 403
+        return response
+
+    excluded = set(exclude)
+    excluded.add(jwt_username)
+
+    usernames = [
+        member["username"]
+        for member in GroupMemberDao.get_group_members_by_id(group_id=group_id)
+        if member["status"] == "accepted" and member["username"] not in excluded
+    ]
+
+    now = datetime.now()
+    notifications_to_add = []
+
+    for username in usernames:
+        notification_to_add = Notification(
+            {
+                "username": username,
+                "time": now,
+                "link": notification_data.get("link"),
+                "viewed": "N",
+                "description": notification_data.get("description"),
+                "deleted": False,
+                "created_date": now,
+                "created_app": "saints-xctf-api",
+            }
+        )
+        notifications_to_add.append(notification_to_add)
+
+    if not NotificationDao.add_notifications(new_notifications=notifications_to_add):
+        response = jsonify(
+            {
+                "self": f"/v2/notifications/group/{group_id}",
+                "added": 0,
+                "usernames": None,
+                "error": "failed to create the notifications",
+            }
+        )
+        response.status_code = 500
+        return response
+
+    current_app.logger.info(
+        f"User {jwt_username} notified {len(usernames)} members of group {group_id}."
+    )
+
+    response = jsonify(
+        {
+            "self": f"/v2/notifications/group/{group_id}",
+            "added": len(usernames),
+            "usernames": usernames,
+        }
+    )
+    response.status_code = 200
+    return response
+
+
 def notification_by_id_get(notification_id) -> Response:
     """
     Retrieve a notification based on its identifier.
@@ -526,6 +758,16 @@ def notification_links_get() -> Response:
                     "verb": "POST",
                     "description": "Create a new user notification.",
                 },
+                {
+                    "link": "/v2/notifications/viewed",
+                    "verb": "PUT",
+                    "description": "Mark many of a user's notifications as viewed.",
+                },
+                {
+                    "link": "/v2/notifications/group/<group_id>",
+                    "verb": "POST",
+                    "description": "Send a notification to every member of a group.",
+                },
                 {
                     "link": "/v2/notifications/<notification_id>",
                     "verb": "GET",
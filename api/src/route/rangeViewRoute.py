@@ -4,15 +4,26 @@ Author: Andrew Jarombek
 Date: 8/3/2019
 """
 
+from typing import List
+
 from flask import Blueprint, abort, request, jsonify, Response
 from flasgger import swag_from
 
 from decorators import auth_required
+from dao.groupDao import GroupDao
 from dao.logDao import LogDao
-from utils import exerciseFilters
+from dao.userDao import UserDao
+from utils import dates, exerciseFilters
+from utils.cursors import encode_cursor, decode_cursor
 
 range_view_route = Blueprint("range_view_route", __name__, url_prefix="/v2/range_view")
 
+# The default and maximum number of users on a page of a comparison range view.
+COMPARE_PAGE_SIZE = 20
+
+# The maximum number of users which can be compared across all pages.
+MAX_COMPARE_USERS = 100
+
 
 @range_view_route.route(
     "/<filter_by>/<bucket>/<exercise_types>/<start>/<end>", methods=["GET"]
@@ -32,7 +43,28 @@ def range_view(filter_by, bucket, exercise_types, start, end):
     """
     if request.method == "GET":
         """[GET] /v2/range_view"""
-        return range_view_get(filter_by, bucket, exercise_types, start, end)
+        granularity = request.args.get("granularity", "day")
+        return range_view_get(
+            filter_by, bucket, exercise_types, start, end, granularity
+        )
+
+    return abort(404)
+
+
+@range_view_route.route("/compare/<exercise_types>/<start>/<end>", methods=["GET"])
+@auth_required()
+@swag_from("swagger/rangeViewRoute/rangeViewCompareGet.yml", methods=["GET"])
+def range_view_compare(exercise_types, start, end):
+    """
+    Endpoint for comparing log information of many users over a date range.
+    :param exercise_types: A string representing the types of exercises to include in the range view.
+    :param start: The first date to include in the range view.
+    :param end: The last date to include in the range view.
+    :return: JSON representation of range views for each user and relevant metadata.
+    """
+    if request.method == "GET":
+        """[GET] /v2/range_view/compare"""
+        return range_view_compare_get(exercise_types, start, end)
 
     return abort(404)
 
@@ -51,7 +83,9 @@ def range_view_links() -> Response:
     return abort(404)
 
 
-def range_view_get(filter_by, bucket, exercise_types, start, end) -> Response:
+def range_view_get(  # pylint: disable=too-many-arguments
+    filter_by, bucket, exercise_types, start, end, granularity="day"
+) -> Response:
     """
     Get a list of range view objects based on certain filters.
     :param filter_by: The first filtering mechanism for the logs in the feed.  You can filter by group (group_name)
@@ -60,23 +94,66 @@ def range_view_get(filter_by, bucket, exercise_types, start, end) -> Response:
     :param exercise_types: A string representing the types of exercises to include in the feed.
     :param start: The first date to include in the exercise log feed.
     :param end: The last date to include in the exercise log feed.
+    :param granularity: The length of time that each range view object covers: 'day', 'week', 'month', or 'year'.
+    Weeks start on the user's or group's preferred first day of the week.
     :return: A response object for the GET API request.
     """
+    self_link = f"/v2/range_view/{filter_by}/{bucket}/{exercise_types}/{start}/{end}"
+
+    if granularity != "day":
+        self_link += f"?granularity={granularity}"
+
+    if granularity not in dates.GRANULARITIES:
+        response = jsonify(
+            {
+                "self": self_link,
+                "range_view": None,
+                "error": "'granularity' must be one of 'day', 'week', 'month', or 'year'",
+            }
+        )
+        response.status_code = 400
+        return response
+
     exercise_type_filter_list = exerciseFilters.create_exercise_filter_list(
         exercise_types
     )
 
     if filter_by in {"group", "groups"}:
+        week_start = "monday"
+
+        if granularity == "week":
+            group = GroupDao.get_group_by_id(group_id=int(bucket))
+            week_start = group.week_start if group and group.week_start else "monday"
+
         range_view_data = LogDao.get_group_range_view(
-            group_id=int(bucket), types=exercise_type_filter_list, start=start, end=end
+            group_id=int(bucket),
+            types=exercise_type_filter_list,
+            start=start,
+            end=end,
+            granularity=granularity,
+            week_start=week_start,
         )
     elif filter_by in {"user", "users"}:
+        week_start = "monday"
+
+        if granularity == "week":
+            user = UserDao.get_user_by_username(username=bucket)
+            week_start = user.week_start if user and user.week_start else "monday"
+
         range_view_data = LogDao.get_user_range_view(
-            username=bucket, types=exercise_type_filter_list, start=start, end=end
+            username=bucket,
+            types=exercise_type_filter_list,
+            start=start,
+            end=end,
+            granularity=granularity,
+            week_start=week_start,
         )
     elif filter_by == "all":
         range_view_data = LogDao.get_range_view(
-            types=exercise_type_filter_list, start=start, end=end
+            types=exercise_type_filter_list,
+            start=start,
+            end=end,
+            granularity=granularity,
         )
     else:
         range_view_data = None
@@ -84,7 +161,7 @@ def range_view_get(filter_by, bucket, exercise_types, start, end) -> Response:
     if range_view_data is None or range_view_data.rowcount == 0:
         response = jsonify(
             {
-                "self": f"/v2/range_view/{filter_by}/{bucket}/{exercise_types}/{start}/{end}",
+                "self": self_link,
                 "range_view": [],
                 "message": "no logs found in this date range with the selected filters",
             }
@@ -100,7 +177,7 @@ def range_view_get(filter_by, bucket, exercise_types, start, end) -> Response:
 
     response = jsonify(
         {
-            "self": f"/v2/range_view/{filter_by}/{bucket}/{exercise_types}/{start}/{end}",
+            "self": self_link,
             "range_view": range_view_list,
         }
     )
@@ -108,6 +185,181 @@ def range_view_get(filter_by, bucket, exercise_types, start, end) -> Response:
     return response
 
 
+def range_view_compare_get(exercise_types, start, end) -> Response:
+    """
+    Get range views for many users, aligned to the same dates.  Users are either given in the 'usernames' query
+    parameter (a comma separated list) or are the 'top' members of the group with the 'group_id' query parameter who
+    exercised the most miles in the date range.  Users are returned in pages of at most 20, and the range views for a
+    page come from a single query.
+    :param exercise_types: A string representing the types of exercises to include in the range view.
+    :param start: The first date to include in the range view.
+    :param end: The last date to include in the range view.
+    :return: A response object for the GET API request.
+    """
+    usernames_param = request.args.get("usernames")
+    group_id = request.args.get("group_id", type=int)
+    top = request.args.get("top", type=int)
+    granularity = request.args.get("granularity", "day")
+    week_start = request.args.get("week_start")
+    limit = min(
+        max(request.args.get("limit", COMPARE_PAGE_SIZE, type=int), 1),
+        COMPARE_PAGE_SIZE,
+    )
+    cursor = request.args.get("cursor")
+
+    self_link = f"/v2/range_view/compare/{exercise_types}/{start}/{end}"
+    query = {
+        "usernames": usernames_param,
+        "group_id": group_id,
+        "top": top,
+        "granularity": granularity if granularity != "day" else None,
+        "week_start": week_start,
+        "limit": limit,
+    }
+    query_string = "&".join(
+        f"{key}={value}" for key, value in query.items() if value is not None
+    )
+
+    def error_response(error: str) -> Response:
+        response = jsonify(
+            {
+                "self": f"{self_link}?{query_string}",
+                "next": None,
+                "dates": None,
+                "users": None,
+                "error": error,
+            }
+        )
+        response.status_code = 400
+        return response
+
+    if (usernames_param is None) == (group_id is None):
+        return error_response(
+            "either the 'usernames' or 'group_id' query parameter is required"
+        )
+
+    if granularity not in dates.GRANULARITIES:
+        return error_response(
+            "'granularity' must be one of 'day', 'week', 'month', or 'year'"
+        )
+
+    if week_start not in {None, "monday", "sunday"}:
+        return error_response("'week_start' must be either 'monday' or 'sunday'")
+
+    exercise_type_filter_list = exerciseFilters.create_exercise_filter_list(
+        exercise_types
+    )
+
+    if usernames_param is not None:
+        usernames = sorted(
+            {username for username in usernames_param.split(",") if username}
+        )
+
+        if len(usernames) == 0 or len(usernames) > MAX_COMPARE_USERS:
+            return error_response(
+                f"between 1 and {MAX_COMPARE_USERS} usernames can be compared"
+            )
+
+        after = None if cursor is None else decode_cursor(cursor, 1)
+
+        if cursor is not None and after is None:
+            return error_response("the cursor is invalid")
+
+        page = [
+            username for username in usernames if after is None or username > after[0]
+        ][:limit]
+
+        range_view_data = (
+            LogDao.get_users_range_view(
+                usernames=page,
+                types=exercise_type_filter_list,
+                start=start,
+                end=end,
+                granularity=granularity,
+                week_start=week_start or "monday",
+            )
+            if page
+            else []
+        )
+        has_next = len(page) == limit and page[-1] != usernames[-1]
+        next_cursor = encode_cursor(page[-1]) if has_next else None
+    else:
+        if top is None or top < 1 or top > MAX_COMPARE_USERS:
+            return error_response(
+                f"'top' must be between 1 and {MAX_COMPARE_USERS} when comparing a group"
+            )
+
+        after = [0] if cursor is None else decode_cursor(cursor, 1)
+
+        if after is None or not isinstance(after[0], int):
+            return error_response("the cursor is invalid")
+
+        if week_start is None and granularity == "week":
+            group = GroupDao.get_group_by_id(group_id=group_id)
+            week_start = group.week_start if group and group.week_start else None
+
+        range_view_data = LogDao.get_group_leaders_range_view(
+            group_id=group_id,
+            types=exercise_type_filter_list,
+            start=start,
+            end=end,
+            top=top,
+            after=after[0],
+            limit=limit,
+            granularity=granularity,
+            week_start=week_start or "monday",
+        )
+
+        # Members are ranked from the position after the cursor, in the order that their range views are returned.
+        range_view_data = list(range_view_data)
+        page = list(dict.fromkeys(item.username for item in range_view_data))
+
+        last_position = after[0] + len(page)
+        has_next = len(page) == limit and last_position < top
+        next_cursor = encode_cursor(last_position) if has_next else None
+
+    series = {username: {} for username in page}
+
+    for item in range_view_data:
+        series[item.username][item.date] = item
+
+    period_dates: List = sorted(
+        {period for user_series in series.values() for period in user_series}
+    )
+
+    users = [
+        {
+            "username": username,
+            "miles": [
+                series[username][period].miles if period in series[username] else 0
+                for period in period_dates
+            ],
+            "feel": [
+                series[username][period].feel if period in series[username] else None
+                for period in period_dates
+            ],
+        }
+        for username in page
+    ]
+
+    next_link = None
+
+    if next_cursor is not None:
+        next_link = f"{self_link}?{query_string}&cursor={next_cursor}"
+
+    response = jsonify(
+        {
+            "self": f"{self_link}?{query_string}"
+            + (f"&cursor={cursor}" if cursor is not None else ""),
+            "next": next_link,
+            "dates": period_dates,
+            "users": users,
+        }
+    )
+    response.status_code = 200
+    return response
+
+
 def range_view_links_get() -> Response:
     """
     Get all the other range view API endpoints.
@@ -120,8 +372,15 @@ def range_view_links_get() -> Response:
                 {
                     "link": "/v2/range_view/<filter_by>/<bucket>/<exercise_types>/<start>/<end>",
                     "verb": "GET",
-                    "description": "Get a list of range view objects based on certain filters.",
-                }
+                    "description": "Get a list of range view objects based on certain filters.  Use the "
+                    "'granularity' query parameter to get one object per 'week', 'month', or 'year' instead of per day.",
+                },
+                {
+                    "link": "/v2/range_view/compare/<exercise_types>/<start>/<end>",
+                    "verb": "GET",
+                    "description": "Compare the range views of many users, given either as a list of usernames or "
+                    "as the top members of a group.",
+                },
             ],
         }
     )
@@ -26,7 +26,10 @@ from flasgger import swag_from
 from flaskBcrypt import flask_bcrypt
 
 from decorators import auth_required, disabled, DELETE, GET
+from utils.cache import cached
+from utils.cursors import encode_cursor, decode_cursor
 from utils.jwt import get_claims
+from utils.streaks import streak_summary
 from dao.userDao import UserDao
 from dao.groupDao import GroupDao
 from dao.groupMemberDao import GroupMemberDao
@@ -34,6 +37,8 @@ from dao.forgotPasswordDao import ForgotPasswordDao
 from dao.flairDao import FlairDao
 from dao.notificationDao import NotificationDao
 from dao.logDao import LogDao
+from dao.personalRecordDao import PersonalRecordDao
+from dao.streakDao import StreakDao
 from dao.teamMemberDao import TeamMemberDao
 from dao.codeDao import CodeDao
 from dao.activationCodeDao import ActivationCodeDao
@@ -46,9 +51,14 @@ from model.UserData import UserData
 from model.ForgotPassword import ForgotPassword
 from model.Team import Team
 from model.Group import Group
+from model.PersonalRecord import PersonalRecord
 
 user_route = Blueprint("user_route", __name__, url_prefix="/v2/users")
 
+# The default and maximum number of notifications on a page of a user's notification inbox.
+NOTIFICATION_PAGE_SIZE = 50
+MAX_NOTIFICATION_PAGE_SIZE = 200
+
 
 @user_route.route("", methods=["GET", "POST"])
 @auth_required(enabled_methods=[GET])
@@ -216,6 +226,22 @@ def user_notifications(username) -> Response:
     return abort(404)
 
 
+@user_route.route("/notifications/<username>/count", methods=["GET"])
+@auth_required()
+@swag_from("swagger/userRoute/userNotificationCountGet.yml", methods=["GET"])
+def user_notification_count(username) -> Response:
+    """
+    Endpoint for retrieving the number of unread notifications for a user.
+    :param username: Username (or email) of a User
+    :return: JSON representation of the number of unread notifications
+    """
+    if request.method == "GET":
+        """[GET] /v2/users/notifications/<username>/count"""
+        return user_notification_count_by_username_get(username)
+
+    return abort(404)
+
+
 @user_route.route("/flair/<username>", methods=["GET"])
 @auth_required()
 @swag_from("swagger/userRoute/userFlairGet.yml", methods=["GET"])
@@ -248,6 +274,22 @@ def user_statistics(username) -> Response:
     return abort(404)
 
 
+@user_route.route("/records/<username>", methods=["GET"])
+@auth_required()
+@swag_from("swagger/userRoute/userRecordsGet.yml", methods=["GET"])
+def user_records(username) -> Response:
+    """
+    Endpoint for retrieving a user's personal records.
+    :param username: Username (or email) of a User
+    :return: JSON representation of a users fastest and longest exercises.
+    """
+    if request.method == "GET":
+        """[GET] /v2/users/records/<username>"""
+        return user_records_by_username_get(username)
+
+    return abort(404)
+
+
 @user_route.route("/<username>/change_password", methods=["PUT"])
 @swag_from("swagger/userRoute/userChangePasswordPut.yml", methods=["PUT"])
 def user_change_password(username) -> Response:
@@ -425,7 +467,19 @@ def user_post() -> Response:
         user_to_add.deleted = False
 
         # First, add the user since its activation code is valid.
-        UserDao.add_user(user_to_add)
+        added_user: Optional[User] = UserDao.add_user(user_to_add)
+
+        if added_user is None:
+            response = jsonify(
+                {
+                    "self": "/v2/users",
+                    "added": False,
+                    "user": None,
+                    "error": "An unexpected error occurred creating the user.",
+                }
+            )
+            response.status_code = 500
+            return response
 
         # Second, set the initial team and group for the user.
         code: Code = ActivationCodeDao.get_activation_code(user_to_add.activation_code)
@@ -444,20 +498,6 @@ def user_post() -> Response:
         # Third, remove the activation code so it cant be used again.
         CodeDao.remove_code(code)
 
-        added_user = UserDao.get_user_by_username(user_to_add.username)
-
-        if added_user is None:
-            response = jsonify(
-                {
-                    "self": "/v2/users",
-                    "added": False,
-                    "user": None,
-                    "error": "An unexpected error occurred creating the user.",
-                }
-            )
-            response.status_code = 500
-            return response
-
         response = jsonify(
             {
                 "self": "/v2/users",
@@ -702,6 +742,30 @@ def user_by_username_soft_delete(username) -> Response:
     return response
 
 
+def user_snapshot_tags(username: str) -> List[str]:
+    """
+    Get the tags of a cached user snapshot.  Snapshots can be requested by email, so the tags include the username
+    of the user with the email, which is the tag invalidated when the user's data changes.
+    :param username: Username or email from the URL of the snapshot request.
+    :return: A list of cache tags.
+    """
+    tags = [f"user:{username}"]
+
+    if "@" in username:
+        user_data: User = UserDao.get_user_by_email(email=username)
+
+        if user_data is not None and user_data.username != username:
+            tags.append(f"user:{user_data.username}")
+
+    return tags
+
+
+@cached(
+    "user_snapshots",
+    ttl=60,
+    tags=user_snapshot_tags,
+    single_flight=True,
+)
 def user_snapshot_by_username_get(username) -> Response:
     """
     Get a snapshot with information about a user with a given username.
@@ -783,20 +847,13 @@ def user_snapshot_by_username_get(username) -> Response:
         username=username
     )
 
-    notification_dicts = []
-    for notification in notifications:
-        notification_dicts.append(
-            {
-                "notification_id": notification["notification_id"],
-                "username": notification["username"],
-                "time": notification["time"],
-                "link": notification["link"],
-                "viewed": notification["viewed"],
-                "description": notification["description"],
-            }
-        )
-
-    user_dict["notifications"] = notification_dicts
+    user_dict["notifications"] = [
+        notification_dict(notification) for notification in notifications
+    ]
+    user_dict["unread_notifications"] = NotificationDao.get_unread_count(
+        username=username
+    )
+    user_dict["streaks"] = streak_summary(StreakDao.get_streak(username=username))
 
     stats = compile_user_statistics(user_data, username)
     user_dict["statistics"] = stats
@@ -957,31 +1014,98 @@ def user_memberships_by_username_put(username) -> Response:
 
 def user_notifications_by_username_get(username) -> Response:
     """
-    Get the notifications for a user.
+    Get the notifications for a user.  By default, notifications from the past two weeks are returned.  If the 'limit'
+    or 'cursor' query parameters are used, a page of the user's notification inbox is returned instead, along with a
+    link to the next page.
     :param username: Username that uniquely identifies a user.
     :return: A response object for the GET API request.
     """
-    notifications: ResultProxy = NotificationDao.get_notification_by_username(
-        username=username
-    )
+    limit = request.args.get("limit", type=int)
+    cursor = request.args.get("cursor")
+
+    if limit is None and cursor is None:
+        notifications: ResultProxy = NotificationDao.get_notification_by_username(
+            username=username
+        )
+
+        response = jsonify(
+            {
+                "self": f"/v2/users/notifications/{username}",
+                "notifications": [
+                    notification_dict(notification) for notification in notifications
+                ],
+            }
+        )
+        response.status_code = 200
+        return response
+
+    limit = min(max(limit or NOTIFICATION_PAGE_SIZE, 1), MAX_NOTIFICATION_PAGE_SIZE)
+    before = None
 
-    notification_dicts = []
-    for notification in notifications:
-        notification_dicts.append(
+    if cursor is not None:
+        try:
+            before_time, before_id = decode_cursor(cursor, 2)
+            before = (datetime.fromisoformat(before_time), int(before_id))
+        except (TypeError, ValueError):
+            pass
+
+    if cursor is not None and before is None:
+        response = jsonify(
             {
-                "notification_id": notification["notification_id"],
-                "username": notification["username"],
-                "time": notification["time"],
-                "link": notification["link"],
-                "viewed": notification["viewed"],
-                "description": notification["description"],
+                "self": f"/v2/users/notifications/{username}",
+                "notifications": None,
+                "next": None,
+                "error": "the cursor is invalid",
             }
         )
+        response.status_code = 400
+        return response
+
+    notifications: ResultProxy = NotificationDao.get_notification_inbox(
+        username=username,
+        limit=limit,
+        before=before,
+    )
+    notification_dicts = [
+        notification_dict(notification) for notification in notifications
+    ]
+
+    self_url = f"/v2/users/notifications/{username}?limit={limit}"
+    if cursor is not None:
+        self_url += f"&cursor={cursor}"
+
+    next_url = None
+    if len(notification_dicts) == limit:
+        last = notification_dicts[-1]
+        next_cursor = encode_cursor(last["time"], last["notification_id"])
+        next_url = (
+            f"/v2/users/notifications/{username}?limit={limit}&cursor={next_cursor}"
+        )
 
     response = jsonify(
         {
-            "self": f"/v2/users/notifications/{username}",
+            "self": self_url,
+            "next": next_url,
             "notifications": notification_dicts,
+            "unread": NotificationDao.get_unread_count(username=username),
+        }
+    )
+    response.status_code = 200
+    return response
+
+
+def user_notification_count_by_username_get(username) -> Response:
+    """
+    Get the number of unread notifications for a user.  The count is maintained as notifications change, so no
+    notifications are read.
+    :param username: Username that uniquely identifies a user.
+    :return: A response object for the GET API request.
+    """
+    response = jsonify(
+        {
+            "self": f"/v2/users/notifications/{username}/count",
+            "username": username,
+            "unread": NotificationDao.get_unread_count(username=username),
         }
     )
     response.status_code = 200
@@ -1041,6 +1165,51 @@ def user_statistics_by_username_get(username) -> Response:
     return response
 
 
+def user_records_by_username_get(username) -> Response:
+    """
+    Get the personal records for a user.  Records are maintained as logs are written, so they are read without
+    scanning the user's exercise logs.
+    :param username: Username that uniquely identifies a user.
+    :return: A response object for the GET API request.
+    """
+    user_data: User = UserDao.get_user_by_username(username=username)
+
+    # If the user cant be found, try searching the email column in the database
+    if user_data is None:
+        email = username
+        user_data: User = UserDao.get_user_by_email(email=email)
+
+    # If the user still can't be found, return with an error code
+    if user_data is None:
+        response = jsonify(
+            {
+                "self": f"/v2/users/records/{username}",
+                "records": None,
+                "error": "there is no user with this username",
+            }
+        )
+        response.status_code = 400
+        return response
+
+    personal_records: List[PersonalRecord] = PersonalRecordDao.get_personal_records(
+        username=user_data.username
+    )
+
+    records = {}
+
+    for record in personal_records:
+        records.setdefault(record.type, {})[record.category] = {
+            "log_id": record.log_id,
+            "date": str(record.date),
+            "miles": record.miles,
+            "seconds": record.seconds,
+        }
+
+    response = jsonify({"self": f"/v2/users/records/{username}", "records": records})
+    response.status_code = 200
+    return response
+
+
 def user_change_password_by_username_put(username) -> Response:
     """
     Change the password of a user with a given username.
@@ -1268,6 +1437,11 @@ def user_links_get() -> Response:
                     "verb": "GET",
                     "description": "Get a list of notifications for a user with a given username.",
                 },
+                {
+                    "link": "/v2/users/notifications/<username>/count",
+                    "verb": "GET",
+                    "description": "Get the number of unread notifications for a user with a given username.",
+                },
                 {
                     "link": "/v2/users/flair/<username>",
                     "verb": "GET",
@@ -1278,6 +1452,12 @@ def user_links_get() -> Response:
                     "verb": "GET",
                     "description": "Get exercise statistics for a user with a given username.",
                 },
+                {
+                    "link": "/v2/users/records/<username>",
+                    "verb": "GET",
+                    "description": "Get the fastest exercises at standard distances and the longest exercises for a "
+                    "user with a given username.",
+                },
                 {
                     "link": "/v2/users/<username>/change_password",
                     "verb": "PUT",
@@ -1305,6 +1485,22 @@ Helper Methods
 """
 
 
+def notification_dict(notification: Row) -> dict:
+    """
+    Convert a notification from the database to a dictionary for a response body.
+    :param notification: A row from the notifications table.
+    :return: A dictionary representing the notification.
+    """
+    return {
+        "notification_id": notification["notification_id"],
+        "username": notification["username"],
+        "time": notification["time"],
+        "link": notification["link"],
+        "viewed": notification["viewed"],
+        "description": notification["description"],
+    }
+
+
 def compile_user_statistics(user_data: UserData, username: str) -> dict:
     """
     Query user statistics and combine them into a single map.
@@ -1333,6 +1529,9 @@ def compile_user_statistics(user_data: UserData, username: str) -> dict:
     week_feel: Optional[Row] = LogDao.get_user_avg_feel_interval(
         username, "week", week_start=user_data.week_start
     )
+    run_pace: Optional[Row] = LogDao.get_user_paces(
+        username, "run", week_start=user_data.week_start
+    )
 
     return {
         "miles_all_time": float(miles["total"]),
@@ -1371,4 +1570,21 @@ def compile_user_statistics(user_data: UserData, username: str) -> dict:
         "feel_past_week": float(
             0 if week_feel["average"] is None else week_feel["average"]
         ),
+        "run_pace_all_time": pace_seconds(run_pace["average"]),
+        "run_pace_past_year": pace_seconds(run_pace["average_past_year"]),
+        "run_pace_past_month": pace_seconds(run_pace["average_past_month"]),
+        "run_pace_past_week": pace_seconds(run_pace["average_past_week"]),
+        "run_best_pace_all_time": pace_seconds(run_pace["best"]),
+        "run_best_pace_past_year": pace_seconds(run_pace["best_past_year"]),
+        "run_best_pace_past_month": pace_seconds(run_pace["best_past_month"]),
+        "run_best_pace_past_week": pace_seconds(run_pace["best_past_week"]),
     }
+
+
+def pace_seconds(pace) -> Optional[int]:
+    """
+    Convert a pace aggregated by MySQL to a whole number of seconds per mile.
+    :param pace: The pace in seconds per mile, or None if there are no logs with a time.
+    :return: The pace as an integer, or None.
+    """
+    return None if pace is None else int(pace)
@@ -4,10 +4,19 @@
 
 SET foreign_key_checks = 0;
 
+DROP TABLE IF EXISTS codes_archive;
+DROP TABLE IF EXISTS comments_archive;
+DROP TABLE IF EXISTS groupmembers_archive;
+DROP TABLE IF EXISTS logs_archive;
+DROP TABLE IF EXISTS notifications_archive;
+DROP TABLE IF EXISTS teammembers_archive;
 DROP TABLE IF EXISTS messages;
+DROP TABLE IF EXISTS personalrecords;
+DROP TABLE IF EXISTS streaks;
 DROP TABLE IF EXISTS comments;
 DROP TABLE IF EXISTS logs;
 DROP TABLE IF EXISTS teammembers;
+DROP TABLE IF EXISTS notificationcounts;
 DROP TABLE IF EXISTS notifications;
 DROP TABLE IF EXISTS events;
 DROP TABLE IF EXISTS flair;
@@ -171,6 +180,8 @@ CREATE TABLE IF NOT EXISTS logs(
     miles         FLOAT                NULL,
     time          TIME                 NULL,
     pace          TIME                 NULL,
+    time_seconds  INT AS (TIME_TO_SEC(time)) STORED,
+    pace_seconds  INT AS (TIME_TO_SEC(pace)) STORED,
     feel          INT(2)               NOT NULL,
     description   VARCHAR(1000)        NULL,
     time_created  DATETIME             NOT NULL,
@@ -209,10 +220,35 @@ CREATE TABLE IF NOT EXISTS notifications(
     deleted_app     VARCHAR(31)          NULL
 );
 
+CREATE TABLE IF NOT EXISTS notificationcounts(
+    username        VARCHAR(20)          NOT NULL PRIMARY KEY,
+    unread          INT DEFAULT 0        NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS personalrecords(
+    username      VARCHAR(20)          NOT NULL,
+    type          VARCHAR(40)          NOT NULL,
+    category      VARCHAR(10)          NOT NULL,
+    log_id        INT                  NOT NULL,
+    date          DATE                 NOT NULL,
+    miles         FLOAT                NOT NULL,
+    seconds       INT                  NULL,
+    PRIMARY KEY (username, type, category)
+);
+
 CREATE TABLE IF NOT EXISTS status(
     status VARCHAR(10) NOT NULL PRIMARY KEY
 );
 
+CREATE TABLE IF NOT EXISTS streaks(
+    username       VARCHAR(20)          NOT NULL PRIMARY KEY,
+    week_start     VARCHAR(15)          NOT NULL,
+    current_streak INT DEFAULT 0        NOT NULL,
+    longest_streak INT DEFAULT 0        NOT NULL,
+    last_date      DATE                 NULL,
+    weeks_over     INT DEFAULT 0        NOT NULL
+);
+
 CREATE TABLE IF NOT EXISTS teamgroups(
     team_name     VARCHAR(31) CHARSET UTF8 NOT NULL,
     group_id      INT                      NOT NULL,
@@ -356,10 +392,43 @@ ALTER TABLE logs
 ADD CONSTRAINT logs_username_fk
 FOREIGN KEY (username) REFERENCES users(username);
 
+ALTER TABLE logs
+ADD INDEX logs_username_type_pace_seconds_index (username, type, pace_seconds);
+
+ALTER TABLE logs
+ADD INDEX logs_username_date_time_seconds_index (username, date, time_seconds);
+
 ALTER TABLE notifications
 ADD CONSTRAINT notifications_username_fk
 FOREIGN KEY (username) REFERENCES users(username);
 
+ALTER TABLE notifications
+ADD INDEX notifications_username_deleted_time_index (username, deleted, time);
+
+ALTER TABLE notifications
+ADD INDEX notifications_time_index (time);
+
+ALTER TABLE forgotpassword
+ADD INDEX forgotpassword_expires_index (expires);
+
+ALTER TABLE codes
+ADD INDEX codes_expiration_date_index (expiration_date);
+
+ALTER TABLE notificationcounts
+ADD CONSTRAINT notificationcounts_username_fk
+FOREIGN KEY (username) REFERENCES users(username);
+
+ALTER TABLE personalrecords
+ADD CONSTRAINT personalrecords_username_fk
+FOREIGN KEY (username) REFERENCES users(username);
+
+ALTER TABLE personalrecords
+ADD INDEX personalrecords_log_id_index (log_id);
+
+ALTER TABLE streaks
+ADD CONSTRAINT streaks_username_fk
+FOREIGN KEY (username) REFERENCES users(username);
+
 ALTER TABLE teamgroups
 ADD CONSTRAINT teamgroups_team_name_fk
 FOREIGN KEY (team_name) REFERENCES teams(name);
@@ -383,3 +452,18 @@ FOREIGN KEY (username) references users(username);
 ALTER TABLE users
 ADD CONSTRAINT users_week_start_fk
 FOREIGN KEY (week_start) references weekstart(week_start);
+
+-- Soft deleted rows are moved to these tables by the 'flask archive' command.
+CREATE TABLE IF NOT EXISTS codes_archive LIKE codes;
+CREATE TABLE IF NOT EXISTS comments_archive LIKE comments;
+CREATE TABLE IF NOT EXISTS groupmembers_archive LIKE groupmembers;
+CREATE TABLE IF NOT EXISTS logs_archive LIKE logs;
+CREATE TABLE IF NOT EXISTS notifications_archive LIKE notifications;
+CREATE TABLE IF NOT EXISTS teammembers_archive LIKE teammembers;
+
+ALTER TABLE codes_archive ADD COLUMN archived_date DATETIME NOT NULL;
+ALTER TABLE comments_archive ADD COLUMN archived_date DATETIME NOT NULL;
+ALTER TABLE groupmembers_archive ADD COLUMN archived_date DATETIME NOT NULL;
+ALTER TABLE logs_archive ADD COLUMN archived_date DATETIME NOT NULL;
+ALTER TABLE notifications_archive ADD COLUMN archived_date DATETIME NOT NULL;
+ALTER TABLE teammembers_archive ADD COLUMN archived_date DATETIME NOT NULL;
@@ -69,6 +69,7 @@ class TestApiRoute(TestSuite):
         self.assertEqual(response_json.get("group"), "/v2/groups/links")
         self.assertEqual(response_json.get("log_feed"), "/v2/log_feed/links")
         self.assertEqual(response_json.get("log"), "/v2/logs/links")
+        self.assertEqual(response_json.get("metrics"), "/v2/metrics/links")
         self.assertEqual(response_json.get("notification"), "/v2/notifications/links")
         self.assertEqual(response_json.get("range_view"), "/v2/range_view/links")
         self.assertEqual(response_json.get("team"), "/v2/teams/links")
@@ -998,6 +998,16 @@ class TestGroupRoute(TestSuite):
         self.assertTrue(isinstance(leaderboard_item.get("miles_swam"), float))
         self.assertIn("miles_other", leaderboard_item)
         self.assertTrue(isinstance(leaderboard_item.get("miles_other"), float))
+        self.assertIn("average_pace_run", leaderboard_item)
+        self.assertTrue(
+            leaderboard_item.get("average_pace_run") is None
+            or isinstance(leaderboard_item.get("average_pace_run"), int)
+        )
+        self.assertIn("best_pace_run", leaderboard_item)
+        self.assertTrue(
+            leaderboard_item.get("best_pace_run") is None
+            or isinstance(leaderboard_item.get("best_pace_run"), int)
+        )
 
     def test_group_leaderboard_get_route_expected_values(self) -> None:
         """
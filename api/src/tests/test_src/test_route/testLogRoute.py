@@ -4,6 +4,7 @@ Author: Andrew Jarombek
 Date: 11/17/2019
 """
 
+import io
 import json
 import unittest
 from datetime import datetime
@@ -205,6 +206,51 @@ class TestLogRoute(TestSuite):
         self.assertEqual(response_json.get("self"), "/v2/logs")
         self.assertTrue(response_json.get("added"))
         self.assertIsNotNone(response_json.get("log"))
+        self.assertIsNotNone(response_json.get("log").get("log_id"))
+        self.assertEqual(response_json.get("log").get("miles"), 4.75)
+
+    def test_log_post_route_200_matches_get(self) -> None:
+        """
+        Test performing an HTTP POST request on the '/v2/logs/' route, and then an HTTP GET request on the
+        '/v2/logs/<log_id>' route for the new log.  This test proves that the created log in the POST response is
+        identical to the log read from the database, including the values which MySQL converts (time, pace, distance,
+        and miles).
+        """
+        request_body = json.dumps(
+            {
+                "username": "andy",
+                "first": "Andrew",
+                "last": "Jarombek",
+                "date": "2019-11-22",
+                "type": "run",
+                "distance": 5,
+                "metric": "kilometers",
+                "time": "19:07",
+                "feel": "6",
+                "time_created": str(datetime.now()),
+            }
+        )
+
+        response: Response = self.client.post(
+            "/v2/logs/",
+            data=request_body,
+            content_type="application/json",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        self.assertEqual(response.status_code, 200)
+        posted_log: dict = response.get_json().get("log")
+
+        response: Response = self.client.get(
+            f"/v2/logs/{posted_log.get('log_id')}",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        self.assertEqual(response.status_code, 200)
+        saved_log: dict = response.get_json().get("log")
+
+        self.assertEqual(
+            json.dumps(posted_log, sort_keys=True),
+            json.dumps(saved_log, sort_keys=True),
+        )
 
     def test_log_post_route_forbidden(self) -> None:
         """
@@ -220,6 +266,278 @@ class TestLogRoute(TestSuite):
             self, self.client, "POST", "/v2/logs/", AuthVariant.UNAUTHORIZED
         )
 
+    def test_log_batch_post_route_400_not_array(self) -> None:
+        """
+        Test performing an HTTP POST request on the '/v2/logs/batch' route.  This test proves that calling this
+        endpoint with a request body that isn't a JSON array results in a 400 error code.
+        """
+        response: Response = self.client.post(
+            "/v2/logs/batch",
+            data=json.dumps({"username": "andy"}),
+            content_type="application/json",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response_json.get("self"), "/v2/logs/batch")
+        self.assertEqual(response_json.get("added"), 0)
+        self.assertIsNone(response_json.get("results"))
+        self.assertEqual(
+            response_json.get("error"),
+            "the request body must be a JSON array or NDJSON of exercise logs",
+        )
+
+    def test_log_batch_post_route_200(self) -> None:
+        """
+        Test performing an HTTP POST request on the '/v2/logs/batch' route.  This test proves that calling this
+        endpoint with NDJSON creates the valid exercise logs and returns an error for each invalid exercise log.
+        """
+        logs = [
+            {
+                "username": "andy",
+                "first": "Andrew",
+                "last": "Jarombek",
+                "date": "2019-11-21",
+                "type": "run",
+                "feel": 6,
+                "distance": 5,
+                "metric": "kilometers",
+                "time": "20:00",
+            },
+            {
+                "username": "andy2",
+                "first": "Andrew",
+                "last": "Jarombek",
+                "date": "2019-11-22",
+                "type": "run",
+                "feel": 6,
+            },
+            {
+                "username": "andy",
+                "first": "Andrew",
+                "last": "Jarombek",
+                "date": "2019-11-23",
+                "type": "run",
+                "feel": 6,
+                "miles": 4.75,
+            },
+        ]
+
+        response: Response = self.client.post(
+            "/v2/logs/batch",
+            data="\n".join(json.dumps(log) for log in logs),
+            content_type="application/x-ndjson",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response_json.get("self"), "/v2/logs/batch")
+        self.assertEqual(response_json.get("added"), 2)
+        self.assertEqual(response_json.get("failed"), 1)
+        self.assertEqual(
+            [result.get("added") for result in response_json.get("results")],
+            [True, False, True],
+        )
+        self.assertIsInstance(response_json.get("results")[0].get("log_id"), int)
+        self.assertEqual(
+            response_json.get("results")[2].get("log_id"),
+            response_json.get("results")[0].get("log_id") + 1,
+        )
+        self.assertIsNone(response_json.get("results")[1].get("log_id"))
+        self.assertEqual(
+            response_json.get("results")[1].get("error"),
+            "User andy is not authorized to upload an exercise log for user andy2.",
+        )
+
+    def test_log_batch_post_route_forbidden(self) -> None:
+        """
+        Test performing a forbidden HTTP POST request on the '/v2/logs/batch' route.
+        """
+        test_route_auth(
+            self, self.client, "POST", "/v2/logs/batch", AuthVariant.FORBIDDEN
+        )
+
+    def test_log_batch_post_route_unauthorized(self) -> None:
+        """
+        Test performing an unauthorized HTTP POST request on the '/v2/logs/batch' route.
+        """
+        test_route_auth(
+            self, self.client, "POST", "/v2/logs/batch", AuthVariant.UNAUTHORIZED
+        )
+
+    def test_log_import_post_route_200(self) -> None:
+        """
+        Test performing an HTTP POST request on the '/v2/logs/import' route.  This test proves that calling this
+        endpoint with an uploaded GPX file creates an exercise log for each track in the file.
+        """
+        gpx = b"""<?xml version="1.0" encoding="UTF-8"?>
+            <gpx version="1.1" xmlns="http://www.topografix.com/GPX/1/1">
+              <trk>
+                <name>Morning Run</name>
+                <type>running</type>
+                <trkseg>
+                  <trkpt lat="40.7800" lon="-73.9700"><time>2019-11-21T12:00:00Z</time></trkpt>
+                  <trkpt lat="40.7900" lon="-73.9700"><time>2019-11-21T12:05:00Z</time></trkpt>
+                </trkseg>
+              </trk>
+            </gpx>"""
+
+        response: Response = self.client.post(
+            "/v2/logs/import",
+            data={"file": (io.BytesIO(gpx), "run.gpx")},
+            content_type="multipart/form-data",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response_json.get("self"), "/v2/logs/import")
+        self.assertEqual(response_json.get("added"), 1)
+        self.assertEqual(response_json.get("results")[0].get("date"), "2019-11-21")
+
+    def test_log_import_post_route_400_fit(self) -> None:
+        """
+        Test performing an HTTP POST request on the '/v2/logs/import' route.  This test proves that calling this
+        endpoint with a FIT file results in a 400 error code.
+        """
+        response: Response = self.client.post(
+            "/v2/logs/import",
+            data={"file": (io.BytesIO(b"\x0e\x10"), "run.fit")},
+            content_type="multipart/form-data",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response_json.get("self"), "/v2/logs/import")
+        self.assertEqual(
+            response_json.get("error"),
+            "FIT files aren't supported, export the activity as a GPX or TCX file instead",
+        )
+
+    def test_log_import_post_route_forbidden(self) -> None:
+        """
+        Test performing a forbidden HTTP POST request on the '/v2/logs/import' route.
+        """
+        test_route_auth(
+            self, self.client, "POST", "/v2/logs/import", AuthVariant.FORBIDDEN
+        )
+
+    def test_log_import_post_route_unauthorized(self) -> None:
+        """
+        Test performing an unauthorized HTTP POST request on the '/v2/logs/import' route.
+        """
+        test_route_auth(
+            self, self.client, "POST", "/v2/logs/import", AuthVariant.UNAUTHORIZED
+        )
+
+    def test_log_export_get_route_200_ndjson(self) -> None:
+        """
+        Test performing an HTTP GET request on the '/v2/logs/export' route.  This test proves that calling this
+        endpoint streams a user's exercise logs as NDJSON in the order they were completed.
+        """
+        response: Response = self.client.get(
+            "/v2/logs/export?username=andy",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/x-ndjson")
+
+        logs = [
+            json.loads(line) for line in response.get_data(as_text=True).splitlines()
+        ]
+        self.assertGreater(len(logs), 0)
+        self.assertTrue(all(log.get("username") == "andy" for log in logs))
+        self.assertEqual(
+            sorted(log.get("date") for log in logs), [log.get("date") for log in logs]
+        )
+
+    def test_log_export_get_route_200_csv(self) -> None:
+        """
+        Test performing an HTTP GET request on the '/v2/logs/export' route.  This test proves that calling this
+        endpoint with the CSV format returns a header row followed by the exercise logs.
+        """
+        response: Response = self.client.get(
+            "/v2/logs/export?username=andy&format=csv",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "text/csv")
+        self.assertTrue(
+            response.get_data(as_text=True).startswith("log_id,username,first,last,")
+        )
+
+    def test_log_export_get_route_400(self) -> None:
+        """
+        Test performing an HTTP GET request on the '/v2/logs/export' route.  This test proves that calling this
+        endpoint with an unknown format results in a 400 error code.
+        """
+        response: Response = self.client.get(
+            "/v2/logs/export?format=xml",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response_json.get("self"), "/v2/logs/export")
+        self.assertEqual(
+            response_json.get("error"), "'format' must be either ndjson or csv"
+        )
+
+    def test_log_export_get_route_200_group(self) -> None:
+        """
+        Test performing an HTTP GET request on the '/v2/logs/export' route.  This test proves that an accepted member
+        of a group can export the exercise logs of the group.
+        """
+        response: Response = self.client.get(
+            "/v2/logs/export?group_id=3",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/x-ndjson")
+
+    def test_log_export_get_route_400_no_filter(self) -> None:
+        """
+        Test performing an HTTP GET request on the '/v2/logs/export' route.  This test proves that calling this
+        endpoint without a username or group_id results in a 400 error code instead of exporting every exercise log.
+        """
+        response: Response = self.client.get(
+            "/v2/logs/export?start=2019-01-01",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response_json.get("self"), "/v2/logs/export")
+        self.assertEqual(
+            response_json.get("error"), "either 'username' or 'group_id' is required"
+        )
+
+    def test_log_export_get_route_403(self) -> None:
+        """
+        Test performing an HTTP GET request on the '/v2/logs/export' route.  This test proves that users can't export
+        the exercise logs of a group they aren't a member of.
+        """
+        response: Response = self.client.get(
+            "/v2/logs/export?group_id=0",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response_json.get("self"), "/v2/logs/export")
+
+    def test_log_export_get_route_forbidden(self) -> None:
+        """
+        Test performing a forbidden HTTP GET request on the '/v2/logs/export' route.
+        """
+        test_route_auth(
+            self, self.client, "GET", "/v2/logs/export", AuthVariant.FORBIDDEN
+        )
+
+    def test_log_export_get_route_unauthorized(self) -> None:
+        """
+        Test performing an unauthorized HTTP GET request on the '/v2/logs/export' route.
+        """
+        test_route_auth(
+            self, self.client, "GET", "/v2/logs/export", AuthVariant.UNAUTHORIZED
+        )
+
     def test_log_by_id_get_route_400(self) -> None:
         """
         Test performing an HTTP GET request on the '/v2/logs/<log_id>' route.  This test proves that trying to
@@ -382,6 +700,52 @@ class TestLogRoute(TestSuite):
         self.assertTrue(response_json.get("updated"))
         self.assertIsNotNone(response_json.get("log"))
 
+    def test_log_by_id_put_route_200_matches_get(self) -> None:
+        """
+        Test performing an HTTP PUT request on the '/v2/logs/<log_id>' route, and then an HTTP GET request on the same
+        route.  This test proves that the updated log in the PUT response is identical to the log read from the
+        database, including the values which MySQL converts (time, pace, distance, and miles).
+        """
+        request_body = json.dumps(
+            {
+                "log_id": 1,
+                "username": "andy",
+                "first": "Andrew",
+                "last": "Jarombek",
+                "name": "Rockies",
+                "location": "Sleepy Hollow, NY",
+                "date": "2016-12-23",
+                "type": "run",
+                "distance": 13.7,
+                "metric": "kilometers",
+                "time": "59:00",
+                "feel": "8",
+                "description": f"Really nice run through the trails at night.  (Edited {datetime.now()})",
+                "time_created": "0000-00-00 00:00:00",
+                "deleted": False,
+            }
+        )
+
+        response: Response = self.client.put(
+            "/v2/logs/1",
+            data=request_body,
+            content_type="application/json",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        self.assertEqual(response.status_code, 200)
+        updated_log: dict = response.get_json().get("log")
+
+        response: Response = self.client.get(
+            "/v2/logs/1", headers={"Authorization": f"Bearer {self.jwt}"}
+        )
+        self.assertEqual(response.status_code, 200)
+        saved_log: dict = response.get_json().get("log")
+
+        self.assertEqual(
+            json.dumps(updated_log, sort_keys=True),
+            json.dumps(saved_log, sort_keys=True),
+        )
+
     def test_log_by_id_put_route_forbidden(self) -> None:
         """
         Test performing a forbidden HTTP PUT request on the '/v2/logs/<log_id>' route.
@@ -630,4 +994,4 @@ class TestLogRoute(TestSuite):
         response_json: dict = response.get_json()
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response_json.get("self"), "/v2/logs/links")
-        self.assertEqual(len(response_json.get("endpoints")), 6)
+        self.assertEqual(len(response_json.get("endpoints")), 9)
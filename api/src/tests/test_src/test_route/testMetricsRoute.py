@@ -0,0 +1,60 @@
+"""
+Test suite for the API routes for worker metrics (api/src/route/metricsRoute.py).
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+from flask import Response
+
+from tests.TestSuite import TestSuite
+from tests.test_src.test_route.utils import test_route_auth, AuthVariant
+
+
+class TestMetricsRoute(TestSuite):
+    def test_pool_get_route_200(self) -> None:
+        """
+        Test performing an HTTP GET request on the '/v2/metrics/pool' route.  This test proves that the endpoint
+        returns the state of the connection pool and a 200 status.
+        """
+        self.client.get("/v2/types/")
+
+        response: Response = self.client.get(
+            "/v2/metrics/pool", headers={"Authorization": f"Bearer {self.jwt}"}
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response_json.get("self"), "/v2/metrics/pool")
+
+        pool: dict = response_json.get("pool")
+        self.assertEqual(pool.get("pool_class"), "InstrumentedQueuePool")
+        self.assertEqual(pool.get("size"), 5)
+        self.assertTrue(pool.get("pre_ping"))
+        self.assertGreaterEqual(pool.get("metrics").get("checkouts"), 1)
+        self.assertEqual(pool.get("metrics").get("timeouts"), 0)
+
+    def test_pool_get_route_forbidden(self) -> None:
+        """
+        Test performing a forbidden HTTP GET request on the '/v2/metrics/pool' route.
+        """
+        test_route_auth(
+            self, self.client, "GET", "/v2/metrics/pool", AuthVariant.FORBIDDEN
+        )
+
+    def test_pool_get_route_unauthorized(self) -> None:
+        """
+        Test performing an unauthorized HTTP GET request on the '/v2/metrics/pool' route.
+        """
+        test_route_auth(
+            self, self.client, "GET", "/v2/metrics/pool", AuthVariant.UNAUTHORIZED
+        )
+
+    def test_metrics_get_links_route_200(self) -> None:
+        """
+        Test performing an HTTP GET request on the '/v2/metrics/links' route.  This test proves that calling
+        this endpoint returns a list of other metrics endpoints.
+        """
+        response: Response = self.client.get("/v2/metrics/links")
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response_json.get("self"), "/v2/metrics/links")
+        self.assertEqual(len(response_json.get("endpoints")), 1)
@@ -216,6 +216,154 @@ class TestNotificationRoute(TestSuite):
             self, self.client, "POST", "/v2/notifications/", AuthVariant.UNAUTHORIZED
         )
 
+    def test_notifications_viewed_put_route_200(self) -> None:
+        """
+        Test performing an HTTP PUT request on the '/v2/notifications/viewed' route.  This test proves that calling
+        this endpoint with a list of notification ids marks the user's unread notifications as viewed.
+        """
+        response: Response = self.client.post(
+            "/v2/notifications/",
+            data=json.dumps({"username": "andy", "description": "Unread Notification"}),
+            content_type="application/json",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        notification_id = response.get_json().get("notification").get("notification_id")
+
+        response: Response = self.client.put(
+            "/v2/notifications/viewed",
+            data=json.dumps({"notification_ids": [notification_id]}),
+            content_type="application/json",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response_json.get("self"), "/v2/notifications/viewed")
+        self.assertTrue(response_json.get("updated"))
+        self.assertEqual(response_json.get("viewed"), 1)
+        self.assertIsInstance(response_json.get("unread"), int)
+
+        response: Response = self.client.get(
+            f"/v2/notifications/{notification_id}",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        self.assertEqual(response.get_json().get("notification").get("viewed"), "Y")
+
+    def test_notifications_viewed_put_route_400(self) -> None:
+        """
+        Test performing an HTTP PUT request on the '/v2/notifications/viewed' route.  This test proves that calling
+        this endpoint without notification ids or a time results in a 400 error code.
+        """
+        response: Response = self.client.put(
+            "/v2/notifications/viewed",
+            data=json.dumps({}),
+            content_type="application/json",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response_json.get("updated"))
+        self.assertEqual(
+            response_json.get("error"),
+            "either 'notification_ids' or 'before' is required",
+        )
+
+    def test_notifications_viewed_put_route_forbidden(self) -> None:
+        """
+        Test performing a forbidden HTTP PUT request on the '/v2/notifications/viewed' route.
+        """
+        test_route_auth(
+            self, self.client, "PUT", "/v2/notifications/viewed", AuthVariant.FORBIDDEN
+        )
+
+    def test_notifications_viewed_put_route_unauthorized(self) -> None:
+        """
+        Test performing an unauthorized HTTP PUT request on the '/v2/notifications/viewed' route.
+        """
+        test_route_auth(
+            self,
+            self.client,
+            "PUT",
+            "/v2/notifications/viewed",
+            AuthVariant.UNAUTHORIZED,
+        )
+
+    def test_notifications_group_post_route_200(self) -> None:
+        """
+        Test performing an HTTP POST request on the '/v2/notifications/group/<group_id>' route.  This test proves
+        that calling this endpoint notifies every accepted group member except for the sender.
+        """
+        response: Response = self.client.post(
+            "/v2/notifications/group/3",
+            data=json.dumps({"description": "Group Notification", "link": "/group/3"}),
+            content_type="application/json",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response_json.get("self"), "/v2/notifications/group/3")
+        self.assertEqual(
+            response_json.get("added"), len(response_json.get("usernames"))
+        )
+        self.assertIn("dotty", response_json.get("usernames"))
+        self.assertNotIn("andy", response_json.get("usernames"))
+
+    def test_notifications_group_post_route_400(self) -> None:
+        """
+        Test performing an HTTP POST request on the '/v2/notifications/group/<group_id>' route.  This test proves
+        that the usernames to exclude must be a list of strings.
+        """
+        response: Response = self.client.post(
+            "/v2/notifications/group/3",
+            data=json.dumps({"description": "Group Notification", "exclude": "dotty"}),
+            content_type="application/json",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response_json.get("added"), 0)
+        self.assertEqual(
+            response_json.get("error"), "'exclude' must be a list of usernames"
+        )
+
+    def test_notifications_group_post_route_403(self) -> None:
+        """
+        Test performing an HTTP POST request on the '/v2/notifications/group/<group_id>' route.  This test proves
+        that users can't notify the members of a group they aren't a member of.
+        """
+        response: Response = self.client.post(
+            "/v2/notifications/group/0",
+            data=json.dumps({"description": "Group Notification"}),
+            content_type="application/json",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response_json.get("added"), 0)
+
+    def test_notifications_group_post_route_forbidden(self) -> None:
+        """
+        Test performing a forbidden HTTP POST request on the '/v2/notifications/group/<group_id>' route.
+        """
+        test_route_auth(
+            self,
+            self.client,
+            "POST",
+            "/v2/notifications/group/3",
+            AuthVariant.FORBIDDEN,
+        )
+
+    def test_notifications_group_post_route_unauthorized(self) -> None:
+        """
+        Test performing an unauthorized HTTP POST request on the '/v2/notifications/group/<group_id>' route.
+        """
+        test_route_auth(
+            self,
+            self.client,
+            "POST",
+            "/v2/notifications/group/3",
+            AuthVariant.UNAUTHORIZED,
+        )
+
     def test_notification_by_id_get_route_400(self) -> None:
         """
         Test performing an HTTP GET request on the '/v2/notifications/<notification_id>' route.  This test proves
@@ -708,4 +856,4 @@ class TestNotificationRoute(TestSuite):
         response_json: dict = response.get_json()
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response_json.get("self"), "/v2/notifications/links")
-        self.assertEqual(len(response_json.get("endpoints")), 6)
+        self.assertEqual(len(response_json.get("endpoints")), 8)
@@ -254,6 +254,71 @@ class TestRangeViewRoute(TestSuite):
         self.assertEqual(9, range_view[5].get("feel"))
         self.assertEqual(1, range_view[5].get("miles"))
 
+    def test_range_view_get_route_200_user_weeks(self) -> None:
+        """
+        Test performing an HTTP GET request on the '/v2/range_view/' route with a weekly granularity.  This test
+        proves that the endpoint returns at most one object per week, each dated on the first day of its week.
+        """
+        end = datetime.now().strftime("%Y-%m-%d")
+        start = (datetime.now() - timedelta(days=69)).strftime("%Y-%m-%d")
+
+        response: Response = self.client.get(
+            f"/v2/range_view/users/andy/r/{start}/{end}?granularity=week",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response_json.get("self"),
+            f"/v2/range_view/users/andy/r/{start}/{end}?granularity=week",
+        )
+
+        range_view = response_json.get("range_view")
+        self.assertGreater(len(range_view), 0)
+        self.assertLessEqual(len(range_view), 11)
+
+        weekdays = {item.get("date")[:3] for item in range_view}
+        self.assertEqual(1, len(weekdays))
+        self.assertTrue(weekdays.issubset({"Mon", "Sun"}))
+
+    def test_range_view_get_route_200_group_years(self) -> None:
+        """
+        Test performing an HTTP GET request on the '/v2/range_view/' route with a yearly granularity.  This test
+        proves that the endpoint returns at most one object per year, each dated on January 1st.
+        """
+        end = datetime.now().strftime("%Y-%m-%d")
+        start = (datetime.now() - timedelta(days=730)).strftime("%Y-%m-%d")
+
+        response: Response = self.client.get(
+            f"/v2/range_view/groups/1/rbso/{start}/{end}?granularity=year",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 200)
+
+        range_view = response_json.get("range_view")
+        self.assertLessEqual(len(range_view), 3)
+
+        for item in range_view:
+            self.assertIn(", 01 Jan ", item.get("date"))
+
+    def test_range_view_get_route_400_invalid_granularity(self) -> None:
+        """
+        Test performing an HTTP GET request on the '/v2/range_view/' route with an unknown granularity.  This test
+        proves that the endpoint returns a 400 error.
+        """
+        response: Response = self.client.get(
+            "/v2/range_view/users/andy/r/2016-12-01/2016-12-31?granularity=decade",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 400)
+        self.assertIsNone(response_json.get("range_view"))
+        self.assertEqual(
+            response_json.get("error"),
+            "'granularity' must be one of 'day', 'week', 'month', or 'year'",
+        )
+
     def test_range_view_get_route_forbidden(self) -> None:
         """
         Test performing a forbidden HTTP GET request on the '/v2/range_view/' route.
@@ -278,6 +343,122 @@ class TestRangeViewRoute(TestSuite):
             AuthVariant.UNAUTHORIZED,
         )
 
+    def test_range_view_compare_get_route_200_usernames(self) -> None:
+        """
+        Test performing an HTTP GET request on the '/v2/range_view/compare' route with a list of usernames.  This test
+        proves that the endpoint returns a series for each user, aligned to the same dates.
+        """
+        end = datetime.now().strftime("%Y-%m-%d")
+        start = (datetime.now() - timedelta(days=10)).strftime("%Y-%m-%d")
+
+        response: Response = self.client.get(
+            f"/v2/range_view/compare/r/{start}/{end}?usernames=dotty,andy,invalid_user",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response_json.get("next"))
+
+        users = response_json.get("users")
+        self.assertListEqual(
+            ["andy", "dotty", "invalid_user"], [user.get("username") for user in users]
+        )
+
+        dates = response_json.get("dates")
+        self.assertGreater(len(dates), 0)
+
+        for user in users:
+            self.assertEqual(len(dates), len(user.get("miles")))
+            self.assertEqual(len(dates), len(user.get("feel")))
+
+        self.assertTrue(all(miles == 0 for miles in users[2].get("miles")))
+
+    def test_range_view_compare_get_route_200_group_top(self) -> None:
+        """
+        Test performing an HTTP GET request on the '/v2/range_view/compare' route with the top members of a group.
+        This test proves that the endpoint returns a page of users and a link to the next page.
+        """
+        end = datetime.now().strftime("%Y-%m-%d")
+        start = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
+
+        response: Response = self.client.get(
+            f"/v2/range_view/compare/rbso/{start}/{end}?group_id=1&top=5&limit=2&granularity=month",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 200)
+
+        users = response_json.get("users")
+        self.assertEqual(len(users), 2)
+        self.assertGreaterEqual(sum(users[0].get("miles")), sum(users[1].get("miles")))
+        self.assertIsNotNone(response_json.get("next"))
+
+        response: Response = self.client.get(
+            response_json.get("next"),
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(
+            {user.get("username") for user in response_json.get("users")}.isdisjoint(
+                {user.get("username") for user in users}
+            )
+        )
+
+    def test_range_view_compare_get_route_400_no_users(self) -> None:
+        """
+        Test performing an HTTP GET request on the '/v2/range_view/compare' route without users to compare.  This
+        test proves that the endpoint returns a 400 error.
+        """
+        response: Response = self.client.get(
+            "/v2/range_view/compare/r/2016-12-01/2016-12-31",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 400)
+        self.assertIsNone(response_json.get("users"))
+        self.assertEqual(
+            response_json.get("error"),
+            "either the 'usernames' or 'group_id' query parameter is required",
+        )
+
+    def test_range_view_compare_get_route_400_invalid_cursor(self) -> None:
+        """
+        Test performing an HTTP GET request on the '/v2/range_view/compare' route with a cursor that wasn't returned
+        by the API.  This test proves that the endpoint returns a 400 error.
+        """
+        response: Response = self.client.get(
+            "/v2/range_view/compare/r/2016-12-01/2016-12-31?usernames=andy&cursor=invalid",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response_json.get("error"), "the cursor is invalid")
+
+    def test_range_view_compare_get_route_forbidden(self) -> None:
+        """
+        Test performing a forbidden HTTP GET request on the '/v2/range_view/compare' route.
+        """
+        test_route_auth(
+            self,
+            self.client,
+            "GET",
+            "/v2/range_view/compare/r/2016-12-01/2016-12-31?usernames=andy",
+            AuthVariant.FORBIDDEN,
+        )
+
+    def test_range_view_compare_get_route_unauthorized(self) -> None:
+        """
+        Test performing an unauthorized HTTP GET request on the '/v2/range_view/compare' route.
+        """
+        test_route_auth(
+            self,
+            self.client,
+            "GET",
+            "/v2/range_view/compare/r/2016-12-01/2016-12-31?usernames=andy",
+            AuthVariant.UNAUTHORIZED,
+        )
+
     def test_range_view_get_links_route_200(self) -> None:
         """
         Test performing an HTTP GET request on the '/v2/range_view/links' route.  This test proves that calling
@@ -287,4 +468,4 @@ class TestRangeViewRoute(TestSuite):
         response_json: dict = response.get_json()
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response_json.get("self"), "/v2/range_view/links")
-        self.assertEqual(len(response_json.get("endpoints")), 1)
+        self.assertEqual(len(response_json.get("endpoints")), 2)
@@ -11,6 +11,7 @@ import asyncio
 
 from flask import Response
 
+from dao.userDao import UserDao
 from tests.TestSuite import TestSuite
 from tests.test_src.test_route.utils import (
     test_route_auth,
@@ -329,6 +330,46 @@ class TestUserRoute(TestSuite):
         self.assertIn("subscribed", user)
         self.assertIn("deleted", user)
 
+    def test_user_post_route_201_hard_delete(self) -> None:
+        """
+        Test performing an HTTP POST request on the '/v2/users/' route, and then hard deleting the new user.  The
+        DELETE '/v2/users/<username>' route is disabled, so the user is deleted with the DAO function it calls.  This
+        test proves that the rows created along with a user don't block it from being deleted.
+        """
+        response: Response = self.client.post(
+            "/v2/activation_code/",
+            data=json.dumps({"group_id": 1, "email": "andrew@jarombek.com"}),
+            content_type="application/json",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        activation_code = (
+            response.get_json().get("activation_code").get("activation_code")
+        )
+
+        UserDao.delete_user(username="andy3")
+
+        response: Response = self.client.post(
+            "/v2/users/",
+            data=json.dumps(
+                {
+                    "username": "andy3",
+                    "email": "andrew@jarombek.com",
+                    "first": "Andrew",
+                    "last": "Jarombek",
+                    "password": "B0unDThr33",
+                    "member_since": str(datetime.fromisoformat("2019-12-13")),
+                    "activation_code": activation_code,
+                    "last_signin": str(datetime.fromisoformat("2019-12-14")),
+                }
+            ),
+            content_type="application/json",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        self.assertEqual(201, response.status_code)
+
+        self.assertTrue(UserDao.delete_user(username="andy3"))
+        self.assertIsNone(UserDao.get_user_by_username(username="andy3"))
+
     @unittest.skip("User Creation Does Not Require JWT Authorization")
     def test_user_post_route_forbidden(self) -> None:
         """
@@ -833,6 +874,12 @@ class TestUserRoute(TestSuite):
         self.assertIsInstance(user.get("groups"), list)
         self.assertIn("notifications", user)
         self.assertIsInstance(user.get("notifications"), list)
+        self.assertIn("unread_notifications", user)
+        self.assertIsInstance(user.get("unread_notifications"), int)
+        self.assertIn("streaks", user)
+        self.assertIsInstance(user.get("streaks").get("current_streak"), int)
+        self.assertIsInstance(user.get("streaks").get("longest_streak"), int)
+        self.assertIsInstance(user.get("streaks").get("weeks_over_threshold"), int)
         self.assertIn("statistics", user)
         self.assertIsInstance(user.get("statistics"), dict)
 
@@ -933,6 +980,26 @@ class TestUserRoute(TestSuite):
         self.assertIn("feel_past_week", statistics)
         self.assertEqual(9, statistics.get("feel_past_week"))
 
+    def test_user_snapshot_by_username_get_route_all_notifications(self) -> None:
+        """
+        Test performing an HTTP GET request on the '/v2/users/snapshot/<username>' route.  This test proves that the
+        snapshot isn't paginated, and includes every notification from the past two weeks.
+        """
+        response: Response = self.client.get(
+            "/v2/users/snapshot/andy", headers={"Authorization": f"Bearer {self.jwt}"}
+        )
+        self.assertEqual(response.status_code, 200)
+        snapshot_notifications = response.get_json().get("user").get("notifications")
+
+        response: Response = self.client.get(
+            "/v2/users/notifications/andy",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.get_json().get("notifications"), snapshot_notifications
+        )
+
     def test_user_snapshot_by_username_get_route_forbidden(self) -> None:
         """
         Test performing a forbidden HTTP GET request on the '/v2/users/snapshot/<username>' route.
@@ -1424,6 +1491,83 @@ class TestUserRoute(TestSuite):
             AuthVariant.UNAUTHORIZED,
         )
 
+    def test_user_notifications_by_username_get_route_200_paginated(self) -> None:
+        """
+        Test performing a successful HTTP GET request on the '/v2/users/notifications/<username>' route with a page
+        size.  This test proves that following the 'next' links returns every notification once, newest first.
+        """
+        url = "/v2/users/notifications/andy?limit=2"
+        notifications = []
+
+        while url is not None:
+            response: Response = self.client.get(
+                url, headers={"Authorization": f"Bearer {self.jwt}"}
+            )
+            response_json: dict = response.get_json()
+            self.assertEqual(response.status_code, 200)
+            self.assertLessEqual(len(response_json.get("notifications")), 2)
+            self.assertIsInstance(response_json.get("unread"), int)
+
+            notifications += response_json.get("notifications")
+            url = response_json.get("next")
+
+        ids = [notification.get("notification_id") for notification in notifications]
+        self.assertGreater(len(ids), 0)
+        self.assertEqual(len(ids), len(set(ids)))
+
+    def test_user_notifications_by_username_get_route_400_cursor(self) -> None:
+        """
+        Test performing an HTTP GET request on the '/v2/users/notifications/<username>' route with an invalid cursor.
+        """
+        response: Response = self.client.get(
+            "/v2/users/notifications/andy?cursor=invalid",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response_json.get("error"), "the cursor is invalid")
+
+    def test_user_notification_count_by_username_get_route_200(self) -> None:
+        """
+        Test performing a successful HTTP GET request on the '/v2/users/notifications/<username>/count' route.
+        """
+        response: Response = self.client.get(
+            "/v2/users/notifications/andy/count",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response_json.get("self"), "/v2/users/notifications/andy/count"
+        )
+        self.assertEqual(response_json.get("username"), "andy")
+        self.assertIsInstance(response_json.get("unread"), int)
+        self.assertGreaterEqual(response_json.get("unread"), 0)
+
+    def test_user_notification_count_by_username_get_route_forbidden(self) -> None:
+        """
+        Test performing a forbidden HTTP GET request on the '/v2/users/notifications/<username>/count' route.
+        """
+        test_route_auth(
+            self,
+            self.client,
+            "GET",
+            "/v2/users/notifications/andy/count",
+            AuthVariant.FORBIDDEN,
+        )
+
+    def test_user_notification_count_by_username_get_route_unauthorized(self) -> None:
+        """
+        Test performing an unauthorized HTTP GET request on the '/v2/users/notifications/<username>/count' route.
+        """
+        test_route_auth(
+            self,
+            self.client,
+            "GET",
+            "/v2/users/notifications/andy/count",
+            AuthVariant.UNAUTHORIZED,
+        )
+
     def test_user_flair_by_username_get_route_200(self) -> None:
         """
         Test performing a successful HTTP GET request on the '/v2/users/flair/<username>' route.
@@ -1562,6 +1706,27 @@ class TestUserRoute(TestSuite):
             or isinstance(statistics.get("feel_past_week"), float)
         )
 
+        for key in [
+            "run_pace_all_time",
+            "run_pace_past_year",
+            "run_pace_past_month",
+            "run_pace_past_week",
+            "run_best_pace_all_time",
+            "run_best_pace_past_year",
+            "run_best_pace_past_month",
+            "run_best_pace_past_week",
+        ]:
+            self.assertIn(key, statistics)
+            self.assertTrue(
+                statistics.get(key) is None or isinstance(statistics.get(key), int)
+            )
+
+        if statistics.get("run_pace_all_time") is not None:
+            self.assertLessEqual(
+                statistics.get("run_best_pace_all_time"),
+                statistics.get("run_pace_all_time"),
+            )
+
     def test_user_statistics_by_username_get_route_forbidden(self) -> None:
         """
         Test performing a forbidden HTTP GET request on the '/v2/users/statistics/<username>' route.
@@ -1582,6 +1747,95 @@ class TestUserRoute(TestSuite):
             AuthVariant.UNAUTHORIZED,
         )
 
+    def test_user_records_by_username_get_route_400_no_existing(self) -> None:
+        """
+        Test performing an HTTP GET request on the '/v2/users/records/<username>' route.  This test proves that
+        trying to get personal records for a user that doesn't exist results in a 400 error.
+        """
+        response: Response = self.client.get(
+            "/v2/users/records/bound2",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response_json.get("self"), "/v2/users/records/bound2")
+        self.assertIsNone(response_json.get("records"))
+        self.assertEqual(
+            response_json.get("error"), "there is no user with this username"
+        )
+
+    def test_user_records_by_username_get_route_200(self) -> None:
+        """
+        Test performing an HTTP GET request on the '/v2/users/records/<username>' route.  This test proves that a new
+        exercise log becomes a personal record, and that the record is given up when the log is deleted.
+        """
+        request_body = json.dumps(
+            {
+                "username": "andy",
+                "first": "Andrew",
+                "last": "Jarombek",
+                "date": "2019-11-21",
+                "type": "run",
+                "distance": 1,
+                "metric": "miles",
+                "time": "00:02:30",
+                "feel": 6,
+            }
+        )
+
+        response: Response = self.client.post(
+            "/v2/logs/",
+            data=request_body,
+            content_type="application/json",
+            headers={"Authorization": f"Bearer {self.jwt}"},
+        )
+        log_id = response.get_json().get("log").get("log_id")
+
+        response: Response = self.client.get(
+            "/v2/users/records/andy", headers={"Authorization": f"Bearer {self.jwt}"}
+        )
+        response_json: dict = response.get_json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response_json.get("self"), "/v2/users/records/andy")
+
+        mile = response_json.get("records").get("run").get("mile")
+        self.assertEqual(mile.get("log_id"), log_id)
+        self.assertEqual(mile.get("seconds"), 150)
+        self.assertEqual(mile.get("date"), "2019-11-21")
+
+        longest = response_json.get("records").get("run").get("longest")
+        self.assertGreaterEqual(longest.get("miles"), 1)
+
+        self.client.delete(
+            f"/v2/logs/soft/{log_id}", headers={"Authorization": f"Bearer {self.jwt}"}
+        )
+
+        response: Response = self.client.get(
+            "/v2/users/records/andy", headers={"Authorization": f"Bearer {self.jwt}"}
+        )
+        mile = response.get_json().get("records").get("run").get("mile")
+        self.assertTrue(mile is None or mile.get("log_id") != log_id)
+
+    def test_user_records_by_username_get_route_forbidden(self) -> None:
+        """
+        Test performing a forbidden HTTP GET request on the '/v2/users/records/<username>' route.
+        """
+        test_route_auth(
+            self, self.client, "GET", "/v2/users/records/andy", AuthVariant.FORBIDDEN
+        )
+
+    def test_user_records_by_username_get_route_unauthorized(self) -> None:
+        """
+        Test performing an unauthorized HTTP GET request on the '/v2/users/records/<username>' route.
+        """
+        test_route_auth(
+            self,
+            self.client,
+            "GET",
+            "/v2/users/records/andy",
+            AuthVariant.UNAUTHORIZED,
+        )
+
     def test_user_change_password_by_username_put_route_500_missing_required_field(
         self,
     ) -> None:
@@ -1837,4 +2091,4 @@ class TestUserRoute(TestSuite):
         response_json: dict = response.get_json()
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response_json.get("self"), "/v2/users/links")
-        self.assertEqual(len(response_json.get("endpoints")), 17)
+        self.assertEqual(len(response_json.get("endpoints")), 19)
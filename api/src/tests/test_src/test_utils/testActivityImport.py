@@ -0,0 +1,147 @@
+"""
+Test suite for the activity file parsers (api/src/utils/activityImport.py)
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+import io
+
+import numpy as np
+from defusedxml import DefusedXmlException
+
+from tests.TestSuite import TestSuite
+from utils.activityImport import haversine_distance, parse_activities
+
+GPX = b"""<?xml version="1.0" encoding="UTF-8"?>
+<gpx version="1.1" creator="test" xmlns="http://www.topografix.com/GPX/1/1">
+  <metadata><name>Export</name></metadata>
+  <trk>
+    <name>Central Park Loop</name>
+    <type>running</type>
+    <trkseg>
+      <trkpt lat="40.7800" lon="-73.9700"><ele>30</ele><time>2026-10-19T12:00:00Z</time></trkpt>
+      <trkpt lat="40.7900" lon="-73.9700"><ele>31</ele><time>2026-10-19T12:04:00Z</time></trkpt>
+    </trkseg>
+    <trkseg>
+      <trkpt lat="40.8000" lon="-73.9700"><time>2026-10-19T12:10:00Z</time></trkpt>
+      <trkpt lat="40.8100" lon="-73.9700"><time>2026-10-19T12:14:00Z</time></trkpt>
+    </trkseg>
+  </trk>
+  <trk>
+    <type>cycling</type>
+    <trkseg>
+      <trkpt lat="40.7800" lon="-73.9700"><time>2026-10-20T12:00:00Z</time></trkpt>
+    </trkseg>
+  </trk>
+</gpx>"""
+
+# An entity expansion ("billion laughs") document, which must be rejected before its entities are expanded.
+ENTITY_GPX = b"""<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE gpx [
+  <!ENTITY lol "lol">
+  <!ENTITY lol2 "&lol;&lol;&lol;&lol;&lol;&lol;&lol;&lol;&lol;&lol;">
+]>
+<gpx version="1.1" xmlns="http://www.topografix.com/GPX/1/1">
+  <trk><name>&lol2;</name></trk>
+</gpx>"""
+
+TCX = b"""<?xml version="1.0" encoding="UTF-8"?>
+<TrainingCenterDatabase xmlns="http://www.garmin.com/xmlschemas/TrainingCenterDatabase/v2">
+  <Activities>
+    <Activity Sport="Running">
+      <Id>2026-10-19T12:00:00Z</Id>
+      <Lap StartTime="2026-10-19T12:00:00Z">
+        <TotalTimeSeconds>1200</TotalTimeSeconds>
+        <DistanceMeters>5000</DistanceMeters>
+        <Track>
+          <Trackpoint><Time>2026-10-19T12:00:00Z</Time><DistanceMeters>0</DistanceMeters></Trackpoint>
+          <Trackpoint><Time>2026-10-19T12:20:00Z</Time><DistanceMeters>5000</DistanceMeters></Trackpoint>
+        </Track>
+      </Lap>
+      <Notes>Treadmill 5K</Notes>
+    </Activity>
+  </Activities>
+</TrainingCenterDatabase>"""
+
+
+class TestActivityImport(TestSuite):
+    def test_haversine_distance(self) -> None:
+        """
+        Prove that the distance along a path is the sum of the distances between consecutive points.
+        """
+        latitudes = np.array([0.0, 0.0, 1.0])
+        longitudes = np.array([0.0, 1.0, 1.0])
+
+        self.assertAlmostEqual(
+            222390, haversine_distance(latitudes, longitudes), delta=10
+        )
+        self.assertEqual(0.0, haversine_distance(latitudes[:1], longitudes[:1]))
+
+    def test_parse_gpx(self) -> None:
+        """
+        Prove that each track in a GPX file becomes an exercise log, and that the distance between track segments
+        isn't counted.
+        """
+        logs = list(parse_activities(io.BytesIO(GPX), "gpx"))
+
+        self.assertEqual(2, len(logs))
+        self.assertEqual("Central Park Loop", logs[0]["name"])
+        self.assertEqual("run", logs[0]["type"])
+        self.assertEqual("2026-10-19", logs[0]["date"])
+        self.assertEqual(1.38, logs[0]["distance"])
+        self.assertEqual("miles", logs[0]["metric"])
+        self.assertEqual("00:14:00", logs[0]["time"])
+
+        self.assertEqual("bike", logs[1]["type"])
+        self.assertIsNone(logs[1]["distance"])
+        self.assertIsNone(logs[1]["time"])
+
+    def test_parse_tcx(self) -> None:
+        """
+        Prove that activities without positions use the distance recorded by the device.
+        """
+        logs = list(parse_activities(io.BytesIO(TCX), "tcx", exercise_type="other"))
+
+        self.assertEqual(1, len(logs))
+        self.assertEqual("Treadmill 5K", logs[0]["name"])
+        self.assertEqual("other", logs[0]["type"])
+        self.assertEqual(3.11, logs[0]["distance"])
+        self.assertEqual("00:20:00", logs[0]["time"])
+
+    def test_parse_tcx_long_time(self) -> None:
+        """
+        Prove that activities longer than 99:59:59 keep their full duration, so validation can reject them.
+        """
+        tcx = TCX.replace(
+            b"<Time>2026-10-19T12:20:00Z</Time>", b"<Time>2026-10-23T16:00:05Z</Time>"
+        )
+        logs = list(parse_activities(io.BytesIO(tcx), "tcx"))
+
+        self.assertEqual("100:00:05", logs[0]["time"])
+
+    def test_parse_dtd(self) -> None:
+        """
+        Prove that activity files with a DTD are rejected instead of having their entities expanded.
+        """
+        with self.assertRaises(DefusedXmlException):
+            list(parse_activities(io.BytesIO(ENTITY_GPX), "gpx"))
+
+    def test_parse_csv(self) -> None:
+        """
+        Prove that each row in a CSV file becomes an exercise log, and that invalid numbers are left for validation.
+        """
+        csv = (
+            "Date,Type,Distance,Metric,Time,Feel,Name\n"
+            "2026-10-19,Running,5,kilometers,20:00,7,Tempo\n"
+            "2026-10-20,bike,far,,1:00:00,,\n"
+        )
+        logs = list(parse_activities(io.BytesIO(csv.encode("utf-8")), "csv"))
+
+        self.assertEqual(2, len(logs))
+        self.assertEqual("run", logs[0]["type"])
+        self.assertEqual(5.0, logs[0]["distance"])
+        self.assertEqual("kilometers", logs[0]["metric"])
+        self.assertEqual(7, logs[0]["feel"])
+        self.assertEqual("far", logs[1]["distance"])
+        self.assertEqual("miles", logs[1]["metric"])
+        self.assertIsNone(logs[1]["feel"])
@@ -0,0 +1,171 @@
+"""
+Test suite for archiving soft deleted rows (api/src/utils/archive.py)
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+from datetime import datetime, timedelta
+
+from tests.TestSuite import TestSuite
+from database import db
+from utils.archive import archive, restore, get_archived_table, parse_keys
+
+
+class TestArchive(TestSuite):
+    def setUp(self) -> None:
+        super().setUp()
+        self.deleted_date = datetime.now() - timedelta(days=400)
+
+    def count(self, table: str, key: str, value: int) -> int:
+        """
+        Count the rows in a table with a certain key.
+        """
+        # pylint: disable=no-member
+        return db.session.execute(
+            f"SELECT COUNT(*) FROM {table} WHERE {key} = :value", {"value": value}
+        ).scalar()
+
+    def add_log(self, deleted: bool) -> int:
+        """
+        Add an exercise log for the test user, which is soft deleted a long time ago if 'deleted' is True.
+        """
+        # pylint: disable=no-member
+        result = db.session.execute(
+            """
+            INSERT INTO logs (
+                username, first, last, date, type, feel, time_created, deleted, deleted_date
+            ) VALUES (
+                'andy', 'Andrew', 'Jarombek', '2019-11-21', 'run', 6, :now, :deleted, :deleted_date
+            )
+            """,
+            {
+                "now": datetime.now(),
+                "deleted": deleted,
+                "deleted_date": self.deleted_date if deleted else None,
+            },
+        )
+        db.session.commit()
+        return result.lastrowid
+
+    def add_comment(self, log_id: int, deleted: bool) -> int:
+        """
+        Add a comment to an exercise log, which is soft deleted a long time ago if 'deleted' is True.
+        """
+        # pylint: disable=no-member
+        result = db.session.execute(
+            """
+            INSERT INTO comments (
+                username, first, last, log_id, time, content, deleted, deleted_date
+            ) VALUES (
+                'andy', 'Andrew', 'Jarombek', :log_id, :now, 'Archived', :deleted, :deleted_date
+            )
+            """,
+            {
+                "log_id": log_id,
+                "now": datetime.now(),
+                "deleted": deleted,
+                "deleted_date": self.deleted_date if deleted else None,
+            },
+        )
+        db.session.commit()
+        return result.lastrowid
+
+    def test_parse_keys(self) -> None:
+        """
+        Prove that composite keys given on the command line are split into their columns.
+        """
+        self.assertEqual(
+            ["12", "13"], parse_keys(get_archived_table("logs"), ["12", "13"])
+        )
+        self.assertEqual(
+            [("saintsxctf", "andy")],
+            parse_keys(get_archived_table("teammembers"), ["saintsxctf,andy"]),
+        )
+        self.assertRaises(
+            ValueError, parse_keys, get_archived_table("teammembers"), ["andy"]
+        )
+        self.assertRaises(ValueError, get_archived_table, "users")
+
+    def test_archive_and_restore(self) -> None:
+        """
+        Prove that soft deleted rows older than the retention window are moved to the archive table, and that they can
+        be moved back.
+        """
+        # pylint: disable=no-member
+        result = db.session.execute(
+            """
+            INSERT INTO notifications (username, time, viewed, description, deleted, deleted_date)
+            VALUES ('andy', :now, 'Y', 'Archived', TRUE, :deleted_date)
+            """,
+            {"now": datetime.now(), "deleted_date": self.deleted_date},
+        )
+        db.session.commit()
+        notification_id = result.lastrowid
+
+        archive(retention_days=500, tables=["notifications"])
+        self.assertEqual(
+            1, self.count("notifications", "notification_id", notification_id)
+        )
+
+        counts = archive(retention_days=365, batch_size=1, tables=["notifications"])
+        self.assertGreaterEqual(counts["notifications"], 1)
+        self.assertEqual(
+            0, self.count("notifications", "notification_id", notification_id)
+        )
+        self.assertEqual(
+            1,
+            self.count("notifications_archive", "notification_id", notification_id),
+        )
+
+        counts = restore("notifications", [notification_id])
+        self.assertEqual({"notifications": 1}, counts)
+        self.assertEqual(
+            1, self.count("notifications", "notification_id", notification_id)
+        )
+        self.assertEqual(
+            0,
+            self.count("notifications_archive", "notification_id", notification_id),
+        )
+
+        db.session.execute(
+            "DELETE FROM notifications WHERE notification_id = :notification_id",
+            {"notification_id": notification_id},
+        )
+        db.session.commit()
+
+    def test_archive_referenced_rows(self) -> None:
+        """
+        Prove that logs are only archived once they have no comments, and that restoring a comment also restores its
+        log.
+        """
+        log_id = self.add_log(deleted=True)
+        comment_id = self.add_comment(log_id, deleted=False)
+
+        archive(tables=["comments", "logs"])
+        self.assertEqual(1, self.count("logs", "log_id", log_id))
+
+        # pylint: disable=no-member
+        db.session.execute(
+            "UPDATE comments SET deleted = TRUE, deleted_date = :deleted_date WHERE comment_id = :comment_id",
+            {"deleted_date": self.deleted_date, "comment_id": comment_id},
+        )
+        db.session.commit()
+
+        archive(tables=["comments", "logs"])
+        self.assertEqual(0, self.count("logs", "log_id", log_id))
+        self.assertEqual(1, self.count("logs_archive", "log_id", log_id))
+        self.assertEqual(1, self.count("comments_archive", "comment_id", comment_id))
+
+        counts = restore("comments", [comment_id])
+        self.assertEqual({"logs": 1, "comments": 1}, counts)
+        self.assertEqual(1, self.count("logs", "log_id", log_id))
+        self.assertEqual(1, self.count("comments", "comment_id", comment_id))
+
+        db.session.execute(
+            "DELETE FROM comments WHERE comment_id = :comment_id",
+            {"comment_id": comment_id},
+        )
+        db.session.execute(
+            "DELETE FROM logs WHERE log_id = :log_id", {"log_id": log_id}
+        )
+        db.session.commit()
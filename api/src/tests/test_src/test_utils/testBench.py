@@ -0,0 +1,63 @@
+"""
+Test suite for the benchmark helper functions (api/src/utils/bench.py)
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+import base64
+import json
+
+from tests.TestSuite import TestSuite
+from utils.bench import percentile, summarize, compare
+from utils.stubServices import make_token
+
+
+class TestBench(TestSuite):
+    def test_percentile(self) -> None:
+        """
+        Prove that percentiles interpolate between the closest ranks of unordered samples.
+        """
+        samples = [4.0, 1.0, 3.0, 2.0, 5.0]
+        self.assertEqual(1.0, percentile(samples, 0))
+        self.assertEqual(3.0, percentile(samples, 50))
+        self.assertEqual(5.0, percentile(samples, 100))
+        self.assertAlmostEqual(4.8, percentile(samples, 95))
+        self.assertEqual(0.0, percentile([], 50))
+
+    def test_summarize(self) -> None:
+        """
+        Prove that a summary contains the mean, min, max, and each reported percentile.
+        """
+        summary = summarize([10.0, 20.0, 30.0])
+        self.assertEqual(
+            {"p50", "p95", "p99", "mean", "min", "max"}, set(summary.keys())
+        )
+        self.assertEqual(20.0, summary["p50"])
+        self.assertEqual(20.0, summary["mean"])
+        self.assertEqual(10.0, summary["min"])
+        self.assertEqual(30.0, summary["max"])
+
+    def test_compare(self) -> None:
+        """
+        Prove that comparing two runs gives the percent change of benchmarks which exist in both runs.
+        """
+        baseline = {
+            "benchmarks": {"a": {"latency_ms": {"p50": 10.0, "p95": 20.0, "p99": 0}}}
+        }
+        current = {
+            "benchmarks": {
+                "a": {"latency_ms": {"p50": 15.0, "p95": 10.0, "p99": 5.0}},
+                "b": {"latency_ms": {"p50": 1.0, "p95": 1.0, "p99": 1.0}},
+            }
+        }
+        self.assertEqual(
+            {"a": {"p50": 50.0, "p95": -50.0, "p99": None}}, compare(current, baseline)
+        )
+
+    def test_make_token(self) -> None:
+        """
+        Prove that tokens created for the stand-in authentication service contain the username as a claim.
+        """
+        payload = make_token("andy").split(".")[1]
+        claims = json.loads(base64.b64decode(payload + "=="))
+        self.assertEqual("andy", claims["sub"])
@@ -0,0 +1,137 @@
+"""
+Test suite for the cache functions (api/src/utils/cache.py)
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+import time
+
+from flask import jsonify
+
+from tests.TestSuite import TestSuite
+from utils.cache import Cache, MemoryBackend, RedisBackend, cached
+
+
+class LocalRedis:
+    """
+    Stand-in for a Redis client which keeps values in a dictionary.
+    """
+
+    def __init__(self):
+        self.values = {}
+
+    def mget(self, keys):
+        """
+        Get multiple values.
+        """
+        return [self.values.get(key) for key in keys]
+
+    def set(self, key, value, ex=None, nx=False):  # pylint: disable=unused-argument
+        """
+        Set a value, unless nx is True and the key already has a value.  Values don't expire.
+        """
+        if nx and key in self.values:
+            return None
+
+        self.values[key] = value
+        return True
+
+    def delete(self, key):
+        """
+        Remove a value.
+        """
+        self.values.pop(key, None)
+
+    def flushdb(self):
+        """
+        Remove every value.
+        """
+        self.values.clear()
+
+
+class TestCache(TestSuite):
+    def test_memory_backend_lru(self) -> None:
+        """
+        Prove that the in-process cache evicts the least recently used entry when it is full.
+        """
+        backend = MemoryBackend(max_entries=2)
+        backend.set("a", b"1", 60)
+        backend.set("b", b"2", 60)
+        backend.get_many(["a"])
+        backend.set("c", b"3", 60)
+        self.assertEqual([b"1", None, b"3"], backend.get_many(["a", "b", "c"]))
+
+    def test_memory_backend_ttl(self) -> None:
+        """
+        Prove that entries in the in-process cache expire.
+        """
+        backend = MemoryBackend()
+        backend.set("a", b"1", 0.01)
+        time.sleep(0.02)
+        self.assertEqual([None], backend.get_many(["a"]))
+
+    def test_tag_invalidation(self) -> None:
+        """
+        Prove that invalidating a tag causes entries with the tag to be computed again.
+        """
+        cache = Cache(RedisBackend(client=LocalRedis()))
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        self.assertEqual(1, cache.get_or_set("key", compute, tags=["teams"]))
+        self.assertEqual(1, cache.get_or_set("key", compute, tags=["teams"]))
+        cache.invalidate("teams")
+        self.assertEqual(2, cache.get_or_set("key", compute, tags=["teams"]))
+        self.assertEqual(1, cache.stats()["hits"])
+        self.assertEqual(2, cache.stats()["misses"])
+
+    def test_cached_response(self) -> None:
+        """
+        Prove that route functions are cached by their arguments, and that only responses with a 200 status are cached.
+        """
+        self.app.extensions["cache"] = Cache(MemoryBackend())
+        calls = []
+
+        @cached("test", tags=lambda name: [f"test:{name}"])
+        def route(name):
+            calls.append(name)
+            response = jsonify({"name": name})
+            response.status_code = 200 if name else 400
+            return response
+
+        self.assertEqual({"name": "andy"}, route("andy").get_json())
+        self.assertEqual({"name": "andy"}, route("andy").get_json())
+        self.assertEqual("0", route("andy").headers.get("Age"))
+        self.assertEqual(["andy"], calls)
+
+        self.assertEqual(400, route("").status_code)
+        self.assertEqual(400, route("").status_code)
+        self.assertEqual(["andy", "", ""], calls)
+
+        self.app.extensions["cache"].invalidate_namespace("test")
+        route("andy")
+        self.assertEqual(["andy", "", "", "andy"], calls)
+
+    def test_stale_while_revalidate(self) -> None:
+        """
+        Prove that a stale entry is returned while it is recomputed in the background.
+        """
+        cache = Cache(MemoryBackend())
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        self.assertEqual(1, cache.get_or_set("key", compute, ttl=0.05, stale_ttl=60))
+        time.sleep(0.1)
+
+        self.assertEqual(1, cache.get_or_set("key", compute, ttl=0.05, stale_ttl=60))
+        time.sleep(0.02)
+        self.assertEqual(2, len(calls))
+        self.assertEqual(1, cache.stats()["stale_hits"])
+
+        self.assertEqual(2, cache.get_or_set("key", compute, ttl=0.05, stale_ttl=60))
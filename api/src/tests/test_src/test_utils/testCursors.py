@@ -0,0 +1,28 @@
+"""
+Test suite for the keyset pagination cursors (api/src/utils/cursors.py)
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+from datetime import datetime
+
+from tests.TestSuite import TestSuite
+from utils.cursors import encode_cursor, decode_cursor
+
+
+class TestCursors(TestSuite):
+    def test_round_trip(self) -> None:
+        """
+        Prove that the values in a cursor are read back, with datetimes as ISO 8601 strings.
+        """
+        cursor = encode_cursor(datetime(2026, 10, 19, 7, 30), 42)
+        self.assertNotIn("=", cursor)
+        self.assertEqual(["2026-10-19T07:30:00", 42], decode_cursor(cursor, 2))
+
+    def test_invalid_cursor(self) -> None:
+        """
+        Prove that missing, malformed, and unexpected cursors are treated as invalid.
+        """
+        self.assertIsNone(decode_cursor(None, 2))
+        self.assertIsNone(decode_cursor("not a cursor", 2))
+        self.assertIsNone(decode_cursor(encode_cursor(1, 2, 3), 2))
@@ -0,0 +1,31 @@
+"""
+Test suite for the date helper functions (api/src/utils/dates.py)
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+from tests.TestSuite import TestSuite
+from utils.dates import get_period_containing_sql
+
+
+class TestDates(TestSuite):
+    def test_get_period_containing_sql(self) -> None:
+        """
+        Prove that logs are bucketed by the first day of their day, week, month, or year.
+        """
+        self.assertEqual("date", get_period_containing_sql("date"))
+        self.assertEqual(
+            "DATE_SUB(date, INTERVAL WEEKDAY(date) DAY)",
+            get_period_containing_sql("date", "week"),
+        )
+        self.assertEqual(
+            "DATE_SUB(date, INTERVAL DAYOFWEEK(date) - 1 DAY)",
+            get_period_containing_sql("date", "week", "sunday"),
+        )
+        self.assertEqual(
+            "MAKEDATE(YEAR(date), 1) + INTERVAL MONTH(date) - 1 MONTH",
+            get_period_containing_sql("date", "month"),
+        )
+        self.assertEqual(
+            "MAKEDATE(YEAR(date), 1)", get_period_containing_sql("date", "year")
+        )
@@ -0,0 +1,57 @@
+"""
+Test suite for the domain event functions (api/src/utils/events.py)
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+from tests.TestSuite import TestSuite
+from utils.events import (
+    subscribe,
+    subscribers,
+    publish,
+    dispatch_pending,
+    discard_pending,
+    LogChanged,
+)
+
+
+class TestEvents(TestSuite):
+    def setUp(self) -> None:
+        super().setUp()
+        self.received = []
+
+        @subscribe(LogChanged)
+        def receive(event):
+            self.received.append(event)
+
+        self.subscriber = receive
+
+    def tearDown(self) -> None:
+        subscribers[LogChanged].remove(self.subscriber)
+        super().tearDown()
+
+    def test_dispatch_pending(self) -> None:
+        """
+        Prove that published events are only delivered once the transaction commits, and that duplicate events are
+        delivered once.
+        """
+        publish(LogChanged(username="andy", date="2026-10-19"))
+        publish(LogChanged(username="andy", date="2026-10-19"))
+        self.assertEqual([], self.received)
+
+        dispatch_pending()
+        self.assertEqual(
+            [LogChanged(username="andy", date="2026-10-19")], self.received
+        )
+
+        dispatch_pending()
+        self.assertEqual(1, len(self.received))
+
+    def test_discard_pending(self) -> None:
+        """
+        Prove that events published in a transaction which was rolled back are never delivered.
+        """
+        publish(LogChanged(username="andy"))
+        discard_pending()
+        dispatch_pending()
+        self.assertEqual([], self.received)
@@ -0,0 +1,104 @@
+"""
+Test suite for the load test helper functions (api/src/utils/loadTest.py)
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+import random
+
+from tests.TestSuite import TestSuite
+from utils.loadTest import substitute, parse_collection, plan, report
+
+
+class TestLoadTest(TestSuite):
+    def test_substitute(self) -> None:
+        """
+        Prove that Postman variables are replaced with their values and unknown variables are left in place.
+        """
+        self.assertEqual(
+            "http://localhost:5000/v2/users/andy/{{unknown}}",
+            substitute(
+                "{{baseUrl}}/v2/users/{{username}}/{{unknown}}",
+                {"baseUrl": "http://localhost:5000", "username": "andy"},
+            ),
+        )
+        self.assertIsNone(substitute(None, {}))
+
+    def test_parse_collection(self) -> None:
+        """
+        Prove that requests in folders are flattened and requests without a URL are skipped.
+        """
+        collection = {
+            "item": [
+                {"name": "blank", "request": {"method": "GET", "url": {"raw": ""}}},
+                {
+                    "name": "folder",
+                    "item": [
+                        {
+                            "name": "log create",
+                            "request": {
+                                "method": "POST",
+                                "header": [
+                                    {
+                                        "key": "Authorization",
+                                        "value": "Bearer {{token}}",
+                                    },
+                                    {
+                                        "key": "X-Disabled",
+                                        "value": "",
+                                        "disabled": True,
+                                    },
+                                ],
+                                "body": {"mode": "raw", "raw": '{"feel": 6}'},
+                                "url": {"raw": "{{baseUrl}}/v2/logs/"},
+                            },
+                        }
+                    ],
+                },
+                {"name": "user", "request": {"url": "{{baseUrl}}/v2/users/andy"}},
+            ]
+        }
+        requests = parse_collection(collection)
+        self.assertEqual(["log create", "user"], [r["name"] for r in requests])
+        self.assertEqual({"Authorization": "Bearer {{token}}"}, requests[0]["headers"])
+        self.assertEqual('{"feel": 6}', requests[0]["body"])
+        self.assertEqual("GET", requests[1]["method"])
+        self.assertIsNone(requests[1]["body"])
+
+    def test_plan(self) -> None:
+        """
+        Prove that requests are scheduled at an even rate and follow the weighted traffic mix.
+        """
+        requests = [{"name": "heavy"}, {"name": "light"}]
+        schedule = plan(
+            requests,
+            {"heavy": 9, "light": 1},
+            rps=100,
+            duration=10,
+            rng=random.Random(3),
+        )
+        self.assertEqual(1000, len(schedule))
+        self.assertEqual(0.0, schedule[0][0])
+        self.assertAlmostEqual(9.99, schedule[-1][0])
+
+        heavy = sum(1 for _, request in schedule if request["name"] == "heavy")
+        self.assertGreater(heavy, 850)
+        self.assertEqual([], plan([], {}, rps=10, duration=10, rng=random.Random(3)))
+
+    def test_report(self) -> None:
+        """
+        Prove that failed requests count as errors and are excluded from throughput.
+        """
+        samples = [
+            {"name": "user", "status": 200, "latency_ms": 10.0},
+            {"name": "user", "status": 500, "latency_ms": 30.0},
+            {"name": "user", "status": None, "latency_ms": 50.0},
+            {"name": "logfeed all", "status": 200, "latency_ms": 20.0},
+        ]
+        results = report(samples, duration=2.0)
+        self.assertEqual(4, results["total"]["requests"])
+        self.assertEqual(2, results["total"]["errors"])
+        self.assertEqual(1.0, results["total"]["throughput_rps"])
+        self.assertEqual(["logfeed all", "user"], list(results["routes"].keys()))
+        self.assertEqual(30.0, results["routes"]["user"]["latency_ms"]["p50"])
+        self.assertEqual(0.5, results["routes"]["user"]["throughput_rps"])
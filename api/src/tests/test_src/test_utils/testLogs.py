@@ -5,7 +5,7 @@ Date: 9/2/2020
 """
 
 from tests.TestSuite import TestSuite
-from utils.logs import to_miles, calculate_mile_pace
+from utils.logs import to_miles, calculate_mile_pace, is_too_long_time
 
 
 class TestUtilLog(TestSuite):
@@ -64,3 +64,12 @@ class TestUtilLog(TestSuite):
         time = "1:25:30"
 
         self.assertEqual("00:06:56", calculate_mile_pace(miles, time))
+
+    def test_too_long_time(self) -> None:
+        """
+        Prove that times with more than two hour digits are recognized as too long to store.
+        """
+        self.assertTrue(is_too_long_time("100:00:05"))
+        self.assertFalse(is_too_long_time("99:59:59"))
+        self.assertFalse(is_too_long_time("20:00"))
+        self.assertFalse(is_too_long_time(None))
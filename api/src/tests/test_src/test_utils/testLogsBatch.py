@@ -0,0 +1,114 @@
+"""
+Test suite for the batch utility functions for exercise logs (api/src/utils/logsBatch.py)
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+import random
+
+from tests.TestSuite import TestSuite
+from model.Log import Log
+from utils.logs import to_miles, calculate_mile_pace, duration_seconds
+from utils.logsBatch import (
+    parse_durations,
+    to_miles_batch,
+    calculate_mile_paces,
+    normalize_logs,
+)
+
+
+class TestUtilLogsBatch(TestSuite):
+    def test_parse_durations(self) -> None:
+        """
+        Prove that times are converted to seconds, and that invalid times are zero seconds.
+        """
+        times = [
+            "1:02:03",
+            "01:02:03",
+            "2:03",
+            "02:03",
+            "03",
+            "3",
+            "1:2:03",
+            "ab:cd",
+            "",
+            "100:00:00",
+            "٣٣",
+        ]
+        self.assertEqual(
+            [3723, 3723, 123, 123, 3, 0, 0, 0, 0, 0, 33],
+            parse_durations(times).tolist(),
+        )
+
+    def test_matches_scalar_functions(self) -> None:
+        """
+        Prove that the batch functions give the same results as the functions which handle one log at a time.
+        """
+        generator = random.Random(38)
+        metrics = []
+        distances = []
+        times = []
+
+        for _ in range(5000):
+            metrics.append(generator.choice(["miles", "kilometers", "meters", "yards"]))
+            distances.append(
+                generator.choice(
+                    [0, generator.randint(1, 20000), generator.uniform(0, 50), 0.0001]
+                )
+            )
+
+            hours, minutes, seconds = (
+                generator.randint(0, 99),
+                generator.randint(0, 59),
+                generator.randint(0, 59),
+            )
+            times.append(
+                generator.choice(
+                    [
+                        f"{hours}:{minutes:02d}:{seconds:02d}",
+                        f"{minutes:02d}:{seconds:02d}",
+                        f"{minutes}:{seconds:02d}",
+                        f"{seconds:02d}",
+                        "".join(
+                            generator.choice("0123456789: x")
+                            for _ in range(generator.randint(0, 9))
+                        ),
+                    ]
+                )
+            )
+
+        miles = to_miles_batch(metrics, distances).tolist()
+        self.assertEqual(
+            [
+                to_miles(metric, distance)
+                for metric, distance in zip(metrics, distances)
+            ],
+            miles,
+        )
+        self.assertEqual(
+            [duration_seconds(time) for time in times], parse_durations(times).tolist()
+        )
+        self.assertEqual(
+            [calculate_mile_pace(mile, time) for mile, time in zip(miles, times)],
+            calculate_mile_paces(miles, times),
+        )
+
+    def test_normalize_logs(self) -> None:
+        """
+        Prove that miles are only computed for logs with a distance and metric, and pace only for logs with a time.
+        """
+        logs = [
+            Log({"distance": 5, "metric": "kilometers", "time": "20:00"}),
+            Log({"distance": 2, "metric": "miles", "time": None}),
+            Log({"distance": None, "metric": None, "time": "20:00"}),
+        ]
+        normalize_logs(logs)
+
+        self.assertEqual(to_miles("kilometers", 5), logs[0].miles)
+        self.assertEqual(
+            calculate_mile_pace(to_miles("kilometers", 5), "20:00"), logs[0].pace
+        )
+        self.assertEqual(2, logs[1].miles)
+        self.assertIsNone(logs[1].pace)
+        self.assertIsNone(logs[2].miles)
+        self.assertIsNone(logs[2].pace)
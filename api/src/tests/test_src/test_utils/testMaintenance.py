@@ -0,0 +1,97 @@
+"""
+Test suite for the maintenance job which removes expired rows (api/src/utils/maintenance.py)
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+from datetime import datetime, timedelta
+
+from tests.TestSuite import TestSuite
+from dao.notificationDao import NotificationDao
+from database import db
+from utils.maintenance import run, report
+
+
+class TestMaintenance(TestSuite):
+    def count(self, table: str, condition: str, params: dict) -> int:
+        """
+        Count the rows in a table which meet a condition.
+        """
+        # pylint: disable=no-member
+        return db.session.execute(
+            f"SELECT COUNT(*) FROM {table} WHERE {condition}", params
+        ).scalar()
+
+    def test_report(self) -> None:
+        """
+        Prove that the report says which rows were deleted and which were archived.
+        """
+        self.assertEqual(
+            [
+                "forgotpassword: 2 rows deleted",
+                "notifications: 3 rows archived",
+                "Removed 5 rows in 1.5s",
+            ],
+            report({"forgotpassword": 2, "notifications": 3}, 1.5, archive=True),
+        )
+
+    def test_remove_forgot_password_codes(self) -> None:
+        """
+        Prove that expired forgot password codes are deleted, and that codes which haven't expired are kept.
+        """
+        now = datetime.now()
+
+        # pylint: disable=no-member
+        db.session.execute(
+            """
+            INSERT INTO forgotpassword (forgot_code, username, expires, deleted) VALUES
+            ('mntold1', 'andy', :expired, FALSE),
+            ('mntold2', 'andy', :expired, FALSE),
+            ('mntnew1', 'andy', :active, FALSE)
+            """,
+            {"expired": now - timedelta(days=1), "active": now + timedelta(days=1)},
+        )
+        db.session.commit()
+
+        counts = run(batch_size=1, pause=0, max_rows=1, tasks=["forgotpassword"])
+        self.assertEqual({"forgotpassword": 1}, counts)
+
+        counts = run(batch_size=1, pause=0, tasks=["forgotpassword"])
+        self.assertGreaterEqual(counts["forgotpassword"], 1)
+        self.assertEqual(
+            0, self.count("forgotpassword", "forgot_code LIKE 'mntold%'", {})
+        )
+        self.assertEqual(1, self.count("forgotpassword", "forgot_code = 'mntnew1'", {}))
+
+        db.session.execute("DELETE FROM forgotpassword WHERE forgot_code = 'mntnew1'")
+        db.session.commit()
+
+    def test_remove_notifications(self) -> None:
+        """
+        Prove that old notifications are removed, and that removing unread notifications lowers the user's unread
+        notification count.
+        """
+        unread = NotificationDao.get_unread_count("andy")
+
+        # pylint: disable=no-member
+        db.session.execute(
+            """
+            INSERT INTO notifications (username, time, viewed, description, deleted)
+            VALUES ('andy', :time, 'N', 'Maintenance', FALSE)
+            """,
+            {"time": datetime.now() - timedelta(days=400)},
+        )
+        NotificationDao.adjust_unread_count("andy", 1)
+        db.session.commit()
+
+        counts = run(pause=0, notification_days=365, tasks=["notifications"])
+        self.assertGreaterEqual(counts["notifications"], 1)
+        self.assertEqual(
+            0,
+            self.count(
+                "notifications",
+                "username = 'andy' AND description = 'Maintenance'",
+                {},
+            ),
+        )
+        self.assertEqual(unread, NotificationDao.get_unread_count("andy"))
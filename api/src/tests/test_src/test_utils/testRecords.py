@@ -0,0 +1,48 @@
+"""
+Test suite for the distances which personal records are kept for (api/src/utils/records.py)
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+from tests.TestSuite import TestSuite
+from utils.records import (
+    LONGEST,
+    RECORD_CATEGORIES,
+    record_buckets,
+    record_buckets_sql,
+)
+
+
+class TestRecords(TestSuite):
+    def categories(self, miles: float) -> list:
+        """
+        Find the categories of personal records which a log of a certain length counts towards.
+        """
+        return [
+            category
+            for category, low, high in record_buckets()
+            if miles > low and (high is None or miles <= high)
+        ]
+
+    def test_record_buckets(self) -> None:
+        """
+        Prove that logs count towards a standard distance if their length is close to the distance, and that every
+        log counts towards the longest exercise.
+        """
+        self.assertEqual(["mile", LONGEST], self.categories(1.0))
+        self.assertEqual(["5k", LONGEST], self.categories(3.1))
+        self.assertEqual(["10k", LONGEST], self.categories(6.2))
+        self.assertEqual(["half", LONGEST], self.categories(13.1))
+        self.assertEqual(["full", LONGEST], self.categories(26.2))
+        self.assertEqual([LONGEST], self.categories(4.0))
+
+    def test_record_buckets_sql(self) -> None:
+        """
+        Prove that the derived table used to join logs with their records contains every category.
+        """
+        sql = record_buckets_sql()
+
+        for category in RECORD_CATEGORIES:
+            self.assertIn(f"'{category}' AS category", sql)
+
+        self.assertIn("NULL AS high", sql)
@@ -0,0 +1,44 @@
+"""
+Test suite for the read replica routing functions (api/src/utils/replicas.py)
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+from flask import g
+
+from database import db
+from tests.TestSuite import TestSuite
+from utils.replicas import read_only, mark_write, healthy_replicas
+
+
+class TestReplicas(TestSuite):
+    def test_read_only_flag(self) -> None:
+        """
+        Prove that the read only flag is set while a @read_only function runs and restored afterwards.
+        """
+
+        @read_only
+        def read():
+            return g.get("db_read_only")
+
+        self.assertTrue(read())
+        self.assertFalse(g.get("db_read_only", False))
+
+    def test_use_replica_after_write(self) -> None:
+        """
+        Prove that reads may use a replica until the request writes to the database.
+        """
+
+        @read_only
+        def use_replica():
+            return db.session().use_replica()
+
+        self.assertTrue(use_replica())
+        mark_write()
+        self.assertFalse(use_replica())
+
+    def test_no_replicas_configured(self) -> None:
+        """
+        Prove that no replicas are healthy when none are configured, so reads use the primary database.
+        """
+        self.assertEqual([], healthy_replicas(db.engines))
@@ -0,0 +1,101 @@
+"""
+Test suite for the synthetic data generation functions (api/src/utils/seed.py)
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+import random
+from datetime import date
+
+from tests.TestSuite import TestSuite
+from utils.seed import (
+    power_law_counts,
+    seasonal_factor,
+    random_log_date,
+    random_exercise_type,
+    format_seconds,
+    chunked,
+    seed_username,
+    seed_group_name,
+    TYPE_WEIGHTS,
+    OTHER_TYPES,
+)
+
+
+class TestSeed(TestSuite):
+    def test_power_law_counts_total(self) -> None:
+        """
+        Prove that distributing items with a power law keeps the total number of items.
+        """
+        rng = random.Random(1)
+        counts = power_law_counts(10000, 100, rng)
+        self.assertEqual(100, len(counts))
+        self.assertEqual(10000, sum(counts))
+        self.assertEqual([], power_law_counts(10, 0, rng))
+
+    def test_power_law_counts_skewed(self) -> None:
+        """
+        Prove that a small fraction of buckets receive the majority of the items.
+        """
+        rng = random.Random(2)
+        counts = sorted(power_law_counts(100000, 1000, rng), reverse=True)
+        self.assertGreater(sum(counts[:200]), sum(counts) / 2)
+
+    def test_power_law_counts_repeatable(self) -> None:
+        """
+        Prove that the same random seed creates the same distribution.
+        """
+        self.assertEqual(
+            power_law_counts(500, 20, random.Random(3)),
+            power_law_counts(500, 20, random.Random(3)),
+        )
+
+    def test_seasonal_factor(self) -> None:
+        """
+        Prove that mileage peaks in the fall and is lowest in the spring.
+        """
+        self.assertAlmostEqual(1.35, seasonal_factor(date(2026, 9, 22)), places=2)
+        self.assertAlmostEqual(0.65, seasonal_factor(date(2026, 3, 23)), places=2)
+
+    def test_random_log_date_in_range(self) -> None:
+        """
+        Prove that generated log dates fall within the requested date range.
+        """
+        rng = random.Random(4)
+        start = date(2024, 1, 1)
+        for _ in range(1000):
+            log_date = random_log_date(start, 365, rng)
+            self.assertGreaterEqual(log_date, start)
+            self.assertLess((log_date - start).days, 365)
+
+    def test_random_exercise_type(self) -> None:
+        """
+        Prove that generated exercise types are valid and mostly runs.
+        """
+        rng = random.Random(5)
+        exercise_types = [random_exercise_type(rng) for _ in range(1000)]
+        valid_types = set(TYPE_WEIGHTS.keys()) | set(OTHER_TYPES)
+        self.assertTrue(all(t in valid_types for t in exercise_types))
+        self.assertGreater(exercise_types.count("run"), 600)
+
+    def test_format_seconds(self) -> None:
+        """
+        Prove that durations are formatted like MySQL TIME values.
+        """
+        self.assertEqual("00:00:00", format_seconds(0))
+        self.assertEqual("00:07:30", format_seconds(450))
+        self.assertEqual("01:02:05", format_seconds(3725))
+
+    def test_chunked(self) -> None:
+        """
+        Prove that rows are split into chunks of the requested size.
+        """
+        chunks = list(chunked(({"i": i} for i in range(7)), 3))
+        self.assertEqual([3, 3, 1], [len(chunk) for chunk in chunks])
+
+    def test_seed_names_fit_columns(self) -> None:
+        """
+        Prove that generated usernames and group names fit in their 20 character columns.
+        """
+        self.assertLessEqual(len(seed_username(999999)), 20)
+        self.assertLessEqual(len(seed_group_name(9999, 99)), 20)
@@ -0,0 +1,78 @@
+"""
+Test suite for the single-flight functions (api/src/utils/singleFlight.py)
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+import threading
+import time
+
+from tests.TestSuite import TestSuite
+from utils.cache import MemoryBackend
+from utils.singleFlight import SingleFlight
+
+
+class TestSingleFlight(TestSuite):
+    def test_coalesce_threads(self) -> None:
+        """
+        Prove that concurrent identical computations in a worker run once.
+        """
+        flights = SingleFlight(MemoryBackend())
+        calls = []
+        results = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return "snapshot"
+
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    flights.run("key", compute, lambda: (False, None))
+                )
+            )
+            for _ in range(5)
+        ]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(1, len(calls))
+        self.assertEqual(["snapshot"] * 5, results)
+        self.assertEqual(4, flights.coalesced)
+
+    def test_wait_for_other_worker(self) -> None:
+        """
+        Prove that a worker waits for the value cached by the worker holding the lock.
+        """
+        backend = MemoryBackend()
+        flights = SingleFlight(backend, poll_interval=0.01)
+        backend.add("key:lock", b"other worker", 30)
+
+        def other_worker():
+            time.sleep(0.05)
+            backend.set("key", b"snapshot", 60)
+            backend.delete("key:lock")
+
+        threading.Thread(target=other_worker).start()
+
+        value = flights.run(
+            "key",
+            lambda: self.fail("The value should come from the other worker"),
+            lambda: (backend.get_many(["key"])[0] is not None, b"snapshot"),
+        )
+        self.assertEqual(b"snapshot", value)
+
+    def test_lock_holder_dies(self) -> None:
+        """
+        Prove that the value is computed once the lock of a worker which died expires.
+        """
+        backend = MemoryBackend()
+        flights = SingleFlight(backend, poll_interval=0.01)
+        backend.add("key:lock", b"dead worker", 0.05)
+
+        value = flights.run("key", lambda: "snapshot", lambda: (False, None))
+        self.assertEqual("snapshot", value)
@@ -0,0 +1,44 @@
+"""
+Test suite for the startup profiling functions (api/src/utils/startup.py)
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+from tests.TestSuite import TestSuite
+from utils.startup import parse_import_times, direct_imports
+
+IMPORT_TIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 | encodings
+import time:        50 |         50 |   json.decoder
+import time:       300 |        350 | json
+import time:      2000 |       2000 |     botocore
+import time:       400 |       2400 |   boto3
+import time:        80 |         80 |   utils.literals
+import time:      1000 |       3830 | app
+"""
+
+
+class TestStartup(TestSuite):
+    def test_parse_import_times(self) -> None:
+        """
+        Prove that the output of 'python -X importtime' is parsed into module names, depths, and times.
+        """
+        imports = parse_import_times(IMPORT_TIME_OUTPUT)
+        self.assertEqual(7, len(imports))
+        self.assertEqual(
+            {"module": "botocore", "depth": 2, "self_ms": 2.0, "cumulative_ms": 2.0},
+            imports[3],
+        )
+        self.assertEqual(0, imports[-1]["depth"])
+        self.assertEqual(3.83, imports[-1]["cumulative_ms"])
+
+    def test_direct_imports(self) -> None:
+        """
+        Prove that only the imports made directly by a module are found.
+        """
+        imports = parse_import_times(IMPORT_TIME_OUTPUT)
+        self.assertEqual(
+            ["boto3", "utils.literals"],
+            [entry["module"] for entry in direct_imports(imports, "app")],
+        )
+        self.assertEqual([], direct_imports(imports, "flask"))
@@ -0,0 +1,137 @@
+"""
+Test suite for training streaks and weekly consistency (api/src/utils/streaks.py)
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+from datetime import date, datetime, timedelta
+
+from tests.TestSuite import TestSuite
+from dao.logDao import LogDao
+from dao.streakDao import StreakDao
+from model.Log import Log
+from utils.dates import get_week_containing, get_week_containing_sql
+from utils.streaks import (
+    add_day,
+    current_streak,
+    extend_streaks,
+    recompute,
+    remove_day,
+    streak_summary,
+)
+
+
+class TestStreaks(TestSuite):
+    def test_current_streak(self) -> None:
+        """
+        Prove that a streak stays current until a full day passes without a log.
+        """
+        today = date(2026, 10, 19)
+
+        self.assertEqual(5, current_streak(5, today, today))
+        self.assertEqual(5, current_streak(5, today - timedelta(days=1), today))
+        self.assertEqual(0, current_streak(5, today - timedelta(days=2), today))
+        self.assertEqual(0, current_streak(0, None, today))
+
+    def test_extend_streaks(self) -> None:
+        """
+        Prove that consecutive days extend the latest streak, and that a gap starts a new streak without shortening
+        the longest streak.
+        """
+        start = date(2026, 10, 1)
+        days = [start + timedelta(days=offset) for offset in [0, 1, 2, 5, 6]]
+
+        self.assertEqual((2, 3, days[-1]), extend_streaks(0, 0, None, days))
+        self.assertEqual((0, 0, None), extend_streaks(0, 0, None, []))
+        self.assertEqual(
+            (3, 3, date(2026, 10, 8)),
+            extend_streaks(2, 3, days[-1], [date(2026, 10, 8)]),
+        )
+
+    def test_add_and_remove_day(self) -> None:
+        """
+        Prove that adding or removing a day only reads the days around it, and that removing a day asks for a rebuild
+        when the longest streak could get shorter.
+        """
+        start = date(2026, 10, 1)
+        days = {start + timedelta(days=offset) for offset in [0, 1, 2, 5, 6, 8]}
+        streaks = extend_streaks(0, 0, None, sorted(days))
+        self.assertEqual((1, 3, date(2026, 10, 9)), streaks)
+
+        # Filling the gap on the 8th joins the latest streak to the streak before it.
+        self.assertEqual(
+            (4, 4, date(2026, 10, 9)), add_day(*streaks, date(2026, 10, 8), days)
+        )
+        self.assertEqual(
+            (1, 3, date(2026, 10, 12)), add_day(*streaks, date(2026, 10, 12), days)
+        )
+
+        # The 6th isn't in the longest streak, but the 2nd is.
+        day = date(2026, 10, 6)
+        self.assertEqual(streaks, remove_day(*streaks, day, days - {day}))
+        day = date(2026, 10, 2)
+        self.assertIsNone(remove_day(*streaks, day, days - {day}))
+        day = date(2026, 10, 9)
+        self.assertIsNone(remove_day(*streaks, day, days - {day}))
+
+    def test_streak_summary(self) -> None:
+        """
+        Prove that users without streaks are described with empty streaks.
+        """
+        summary = streak_summary(None)
+        self.assertEqual(0, summary["current_streak"])
+        self.assertEqual(0, summary["longest_streak"])
+        self.assertIsNone(summary["last_date"])
+        self.assertEqual(0, summary["weeks_over_threshold"])
+
+    def test_get_week_containing(self) -> None:
+        """
+        Prove that weeks start on the user's week_start day, and that the SQL expression uses the matching function.
+        """
+        # October 19th, 2026 is a Monday.
+        self.assertEqual(date(2026, 10, 19), get_week_containing(date(2026, 10, 19)))
+        self.assertEqual(date(2026, 10, 19), get_week_containing(date(2026, 10, 25)))
+        self.assertEqual(
+            date(2026, 10, 18), get_week_containing(date(2026, 10, 19), "sunday")
+        )
+        self.assertEqual(
+            date(2026, 10, 25), get_week_containing(date(2026, 10, 25), "sunday")
+        )
+        self.assertIn("WEEKDAY(date)", get_week_containing_sql("date"))
+        self.assertIn("DAYOFWEEK(date)", get_week_containing_sql("date", "sunday"))
+
+    def test_streak_updated_by_logs(self) -> None:
+        """
+        Prove that a new log extends a user's streak, and that deleting the log rebuilds the streak without it.
+        """
+        self.assertEqual(1, recompute(usernames=["andy"]))
+        longest = StreakDao.get_streak("andy").longest_streak
+
+        log = Log(
+            {
+                "username": "andy",
+                "first": "Andrew",
+                "last": "Jarombek",
+                "date": date.today(),
+                "type": "run",
+                "miles": 3.0,
+                "feel": 6,
+                "time_created": datetime.now(),
+                "deleted": False,
+            }
+        )
+        added: Log = LogDao.add_log(log)
+
+        streak = StreakDao.get_streak("andy")
+        self.assertEqual(date.today(), streak.last_date)
+        self.assertGreaterEqual(streak.current_streak, 1)
+        self.assertGreaterEqual(streak.longest_streak, longest)
+
+        self.assertTrue(LogDao.delete_log(added.log_id))
+        self.assertEqual(longest, StreakDao.get_streak("andy").longest_streak)
+
+        streak = StreakDao.get_streak("andy")
+        computed = StreakDao.compute_streak("andy")
+        self.assertEqual(computed.current_streak, streak.current_streak)
+        self.assertEqual(computed.last_date, streak.last_date)
+        self.assertEqual(computed.weeks_over, streak.weeks_over)
@@ -0,0 +1,38 @@
+"""
+Test suite for the Open API specification functions (api/src/utils/swagger.py)
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+from flask import Response
+
+from tests.TestSuite import TestSuite
+from utils.swagger import init_swagger, compile_spec
+
+
+class TestSwagger(TestSuite):
+    def test_compile_spec(self) -> None:
+        """
+        Prove that the compiled API specification contains the documentation of routes.
+        """
+        spec: dict = compile_spec(self.app)
+        self.assertEqual(spec.get("swagger"), "2.0")
+        self.assertIn("/v2/types/", spec.get("paths"))
+
+    def test_spec_route_etag(self) -> None:
+        """
+        Test performing HTTP GET requests on the '/apispec_1.json' route.  This test proves that the specification is
+        served with cache headers and that a request with a matching ETag returns a 304 status.
+        """
+        init_swagger(self.app)
+
+        response: Response = self.client.get("/apispec_1.json")
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNotNone(response.headers.get("ETag"))
+        self.assertIn("max-age=86400", response.headers.get("Cache-Control"))
+        self.assertIn("paths", response.get_json())
+
+        response: Response = self.client.get(
+            "/apispec_1.json", headers={"If-None-Match": response.headers.get("ETag")}
+        )
+        self.assertEqual(response.status_code, 304)
@@ -0,0 +1,386 @@
+"""
+Parse activity files exported from GPS watches and exercise apps into exercise logs.  GPX and TCX files are read with
+an incremental XML parser which discards each trackpoint once it is measured, and distances are computed from chunks
+of trackpoints with vectorized haversine math, so memory use doesn't grow with the size of a track.  CSV files
+contain one exercise per row.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+import codecs
+import csv
+from datetime import datetime
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+from defusedxml.ElementTree import iterparse
+
+from utils.logs import METERS_PER_MILE
+
+EARTH_RADIUS_METERS = 6371008.8
+
+# The number of trackpoints held in memory before their distance is computed.
+CHUNK_SIZE = 4096
+
+# Exercise types for the sports named in activity files.
+SPORT_TYPES = {
+    "run": "run",
+    "running": "run",
+    "trail_running": "run",
+    "treadmill_running": "run",
+    "bike": "bike",
+    "biking": "bike",
+    "cycling": "bike",
+    "ride": "bike",
+    "swim": "swim",
+    "swimming": "swim",
+    "walk": "walk",
+    "walking": "walk",
+    "hike": "hike",
+    "hiking": "hike",
+    "row": "row",
+    "rowing": "row",
+    "yoga": "yoga",
+}
+
+
+def haversine_distance(latitudes: np.ndarray, longitudes: np.ndarray) -> float:
+    """
+    Compute the length of a path along the surface of the earth.
+    :param latitudes: Latitudes of the points on the path in degrees.
+    :param longitudes: Longitudes of the points on the path in degrees.
+    :return: The distance between consecutive points, summed, in meters.
+    """
+    if latitudes.size < 2:
+        return 0.0
+
+    lat = np.radians(latitudes)
+    lon = np.radians(longitudes)
+
+    a = (
+        np.sin(np.diff(lat) / 2) ** 2
+        + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(np.diff(lon) / 2) ** 2
+    )
+    return float(np.sum(2 * EARTH_RADIUS_METERS * np.arcsin(np.sqrt(np.clip(a, 0, 1)))))
+
+
+def parse_timestamp(text: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an ISO 8601 timestamp from an activity file.
+    :param text: The timestamp, such as 2026-10-19T13:45:30Z.
+    :return: The timestamp as a datetime object, or None if it isn't valid.
+    """
+    if not text:
+        return None
+
+    try:
+        return datetime.fromisoformat(text.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def local_name(tag: str) -> str:
+    """
+    Remove the namespace from the tag of an XML element.
+    :param tag: The tag, such as {http://www.topografix.com/GPX/1/1}trkpt.
+    :return: The tag without a namespace, such as trkpt.
+    """
+    return tag.rsplit("}", 1)[-1]
+
+
+class Track:
+    def __init__(self, sport: Optional[str] = None):
+        """
+        A recorded activity whose distance and duration are measured as trackpoints are read.
+        :param sport: The sport named in the activity file.
+        """
+        self.name: Optional[str] = None
+        self.sport = sport
+        self.start: Optional[datetime] = None
+        self.end: Optional[datetime] = None
+        self.meters = 0.0
+        self.recorded_meters = 0.0
+        self.recorded_seconds = 0.0
+        self.latitudes: List[float] = []
+        self.longitudes: List[float] = []
+
+    def add_point(
+        self,
+        latitude: Optional[float],
+        longitude: Optional[float],
+        time: Optional[datetime],
+    ) -> None:
+        """
+        Add a trackpoint to the end of the track.
+        :param latitude: Latitude of the trackpoint in degrees, or None if it has no position.
+        :param longitude: Longitude of the trackpoint in degrees, or None if it has no position.
+        :param time: Time when the trackpoint was recorded.
+        """
+        if time is not None:
+            self.start = time if self.start is None else min(self.start, time)
+            self.end = time if self.end is None else max(self.end, time)
+
+        if latitude is not None and longitude is not None:
+            self.latitudes.append(latitude)
+            self.longitudes.append(longitude)
+
+            if len(self.latitudes) >= CHUNK_SIZE:
+                self.measure(keep_last=True)
+
+    def measure(self, keep_last: bool = False) -> None:
+        """
+        Add the distance between the trackpoints held in memory to the length of the track, then discard them.
+        :param keep_last: Whether to keep the last trackpoint, so the distance to the next trackpoint is measured.
+        """
+        self.meters += haversine_distance(
+            np.array(self.latitudes), np.array(self.longitudes)
+        )
+
+        if keep_last and self.latitudes:
+            self.latitudes = self.latitudes[-1:]
+            self.longitudes = self.longitudes[-1:]
+        else:
+            self.latitudes = []
+            self.longitudes = []
+
+    def summary(self) -> dict:
+        """
+        Summarize the track once all of its trackpoints are read.  Distances and durations recorded by the device are
+        used when the trackpoints don't have positions or times.
+        :return: The name, sport, date, distance (in miles), and duration (in seconds) of the activity.
+        """
+        self.measure()
+
+        meters = self.meters if self.meters > 0 else self.recorded_meters
+        seconds = (
+            (self.end - self.start).total_seconds()
+            if self.start is not None and self.end is not None and self.end > self.start
+            else self.recorded_seconds
+        )
+
+        return {
+            "name": self.name,
+            "sport": self.sport,
+            "date": self.start.date() if self.start is not None else None,
+            "miles": meters / METERS_PER_MILE,
+            "seconds": int(round(seconds)),
+        }
+
+
+def iterparse_tree(stream: BinaryIO) -> Iterator[tuple]:
+    """
+    Read the elements of an XML document one at a time.  Elements are removed from their parent once they are
+    handled, so the document is never held in memory.  Documents with a DTD are rejected, since activity files never
+    need one and entity declarations can be used to expand a small upload into a huge document.
+    :param stream: The XML document.
+    :return: A generator of (event, element, parent tag) tuples, where the event is 'start' or 'end'.
+    """
+    stack = []
+
+    for event, element in iterparse(stream, events=("start", "end"), forbid_dtd=True):
+        if event == "start":
+            parent = local_name(stack[-1].tag) if stack else None
+            stack.append(element)
+            yield event, element, parent
+        else:
+            stack.pop()
+            parent = local_name(stack[-1].tag) if stack else None
+            yield event, element, parent
+
+            if stack:
+                stack[-1].remove(element)
+
+
+def parse_gpx(stream: BinaryIO) -> Iterator[dict]:
+    """
+    Parse the tracks in a GPX file.  Each track becomes an exercise, and the distance between track segments isn't
+    counted since the device wasn't recording.
+    :param stream: The GPX file.
+    :return: A generator of activity summaries.
+    """
+    track: Optional[Track] = None
+    time: Optional[datetime] = None
+
+    for event, element, parent in iterparse_tree(stream):
+        tag = local_name(element.tag)
+
+        if event == "start":
+            if tag == "trk":
+                track = Track()
+            elif tag == "trkseg" and track is not None:
+                track.measure()
+            continue
+
+        if track is None:
+            continue
+
+        if tag == "time" and parent == "trkpt":
+            time = parse_timestamp(element.text)
+        elif tag == "name" and parent == "trk":
+            track.name = (element.text or "").strip() or None
+        elif tag == "type" and parent == "trk":
+            track.sport = (element.text or "").strip() or None
+        elif tag == "trkpt":
+            try:
+                latitude = float(element.get("lat"))
+                longitude = float(element.get("lon"))
+            except (TypeError, ValueError):
+                latitude = longitude = None
+
+            track.add_point(latitude, longitude, time)
+            time = None
+        elif tag == "trk":
+            yield track.summary()
+            track = None
+
+
+def parse_tcx(stream: BinaryIO) -> Iterator[dict]:
+    """
+    Parse the activities in a TCX file.  Each activity becomes an exercise.
+    :param stream: The TCX file.
+    :return: A generator of activity summaries.
+    """
+    track: Optional[Track] = None
+    point: Dict[str, object] = {}
+
+    for event, element, parent in iterparse_tree(stream):
+        tag = local_name(element.tag)
+
+        if event == "start" and tag == "Activity":
+            track = Track(sport=element.get("Sport"))
+
+        if event == "start" or track is None:
+            continue
+
+        text = (element.text or "").strip()
+
+        try:
+            if tag == "Time" and parent == "Trackpoint":
+                point["time"] = parse_timestamp(text)
+            elif tag == "LatitudeDegrees":
+                point["latitude"] = float(text)
+            elif tag == "LongitudeDegrees":
+                point["longitude"] = float(text)
+            elif tag == "DistanceMeters" and parent == "Lap":
+                track.recorded_meters += float(text)
+            elif tag == "TotalTimeSeconds" and parent == "Lap":
+                track.recorded_seconds += float(text)
+            elif tag == "Notes" and parent == "Activity":
+                track.name = text or None
+        except ValueError:
+            pass
+
+        if tag == "Trackpoint":
+            track.add_point(
+                point.get("latitude"), point.get("longitude"), point.get("time")
+            )
+            point = {}
+        elif tag == "Activity":
+            yield track.summary()
+            track = None
+
+
+def parse_csv(stream: BinaryIO) -> Iterator[dict]:
+    """
+    Parse the exercises in a CSV file with a header row.  The 'date' column is required, and the 'name', 'location',
+    'type', 'distance', 'metric', 'time', 'feel', and 'description' columns are optional.  Values are converted to
+    numbers where possible, and are otherwise left as strings to be reported by validation.
+    :param stream: The CSV file.
+    :return: A generator of exercise logs.
+    """
+    reader = csv.DictReader(codecs.getreader("utf-8-sig")(stream))
+
+    for row in reader:
+        row = {
+            (key or "").strip().lower(): (value or "").strip() or None
+            for key, value in row.items()
+        }
+        log = {
+            "name": row.get("name"),
+            "location": row.get("location"),
+            "date": row.get("date"),
+            "type": SPORT_TYPES.get((row.get("type") or "").lower(), row.get("type")),
+            "distance": row.get("distance"),
+            "metric": (
+                (row.get("metric") or "miles").lower()
+                if row.get("distance")
+                else row.get("metric")
+            ),
+            "time": row.get("time"),
+            "feel": row.get("feel"),
+            "description": row.get("description"),
+        }
+
+        for field, convert in [("distance", float), ("feel", int)]:
+            try:
+                if log[field] is not None:
+                    log[field] = convert(log[field])
+            except ValueError:
+                pass
+
+        yield log
+
+
+def format_seconds(seconds: int) -> Optional[str]:
+    """
+    Format a duration as a time taken exercising.
+    :param seconds: The duration in seconds.
+    :return: The duration formatted as HH:MM:SS, or None if the duration is unknown.
+    """
+    if seconds <= 0:
+        return None
+
+    return f"{seconds // 3600:02d}:{(seconds // 60) % 60:02d}:{seconds % 60:02d}"
+
+
+def summary_to_log(summary: dict, exercise_type: Optional[str]) -> dict:
+    """
+    Convert the summary of a GPX or TCX activity to an exercise log.
+    :param summary: An activity summary created by parse_gpx() or parse_tcx().
+    :param exercise_type: Type of exercise to use instead of the sport named in the activity file.
+    :return: An exercise log.
+    """
+    sport = (summary.get("sport") or "").lower()
+    seconds = summary["seconds"]
+
+    return {
+        "name": summary.get("name"),
+        "date": str(summary["date"]) if summary.get("date") else None,
+        "type": exercise_type
+        or SPORT_TYPES.get(sport, "run" if not sport else "other"),
+        "distance": round(summary["miles"], 2) if summary["miles"] > 0 else None,
+        "metric": "miles" if summary["miles"] > 0 else None,
+        "time": format_seconds(seconds),
+    }
+
+
+PARSERS: Dict[str, Callable[[BinaryIO], Iterator[dict]]] = {
+    "gpx": parse_gpx,
+    "tcx": parse_tcx,
+    "csv": parse_csv,
+}
+
+
+def parse_activities(
+    stream: BinaryIO, file_format: str, exercise_type: Optional[str] = None
+) -> Iterator[dict]:
+    """
+    Parse an activity file into exercise logs.  Fields which aren't in the file, such as the username and feel, must
+    be added before the logs are validated.
+    :param stream: The activity file.
+    :param file_format: The format of the file, one of 'gpx', 'tcx', or 'csv'.
+    :param exercise_type: Type of exercise for activities in GPX and TCX files and CSV rows without a type.  The
+    sport named in the file (or 'run' if there isn't one) is used if this is None.
+    :return: A generator of exercise logs.
+    """
+    if file_format == "csv":
+        for log in parse_csv(stream):
+            if log["type"] is None:
+                log["type"] = exercise_type or "run"
+
+            yield log
+
+        return
+
+    for summary in PARSERS[file_format](stream):
+        yield summary_to_log(summary, exercise_type)
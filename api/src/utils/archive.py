@@ -0,0 +1,292 @@
+"""
+Move soft deleted rows out of the tables queried by the API and into archive tables.  Every query filters out soft
+deleted rows, so once they are no longer needed they only make the tables and their indexes larger.  Rows are
+archived after they have been deleted for longer than a retention window, in batches which are each committed in their
+own transaction so that locks on the tables are held briefly.  Archived rows can be restored to their original tables.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import bindparam, text
+
+from database import db
+
+ARCHIVE_SUFFIX = "_archive"
+
+
+@dataclass(frozen=True)
+class ArchivedTable:
+    """
+    A table whose soft deleted rows are moved to an archive table.
+    """
+
+    name: str
+    keys: Tuple[str, ...]
+    # SQL condition which rows must also meet to be archived, used to keep rows which other tables still reference.
+    condition: Optional[str] = None
+    # The table and column of a foreign key.  Archived parent rows are restored along with their children.
+    parent: Optional[Tuple[str, str]] = None
+
+    @property
+    def archive(self) -> str:
+        """
+        The name of the archive table for this table.
+        """
+        return f"{self.name}{ARCHIVE_SUFFIX}"
+
+    @property
+    def key_sql(self) -> str:
+        """
+        The primary key of the table as SQL, wrapped in parentheses if it has more than one column.
+        """
+        return self.keys[0] if len(self.keys) == 1 else f"({', '.join(self.keys)})"
+
+
+# Tables are archived in this order, so that child rows are archived before the rows they reference.
+ARCHIVED_TABLES: List[ArchivedTable] = [
+    ArchivedTable(name="comments", keys=("comment_id",), parent=("logs", "log_id")),
+    ArchivedTable(
+        name="logs",
+        keys=("log_id",),
+        condition="NOT EXISTS (SELECT 1 FROM comments WHERE comments.log_id = logs.log_id)",
+    ),
+    ArchivedTable(name="notifications", keys=("notification_id",)),
+    ArchivedTable(name="groupmembers", keys=("id",)),
+    ArchivedTable(name="teammembers", keys=("team_name", "username")),
+    ArchivedTable(name="codes", keys=("activation_code",)),
+]
+
+ARCHIVED_TABLE_NAMES = [table.name for table in ARCHIVED_TABLES]
+
+
+def get_archived_table(name: str) -> ArchivedTable:
+    """
+    Find a table whose rows are archived.
+    :param name: The name of the table, without the archive suffix.
+    :return: The archived table.
+    """
+    for table in ARCHIVED_TABLES:
+        if table.name == name:
+            return table
+
+    raise ValueError(f"Rows in the '{name}' table aren't archived.")
+
+
+def parse_keys(table: ArchivedTable, keys: Sequence[str]) -> list:
+    """
+    Parse primary keys given on the command line.  Columns of composite keys are separated by commas.
+    :param table: The table which the keys identify rows in.
+    :param keys: The primary keys as strings, such as '12' or 'saintsxctf,andy'.
+    :return: A list of keys, with composite keys as tuples.
+    """
+    if len(table.keys) == 1:
+        return list(keys)
+
+    parsed = [tuple(key.split(",")) for key in keys]
+
+    for key in parsed:
+        if len(key) != len(table.keys):
+            raise ValueError(
+                f"Keys for the '{table.name}' table have the columns {', '.join(table.keys)}."
+            )
+
+    return parsed
+
+
+def table_columns(table: str) -> List[str]:
+    """
+    Get the columns of a table in the order they are defined in MySQL.  Generated columns are skipped, since MySQL
+    computes them when rows are copied.
+    :param table: The name of the table.
+    :return: A list of column names.
+    """
+    # pylint: disable=no-member
+    result = db.session.execute(
+        """
+        SELECT column_name FROM information_schema.columns
+        WHERE table_schema = DATABASE()
+        AND table_name = :table
+        AND generation_expression = ''
+        ORDER BY ordinal_position
+        """,
+        {"table": table},
+    )
+    return [row[0] for row in result]
+
+
+def move_rows(
+    table: ArchivedTable,
+    keys: list,
+    to_archive: bool,
+    archived_date: Optional[datetime] = None,
+) -> int:
+    """
+    Copy rows between a table and its archive table, then delete them from the table they were copied from.  The
+    changes aren't committed.
+    :param table: The table whose rows are moved.
+    :param keys: The primary keys of the rows, with composite keys as tuples.
+    :param to_archive: Whether the rows are moved to the archive table (True) or restored from it (False).
+    :param archived_date: The time that the rows were archived.  Only used when moving rows to the archive table.
+    :return: The number of rows moved.
+    """
+    if not keys:
+        return 0
+
+    columns = ", ".join(f"`{column}`" for column in table_columns(table.name))
+    source, destination = (
+        (table.name, table.archive) if to_archive else (table.archive, table.name)
+    )
+
+    if to_archive:
+        insert = f"""
+            INSERT INTO {destination} ({columns}, archived_date)
+            SELECT {columns}, :archived_date FROM {source} WHERE {table.key_sql} IN :keys
+        """
+    else:
+        insert = f"""
+            INSERT INTO {destination} ({columns})
+            SELECT {columns} FROM {source} WHERE {table.key_sql} IN :keys
+        """
+
+    delete = f"DELETE FROM {source} WHERE {table.key_sql} IN :keys"
+    params = {"keys": keys, "archived_date": archived_date}
+
+    # pylint: disable=no-member
+    db.session.execute(
+        text(insert).bindparams(bindparam("keys", expanding=True)), params
+    )
+    result = db.session.execute(
+        text(delete).bindparams(bindparam("keys", expanding=True)), params
+    )
+    return result.rowcount
+
+
+def archive_batch(table: ArchivedTable, cutoff: datetime, batch_size: int) -> int:
+    """
+    Move one batch of soft deleted rows to the archive table and commit the transaction.  The rows are locked while
+    they are moved, so rows referenced by a foreign key can't gain new references in the meantime.
+    :param table: The table whose rows are archived.
+    :param cutoff: Rows which were deleted before this time are archived.
+    :param batch_size: The maximum number of rows to archive.
+    :return: The number of rows archived.
+    """
+    condition = f"AND {table.condition}" if table.condition else ""
+
+    # pylint: disable=no-member
+    result = db.session.execute(
+        f"""
+        SELECT {', '.join(table.keys)} FROM {table.name}
+        WHERE deleted IS TRUE
+        AND deleted_date < :cutoff
+        {condition}
+        ORDER BY {', '.join(table.keys)}
+        LIMIT :batch_size
+        FOR UPDATE
+        """,
+        {"cutoff": cutoff, "batch_size": batch_size},
+    )
+    keys = [row[0] if len(table.keys) == 1 else tuple(row) for row in result]
+
+    try:
+        archived = move_rows(table, keys, to_archive=True, archived_date=datetime.now())
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    return archived
+
+
+def archive(
+    retention_days: int = 365,
+    batch_size: int = 1000,
+    pause: float = 0.0,
+    tables: Optional[Sequence[str]] = None,
+    now: Optional[datetime] = None,
+) -> Dict[str, int]:
+    """
+    Archive the rows which have been soft deleted for longer than the retention window.  Rows without a deletion date
+    are left in place, since there is no way to know how long ago they were deleted.
+    :param retention_days: The number of days that soft deleted rows are kept in their original tables.
+    :param batch_size: The maximum number of rows archived in each transaction.
+    :param pause: Seconds to wait between batches, giving replicas time to apply each batch.
+    :param tables: Names of the tables to archive rows from.  Defaults to every table in ARCHIVED_TABLES.
+    :param now: The current time, which the retention window is measured from.
+    :return: The number of rows archived from each table.
+    """
+    cutoff = (now or datetime.now()) - timedelta(days=retention_days)
+    counts: Dict[str, int] = {}
+
+    for table in ARCHIVED_TABLES:
+        if tables and table.name not in tables:
+            continue
+
+        counts[table.name] = 0
+
+        while True:
+            archived = archive_batch(table, cutoff, batch_size)
+            counts[table.name] += archived
+
+            if archived < batch_size:
+                break
+
+            if pause > 0:
+                time.sleep(pause)
+
+    return counts
+
+
+def restore(table_name: str, keys: list) -> Dict[str, int]:
+    """
+    Move archived rows back to their original table, where they are still soft deleted.  Archived rows which they
+    reference (such as the log of a comment) and archived rows which reference them (such as the comments of a log)
+    are restored in the same transaction.
+    :param table_name: The name of the original table.
+    :param keys: The primary keys of the rows to restore, with composite keys as tuples.
+    :return: The number of rows restored to each table.
+    """
+    table = get_archived_table(table_name)
+    counts: Dict[str, int] = {}
+
+    if not keys:
+        return counts
+
+    def archived_values(source: ArchivedTable, select: str, where: str, values: list):
+        # pylint: disable=no-member
+        result = db.session.execute(
+            text(
+                f"SELECT DISTINCT {select} FROM {source.archive} WHERE {where} IN :values"
+            ).bindparams(bindparam("values", expanding=True)),
+            {"values": values},
+        )
+        return [row[0] if len(row) == 1 else tuple(row) for row in result]
+
+    try:
+        if table.parent is not None:
+            parent_name, column = table.parent
+            parent = get_archived_table(parent_name)
+            parent_keys = archived_values(table, column, table.key_sql, keys)
+            counts[parent.name] = move_rows(parent, parent_keys, to_archive=False)
+
+        counts[table.name] = move_rows(table, keys, to_archive=False)
+
+        for child in ARCHIVED_TABLES:
+            if child.parent is not None and child.parent[0] == table.name:
+                child_keys = archived_values(
+                    child, ", ".join(child.keys), child.parent[1], keys
+                )
+                counts[child.name] = move_rows(child, child_keys, to_archive=False)
+
+        # pylint: disable=no-member
+        db.session.commit()
+    except Exception:
+        # pylint: disable=no-member
+        db.session.rollback()
+        raise
+
+    return counts
@@ -6,8 +6,6 @@ Date: 6/12/2019
 
 import json
 
-import boto3
-
 
 def retrieve_db_cred(env: str = "prod") -> map:
     """
@@ -15,6 +13,9 @@ def retrieve_db_cred(env: str = "prod") -> map:
     :param env: The environment the API is running in.
     :return: A dictionary containing a username and password.
     """
+    # boto3 takes longer to import than the rest of the API, so it is only imported when credentials are resolved.
+    import boto3  # pylint: disable=import-outside-toplevel
+
     secretsmanager = boto3.client("secretsmanager")
     response = secretsmanager.get_secret_value(SecretId=f"saints-xctf-rds-{env}-secret")
     secret_string = response.get("SecretString")
@@ -32,6 +33,8 @@ def retrieve_db_host(env: str = "prod") -> str:
     :param env: The environment the API is running in.
     :return: A string representing the database hostname.
     """
+    import boto3  # pylint: disable=import-outside-toplevel
+
     rds = boto3.client("rds")
     rds_instances = rds.describe_db_instances(
         DBInstanceIdentifier=f"saints-xctf-mysql-database-{env}"
@@ -0,0 +1,438 @@
+"""
+Benchmarks for the hot paths of the API.  Micro-benchmarks time helper functions and DAO queries directly, while
+macro-benchmarks send requests through the Flask test client against a database populated by 'flask seed'.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+import json
+import math
+import platform
+import subprocess
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional
+
+import click
+from flask import current_app
+from sqlalchemy import event
+
+from database import db
+from utils.logs import calculate_mile_pace, to_miles
+from utils.logsBatch import calculate_mile_paces, to_miles_batch
+from utils.seed import SEED_APP
+from utils.stubServices import StubService, make_token
+
+PERCENTILES = [50, 95, 99]
+BATCH_SIZE = 1000
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """
+    Compute a percentile of a list of samples, interpolating linearly between the closest ranks.
+    :param samples: Measurements in any order.
+    :param pct: The percentile to compute, between 0 and 100.
+    :return: The value at the percentile.
+    """
+    if not samples:
+        return 0.0
+
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """
+    Summarize a list of measurements.
+    :param samples: Measurements in any order.
+    :return: The mean, min, max, and percentiles of the measurements.
+    """
+    summary = {f"p{pct}": round(percentile(samples, pct), 4) for pct in PERCENTILES}
+    summary["mean"] = round(sum(samples) / len(samples), 4) if samples else 0.0
+    summary["min"] = round(min(samples), 4) if samples else 0.0
+    summary["max"] = round(max(samples), 4) if samples else 0.0
+    return summary
+
+
+def compare(current: dict, baseline: dict) -> Dict[str, Dict[str, Optional[float]]]:
+    """
+    Compare the latency of two benchmark runs.
+    :param current: Results of the current run.
+    :param baseline: Results of an earlier run.
+    :return: The percent change of each latency percentile, keyed by benchmark name.  Benchmarks missing from the
+    baseline are omitted.
+    """
+    changes = {}
+    for name, result in current["benchmarks"].items():
+        previous = baseline.get("benchmarks", {}).get(name)
+        if previous is None:
+            continue
+
+        changes[name] = {}
+        for pct in PERCENTILES:
+            key = f"p{pct}"
+            before = previous["latency_ms"].get(key)
+            after = result["latency_ms"][key]
+            changes[name][key] = (
+                round((after - before) / before * 100, 1) if before else None
+            )
+
+    return changes
+
+
+@contextmanager
+def count_queries() -> Iterator[List[int]]:
+    """
+    Count the SQL statements executed within a block.
+    :return: A single element list holding the number of statements, updated as statements run.
+    """
+    counter = [0]
+
+    def before_cursor_execute(*_args) -> None:
+        counter[0] += 1
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+
+
+def measure(fn: Callable[[], object], iterations: int, warmup: int) -> dict:
+    """
+    Benchmark a function.  Latency and query counts are measured in one pass and allocations in a second pass,
+    since tracing allocations slows down every call.
+    :param fn: The function to call.
+    :param iterations: The number of measured calls.
+    :param warmup: The number of calls made before measuring.
+    :return: Latency percentiles in milliseconds, queries per call, and peak allocated KiB per call.
+    """
+    for _ in range(warmup):
+        fn()
+
+    latencies = []
+    with count_queries() as queries:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            fn()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    allocations = []
+    tracemalloc.start()
+    try:
+        for _ in range(iterations):
+            tracemalloc.clear_traces()
+            fn()
+            allocations.append(tracemalloc.get_traced_memory()[1] / 1024)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "iterations": iterations,
+        "latency_ms": summarize(latencies),
+        "queries_per_call": round(queries[0] / iterations, 2),
+        "allocated_kib": summarize(allocations),
+    }
+
+
+def find_targets() -> dict:
+    """
+    Find the seeded user, group, and log with the most activity.  Benchmarking the busiest entities exercises the
+    worst case of each query.
+    :return: A dictionary of identifiers used in benchmark requests.
+    """
+    # pylint: disable=no-member
+    user = db.session.execute(
+        """
+        SELECT users.username, users.first, users.last, COUNT(*) AS total
+        FROM users
+        INNER JOIN logs ON users.username = logs.username
+        WHERE users.created_app = :app AND logs.deleted IS NOT TRUE
+        GROUP BY users.username, users.first, users.last
+        ORDER BY total DESC
+        LIMIT 1
+        """,
+        {"app": SEED_APP},
+    ).first()
+
+    group = db.session.execute(
+        """
+        SELECT `groups`.id, `groups`.group_name, teamgroups.team_name, COUNT(*) AS total
+        FROM `groups`
+        INNER JOIN teamgroups ON `groups`.id = teamgroups.group_id
+        INNER JOIN groupmembers ON `groups`.id = groupmembers.group_id
+        WHERE `groups`.created_app = :app AND groupmembers.status = 'accepted'
+        GROUP BY `groups`.id, `groups`.group_name, teamgroups.team_name
+        ORDER BY total DESC
+        LIMIT 1
+        """,
+        {"app": SEED_APP},
+    ).first()
+
+    if user is None or group is None:
+        raise click.ClickException(
+            "No seeded data found.  Run 'flask seed' before 'flask bench'."
+        )
+
+    log = db.session.execute(
+        """
+        SELECT log_id, date FROM logs
+        WHERE username = :username AND deleted IS NOT TRUE
+        ORDER BY date DESC
+        LIMIT 1
+        """,
+        {"username": user.username},
+    ).first()
+
+    return {
+        "username": user.username,
+        "first": user.first,
+        "last": user.last,
+        "group_id": group.id,
+        "group_name": group.group_name,
+        "team_name": group.team_name,
+        "log_id": log.log_id,
+        "log_date": log.date,
+    }
+
+
+def micro_benchmarks(targets: dict) -> Dict[str, Callable[[], object]]:
+    """
+    Create benchmarks for helper functions and DAO queries.
+    :param targets: Identifiers returned by find_targets().
+    :return: Functions to benchmark, keyed by name.
+    """
+    # pylint: disable=import-outside-toplevel
+    from dao.groupDao import GroupDao
+    from dao.logDao import LogDao
+
+    # A bulk import of exercise logs, which is normalized one log at a time and all at once.
+    metrics = ["miles", "kilometers", "meters", "miles"] * (BATCH_SIZE // 4)
+    distances = [5.2, 8, 1600, 3.1] * (BATCH_SIZE // 4)
+    times = ["00:36:24", "40:12", "05:01", "1:02:30"] * (BATCH_SIZE // 4)
+
+    def normalize_scalar() -> None:
+        for metric, distance, duration in zip(metrics, distances, times):
+            calculate_mile_pace(to_miles(metric, distance), duration)
+
+    def normalize_batch() -> None:
+        calculate_mile_paces(to_miles_batch(metrics, distances), times)
+
+    return {
+        "to_miles": lambda: to_miles("kilometers", 5.2),
+        "calculate_mile_pace": lambda: calculate_mile_pace(3.23, "00:19:46"),
+        f"normalize {BATCH_SIZE} logs (scalar)": normalize_scalar,
+        f"normalize {BATCH_SIZE} logs (batch)": normalize_batch,
+        "LogDao.get_log_feed": lambda: LogDao.get_log_feed(
+            limit=10, offset=0, username=targets["username"]
+        ).fetchall(),
+        "LogDao.get_user_miles": lambda: LogDao.get_user_miles(targets["username"]),
+        "GroupDao.get_group_leaderboard": lambda: GroupDao.get_group_leaderboard(
+            group_id=targets["group_id"]
+        ).fetchall(),
+    }
+
+
+def macro_benchmarks(client, targets: dict, created: dict) -> Dict[str, Callable]:
+    """
+    Create benchmarks for requests to the hot endpoints.
+    :param client: A Flask test client.
+    :param targets: Identifiers returned by find_targets().
+    :param created: Lists which collect the ids of logs and comments created by POST requests, so they can be
+    removed after the benchmarks run.
+    :return: Functions to benchmark, keyed by name.
+    """
+    username = targets["username"]
+    group_id = targets["group_id"]
+    headers = {"Authorization": f"Bearer {make_token(username)}"}
+    end = targets["log_date"]
+    start = end - timedelta(days=35)
+
+    def get(url: str) -> Callable[[], None]:
+        def request() -> None:
+            response = client.get(url, headers=headers)
+            assert response.status_code == 200, f"GET {url}: {response.status_code}"
+
+        return request
+
+    def post_log() -> None:
+        response = client.post(
+            "/v2/logs/",
+            headers=headers,
+            json={
+                "username": username,
+                "first": targets["first"],
+                "last": targets["last"],
+                "name": "Benchmark Run",
+                "location": "Riverside Park",
+                "date": str(date.today()),
+                "type": "run",
+                "distance": 5.2,
+                "metric": "miles",
+                "time": "00:36:24",
+                "feel": 6,
+                "description": "Created by 'flask bench'.",
+            },
+        )
+        assert response.status_code == 200, f"POST /v2/logs: {response.status_code}"
+        created["logs"].append(response.get_json()["log"]["log_id"])
+
+    def post_comment() -> None:
+        response = client.post(
+            "/v2/comments/",
+            headers=headers,
+            json={
+                "username": username,
+                "first": targets["first"],
+                "last": targets["last"],
+                "log_id": targets["log_id"],
+                "content": "Created by 'flask bench'.",
+            },
+        )
+        assert response.status_code == 200, f"POST /v2/comments: {response.status_code}"
+        created["comments"].append(response.get_json()["comment"]["comment_id"])
+
+    return {
+        "GET /v2/log_feed/all": get("/v2/log_feed/all/all/10/0"),
+        "GET /v2/log_feed/user": get(f"/v2/log_feed/user/{username}/10/0"),
+        "GET /v2/log_feed/group": get(f"/v2/log_feed/group/{group_id}/10/0"),
+        "GET /v2/range_view/user": get(
+            f"/v2/range_view/user/{username}/rbso/{start}/{end}"
+        ),
+        "GET /v2/range_view/group": get(
+            f"/v2/range_view/group/{group_id}/rbso/{start}/{end}"
+        ),
+        "GET /v2/groups/leaderboard": get(f"/v2/groups/leaderboard/{group_id}"),
+        "GET /v2/users/snapshot": get(f"/v2/users/snapshot/{username}"),
+        "GET /v2/groups/snapshot": get(
+            f"/v2/groups/snapshot/{targets['team_name']}/{targets['group_name']}"
+        ),
+        "POST /v2/logs": post_log,
+        "POST /v2/comments": post_comment,
+    }
+
+
+def remove_created(created: dict) -> None:
+    """
+    Delete the logs and comments created by benchmark requests.  Logs are deleted with the DAO, so the personal
+    records and streaks they changed are restored.
+    :param created: Lists of log and comment ids.
+    """
+    # pylint: disable=import-outside-toplevel
+    from dao.logDao import LogDao
+
+    # pylint: disable=no-member
+    for comment_id in created["comments"]:
+        db.session.execute(
+            "DELETE FROM comments WHERE comment_id = :comment_id",
+            {"comment_id": comment_id},
+        )
+
+    db.session.commit()
+
+    for log_id in created["logs"]:
+        assert LogDao.delete_log(log_id), f"Failed to delete log {log_id}"
+
+
+def git_commit() -> Optional[str]:
+    """
+    Get the commit of the code being benchmarked.
+    :return: A commit hash, or None if the code isn't in a git repository.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(
+    iterations: int = 50,
+    warmup: int = 5,
+    only: Optional[List[str]] = None,
+    micro: bool = True,
+    macro: bool = True,
+) -> dict:
+    """
+    Run the benchmark suite against the database of the current application.  Authentication requests are answered
+    by a stand-in authentication service for the duration of the run.
+    :param iterations: The number of measured calls of each benchmark.
+    :param warmup: The number of calls of each benchmark made before measuring.
+    :param only: Substrings of benchmark names to run.  All benchmarks run if this is empty.
+    :param micro: Whether to run micro-benchmarks.
+    :param macro: Whether to run macro-benchmarks.
+    :return: Metadata about the run and the results of each benchmark.
+    """
+    targets = find_targets()
+    created = {"logs": [], "comments": []}
+    benchmarks = {}
+
+    if micro:
+        benchmarks.update(micro_benchmarks(targets))
+
+    auth_url = current_app.config["AUTH_URL"]
+    stub = StubService().start()
+    current_app.config["AUTH_URL"] = stub.url
+
+    try:
+        if macro:
+            client = current_app.test_client()
+            benchmarks.update(macro_benchmarks(client, targets, created))
+
+        results = {}
+        for name, fn in benchmarks.items():
+            if only and not any(pattern in name for pattern in only):
+                continue
+
+            current_app.logger.info(f"Benchmarking {name}")
+            results[name] = measure(fn, iterations=iterations, warmup=warmup)
+            print(
+                f"{name}: p50 {results[name]['latency_ms']['p50']}ms, "
+                f"p99 {results[name]['latency_ms']['p99']}ms, "
+                f"{results[name]['queries_per_call']} queries"
+            )
+    finally:
+        current_app.config["AUTH_URL"] = auth_url
+        stub.stop()
+        remove_created(created)
+
+    return {
+        "commit": git_commit(),
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "iterations": iterations,
+        "warmup": warmup,
+        "targets": {
+            key: str(value) for key, value in targets.items() if key != "log_date"
+        },
+        "benchmarks": results,
+    }
+
+
+def write_results(results: dict, path: str, baseline_path: Optional[str]) -> None:
+    """
+    Write benchmark results to a JSON file, optionally including a comparison with an earlier run.
+    :param results: Results returned by run().
+    :param path: The file to write.
+    :param baseline_path: A results file from an earlier run.
+    """
+    if baseline_path:
+        with open(baseline_path, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+        results["baseline"] = {
+            "commit": baseline.get("commit"),
+            "change_percent": compare(results, baseline),
+        }
+
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
@@ -0,0 +1,679 @@
+"""
+Cache for DAO and route functions.  Cached values are stored in a backend selected by the CACHE_BACKEND config: a
+bounded LRU in each process, the uWSGI cache shared by all the workers on a host, or a Redis server.  Entries expire
+after a TTL and are invalidated early when one of their tags is invalidated.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+import contextlib
+import functools
+import hashlib
+import logging
+import pickle
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+
+from flask import Flask, Response, current_app, has_app_context
+
+from utils.singleFlight import (
+    SingleFlight,
+    DEFAULT_LOCK_TIMEOUT,
+    DEFAULT_WAIT_TIMEOUT,
+)
+
+DEFAULT_TTL = 60
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_KEY_PREFIX = "saintsxctf"
+DEFAULT_UWSGI_CACHE = "saintsxctf"
+
+# States of a cache entry read from the backend.
+FRESH = "fresh"
+STALE = "stale"
+
+# Seconds that tag versions are kept.  An entry whose tag version was evicted is treated as invalidated.
+TAG_TTL = 7 * 24 * 60 * 60
+
+Tags = Union[Iterable[str], Callable[..., Iterable[str]], None]
+
+
+class MemoryBackend:
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Create a least recently used cache in the current process.  Each uWSGI worker has its own copy.
+        :param max_entries: The maximum number of entries before the least recently used entry is evicted.
+        """
+        self.max_entries = max_entries
+        self.entries: OrderedDict = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        """
+        Get multiple values from the cache.
+        :param keys: Keys of the cache entries.
+        :return: The value of each key, or None if the key isn't cached or has expired.
+        """
+        now = time.monotonic()
+        values = []
+
+        with self.lock:
+            for key in keys:
+                entry = self.entries.get(key)
+                if entry is None or entry[0] <= now:
+                    values.append(None)
+                    continue
+
+                self.entries.move_to_end(key)
+                values.append(entry[1])
+
+        return values
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        """
+        Add a value to the cache.
+        :param key: Key of the cache entry.
+        :param value: The serialized value.
+        :param ttl: Seconds until the entry expires.
+        """
+        with self.lock:
+            self.store(key, value, ttl)
+
+    def add(self, key: str, value: bytes, ttl: int) -> bool:
+        """
+        Add a value to the cache unless the key already has a value which hasn't expired.
+        :param key: Key of the cache entry.
+        :param value: The serialized value.
+        :param ttl: Seconds until the entry expires.
+        :return: True if the value was added, False if the key already has a value.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return False
+
+            self.store(key, value, ttl)
+            return True
+
+    def store(self, key: str, value: bytes, ttl: int) -> None:
+        """
+        Add a value to the cache while holding the lock, evicting the least recently used entry if the cache is full.
+        :param key: Key of the cache entry.
+        :param value: The serialized value.
+        :param ttl: Seconds until the entry expires.
+        """
+        self.entries[key] = (time.monotonic() + ttl, value)
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a value from the cache.
+        :param key: Key of the cache entry.
+        """
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove every value from the cache.
+        """
+        with self.lock:
+            self.entries.clear()
+
+
+class UwsgiBackend:
+    def __init__(self, name: str = DEFAULT_UWSGI_CACHE, uwsgi_module=None):
+        """
+        Use a uWSGI cache, which is shared memory available to every worker on a host.  The cache is configured with
+        the 'cache2' option in uwsgi.ini.
+        :param name: The name of the uWSGI cache.
+        :param uwsgi_module: The uwsgi module, which is only importable in processes started by uWSGI.
+        """
+        if uwsgi_module is None:
+            import uwsgi as uwsgi_module  # pylint: disable=import-outside-toplevel
+
+        self.name = name
+        self.uwsgi = uwsgi_module
+
+    def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        """
+        Get multiple values from the cache.
+        :param keys: Keys of the cache entries.
+        :return: The value of each key, or None if the key isn't cached or has expired.
+        """
+        return [self.uwsgi.cache_get(key, self.name) for key in keys]
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        """
+        Add a value to the cache.
+        :param key: Key of the cache entry.
+        :param value: The serialized value.
+        :param ttl: Seconds until the entry expires.
+        """
+        self.uwsgi.cache_update(key, value, ttl, self.name)
+
+    def add(self, key: str, value: bytes, ttl: int) -> bool:
+        """
+        Add a value to the cache unless the key already has a value which hasn't expired.
+        :param key: Key of the cache entry.
+        :param value: The serialized value.
+        :param ttl: Seconds until the entry expires.
+        :return: True if the value was added, False if the key already has a value.
+        """
+        return bool(self.uwsgi.cache_set(key, value, ttl, self.name))
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a value from the cache.
+        :param key: Key of the cache entry.
+        """
+        self.uwsgi.cache_del(key, self.name)
+
+    def clear(self) -> None:
+        """
+        Remove every value from the cache.
+        """
+        self.uwsgi.cache_clear(self.name)
+
+
+class RedisBackend:
+    def __init__(self, url: str = None, client=None):
+        """
+        Use a Redis server, which is shared by every API instance.
+        :param url: Connection URL for the Redis server.
+        :param client: A client with the redis-py interface to use instead of connecting to the URL.
+        """
+        if client is None:
+            import redis  # pylint: disable=import-outside-toplevel
+
+            client = redis.Redis.from_url(url)
+
+        self.client = client
+
+    def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        """
+        Get multiple values from the cache in a single round trip.
+        :param keys: Keys of the cache entries.
+        :return: The value of each key, or None if the key isn't cached or has expired.
+        """
+        return self.client.mget(keys)
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        """
+        Add a value to the cache.
+        :param key: Key of the cache entry.
+        :param value: The serialized value.
+        :param ttl: Seconds until the entry expires.
+        """
+        self.client.set(key, value, ex=ttl)
+
+    def add(self, key: str, value: bytes, ttl: int) -> bool:
+        """
+        Add a value to the cache unless the key already has a value which hasn't expired.
+        :param key: Key of the cache entry.
+        :param value: The serialized value.
+        :param ttl: Seconds until the entry expires.
+        :return: True if the value was added, False if the key already has a value.
+        """
+        return bool(self.client.set(key, value, ex=ttl, nx=True))
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a value from the cache.
+        :param key: Key of the cache entry.
+        """
+        self.client.delete(key)
+
+    def clear(self) -> None:
+        """
+        Remove every value from the cache.  Other data in the Redis database is also removed.
+        """
+        self.client.flushdb()
+
+
+class Cache:
+    def __init__(
+        self,
+        backend,
+        prefix: str = DEFAULT_KEY_PREFIX,
+        default_ttl: int = DEFAULT_TTL,
+        flights: SingleFlight = None,
+    ):
+        """
+        Create a cache which stores values in a backend.
+        :param backend: A MemoryBackend, UwsgiBackend, or RedisBackend.
+        :param prefix: Prefix of every key, which separates API environments sharing a backend.
+        :param default_ttl: Seconds until entries expire if no TTL is given.
+        :param flights: Coalesces concurrent computations of the same entry.
+        """
+        self.backend = backend
+        self.flights = flights or SingleFlight(backend)
+        self.prefix = prefix
+        self.default_ttl = default_ttl
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.errors = 0
+
+    def key(self, namespace: str, name: str, args: tuple, kwargs: dict) -> str:
+        """
+        Build the key for a function call.  Arguments are hashed to keep keys short.
+        :param namespace: Namespace of the cached function.
+        :param name: Name of the cached function.
+        :param args: Positional arguments of the call.
+        :param kwargs: Keyword arguments of the call.
+        :return: A cache key.
+        """
+        digest = hashlib.sha1(
+            repr((args, sorted(kwargs.items()))).encode("utf-8")
+        ).hexdigest()
+        return f"{self.prefix}:{namespace}:{name}:{digest}"
+
+    def tag_key(self, tag: str) -> str:
+        """
+        Build the key which holds the current version of a tag.
+        :param tag: A tag attached to cache entries.
+        :return: A cache key.
+        """
+        return f"{self.prefix}:tag:{tag}"
+
+    def get_or_set(  # pylint: disable=too-many-arguments
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: int = None,
+        tags: List[str] = (),
+        single_flight: bool = False,
+        stale_ttl: int = 0,
+    ) -> Any:
+        """
+        Get a value from the cache, computing and caching it on a miss.  Tag versions are read before the value is
+        computed, so a value computed while one of its tags is invalidated is never served as fresh.
+        :param key: Key of the cache entry.
+        :param compute: Function which computes the value.  None and Uncacheable values are not cached.
+        :param ttl: Seconds until the entry is stale.
+        :param tags: Tags attached to the entry.
+        :param single_flight: Whether concurrent misses for the same key wait on a single computation.
+        :param stale_ttl: Seconds after an entry becomes stale (expired or invalidated) that it is still returned while
+        it is recomputed in the background.
+        :return: The cached or computed value.
+        """
+        ttl = ttl or self.default_ttl
+        tag_keys = [self.tag_key(tag) for tag in tags]
+
+        try:
+            state, value, versions = self.read(key, tag_keys, ttl, stale_ttl)
+        except Exception:  # pylint: disable=broad-except
+            logging.exception(f"Unable to read {key} from the cache")
+            self.record("errors")
+            return compute()
+
+        if state == FRESH:
+            self.record("hits")
+            return value
+
+        if state == STALE:
+            self.record("stale_hits")
+            self.revalidate(key, compute, tag_keys, ttl, stale_ttl)
+            return value
+
+        self.record("misses")
+
+        def compute_and_store() -> Any:
+            computed = compute()
+            self.store(key, computed, versions, ttl + stale_ttl)
+            return computed
+
+        if not single_flight:
+            return compute_and_store()
+
+        return self.flights.run(
+            key,
+            compute_and_store,
+            lookup=lambda: self.lookup(key, tag_keys, ttl),
+            shareable=lambda computed: not isinstance(computed, Uncacheable),
+        )
+
+    def read(
+        self, key: str, tag_keys: List[str], ttl: int, stale_ttl: int = 0
+    ) -> Tuple[Optional[str], Any, List[bytes]]:
+        """
+        Read an entry and the current versions of its tags in a single request to the backend.
+        :param key: Key of the cache entry.
+        :param tag_keys: Keys of the tag versions.
+        :param ttl: Seconds until the entry is stale.
+        :param stale_ttl: Seconds that a stale entry may still be returned.
+        :return: FRESH, STALE, or None if no usable entry was found, along with the entry's value and the current tag
+        versions.
+        """
+        entry, *versions = self.backend.get_many([key, *tag_keys])
+        versions = self.create_missing_versions(tag_keys, versions)
+
+        if entry is None:
+            return None, None, versions
+
+        entry_versions, computed, value = pickle.loads(entry)
+        age = time.time() - computed
+
+        if entry_versions == versions and age < ttl:
+            return FRESH, value, versions
+
+        if stale_ttl and age < ttl + stale_ttl:
+            return STALE, value, versions
+
+        return None, None, versions
+
+    def lookup(self, key: str, tag_keys: List[str], ttl: int) -> Tuple[bool, Any]:
+        """
+        Check for a fresh entry computed by another worker.
+        :param key: Key of the cache entry.
+        :param tag_keys: Keys of the tag versions.
+        :param ttl: Seconds until the entry is stale.
+        :return: Whether a fresh entry was found and its value.
+        """
+        state, value, _ = self.read(key, tag_keys, ttl)
+        return state == FRESH, value
+
+    def store(self, key: str, value: Any, versions: List[bytes], ttl: int) -> None:
+        """
+        Write an entry to the cache.  Errors are logged, since the value can still be returned to the caller.
+        :param key: Key of the cache entry.
+        :param value: The value to cache.  None and Uncacheable values are skipped.
+        :param versions: Versions of the entry's tags when the value was computed.
+        :param ttl: Seconds until the entry is removed from the backend.
+        """
+        if value is None or isinstance(value, Uncacheable):
+            return
+
+        try:
+            self.backend.set(key, pickle.dumps((versions, time.time(), value)), ttl)
+        except Exception:  # pylint: disable=broad-except
+            logging.exception(f"Unable to write {key} to the cache")
+            self.record("errors")
+
+    def revalidate(  # pylint: disable=too-many-arguments
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        tag_keys: List[str],
+        ttl: int,
+        stale_ttl: int,
+    ) -> None:
+        """
+        Recompute a stale entry on a background thread.  A lock in the backend ensures only one worker recomputes
+        the entry at a time.
+        :param key: Key of the cache entry.
+        :param compute: Function which computes the value.
+        :param tag_keys: Keys of the tag versions.
+        :param ttl: Seconds until the entry is stale.
+        :param stale_ttl: Seconds that a stale entry may still be returned.
+        """
+        lock_key = f"{key}:revalidate"
+
+        try:
+            if not self.backend.add(lock_key, b"1", self.flights.lock_timeout):
+                return
+        except Exception:  # pylint: disable=broad-except
+            logging.exception(f"Unable to lock {key} for revalidation")
+            return
+
+        # The recompute thread needs the application itself, since current_app is a proxy to a context which is
+        # removed when the request ends.  _get_current_object() is Flask's documented way to get it.
+        # pylint: disable=protected-access
+        app = current_app._get_current_object() if has_app_context() else None
+
+        def recompute() -> None:
+            with app.app_context() if app else contextlib.nullcontext():
+                try:
+                    versions = self.create_missing_versions(
+                        tag_keys, self.backend.get_many(tag_keys)
+                    )
+                    self.store(key, compute(), versions, ttl + stale_ttl)
+                except Exception:  # pylint: disable=broad-except
+                    logging.exception(f"Unable to revalidate {key}")
+                finally:
+                    self.flights.release(lock_key)
+
+        threading.Thread(target=recompute, daemon=True).start()
+
+    def create_missing_versions(
+        self, tag_keys: List[str], versions: List[Optional[bytes]]
+    ) -> List[bytes]:
+        """
+        Give a version to tags which haven't been invalidated or whose version was evicted.
+        :param tag_keys: Keys of the tag versions.
+        :param versions: The current versions of the tags.
+        :return: A version for every tag.
+        """
+        versions = list(versions)
+        for index, version in enumerate(versions):
+            if version is None:
+                versions[index] = uuid.uuid4().hex.encode("utf-8")
+                self.backend.set(tag_keys[index], versions[index], TAG_TTL)
+
+        return versions
+
+    def invalidate(self, *tags: str) -> None:
+        """
+        Invalidate every cache entry with one of the given tags.  Entries are left in the backend until they expire or
+        are evicted, but are no longer served.
+        :param tags: Tags to invalidate.
+        """
+        for tag in tags:
+            self.backend.set(
+                self.tag_key(tag), uuid.uuid4().hex.encode("utf-8"), TAG_TTL
+            )
+
+    def invalidate_namespace(self, namespace: str) -> None:
+        """
+        Invalidate every cache entry in a namespace.
+        :param namespace: Namespace of cached functions.
+        """
+        self.invalidate(namespace_tag(namespace))
+
+    def record(self, counter: str) -> None:
+        """
+        Increment a counter of cache activity.
+        :param counter: 'hits', 'misses', 'stale_hits', or 'errors'.
+        """
+        with self.lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self) -> dict:
+        """
+        Get the cache activity of this process.
+        :return: Counts of cache hits, misses, stale hits, errors, and callers who waited on another computation.
+        """
+        with self.lock:
+            return {
+                "backend": type(self.backend).__name__,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale_hits": self.stale_hits,
+                "errors": self.errors,
+                "coalesced": self.flights.coalesced,
+            }
+
+
+def namespace_tag(namespace: str) -> str:
+    """
+    Get the tag which every entry in a namespace has.
+    :param namespace: Namespace of cached functions.
+    :return: A tag.
+    """
+    return f"namespace:{namespace}"
+
+
+def create_backend(config: dict):
+    """
+    Create the cache backend configured for the application.
+    :param config: The Flask application configuration.
+    :return: A cache backend, or None if caching is disabled.
+    """
+    backend = config.get("CACHE_BACKEND", "none")
+
+    if backend == "memory":
+        return MemoryBackend(config.get("CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+
+    if backend == "uwsgi":
+        try:
+            return UwsgiBackend(config.get("CACHE_UWSGI_NAME", DEFAULT_UWSGI_CACHE))
+        except ImportError:
+            # Processes not started by uWSGI, such as Flask CLI commands, fall back to a cache of their own.
+            logging.info("uWSGI isn't running, using an in-process cache instead")
+            return MemoryBackend(config.get("CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+
+    if backend == "redis":
+        return RedisBackend(config.get("CACHE_REDIS_URL"))
+
+    return None
+
+
+def init_cache(app: Flask) -> Optional[Cache]:
+    """
+    Add a cache to the application.  Functions decorated with @cached use it.
+    :param app: The Flask application.
+    :return: The cache, or None if caching is disabled.
+    """
+    backend = create_backend(app.config)
+    if backend is None:
+        return None
+
+    cache = Cache(
+        backend,
+        prefix=f"{app.config.get('CACHE_KEY_PREFIX', DEFAULT_KEY_PREFIX)}:{app.config['ENV']}",
+        default_ttl=app.config.get("CACHE_DEFAULT_TTL", DEFAULT_TTL),
+        flights=SingleFlight(
+            backend,
+            lock_timeout=app.config.get("CACHE_LOCK_TIMEOUT", DEFAULT_LOCK_TIMEOUT),
+            wait_timeout=app.config.get("CACHE_LOCK_WAIT", DEFAULT_WAIT_TIMEOUT),
+        ),
+    )
+    app.extensions["cache"] = cache
+    return cache
+
+
+def get_cache() -> Optional[Cache]:
+    """
+    Get the cache of the current application.
+    :return: The cache, or None if there is no application context or caching is disabled.
+    """
+    if not has_app_context():
+        return None
+
+    return current_app.extensions.get("cache")
+
+
+def cached(
+    namespace: str,
+    ttl: int = None,
+    tags: Tags = None,
+    single_flight: bool = False,
+    stale_ttl: int = 0,
+):
+    """
+    Decorator which caches the return values of a DAO or route function.  Route functions returning a response
+    are only cached if the response status is 200, and cached responses have an Age header with the number of seconds
+    since they were computed.  DAO functions returning ORM objects receive detached copies.
+    :param namespace: Namespace of the function's cache entries.
+    :param ttl: Seconds until entries are stale.  Defaults to the CACHE_DEFAULT_TTL config.
+    :param tags: Tags attached to entries, or a function which takes the decorated function's arguments and returns
+    tags.
+    :param single_flight: Whether concurrent calls with the same arguments wait on the first call instead of computing
+    the value again.  Use for expensive functions which are often called at the same time.
+    :param stale_ttl: Seconds that stale entries are still returned while they are recomputed in the background
+    (stale-while-revalidate).  Use for data which can be a few seconds out of date.
+    :return: The decorator.
+    """
+
+    def decorator(f):
+        @functools.wraps(f)
+        def decorated_function(*args, **kwargs):
+            cache = get_cache()
+            if cache is None:
+                return f(*args, **kwargs)
+
+            entry_tags = [namespace_tag(namespace)]
+            if callable(tags):
+                entry_tags.extend(tags(*args, **kwargs))
+            elif tags is not None:
+                entry_tags.extend(tags)
+
+            value = cache.get_or_set(
+                cache.key(namespace, f.__qualname__, args, kwargs),
+                lambda: to_cacheable(f(*args, **kwargs)),
+                ttl=ttl,
+                tags=entry_tags,
+                single_flight=single_flight,
+                stale_ttl=stale_ttl,
+            )
+
+            if isinstance(value, CachedResponse):
+                return value.to_response()
+
+            if isinstance(value, Uncacheable):
+                return value.value
+
+            return value
+
+        return decorated_function
+
+    return decorator
+
+
+class CachedResponse:
+    def __init__(self, response: Response):
+        """
+        Picklable copy of a Flask response.
+        :param response: A response returned by a route function.
+        """
+        self.data = response.get_data()
+        self.created = time.time()
+        self.status_code = response.status_code
+        self.headers = [
+            (name, value)
+            for name, value in response.headers.items()
+            if name != "Content-Length"
+        ]
+
+    def to_response(self) -> Response:
+        """
+        Create a new response from the copy.  The Age header contains the number of seconds since the response was
+        computed.
+        :return: A Flask response.
+        """
+        response = current_app.response_class(
+            self.data, status=self.status_code, headers=self.headers
+        )
+        response.headers["Age"] = str(int(max(time.time() - self.created, 0)))
+        return response
+
+
+class Uncacheable:
+    def __init__(self, value: Any):
+        """
+        Wrapper for a value which is returned but never cached, such as an error response.
+        :param value: The return value of a cached function.
+        """
+        self.value = value
+
+
+def to_cacheable(value: Any) -> Any:
+    """
+    Convert the return value of a cached function into a value which can be stored in the cache.
+    :param value: The return value of a cached function.
+    :return: A picklable value, or an Uncacheable wrapper if the value shouldn't be cached.
+    """
+    if isinstance(value, Response):
+        if value.status_code != 200 or value.is_streamed:
+            return Uncacheable(value)
+
+        return CachedResponse(value)
+
+    return value
@@ -0,0 +1,52 @@
+"""
+Opaque cursors for keyset pagination.  A cursor holds the sort key of the last item on a page, and the next page
+starts after it.  Unlike offsets, cursors don't skip or repeat items when new items are added while paging.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import List, Optional
+
+
+def encode_cursor(*values) -> str:
+    """
+    Create a cursor from the sort key of the last item on a page.
+    :param values: The values of the columns that items are sorted by.  Dates and datetimes are stored as ISO 8601
+    strings.
+    :return: A URL safe string.
+    """
+    serializable = [
+        value.isoformat() if isinstance(value, (date, datetime)) else value
+        for value in values
+    ]
+    return (
+        base64.urlsafe_b64encode(json.dumps(serializable).encode("utf-8"))
+        .decode("utf-8")
+        .rstrip("=")
+    )
+
+
+def decode_cursor(cursor: Optional[str], length: int) -> Optional[List]:
+    """
+    Read the sort key from a cursor.
+    :param cursor: A cursor created by encode_cursor().
+    :param length: The number of values expected in the cursor.
+    :return: The values in the cursor, or None if the cursor is missing or invalid.
+    """
+    if not cursor:
+        return None
+
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(cursor + padding))
+    except (binascii.Error, ValueError):
+        return None
+
+    if not isinstance(values, list) or len(values) != length:
+        return None
+
+    return values
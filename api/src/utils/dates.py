@@ -7,7 +7,9 @@ Date: 7/4/2019
 from typing import Optional
 from datetime import datetime, timedelta, date
 
-from utils.literals import Interval, WeekStart
+from utils.literals import Granularity, Interval, WeekStart
+
+GRANULARITIES = ("day", "week", "month", "year")
 
 
 def get_start_date_interval(
@@ -60,3 +62,64 @@ def get_first_day_of_week(week_start: WeekStart = "monday") -> date:
         days=todays_weekday + sunday_week_start
     )
     return first_day_of_week.date()
+
+
+def get_notification_window_start() -> date:
+    """
+    Retrieve the first day that notifications are shown for, which is the Saturday before the start of the week two
+    weeks ago (with Sunday as the first day of the week).
+    :return: A date object.
+    """
+    today = datetime.today().date()
+
+    # Matches MySQL's DAYOFWEEK(), where Sunday is 1 and Saturday is 7.
+    day_of_week = today.isoweekday() % 7 + 1
+    return today - timedelta(days=day_of_week + 13)
+
+
+def get_week_containing(day: date, week_start: WeekStart = "monday") -> date:
+    """
+    Retrieve the first day of the week which contains a date.
+    :param day: A date within the week.
+    :param week_start: Either 'monday' or 'sunday'
+    :return: A date object representing the first day of the week
+    """
+    if week_start == "sunday":
+        return day - timedelta(days=(day.weekday() + 1) % 7)
+
+    return day - timedelta(days=day.weekday())
+
+
+def get_week_containing_sql(column: str, week_start: WeekStart = "monday") -> str:
+    """
+    Create a MySQL expression for the first day of the week which contains a date column.  The expression matches
+    get_week_containing(), so weeks can be grouped in SQL.
+    :param column: The name of a DATE column.
+    :param week_start: Either 'monday' or 'sunday'
+    :return: A SQL expression.
+    """
+    if week_start == "sunday":
+        return f"DATE_SUB({column}, INTERVAL DAYOFWEEK({column}) - 1 DAY)"
+
+    return f"DATE_SUB({column}, INTERVAL WEEKDAY({column}) DAY)"
+
+
+def get_period_containing_sql(
+    column: str, granularity: Granularity = "day", week_start: WeekStart = "monday"
+) -> str:
+    """
+    Create a MySQL expression for the first day of the day, week, month, or year which contains a date column.  Logs
+    are grouped by this expression to bucket them in SQL.
+    :param column: The name of a DATE column.
+    :param granularity: The length of each bucket: 'day', 'week', 'month', or 'year'.
+    :param week_start: Either 'monday' or 'sunday'.  Only used when the granularity is 'week'.
+    :return: A SQL expression.
+    """
+    if granularity == "week":
+        return get_week_containing_sql(column, week_start)
+    if granularity == "month":
+        return f"MAKEDATE(YEAR({column}), 1) + INTERVAL MONTH({column}) - 1 MONTH"
+    if granularity == "year":
+        return f"MAKEDATE(YEAR({column}), 1)"
+
+    return column
@@ -0,0 +1,120 @@
+"""
+Domain events published by DAO functions which change data.  Events are queued on the database session and only
+delivered to subscribers after the transaction commits, so subscribers never react to changes that were rolled back.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, DefaultDict, List, Optional, Union
+
+from flask import current_app, has_app_context
+
+from database import db
+
+PENDING_EVENTS = "pending_events"
+
+subscribers: DefaultDict[type, List[Callable]] = defaultdict(list)
+
+
+@dataclass(frozen=True)
+class LogChanged:
+    """
+    An exercise log was created, updated, or deleted.
+    """
+
+    username: Optional[str]
+    date: Optional[Union[date, str]] = None
+    log_id: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class GroupMembershipChanged:
+    """
+    The status or user type of a user's group membership changed.
+    """
+
+    group_id: int
+    username: str
+
+
+@dataclass(frozen=True)
+class MembershipsChanged:
+    """
+    A user joined or left teams and groups.
+    """
+
+    username: str
+
+
+@dataclass(frozen=True)
+class UserChanged:
+    """
+    A user's profile information changed.
+    """
+
+    username: str
+
+
+@dataclass(frozen=True)
+class NotificationsChanged:
+    """
+    A user's notifications were created, viewed, or deleted.
+    """
+
+    username: str
+
+
+def subscribe(*event_types: type):
+    """
+    Decorator which registers a function to receive events after they are committed.
+    :param event_types: The classes of events that the function receives.
+    :return: The decorator.
+    """
+
+    def decorator(f):
+        for event_type in event_types:
+            if f not in subscribers[event_type]:
+                subscribers[event_type].append(f)
+
+        return f
+
+    return decorator
+
+
+def publish(event) -> None:
+    """
+    Queue an event to be delivered when the current database transaction commits.
+    :param event: An event describing a change to the database.
+    """
+    # pylint: disable=no-member
+    db.session.info.setdefault(PENDING_EVENTS, []).append(event)
+
+
+def dispatch_pending() -> None:
+    """
+    Deliver the events queued during a transaction which just committed.  Duplicate events are delivered once.  A
+    failing subscriber is logged instead of failing the request, since the data is already committed.
+    """
+    # pylint: disable=no-member
+    events = db.session.info.pop(PENDING_EVENTS, [])
+
+    for event in dict.fromkeys(events):
+        for subscriber in subscribers[type(event)]:
+            try:
+                subscriber(event)
+            except Exception:  # pylint: disable=broad-except
+                if has_app_context():
+                    current_app.logger.exception(
+                        f"Subscriber {subscriber.__name__} failed to handle {event}"
+                    )
+
+
+def discard_pending() -> None:
+    """
+    Drop the events queued during a transaction which was rolled back.
+    """
+    # pylint: disable=no-member
+    db.session.info.pop(PENDING_EVENTS, None)
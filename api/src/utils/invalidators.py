@@ -0,0 +1,76 @@
+"""
+Invalidate cached responses when the data they contain changes.  Invalidators run after a transaction commits and
+invalidate cache tags.  Tag versions are stored in the cache backend, so with a shared backend an invalidation made by
+one worker applies to every worker.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+from typing import List
+
+from dao.groupMemberDao import GroupMemberDao
+from dao.logDao import LogDao
+from utils.cache import get_cache
+from utils.events import (
+    subscribe,
+    GroupMembershipChanged,
+    LogChanged,
+    MembershipsChanged,
+    NotificationsChanged,
+    UserChanged,
+)
+
+
+def user_tags(username: str) -> List[str]:
+    """
+    Get the tags of cache entries containing a user's data.  This includes every group the user is or was a member
+    of, since group snapshots and leaderboards contain their members' exercise statistics.
+    :param username: Unique identifier for the user.
+    :return: A list of cache tags.
+    """
+    tags = [f"user:{username}"]
+
+    for group in GroupMemberDao.get_user_group_history(username=username):
+        tags.append(f"group:{group['id']}")
+        tags.append(f"group:{group['team_name']}/{group['group_name']}")
+
+    return tags
+
+
+def invalidate_user(event) -> None:
+    """
+    Invalidate cached responses after a user's profile, exercise logs, or memberships change.
+    :param event: A LogChanged, GroupMembershipChanged, MembershipsChanged, or UserChanged event.
+    """
+    cache = get_cache()
+    if cache is None:
+        return
+
+    username = event.username
+    if username is None and isinstance(event, LogChanged):
+        log = LogDao.get_log_by_id(log_id=event.log_id)
+        username = log.username if log else None
+
+    if username is not None:
+        cache.invalidate(*user_tags(username))
+
+
+def invalidate_notifications(event: NotificationsChanged) -> None:
+    """
+    Invalidate a user's cached snapshot after their notifications change, since it contains their notifications and
+    unread notification count.
+    :param event: A NotificationsChanged event.
+    """
+    cache = get_cache()
+    if cache is not None:
+        cache.invalidate(f"user:{event.username}")
+
+
+def register_invalidators() -> None:
+    """
+    Subscribe the invalidators to the events published by DAO functions.
+    """
+    subscribe(LogChanged, GroupMembershipChanged, MembershipsChanged, UserChanged)(
+        invalidate_user
+    )
+    subscribe(NotificationsChanged)(invalidate_notifications)
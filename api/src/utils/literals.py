@@ -8,4 +8,5 @@ from typing import Literal
 
 WeekStart = Literal["monday", "sunday"]
 Interval = Literal["year", "month", "week"]
+Granularity = Literal["day", "week", "month", "year"]
 HTTPMethod = Literal["GET", "POST", "PUT", "PATCH", "DELETE"]
@@ -0,0 +1,405 @@
+"""
+Load generator which replays the requests in the Postman collection against a running API instance.  Requests are
+parameterized with seeded users and sent at a fixed rate, independent of how fast the API responds, so that the
+measured latency includes time spent queued behind slow requests.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+import asyncio
+import json
+import random
+import re
+import time
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
+import click
+
+from database import db
+from utils.bench import summarize
+from utils.seed import SEED_APP
+from utils.stubServices import make_token
+
+# Marker placed in logs and comments created during a load test, so they can be removed afterwards.
+LOAD_TEST_MARKER = "Created by a load test."
+
+# Relative frequency of each request in the Postman collection, approximating production traffic.  Requests missing
+# from this dictionary have a weight of 1.
+DEFAULT_WEIGHTS = {
+    "logfeed all": 25,
+    "user snapshot": 10,
+    "user notifications": 10,
+    "logfeed user": 10,
+    "logfeed group": 10,
+    "range view user": 6,
+    "range view group": 4,
+    "user": 5,
+    "user groups": 5,
+    "group leaderboard": 5,
+    "group snapshot": 5,
+    "log create": 3,
+    "comment create": 2,
+    "user flair": 2,
+}
+
+VARIABLE_PATTERN = re.compile(r"{{(\w+)}}")
+
+
+def substitute(template: Optional[str], variables: Dict[str, str]) -> Optional[str]:
+    """
+    Replace Postman variables (such as {{username}}) in a string.  Unknown variables are left in place.
+    :param template: A string containing Postman variables.
+    :param variables: Values of the variables.
+    :return: The string with the variables replaced.
+    """
+    if template is None:
+        return None
+
+    return VARIABLE_PATTERN.sub(
+        lambda match: str(variables.get(match.group(1), match.group(0))), template
+    )
+
+
+def parse_collection(collection: dict) -> List[dict]:
+    """
+    Flatten the requests in a Postman (v2.1) collection.  Requests in folders are included, and requests without a
+    URL are skipped.
+    :param collection: A parsed Postman collection.
+    :return: Request templates with a name, method, URL, headers, and body.
+    """
+    requests = []
+
+    for item in collection.get("item", []):
+        if "item" in item:
+            requests += parse_collection(item)
+            continue
+
+        request = item.get("request", {})
+        url = request.get("url")
+        raw_url = url.get("raw") if isinstance(url, dict) else url
+
+        if not raw_url:
+            continue
+
+        body = request.get("body") or {}
+        requests.append(
+            {
+                "name": item.get("name"),
+                "method": request.get("method", "GET"),
+                "url": raw_url,
+                "headers": {
+                    header["key"]: header["value"]
+                    for header in request.get("header", [])
+                    if not header.get("disabled")
+                },
+                "body": body.get("raw") if body.get("mode") == "raw" else None,
+            }
+        )
+
+    return requests
+
+
+def collection_variables(collection: dict) -> Dict[str, str]:
+    """
+    Get the default values of the variables defined in a Postman collection.
+    :param collection: A parsed Postman collection.
+    :return: Variable values, keyed by variable name.
+    """
+    return {
+        variable["key"]: variable.get("value")
+        for variable in collection.get("variable", [])
+    }
+
+
+def plan(
+    requests: List[dict],
+    weights: Dict[str, int],
+    rps: float,
+    duration: float,
+    rng: random.Random,
+) -> List[Tuple[float, dict]]:
+    """
+    Choose the requests to send and when to send them.
+    :param requests: Request templates returned by parse_collection().
+    :param weights: Relative frequency of requests, keyed by request name.
+    :param rps: The number of requests to send each second.
+    :param duration: The length of the load test in seconds.
+    :param rng: Random number generator.
+    :return: Pairs of a send time (in seconds since the start of the test) and a request template.
+    """
+    if not requests:
+        return []
+
+    total = int(rps * duration)
+    chosen = rng.choices(
+        requests,
+        weights=[weights.get(request["name"], 1) for request in requests],
+        k=total,
+    )
+    return [(index / rps, request) for index, request in enumerate(chosen)]
+
+
+def load_variable_sets(count: int, rng: random.Random) -> List[Dict[str, str]]:
+    """
+    Build Postman variable values for a sample of seeded users.  Each user is paired with a group they are a member
+    of and a recent log they can comment on.
+    :param count: The maximum number of users to sample.
+    :param rng: Random number generator.
+    :return: A list of variable values, one for each user.
+    """
+    # pylint: disable=no-member
+    rows = db.session.execute(
+        """
+        SELECT users.username, users.first, users.last, MIN(groupmembers.group_id) AS group_id
+        FROM users
+        INNER JOIN groupmembers ON users.username = groupmembers.username
+        WHERE users.created_app = :app AND groupmembers.status = 'accepted'
+        GROUP BY users.username, users.first, users.last
+        """,
+        {"app": SEED_APP},
+    ).fetchall()
+    rows = rng.sample(rows, min(count, len(rows)))
+
+    end = date.today()
+    start = end - timedelta(days=30)
+
+    variable_sets = []
+    for row in rows:
+        group = db.session.execute(
+            """
+            SELECT teamgroups.team_name, teamgroups.group_name
+            FROM teamgroups
+            WHERE teamgroups.group_id = :group_id
+            """,
+            {"group_id": row.group_id},
+        ).first()
+        log = db.session.execute(
+            """
+            SELECT MAX(log_id) AS log_id FROM logs
+            WHERE username = :username AND deleted IS NOT TRUE
+            """,
+            {"username": row.username},
+        ).first()
+
+        if group is None or log.log_id is None:
+            continue
+
+        variable_sets.append(
+            {
+                "username": row.username,
+                "first": row.first,
+                "last": row.last,
+                "token": make_token(row.username),
+                "groupId": str(row.group_id),
+                "teamName": group.team_name,
+                "groupName": group.group_name,
+                "logId": str(log.log_id),
+                "start": str(start),
+                "end": str(end),
+            }
+        )
+
+    return variable_sets
+
+
+async def replay(
+    schedule: List[Tuple[float, dict]],
+    variable_sets: List[Dict[str, str]],
+    max_in_flight: int,
+    timeout: float,
+    rng: random.Random,
+) -> List[dict]:
+    """
+    Send the scheduled requests.  Latency is measured from the scheduled send time rather than the actual send time,
+    so requests delayed by the in flight limit count the delay against the API.
+    :param schedule: Send times and request templates returned by plan().
+    :param variable_sets: Variable values to parameterize requests with, one of which is chosen for each request.
+    :param max_in_flight: The maximum number of requests awaiting a response at once.
+    :param timeout: Seconds to wait for a response before counting a request as an error.
+    :param rng: Random number generator.
+    :return: The name, status code, and latency in milliseconds of each request.
+    """
+    semaphore = asyncio.Semaphore(max_in_flight)
+    samples = []
+
+    async def send(session: aiohttp.ClientSession, scheduled: float, request: dict):
+        variables = rng.choice(variable_sets)
+        async with semaphore:
+            try:
+                async with session.request(
+                    request["method"],
+                    substitute(request["url"], variables),
+                    headers={
+                        key: substitute(value, variables)
+                        for key, value in request["headers"].items()
+                    },
+                    data=substitute(request["body"], variables),
+                ) as response:
+                    await response.read()
+                    status = response.status
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                status = None
+
+        samples.append(
+            {
+                "name": request["name"],
+                "status": status,
+                "latency_ms": (time.perf_counter() - scheduled) * 1000,
+            }
+        )
+
+    async with aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        connector=aiohttp.TCPConnector(limit=max_in_flight),
+    ) as session:
+        start = time.perf_counter()
+        tasks = []
+        for offset, request in schedule:
+            delay = start + offset - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            tasks.append(asyncio.ensure_future(send(session, start + offset, request)))
+
+        await asyncio.gather(*tasks)
+
+    return samples
+
+
+def report(samples: List[dict], duration: float) -> dict:
+    """
+    Summarize the results of a load test for each request in the collection.
+    :param samples: Results returned by replay().
+    :param duration: The length of the load test in seconds.
+    :return: Throughput, error counts, and latency percentiles keyed by request name, plus a total for all requests.
+    """
+    by_name = {}
+    for sample in samples:
+        by_name.setdefault(sample["name"], []).append(sample)
+
+    def summarize_samples(group: List[dict]) -> dict:
+        succeeded = [
+            sample
+            for sample in group
+            if sample["status"] is not None and sample["status"] < 400
+        ]
+        return {
+            "requests": len(group),
+            "errors": len(group) - len(succeeded),
+            "throughput_rps": round(len(succeeded) / duration, 2) if duration else 0.0,
+            "latency_ms": summarize([sample["latency_ms"] for sample in group]),
+        }
+
+    routes = {name: summarize_samples(group) for name, group in sorted(by_name.items())}
+    return {"total": summarize_samples(samples), "routes": routes}
+
+
+def remove_created() -> None:
+    """
+    Delete the logs and comments created by load test requests.  The personal records and streaks of the users who
+    created logs are rebuilt without them.
+    """
+    # pylint: disable=import-outside-toplevel
+    from dao.personalRecordDao import PersonalRecordDao
+    from dao.streakDao import StreakDao
+
+    # pylint: disable=no-member
+    result = db.session.execute(
+        "SELECT DISTINCT username FROM logs WHERE username IN (SELECT username FROM users WHERE created_app = :app) AND description = :marker",
+        {"app": SEED_APP, "marker": LOAD_TEST_MARKER},
+    )
+    usernames = [row[0] for row in result]
+
+    db.session.execute(
+        "DELETE FROM comments WHERE username IN (SELECT username FROM users WHERE created_app = :app) AND content = :marker",
+        {"app": SEED_APP, "marker": LOAD_TEST_MARKER},
+    )
+    db.session.execute(
+        """
+        DELETE FROM comments WHERE log_id IN (
+            SELECT log_id FROM (
+                SELECT log_id FROM logs
+                WHERE username IN (SELECT username FROM users WHERE created_app = :app)
+                AND description = :marker
+            ) AS created_logs
+        )
+        """,
+        {"app": SEED_APP, "marker": LOAD_TEST_MARKER},
+    )
+    db.session.execute(
+        "DELETE FROM logs WHERE username IN (SELECT username FROM users WHERE created_app = :app) AND description = :marker",
+        {"app": SEED_APP, "marker": LOAD_TEST_MARKER},
+    )
+
+    for username in usernames:
+        PersonalRecordDao.rebuild_records(username)
+        StreakDao.rebuild_streak(username)
+
+    db.session.commit()
+
+
+def run(  # pylint: disable=too-many-arguments
+    collection_path: str,
+    target: str,
+    rps: float,
+    duration: float,
+    users: int = 100,
+    max_in_flight: int = 200,
+    timeout: float = 30,
+    weights: Optional[Dict[str, int]] = None,
+    random_seed: int = 28,
+) -> dict:
+    """
+    Replay a weighted mix of the requests in a Postman collection against a running API instance.
+    :param collection_path: Path to the Postman collection.
+    :param target: The base URL of the API instance.
+    :param rps: The number of requests to send each second.
+    :param duration: The length of the load test in seconds.
+    :param users: The number of seeded users to send requests as.
+    :param max_in_flight: The maximum number of requests awaiting a response at once.
+    :param timeout: Seconds to wait for a response before counting a request as an error.
+    :param weights: Relative frequency of requests, keyed by request name.
+    :param random_seed: Seed for a repeatable traffic mix.
+    :return: Settings of the load test and its results.
+    """
+    rng = random.Random(random_seed)
+
+    with open(collection_path, encoding="utf-8") as file:
+        collection = json.load(file)
+
+    requests = parse_collection(collection)
+    defaults = collection_variables(collection)
+
+    variable_sets = load_variable_sets(users, rng)
+    if not variable_sets:
+        raise click.ClickException(
+            "No seeded data found.  Run 'flask seed' before 'flask loadtest'."
+        )
+
+    for variables in variable_sets:
+        variables.update(
+            {key: value for key, value in defaults.items() if key not in variables}
+        )
+        variables["baseUrl"] = target.rstrip("/")
+
+    schedule = plan(requests, weights or DEFAULT_WEIGHTS, rps, duration, rng)
+
+    start = time.perf_counter()
+    try:
+        samples = asyncio.run(
+            replay(schedule, variable_sets, max_in_flight, timeout, rng)
+        )
+    finally:
+        remove_created()
+
+    elapsed = time.perf_counter() - start
+
+    return {
+        "target": target,
+        "target_rps": rps,
+        "duration": round(elapsed, 2),
+        "users": len(variable_sets),
+        "results": report(samples, elapsed),
+    }
@@ -6,6 +6,18 @@ Date: 9/1/2020
 
 import re
 
+# Times taken exercising are formatted as HH:MM:SS, MM:SS, or SS.
+time_regex = re.compile(r"\d{1,2}:\d{2}:\d{2}|\d{1,2}:\d{2}|\d{2}")
+hour_regex = re.compile(r"(\d{1,2}):(\d{2}):(\d{2})")
+minute_regex = re.compile(r"(\d{1,2}):(\d{2})")
+seconds_regex = re.compile(r"(\d{2})")
+
+# Times with more than two hour digits, which are longer than the longest time that can be stored (99:59:59).
+long_time_regex = re.compile(r"\d{3,}:\d{2}:\d{2}")
+
+METERS_PER_MILE = 1609.344
+MILES_PER_KILOMETER = 0.621317
+
 
 def to_miles(metric: str, distance: float) -> float:
     """
@@ -17,24 +29,37 @@ def to_miles(metric: str, distance: float) -> float:
     if metric == "miles":
         return distance
     if metric == "meters":
-        return distance / 1609.344
+        return distance / METERS_PER_MILE
     if metric == "kilometers":
-        return distance * 0.621317
+        return distance * MILES_PER_KILOMETER
 
     return distance
 
 
-def calculate_mile_pace(miles: float, time: str) -> str:
+def is_valid_time(time: str) -> bool:
     """
-    Calculate the mile pace of an exercise.
-    :param miles: The length of the exercise in miles.
+    Determine whether the time taken exercising is in a format that MySQL accepts.
+    :param time: The time taken exercising (represented as a string).  Valid formats are HH:MM:SS, MM:SS, and SS.
+    :return: True if the time is valid, False otherwise.
+    """
+    return isinstance(time, str) and time_regex.fullmatch(time) is not None
+
+
+def is_too_long_time(time: str) -> bool:
+    """
+    Determine whether the time taken exercising is formatted as HH:MM:SS but has too many hours to be stored.
     :param time: The time taken exercising (represented as a string).
-    :return: The pace per mile of the exercise (represented as a string).
+    :return: True if the time is longer than 99:59:59, False otherwise.
     """
-    hour_regex = re.compile(r"(\d{1,2}):(\d{2}):(\d{2})")
-    minute_regex = re.compile(r"(\d{1,2}):(\d{2})")
-    seconds_regex = re.compile(r"(\d{2})")
+    return isinstance(time, str) and long_time_regex.fullmatch(time) is not None
+
 
+def duration_seconds(time: str) -> int:
+    """
+    Convert the time taken exercising to seconds.
+    :param time: The time taken exercising (represented as a string).  Valid formats are HH:MM:SS, MM:SS, and SS.
+    :return: The number of seconds in the time, or zero if the time isn't valid.
+    """
     hour = 0
     minute = 0
     second = 0
@@ -46,7 +71,17 @@ def calculate_mile_pace(miles: float, time: str) -> str:
     elif match := seconds_regex.fullmatch(time):
         second = match.group(1)
 
-    total_seconds = (int(hour) * 60 * 60) + (int(minute) * 60) + int(second)
+    return (int(hour) * 60 * 60) + (int(minute) * 60) + int(second)
+
+
+def calculate_mile_pace(miles: float, time: str) -> str:
+    """
+    Calculate the mile pace of an exercise.
+    :param miles: The length of the exercise in miles.
+    :param time: The time taken exercising (represented as a string).
+    :return: The pace per mile of the exercise (represented as a string).
+    """
+    total_seconds = duration_seconds(time)
 
     if miles == 0:
         miles = 1
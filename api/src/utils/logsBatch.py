@@ -0,0 +1,149 @@
+"""
+Helper functions which compute the miles and pace of many exercise logs at once using NumPy arrays.  The results are
+identical to those of to_miles() and calculate_mile_pace() in utils/logs.py, which handle one log at a time.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+from typing import List, Sequence
+
+import numpy as np
+
+from utils.logs import duration_seconds, METERS_PER_MILE, MILES_PER_KILOMETER
+
+# Times shorter than HH:MM:SS are padded on the left with the start of this template, so that the hours, minutes, and
+# seconds are always at the same character positions.
+TIME_TEMPLATE = "00:00:00"
+TIME_LENGTHS = [2, 4, 5, 7, 8]
+DIGIT_POSITIONS = [0, 1, 3, 4, 6, 7]
+COLON_POSITIONS = [2, 5]
+
+# Paces of 100 hours or more don't fit in the HH:MM:SS template.
+MAX_TEMPLATE_PACE = 100 * 3600
+
+
+def char_codes(strings: np.ndarray, width: int) -> np.ndarray:
+    """
+    Get the Unicode code points of fixed width strings.
+    :param strings: An array of strings with at most 'width' characters.
+    :param width: The number of characters in each row of the result.
+    :return: A two dimensional array with the code points of each string, padded with zeros.
+    """
+    return strings.astype(f"<U{width}").view(np.uint32).reshape(-1, width)
+
+
+def parse_durations(times: Sequence[str]) -> np.ndarray:
+    """
+    Convert times taken exercising to seconds.  Times which aren't formatted as HH:MM:SS, MM:SS, or SS are zero
+    seconds, matching duration_seconds().
+    :param times: Times taken exercising (represented as strings).
+    :return: An array of the number of seconds in each time.
+    """
+    times = np.asarray(times, dtype=np.str_).reshape(-1)
+    seconds = np.zeros(times.size, dtype=np.int64)
+
+    if times.size == 0:
+        return seconds
+
+    width = len(TIME_TEMPLATE)
+    lengths = np.char.str_len(times)
+    valid = np.isin(lengths, TIME_LENGTHS)
+
+    codes = char_codes(np.where(valid, times, ""), width).astype(np.int64)
+
+    # Shift each time to the right so that it ends at the last character position, filling in the template before it.
+    positions = np.arange(width) - (width - lengths)[:, np.newaxis]
+    shifted = np.take_along_axis(codes, np.clip(positions, 0, width - 1), axis=1)
+    template = char_codes(np.array([TIME_TEMPLATE]), width)
+    codes = np.where(positions >= 0, shifted, template)
+
+    # Unicode digits other than 0-9 are valid in times, but can't be parsed from their code points.
+    unicode_times = np.flatnonzero(valid & (codes > 127).any(axis=1))
+
+    digits = codes[:, DIGIT_POSITIONS] - ord("0")
+    valid &= ((digits >= 0) & (digits <= 9)).all(axis=1)
+    valid &= (codes[:, COLON_POSITIONS] == ord(":")).all(axis=1)
+
+    units = digits[:, 0::2] * 10 + digits[:, 1::2]
+    seconds[valid] = (units @ np.array([3600, 60, 1]))[valid]
+
+    for index in unicode_times:
+        seconds[index] = duration_seconds(str(times[index]))
+
+    return seconds
+
+
+def to_miles_batch(metrics: Sequence[str], distances: Sequence[float]) -> np.ndarray:
+    """
+    Convert distances of different units to miles.
+    :param metrics: The unit of measurement used for each distance.
+    :param distances: The distances in their units of measurement.
+    :return: An array of the distances converted to miles.
+    """
+    metrics = np.asarray(metrics, dtype=np.str_).reshape(-1)
+    distances = np.asarray(distances, dtype=np.float64).reshape(-1)
+
+    return np.select(
+        [metrics == "meters", metrics == "kilometers"],
+        [distances / METERS_PER_MILE, distances * MILES_PER_KILOMETER],
+        default=distances,
+    )
+
+
+def calculate_mile_paces(miles: Sequence[float], times: Sequence[str]) -> List[str]:
+    """
+    Calculate the mile pace of many exercises.
+    :param miles: The length of each exercise in miles.
+    :param times: The time taken for each exercise (represented as strings).
+    :return: The pace per mile of each exercise (represented as strings).
+    """
+    miles = np.asarray(miles, dtype=np.float64).reshape(-1)
+    miles = np.where(miles == 0, 1.0, miles)
+    total_seconds = parse_durations(times).astype(np.float64)
+
+    second_pace = np.floor_divide(total_seconds, miles).astype(np.int64)
+
+    # Build the characters of each pace, then fall back to string formatting for paces that don't fit the template.
+    units = np.stack([second_pace // 3600, (second_pace // 60) % 60, second_pace % 60])
+    codes = np.empty((second_pace.size, len(TIME_TEMPLATE)), dtype=np.uint32)
+    codes[:, COLON_POSITIONS] = ord(":")
+    codes[:, DIGIT_POSITIONS[0::2]] = (units // 10).T + ord("0")
+    codes[:, DIGIT_POSITIONS[1::2]] = (units % 10).T + ord("0")
+
+    paces = codes.view(f"<U{len(TIME_TEMPLATE)}").reshape(-1).tolist()
+
+    for index in np.flatnonzero((second_pace < 0) | (second_pace >= MAX_TEMPLATE_PACE)):
+        hours, minutes, secs = units[:, index].tolist()
+        paces[index] = f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+    return paces
+
+
+def normalize_logs(logs: list) -> None:
+    """
+    Compute the miles and pace of exercise logs based on their time, metric, and distance.  Logs without a distance
+    and metric are left unchanged, and logs without a time are given miles but no pace.
+    :param logs: Log objects which are modified in place.
+    """
+    measured = [log for log in logs if log.distance and log.metric]
+
+    if not measured:
+        return
+
+    miles = to_miles_batch(
+        [log.metric for log in measured], [log.distance for log in measured]
+    )
+
+    timed: List[int] = []
+    for index, log in enumerate(measured):
+        log.miles = float(miles[index])
+        if log.time is not None:
+            timed.append(index)
+
+    if timed:
+        paces = calculate_mile_paces(
+            miles[timed], [measured[index].time for index in timed]
+        )
+
+        for index, pace in zip(timed, paces):
+            measured[index].pace = pace
@@ -0,0 +1,254 @@
+"""
+Remove rows which the API never reads again: forgot password codes and activation codes past their expiration date,
+and notifications older than a retention window.  Rows are removed in small batches, each in its own short
+transaction, with a pause between batches so that the job doesn't hold locks on tables used by API requests.  Expired
+activation codes and old notifications can be moved to their archive tables instead of being deleted.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy import bindparam, text
+
+from database import db
+from utils.archive import get_archived_table, move_rows
+from utils.events import (
+    dispatch_pending,
+    discard_pending,
+    publish,
+    NotificationsChanged,
+)
+
+MAINTENANCE_TASKS = ["forgotpassword", "codes", "notifications"]
+
+
+def expired_keys(
+    table: str, key: str, column: str, before: datetime, limit: int
+) -> list:
+    """
+    Find the primary keys of expired rows without locking them.  Rows are searched in order of an indexed time
+    column, so the oldest rows are found first without scanning the table.
+    :param table: The table to search.
+    :param key: The primary key column of the table.
+    :param column: The indexed time column which rows expire by.
+    :param before: Rows whose time column is before this time are expired.
+    :param limit: The maximum number of keys to return.
+    :return: A list of primary keys.
+    """
+    # pylint: disable=no-member
+    result = db.session.execute(
+        f"SELECT {key} FROM {table} WHERE {column} < :before ORDER BY {column} LIMIT :limit",
+        {"before": before, "limit": limit},
+    )
+    return [row[0] for row in result]
+
+
+def commit() -> None:
+    """
+    Commit a batch, delivering the events published while it was removed.  The batch is rolled back if it fails.
+    """
+    try:
+        # pylint: disable=no-member
+        db.session.commit()
+    except Exception:
+        # pylint: disable=no-member
+        db.session.rollback()
+        discard_pending()
+        raise
+
+    dispatch_pending()
+
+
+def remove_forgot_password_codes(now: datetime, limit: int) -> int:
+    """
+    Delete a batch of expired forgot password codes.  Forgot password codes don't have an archive table, since an
+    expired code is never useful.
+    :param now: The current time.
+    :param limit: The maximum number of codes to delete.
+    :return: The number of codes deleted.
+    """
+    keys = expired_keys("forgotpassword", "forgot_code", "expires", now, limit)
+
+    if not keys:
+        return 0
+
+    # pylint: disable=no-member
+    result = db.session.execute(
+        text(
+            "DELETE FROM forgotpassword WHERE forgot_code IN :keys AND expires < :now"
+        ).bindparams(bindparam("keys", expanding=True)),
+        {"now": now, "keys": keys},
+    )
+    commit()
+    return result.rowcount
+
+
+def remove_activation_codes(now: datetime, limit: int, archive: bool) -> int:
+    """
+    Delete or archive a batch of expired activation codes.
+    :param now: The current time.
+    :param limit: The maximum number of codes to remove.
+    :param archive: Whether to move the codes to the archive table instead of deleting them.
+    :return: The number of codes removed.
+    """
+    keys = expired_keys("codes", "activation_code", "expiration_date", now, limit)
+
+    if not keys:
+        return 0
+
+    if archive:
+        removed = move_rows(
+            get_archived_table("codes"), keys, to_archive=True, archived_date=now
+        )
+    else:
+        result = db.session.execute(  # pylint: disable=no-member
+            text(
+                "DELETE FROM codes WHERE activation_code IN :keys AND expiration_date < :now"
+            ).bindparams(bindparam("keys", expanding=True)),
+            {"now": now, "keys": keys},
+        )
+        removed = result.rowcount
+
+    commit()
+    return removed
+
+
+def remove_notifications(cutoff: datetime, limit: int, archive: bool) -> int:
+    """
+    Delete or archive a batch of notifications sent before a cutoff time.  The unread notification counts of their
+    users are lowered in the same transaction.
+    :param cutoff: Notifications sent before this time are removed.
+    :param limit: The maximum number of notifications to remove.
+    :param archive: Whether to move the notifications to the archive table instead of deleting them.
+    :return: The number of notifications removed.
+    """
+    keys = expired_keys("notifications", "notification_id", "time", cutoff, limit)
+
+    if not keys:
+        return 0
+
+    # Lock the notifications by their primary keys, so they can't be marked as viewed before they are removed.
+    # pylint: disable=no-member
+    rows = db.session.execute(
+        text("""
+            SELECT notification_id, username, viewed, deleted FROM notifications
+            WHERE notification_id IN :keys
+            FOR UPDATE
+            """).bindparams(bindparam("keys", expanding=True)),
+        {"keys": keys},
+    ).fetchall()
+
+    unread = Counter(
+        row.username for row in rows if row.viewed == "N" and not row.deleted
+    )
+
+    if archive:
+        removed = move_rows(
+            get_archived_table("notifications"),
+            keys,
+            to_archive=True,
+            archived_date=datetime.now(),
+        )
+    else:
+        result = db.session.execute(
+            text("DELETE FROM notifications WHERE notification_id IN :keys").bindparams(
+                bindparam("keys", expanding=True)
+            ),
+            {"keys": keys},
+        )
+        removed = result.rowcount
+
+    for username, count in unread.items():
+        db.session.execute(
+            """
+            UPDATE notificationcounts
+            SET unread=GREATEST(CAST(unread AS SIGNED) - :count, 0)
+            WHERE username=:username
+            """,
+            {"username": username, "count": count},
+        )
+
+    for username in {row.username for row in rows}:
+        publish(NotificationsChanged(username=username))
+
+    commit()
+    return removed
+
+
+def run(  # pylint: disable=too-many-arguments
+    batch_size: int = 500,
+    pause: float = 0.5,
+    max_rows: Optional[int] = None,
+    notification_days: int = 365,
+    archive: bool = False,
+    tasks: Optional[Sequence[str]] = None,
+    now: Optional[datetime] = None,
+) -> Dict[str, int]:
+    """
+    Remove expired rows from each table in batches.
+    :param batch_size: The maximum number of rows removed in each transaction.
+    :param pause: Seconds to wait between batches.
+    :param max_rows: The maximum number of rows removed from each table, or None to remove every expired row.  Rows
+    left behind are removed the next time the job runs.
+    :param notification_days: Notifications older than this number of days are removed.
+    :param archive: Whether to move activation codes and notifications to their archive tables instead of deleting
+    them.
+    :param tasks: Names of the tables to remove rows from.  Defaults to every table in MAINTENANCE_TASKS.
+    :param now: The current time.
+    :return: The number of rows removed from each table.
+    """
+    now = now or datetime.now()
+    removers: Dict[str, Callable[[int], int]] = {
+        "forgotpassword": lambda limit: remove_forgot_password_codes(now, limit),
+        "codes": lambda limit: remove_activation_codes(now, limit, archive),
+        "notifications": lambda limit: remove_notifications(
+            now - timedelta(days=notification_days), limit, archive
+        ),
+    }
+
+    counts: Dict[str, int] = {}
+
+    for task in MAINTENANCE_TASKS:
+        if tasks and task not in tasks:
+            continue
+
+        counts[task] = 0
+
+        while max_rows is None or counts[task] < max_rows:
+            limit = (
+                batch_size
+                if max_rows is None
+                else min(batch_size, max_rows - counts[task])
+            )
+            removed = removers[task](limit)
+            counts[task] += removed
+
+            if removed < limit:
+                break
+
+            if pause > 0:
+                time.sleep(pause)
+
+    return counts
+
+
+def report(counts: Dict[str, int], elapsed: float, archive: bool) -> List[str]:
+    """
+    Describe the rows removed by a maintenance run.
+    :param counts: The number of rows removed from each table, as returned by run().
+    :param elapsed: The length of the run in seconds.
+    :param archive: Whether rows were archived instead of deleted.
+    :return: Lines of text for the report.
+    """
+    lines = []
+
+    for task, count in counts.items():
+        action = "archived" if archive and task != "forgotpassword" else "deleted"
+        lines.append(f"{task}: {count} rows {action}")
+
+    lines.append(f"Removed {sum(counts.values())} rows in {elapsed:.1f}s")
+    return lines
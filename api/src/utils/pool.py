@@ -0,0 +1,184 @@
+"""
+Database connection pool with instrumentation.  Metrics are kept for each process, since every uWSGI worker has its own
+connection pool.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+import os
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+class PoolMetrics:
+    def __init__(self):
+        """
+        Create counters for connection pool activity.
+        """
+        self.lock = threading.Lock()
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.overflow_checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.started = time.time()
+
+    def record_wait(self, seconds: float, timed_out: bool) -> None:
+        """
+        Record the time spent waiting for a connection from the pool.
+        :param seconds: Time spent waiting in seconds.
+        :param timed_out: Whether the pool ran out of connections before one was returned.
+        """
+        with self.lock:
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def increment(self, counter: str) -> None:
+        """
+        Increment one of the counters.
+        :param counter: The name of the counter.
+        """
+        with self.lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def to_dict(self) -> dict:
+        """
+        Get the current values of the counters.
+        :return: A dictionary of counter values.
+        """
+        with self.lock:
+            return {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "overflow_checkouts": self.overflow_checkouts,
+                "timeouts": self.timeouts,
+                "wait_ms_total": round(self.wait_seconds_total * 1000, 3),
+                "wait_ms_max": round(self.wait_seconds_max * 1000, 3),
+                "wait_ms_avg": (
+                    round(self.wait_seconds_total * 1000 / self.checkouts, 3)
+                    if self.checkouts
+                    else 0.0
+                ),
+                "uptime_seconds": round(time.time() - self.started),
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    def __init__(
+        self,
+        *args,
+        max_overflow: int = 10,
+        recycle: int = -1,
+        pre_ping: bool = False,
+        **kwargs,
+    ):
+        """
+        Create a QueuePool which measures how long callers wait for a connection.  The overflow, recycle, and pre-ping
+        settings are kept so they can be reported, since QueuePool doesn't expose them.
+        """
+        super().__init__(
+            *args,
+            max_overflow=max_overflow,
+            recycle=recycle,
+            pre_ping=pre_ping,
+            **kwargs,
+        )
+        self.metrics = PoolMetrics()
+        self.settings = {
+            "max_overflow": max_overflow,
+            "recycle": recycle,
+            "pre_ping": pre_ping,
+        }
+
+    def _do_get(self):
+        """
+        Get a connection from the pool, recording the time spent waiting for it.
+        :return: A connection record.
+        """
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self.metrics.record_wait(time.perf_counter() - start, timed_out)
+
+    def recreate(self):
+        """
+        Create a new pool with the same configuration, which happens when the engine is disposed.  The metrics carry
+        over to the new pool.
+        :return: A new connection pool.
+        """
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def instrument(engine: Engine) -> None:
+    """
+    Listen to connection pool events on an engine.  The engine must use an InstrumentedQueuePool.
+    :param engine: The SQLAlchemy engine for the database.
+    """
+
+    def on_checkout(*_args) -> None:
+        pool = engine.pool
+        pool.metrics.increment("checkouts")
+        if pool.checkedout() > pool.size():
+            pool.metrics.increment("overflow_checkouts")
+
+    event.listen(engine, "checkout", on_checkout)
+    event.listen(
+        engine, "checkin", lambda *_args: engine.pool.metrics.increment("checkins")
+    )
+    event.listen(
+        engine, "connect", lambda *_args: engine.pool.metrics.increment("connects")
+    )
+    event.listen(
+        engine,
+        "invalidate",
+        lambda *_args: engine.pool.metrics.increment("invalidations"),
+    )
+
+
+def pool_status(engine: Engine) -> dict:
+    """
+    Get the configuration, state, and metrics of an engine's connection pool.
+    :param engine: The SQLAlchemy engine for the database.
+    :return: A dictionary describing the connection pool.
+    """
+    pool = engine.pool
+    status = {
+        "pid": os.getpid(),
+        "pool_class": type(pool).__name__,
+    }
+
+    if isinstance(pool, QueuePool):
+        status.update(
+            {
+                "size": pool.size(),
+                "timeout": pool.timeout(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+            }
+        )
+
+    if isinstance(pool, InstrumentedQueuePool):
+        status.update(pool.settings)
+        status["metrics"] = pool.metrics.to_dict()
+
+    return status
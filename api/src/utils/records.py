@@ -0,0 +1,55 @@
+"""
+Standard distances which personal records are kept for.  A log counts towards a distance if its length is within a
+small tolerance of the distance, since GPS watches rarely measure races exactly.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+from typing import List, Optional, Tuple
+
+from utils.logs import MILES_PER_KILOMETER
+
+# The category of the longest exercise, which is ranked by distance instead of time.
+LONGEST = "longest"
+
+# Standard distances in miles, ranked by the fastest time.
+RECORD_DISTANCES = {
+    "mile": 1.0,
+    "5k": 5 * MILES_PER_KILOMETER,
+    "10k": 10 * MILES_PER_KILOMETER,
+    "half": 21.0975 * MILES_PER_KILOMETER,
+    "full": 42.195 * MILES_PER_KILOMETER,
+}
+
+RECORD_CATEGORIES = list(RECORD_DISTANCES.keys()) + [LONGEST]
+
+# The fraction of a distance that a log's length can differ by and still count towards the distance.
+RECORD_TOLERANCE = 0.03
+
+
+def record_buckets() -> List[Tuple[str, float, Optional[float]]]:
+    """
+    Get the range of lengths which count towards each personal record.
+    :return: A list of (category, lowest miles, highest miles) tuples.  The longest exercise has no upper bound.
+    """
+    buckets = [
+        (
+            category,
+            round(miles * (1 - RECORD_TOLERANCE), 4),
+            round(miles * (1 + RECORD_TOLERANCE), 4),
+        )
+        for category, miles in RECORD_DISTANCES.items()
+    ]
+    buckets.append((LONGEST, 0.0, None))
+    return buckets
+
+
+def record_buckets_sql() -> str:
+    """
+    Create a derived table with the range of lengths for each personal record, to join with the logs table.
+    :return: A SELECT statement with category, low, and high columns.
+    """
+    return " UNION ALL ".join(
+        f"SELECT '{category}' AS category, {low} AS low, {'NULL' if high is None else high} AS high"
+        for category, low, high in record_buckets()
+    )
@@ -0,0 +1,169 @@
+"""
+Route read-only database queries to MySQL read replicas.  Queries go to the primary database unless they are made by a
+DAO function marked with @read_only, no writes have happened earlier in the request, and a replica is keeping up with
+the primary.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+import functools
+import random
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from flask import current_app, g, has_app_context
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+
+REPLICA_BIND_PREFIX = "replica_"
+
+# Default seconds a replica may fall behind the primary before reads are routed to the primary instead.
+DEFAULT_MAX_LAG = 5
+
+# Default seconds between checks of a replica's lag.
+DEFAULT_LAG_CHECK_INTERVAL = 10
+
+lag_cache: Dict[str, Tuple[float, Optional[float]]] = {}
+lag_cache_lock = threading.Lock()
+
+
+def read_only(f):
+    """
+    Decorator for DAO functions which only read from the database.  Their queries may be routed to a read replica.
+    :param f: A DAO function.
+    :return: The decorated function.
+    """
+
+    @functools.wraps(f)
+    def decorated_function(*args, **kwargs):
+        if not has_app_context():
+            return f(*args, **kwargs)
+
+        previous = g.get("db_read_only", False)
+        g.db_read_only = True
+        try:
+            return f(*args, **kwargs)
+        finally:
+            g.db_read_only = previous
+
+    return decorated_function
+
+
+def mark_write() -> None:
+    """
+    Record that the current request wrote to the database.  Later reads in the request go to the primary database so
+    that they see the write.
+    """
+    if has_app_context():
+        g.db_wrote = True
+
+
+def replica_lag(engine: Engine) -> Optional[float]:
+    """
+    Query how many seconds a replica is behind the primary database.
+    :param engine: The SQLAlchemy engine for a replica.
+    :return: The replication lag in seconds, 0 if the database isn't replicating, or None if the lag is unknown
+    because replication stopped or the replica is unreachable.
+    """
+    try:
+        with engine.connect() as connection:
+            status = connection.execute(text("SHOW SLAVE STATUS")).mappings().first()
+    except Exception as error:  # pylint: disable=broad-except
+        current_app.logger.warning(f"Unable to check replica lag: {error}")
+        return None
+
+    if status is None:
+        return 0.0
+
+    lag = status.get("Seconds_Behind_Master")
+    return float(lag) if lag is not None else None
+
+
+def cached_replica_lag(engine: Engine, interval: float) -> Optional[float]:
+    """
+    Get the lag of a replica, checking it at most once per interval in each process.
+    :param engine: The SQLAlchemy engine for a replica.
+    :param interval: Seconds between checks of the replica's lag.
+    :return: The replication lag in seconds, or None if the lag is unknown.
+    """
+    key = str(engine.url)
+    now = time.monotonic()
+
+    with lag_cache_lock:
+        cached = lag_cache.get(key)
+        if cached is not None and now - cached[0] < interval:
+            return cached[1]
+
+        # Record the check time before querying, so concurrent threads don't check the same replica at once.
+        lag_cache[key] = (now, cached[1] if cached else None)
+
+    lag = replica_lag(engine)
+
+    with lag_cache_lock:
+        lag_cache[key] = (now, lag)
+
+    return lag
+
+
+def healthy_replicas(engines: Dict[Optional[str], Engine]) -> List[Engine]:
+    """
+    Find the replicas which are close enough to the primary database to serve reads.
+    :param engines: Engines for every database bind, keyed by bind key.
+    :return: Engines of the healthy replicas.
+    """
+    max_lag = current_app.config.get("DB_REPLICA_MAX_LAG", DEFAULT_MAX_LAG)
+    interval = current_app.config.get(
+        "DB_REPLICA_LAG_CHECK_INTERVAL", DEFAULT_LAG_CHECK_INTERVAL
+    )
+
+    healthy = []
+    for key, engine in engines.items():
+        if key is None or not key.startswith(REPLICA_BIND_PREFIX):
+            continue
+
+        lag = cached_replica_lag(engine, interval)
+        if lag is not None and lag <= max_lag:
+            healthy.append(engine)
+
+    return healthy
+
+
+class RoutingSession(Session):
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        """
+        Select the database engine for a query.  Reads from @read_only DAO functions use a healthy replica, chosen
+        once per request so that reads within a request don't go back in time.
+        """
+        if bind is None and self.use_replica():
+            replica = g.get("db_replica")
+            if replica is None:
+                replicas = healthy_replicas(self._db.engines)
+                replica = random.choice(replicas) if replicas else False
+                g.db_replica = replica
+
+            if replica:
+                return replica
+
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def use_replica(self) -> bool:
+        """
+        Determine whether the current query may be routed to a replica.
+        :return: True if the query may read from a replica.
+        """
+        return (
+            has_app_context()
+            and g.get("db_read_only", False)
+            and not g.get("db_wrote", False)
+            and not (self.new or self.dirty or self.deleted)
+        )
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def after_flush(_session, _flush_context) -> None:
+    """
+    Record a write when pending ORM changes are sent to the database.
+    """
+    mark_write()
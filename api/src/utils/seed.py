@@ -0,0 +1,542 @@
+"""
+Generate synthetic data for the SaintsXCTF database.  The generated data mimics the distributions found in production
+(a small number of very active users, seasonal mileage, users on multiple teams) so that queries can be tested
+against realistic table sizes.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+import math
+import random
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Iterator, List
+
+from flask import current_app
+from sqlalchemy import Table
+
+from database import db
+from flaskBcrypt import flask_bcrypt
+from utils.streaks import recompute
+
+SEED_PREFIX = "seed"
+SEED_PASSWORD = "seedpassword"
+SEED_APP = "saints-xctf-seed"
+
+# Share of logs for each exercise type.  Types in the 'other' bucket are chosen uniformly.
+TYPE_WEIGHTS = {"run": 0.7, "bike": 0.1, "swim": 0.05, "other": 0.15}
+OTHER_TYPES = ["core", "strength", "weights", "yoga", "walk", "hike", "row"]
+
+# Day of the year (late September) when cross country mileage peaks.
+PEAK_DAY_OF_YEAR = 265
+
+
+def seed_username(index: int) -> str:
+    """
+    Create the username of a seeded user.
+    :param index: Position of the user in the generated data set.
+    :return: A username which fits in the 20 character username column.
+    """
+    return f"{SEED_PREFIX}user{index:06d}"
+
+
+def seed_team_name(index: int) -> str:
+    """
+    Create the name of a seeded team.
+    :param index: Position of the team in the generated data set.
+    :return: A unique team name.
+    """
+    return f"{SEED_PREFIX}team{index:04d}"
+
+
+def seed_group_name(team_index: int, group_index: int) -> str:
+    """
+    Create the name of a seeded group.
+    :param team_index: Position of the team that the group belongs to.
+    :param group_index: Position of the group within the team.
+    :return: A group name which fits in the 20 character group name column.
+    """
+    return f"{SEED_PREFIX}grp{team_index:04d}g{group_index:02d}"
+
+
+def power_law_counts(
+    total: int, buckets: int, rng: random.Random, alpha: float = 1.16
+) -> List[int]:
+    """
+    Split a total count into buckets following a power law distribution.  With the default alpha, roughly 20% of the
+    buckets receive 80% of the total.
+    :param total: The number of items to distribute.
+    :param buckets: The number of buckets to distribute the items across.
+    :param rng: Random number generator used to draw the distribution.
+    :param alpha: Shape parameter of the Pareto distribution.
+    :return: A list of counts with one entry per bucket which adds up to the total.
+    """
+    if buckets <= 0:
+        return []
+
+    weights = [rng.paretovariate(alpha) for _ in range(buckets)]
+    weight_sum = sum(weights)
+    counts = [int(total * weight / weight_sum) for weight in weights]
+
+    # Distribute the items lost to rounding, starting with the heaviest buckets.
+    remainder = total - sum(counts)
+    by_weight = sorted(range(buckets), key=lambda i: weights[i], reverse=True)
+    for i in range(remainder):
+        counts[by_weight[i % buckets]] += 1
+
+    return counts
+
+
+def seasonal_factor(day: date) -> float:
+    """
+    Multiplier applied to a user's typical mileage based on the time of year.  Mileage is highest during the fall
+    cross country season and lowest in the middle of winter.
+    :param day: The date of an exercise log.
+    :return: A multiplier between 0.65 and 1.35.
+    """
+    angle = 2 * math.pi * (day.timetuple().tm_yday - PEAK_DAY_OF_YEAR) / 365.25
+    return 1 + 0.35 * math.cos(angle)
+
+
+def random_log_date(start: date, days: int, rng: random.Random) -> date:
+    """
+    Pick a date for an exercise log.  Dates are chosen with rejection sampling so that busy parts of the season
+    contain more logs.
+    :param start: The earliest date a log can fall on.
+    :param days: The number of days in the date range.
+    :param rng: Random number generator.
+    :return: A date within the range.
+    """
+    while True:
+        candidate = start + timedelta(days=rng.randrange(days))
+        if rng.random() * 1.35 <= seasonal_factor(candidate):
+            return candidate
+
+
+def random_exercise_type(rng: random.Random) -> str:
+    """
+    Pick an exercise type based on how often each type is logged.
+    :param rng: Random number generator.
+    :return: The name of an exercise type.
+    """
+    exercise_type = rng.choices(
+        list(TYPE_WEIGHTS.keys()), weights=list(TYPE_WEIGHTS.values())
+    )[0]
+
+    if exercise_type == "other":
+        return rng.choice(OTHER_TYPES)
+
+    return exercise_type
+
+
+def format_seconds(seconds: int) -> str:
+    """
+    Format a number of seconds as a MySQL TIME string.
+    :param seconds: A duration in seconds.
+    :return: A string in the format HH:MM:SS.
+    """
+    return f"{seconds // 3600:02d}:{(seconds // 60) % 60:02d}:{seconds % 60:02d}"
+
+
+def chunked(rows: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    """
+    Split a stream of rows into lists of a fixed size.
+    :param rows: Rows to insert into the database.
+    :param size: The maximum number of rows in each chunk.
+    :return: A generator of row lists.
+    """
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def bulk_insert(table: Table, rows: Iterable[dict], batch_size: int) -> int:
+    """
+    Insert rows into a table in batches.  Each batch is sent as a single executemany() call, which PyMySQL rewrites
+    into a multi-row INSERT statement.
+    :param table: The table to insert rows into.
+    :param rows: Dictionaries mapping column names to values.
+    :param batch_size: The number of rows to insert per statement.
+    :return: The number of rows inserted.
+    """
+    count = 0
+    for chunk in chunked(rows, batch_size):
+        # pylint: disable=no-member
+        db.session.execute(table.insert(), chunk)
+        db.session.commit()
+        count += len(chunk)
+
+    current_app.logger.info(f"Seeded {count} rows into {table.name}")
+    return count
+
+
+def audit_columns(now: datetime) -> dict:
+    """
+    Audit column values shared by every seeded row.
+    :param now: The time that the data was generated.
+    :return: A dictionary of audit column values.
+    """
+    return {
+        "deleted": False,
+        "created_date": now,
+        "created_user": None,
+        "created_app": SEED_APP,
+    }
+
+
+def seed_reference_data() -> None:
+    """
+    Make sure the lookup tables referenced by foreign keys contain the values used by the seeded data.
+    """
+    statements = [
+        (
+            "INSERT IGNORE INTO weekstart(week_start) VALUES (:value)",
+            ["monday", "sunday"],
+        ),
+        ("INSERT IGNORE INTO status(status) VALUES (:value)", ["accepted", "pending"]),
+        ("INSERT IGNORE INTO admins(user) VALUES (:value)", ["admin", "user"]),
+        (
+            "INSERT IGNORE INTO metrics(metric) VALUES (:value)",
+            ["miles", "kilometers", "meters"],
+        ),
+        (
+            "INSERT IGNORE INTO types(type) VALUES (:value)",
+            ["run", "bike", "swim", "other", *OTHER_TYPES],
+        ),
+    ]
+
+    # pylint: disable=no-member
+    for statement, values in statements:
+        db.session.execute(statement, [{"value": value} for value in values])
+
+    db.session.commit()
+
+
+def clear_seed_data() -> None:
+    """
+    Remove all the rows created by a previous seed run.  Seeded rows are found by their created_app column rather
+    than their names, so real accounts are never removed.  Rows are removed child tables first to satisfy foreign keys.
+    """
+    seed_users = "SELECT username FROM users WHERE created_app = :app"
+    statements = [
+        f"DELETE FROM comments WHERE username IN ({seed_users})",
+        f"DELETE FROM comments WHERE log_id IN (SELECT log_id FROM logs WHERE username IN ({seed_users}))",
+        f"DELETE FROM personalrecords WHERE username IN ({seed_users})",
+        f"DELETE FROM logs WHERE username IN ({seed_users})",
+        f"DELETE FROM streaks WHERE username IN ({seed_users})",
+        f"DELETE FROM notifications WHERE username IN ({seed_users})",
+        f"DELETE FROM notificationcounts WHERE username IN ({seed_users})",
+        f"DELETE FROM groupmembers WHERE username IN ({seed_users})",
+        f"DELETE FROM teammembers WHERE username IN ({seed_users})",
+        "DELETE FROM teamgroups WHERE created_app = :app",
+        "DELETE FROM `groups` WHERE created_app = :app",
+        "DELETE FROM teams WHERE created_app = :app",
+        "DELETE FROM users WHERE created_app = :app",
+    ]
+
+    # pylint: disable=no-member
+    for statement in statements:
+        db.session.execute(statement, {"app": SEED_APP})
+
+    db.session.commit()
+
+
+def generate(  # pylint: disable=too-many-arguments
+    users: int = 1000,
+    teams: int = 10,
+    groups_per_team: int = 4,
+    logs: int = 200000,
+    comments: int = 50000,
+    notifications: int = 20000,
+    days: int = 1095,
+    multi_team_rate: float = 0.25,
+    batch_size: int = 5000,
+    random_seed: int = 26,
+) -> Dict[str, int]:
+    """
+    Generate a synthetic data set and bulk insert it into the database.
+    :param users: The number of users to create.
+    :param teams: The number of teams to create.
+    :param groups_per_team: The number of groups in each team.
+    :param logs: The total number of exercise logs to create, distributed across users with a power law.
+    :param comments: The total number of comments to create, distributed across logs with a power law.
+    :param notifications: The total number of notifications to create.
+    :param days: The number of days before today that exercise logs span.
+    :param multi_team_rate: The fraction of users who are members of more than one team.
+    :param batch_size: The number of rows inserted per statement.
+    :param random_seed: Seed for the random number generator, making runs repeatable.
+    :return: The number of rows created in each table.
+    """
+    # pylint: disable=import-outside-toplevel
+    from dao.personalRecordDao import compete_for_records_sql
+    from model.Comment import Comment
+    from model.Group import Group
+    from model.GroupMember import GroupMember
+    from model.Log import Log
+    from model.Notification import Notification
+    from model.Team import Team
+    from model.TeamGroup import TeamGroup
+    from model.TeamMember import TeamMember
+    from model.User import User
+
+    rng = random.Random(random_seed)
+    now = datetime.now()
+    today = now.date()
+    start = today - timedelta(days=days)
+    counts = {}
+
+    seed_reference_data()
+
+    # Hashing is intentionally slow, so every seeded user shares the same password hash.
+    password = flask_bcrypt.generate_password_hash(SEED_PASSWORD).decode("utf-8")
+
+    user_rows = []
+    for i in range(users):
+        username = seed_username(i)
+        user_rows.append(
+            {
+                "username": username,
+                "first": f"Seed{i}",
+                "last": "Athlete",
+                "salt": None,
+                "password": password,
+                "description": None,
+                "member_since": start + timedelta(days=rng.randrange(max(days, 1))),
+                "class_year": rng.randint(2000, today.year + 4),
+                "location": None,
+                "favorite_event": rng.choice(["5K", "8K", "10K", "Mile", "Steeple"]),
+                "activation_code": "SEED",
+                "email": f"{username}@seed.saintsxctf.com",
+                "last_signin": now,
+                "week_start": rng.choice(["monday", "sunday"]),
+                "subscribed": None,
+                **audit_columns(now),
+            }
+        )
+
+    counts["users"] = bulk_insert(User.__table__, user_rows, batch_size)
+
+    team_rows = []
+    group_rows = []
+    for t in range(teams):
+        team_rows.append(
+            {
+                "name": seed_team_name(t),
+                "title": f"Seed Team {t}",
+                "picture_name": None,
+                "description": None,
+                "week_start": "monday",
+                **audit_columns(now),
+            }
+        )
+        for g in range(groups_per_team):
+            group_rows.append(
+                {
+                    "group_name": seed_group_name(t, g),
+                    "group_title": f"Seed Team {t} Group {g}",
+                    "description": None,
+                    "week_start": rng.choice(["monday", "sunday"]),
+                    **audit_columns(now),
+                }
+            )
+
+    counts["teams"] = bulk_insert(Team.__table__, team_rows, batch_size)
+    counts["groups"] = bulk_insert(Group.__table__, group_rows, batch_size)
+
+    # pylint: disable=no-member
+    group_ids = {
+        row.group_name: row.id
+        for row in db.session.execute(
+            "SELECT id, group_name FROM `groups` WHERE created_app = :app",
+            {"app": SEED_APP},
+        )
+    }
+
+    team_group_rows = [
+        {
+            "team_name": seed_team_name(t),
+            "group_id": group_ids[seed_group_name(t, g)],
+            "group_name": seed_group_name(t, g),
+            **audit_columns(now),
+        }
+        for t in range(teams)
+        for g in range(groups_per_team)
+    ]
+    counts["teamgroups"] = bulk_insert(TeamGroup.__table__, team_group_rows, batch_size)
+
+    # Every user joins a home team, and some users also join one or two additional teams.
+    team_member_rows = []
+    group_member_rows = []
+    user_teams: Dict[str, List[int]] = {}
+    for i in range(users):
+        username = seed_username(i)
+        memberships = [rng.randrange(teams)] if teams else []
+        if teams > 1 and rng.random() < multi_team_rate:
+            extra = rng.sample(range(teams), k=min(teams, rng.randint(2, 3)))
+            memberships = list(dict.fromkeys(memberships + extra))
+
+        user_teams[username] = memberships
+
+        for t in memberships:
+            team_member_rows.append(
+                {
+                    "team_name": seed_team_name(t),
+                    "username": username,
+                    "status": "accepted" if rng.random() < 0.95 else "pending",
+                    "user": "admin" if rng.random() < 0.02 else "user",
+                    **audit_columns(now),
+                }
+            )
+            group_count = (
+                rng.randint(1, min(3, groups_per_team)) if groups_per_team else 0
+            )
+            for g in rng.sample(range(groups_per_team), k=group_count):
+                group_member_rows.append(
+                    {
+                        "group_id": group_ids[seed_group_name(t, g)],
+                        "group_name": seed_group_name(t, g),
+                        "username": username,
+                        "status": "accepted" if rng.random() < 0.95 else "pending",
+                        "user": "admin" if rng.random() < 0.05 else "user",
+                        **audit_columns(now),
+                    }
+                )
+
+    counts["teammembers"] = bulk_insert(
+        TeamMember.__table__, team_member_rows, batch_size
+    )
+    counts["groupmembers"] = bulk_insert(
+        GroupMember.__table__, group_member_rows, batch_size
+    )
+
+    log_counts = power_law_counts(logs, users, rng)
+
+    def log_rows() -> Iterator[dict]:
+        for i, log_count in enumerate(log_counts):
+            username = seed_username(i)
+            # Typical daily mileage for the user, drawn from a log-normal distribution (median of 5 miles).
+            base_miles = rng.lognormvariate(math.log(5), 0.45)
+            # Typical pace for the user in seconds per mile.
+            base_pace = rng.gauss(480, 60)
+
+            for _ in range(log_count):
+                log_date = random_log_date(start, days, rng)
+                exercise_type = random_exercise_type(rng)
+                miles = round(
+                    max(
+                        0.5,
+                        base_miles * seasonal_factor(log_date) * rng.uniform(0.6, 1.5),
+                    ),
+                    2,
+                )
+                pace = max(240, int(rng.gauss(base_pace, 25)))
+                if exercise_type == "bike":
+                    miles, pace = round(miles * 3, 2), pace // 3
+
+                yield {
+                    "username": username,
+                    "first": f"Seed{i}",
+                    "last": "Athlete",
+                    "name": None,
+                    "location": None,
+                    "date": log_date,
+                    "type": exercise_type,
+                    "distance": miles,
+                    "metric": "miles",
+                    "miles": miles,
+                    "time": format_seconds(int(pace * miles)),
+                    "pace": format_seconds(pace),
+                    "feel": min(10, max(1, int(rng.gauss(6, 2)))),
+                    "description": None,
+                    "time_created": datetime.combine(log_date, datetime.min.time()),
+                    **audit_columns(now),
+                }
+
+    counts["logs"] = bulk_insert(Log.__table__, log_rows(), batch_size)
+
+    # pylint: disable=no-member
+    log_ids = [
+        row.log_id
+        for row in db.session.execute(
+            "SELECT log_id FROM logs WHERE created_app = :app ORDER BY log_id",
+            {"app": SEED_APP},
+        )
+    ]
+
+    def comment_rows() -> Iterator[dict]:
+        if not log_ids:
+            return
+
+        # A small number of logs (from the most popular athletes) receive most of the comments.
+        commented_logs = rng.sample(log_ids, k=min(len(log_ids), max(1, comments // 2)))
+        comment_counts = power_law_counts(comments, len(commented_logs), rng)
+
+        for log_id, comment_count in zip(commented_logs, comment_counts):
+            for _ in range(comment_count):
+                commenter = rng.randrange(users)
+                yield {
+                    "username": seed_username(commenter),
+                    "first": f"Seed{commenter}",
+                    "last": "Athlete",
+                    "log_id": log_id,
+                    "time": now - timedelta(minutes=rng.randrange(days * 24 * 60 or 1)),
+                    "content": "Nice work!",
+                    **audit_columns(now),
+                }
+
+    counts["comments"] = bulk_insert(Comment.__table__, comment_rows(), batch_size)
+
+    def notification_rows() -> Iterator[dict]:
+        for i, notification_count in enumerate(
+            power_law_counts(notifications, users, rng)
+        ):
+            for _ in range(notification_count):
+                yield {
+                    "username": seed_username(i),
+                    "time": now - timedelta(minutes=rng.randrange(60 * 24 * 60)),
+                    "link": f"https://www.saintsxctf.com/profile/{seed_username(rng.randrange(users))}",
+                    "viewed": "Y" if rng.random() < 0.7 else "N",
+                    "description": "A teammate commented on your exercise log.",
+                    **audit_columns(now),
+                }
+
+    counts["notifications"] = bulk_insert(
+        Notification.__table__, notification_rows(), batch_size
+    )
+
+    # The bulk inserts skip the DAOs, so the tables they keep up to date are filled the same way as the migrations
+    # which created them.
+    seed_users = "SELECT username FROM users WHERE created_app = :app"
+
+    # pylint: disable=no-member
+    db.session.execute(
+        f"""
+        INSERT INTO notificationcounts (username, unread)
+        SELECT users.username, COUNT(notifications.notification_id) FROM users
+        LEFT JOIN notifications
+        ON notifications.username = users.username
+        AND notifications.viewed = 'N'
+        AND notifications.deleted IS FALSE
+        WHERE users.username IN ({seed_users})
+        GROUP BY users.username
+        ON DUPLICATE KEY UPDATE unread = VALUES(unread)
+        """,
+        {"app": SEED_APP},
+    )
+    db.session.execute(
+        compete_for_records_sql(f"AND logs.username IN ({seed_users})"),
+        {"app": SEED_APP},
+    )
+    db.session.commit()
+
+    counts["notificationcounts"] = users
+    counts["streaks"] = recompute(
+        usernames=[seed_username(i) for i in range(users)], batch_size=batch_size
+    )
+
+    return counts
@@ -0,0 +1,164 @@
+"""
+Coalesce concurrent identical computations so that only one of them runs.  Within a worker, threads wait on the first
+computation.  Across workers, a lock in the shared cache backend elects one worker to compute while the others wait
+for the result to appear in the cache.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+import logging
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Tuple
+
+DEFAULT_LOCK_TIMEOUT = 30
+DEFAULT_WAIT_TIMEOUT = 10
+DEFAULT_POLL_INTERVAL = 0.05
+
+
+class Flight:
+    def __init__(self):
+        """
+        A computation in progress in this process.
+        """
+        self.done = threading.Event()
+        self.value = None
+        self.failed = False
+
+
+class SingleFlight:
+    def __init__(
+        self,
+        backend,
+        lock_timeout: int = DEFAULT_LOCK_TIMEOUT,
+        wait_timeout: float = DEFAULT_WAIT_TIMEOUT,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ):
+        """
+        Create a single-flight group.
+        :param backend: The cache backend holding locks shared between workers.
+        :param lock_timeout: Seconds until a worker's lock expires, in case the worker dies while computing.
+        :param wait_timeout: Seconds to wait for another computation before computing the value independently.
+        :param poll_interval: Seconds between checks for a value computed by another worker.
+        """
+        self.backend = backend
+        self.lock_timeout = lock_timeout
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self.flights: Dict[str, Flight] = {}
+        self.lock = threading.Lock()
+        self.coalesced = 0
+
+    def run(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        lookup: Callable[[], Tuple[bool, Any]],
+        shareable: Callable[[Any], bool] = lambda value: True,
+    ) -> Any:
+        """
+        Compute a value, unless an identical computation is in progress in which case its result is used.
+        :param key: Key identifying the computation.
+        :param compute: Function which computes the value and stores it in the cache.
+        :param lookup: Function which reads the value from the cache, returning whether it was found and the value.
+        :param shareable: Function which determines whether a value computed by another thread can be returned.
+        :return: The computed value.
+        """
+        with self.lock:
+            flight = self.flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = Flight()
+                self.flights[key] = flight
+
+        if not leader:
+            if (
+                flight.done.wait(self.wait_timeout)
+                and not flight.failed
+                and shareable(flight.value)
+            ):
+                self.record_coalesced()
+                return flight.value
+
+            return compute()
+
+        try:
+            flight.value = self.run_across_workers(key, compute, lookup)
+            return flight.value
+        except BaseException:
+            flight.failed = True
+            raise
+        finally:
+            with self.lock:
+                self.flights.pop(key, None)
+
+            flight.done.set()
+
+    def run_across_workers(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        lookup: Callable[[], Tuple[bool, Any]],
+    ) -> Any:
+        """
+        Compute a value while holding a lock in the cache backend, or wait for the worker holding the lock to cache
+        the value.  If the lock holder doesn't finish in time, the value is computed without the lock.
+        :param key: Key identifying the computation.
+        :param compute: Function which computes the value and stores it in the cache.
+        :param lookup: Function which reads the value from the cache, returning whether it was found and the value.
+        :return: The computed value.
+        """
+        lock_key = f"{key}:lock"
+        deadline = time.monotonic() + self.wait_timeout
+
+        while True:
+            try:
+                acquired = self.backend.add(
+                    lock_key, uuid.uuid4().hex.encode("utf-8"), self.lock_timeout
+                )
+            except Exception:  # pylint: disable=broad-except
+                logging.exception(f"Unable to lock {key} in the cache")
+                return compute()
+
+            if acquired:
+                try:
+                    return compute()
+                finally:
+                    self.release(lock_key)
+
+            while time.monotonic() < deadline:
+                time.sleep(self.poll_interval)
+
+                try:
+                    found, value = lookup()
+                    if found:
+                        self.record_coalesced()
+                        return value
+
+                    # The lock holder finished without caching a value, or its lock expired.
+                    if self.backend.get_many([lock_key])[0] is None:
+                        break
+                except Exception:  # pylint: disable=broad-except
+                    logging.exception(f"Unable to read {key} from the cache")
+                    return compute()
+            else:
+                logging.warning(f"Timed out waiting for {key}, computing it instead")
+                return compute()
+
+    def release(self, lock_key: str) -> None:
+        """
+        Release a lock held in the cache backend.
+        :param lock_key: Key of the lock.
+        """
+        try:
+            self.backend.delete(lock_key)
+        except Exception:  # pylint: disable=broad-except
+            logging.exception(f"Unable to release the lock {lock_key}")
+
+    def record_coalesced(self) -> None:
+        """
+        Count a caller which used the result of another computation.
+        """
+        with self.lock:
+            self.coalesced += 1
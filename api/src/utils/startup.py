@@ -0,0 +1,124 @@
+"""
+Profile the time it takes an API worker to start.  Imports are measured in a fresh interpreter, since modules
+imported by the current process are already cached.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List
+
+from utils.db import get_connection_url
+
+
+def parse_import_times(output: str) -> List[dict]:
+    """
+    Parse the output of 'python -X importtime'.
+    :param output: Lines written to stderr by the interpreter.
+    :return: The module name, nesting depth, self time, and cumulative time (in milliseconds) of each import.
+    """
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append(
+            {
+                "module": name.strip(),
+                "depth": depth,
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+            }
+        )
+
+    return imports
+
+
+def direct_imports(imports: List[dict], module: str) -> List[dict]:
+    """
+    Find the imports made directly by a top level module.  The interpreter lists nested imports before the module
+    that imported them.
+    :param imports: Imports returned by parse_import_times().
+    :param module: The name of a top level module.
+    :return: Imports one level below the module.
+    """
+    children = []
+    for entry in imports:
+        if entry["depth"] == 0:
+            if entry["module"] == module:
+                return children
+
+            children = []
+        elif entry["depth"] == 1:
+            children.append(entry)
+
+    return []
+
+
+def profile_imports(module: str = "app") -> dict:
+    """
+    Import a module in a new interpreter and record how long each import takes.
+    :param module: The module to import.
+    :return: The wall time of the interpreter and the time of each import.
+    """
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+        env=os.environ.copy(),
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    elapsed = time.perf_counter() - start
+
+    if process.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{process.stderr[-2000:]}")
+
+    return {"wall_ms": elapsed * 1000, "imports": parse_import_times(process.stderr)}
+
+
+def profile_connection_url() -> dict:
+    """
+    Time the resolution of the database connection URL with and without the shared cache.
+    :return: Milliseconds taken to resolve the connection URL in each case.
+    """
+    start = time.perf_counter()
+    get_connection_url(use_cache=False)
+    uncached = time.perf_counter() - start
+
+    start = time.perf_counter()
+    get_connection_url()
+    cached = time.perf_counter() - start
+
+    return {"uncached_ms": uncached * 1000, "cached_ms": cached * 1000}
+
+
+def profile(runs: int = 3, top: int = 15) -> dict:
+    """
+    Profile the startup of the API.
+    :param runs: The number of times to start a new interpreter.  The median wall time is reported.
+    :param top: The number of slowest imports to report.
+    :return: Startup timings.
+    """
+    results = [profile_imports() for _ in range(runs)]
+    imports = results[-1]["imports"]
+
+    return {
+        "wall_ms": statistics.median(result["wall_ms"] for result in results),
+        "top_level_imports": sorted(
+            direct_imports(imports, "app"),
+            key=lambda entry: entry["cumulative_ms"],
+            reverse=True,
+        )[:top],
+        "slowest_modules": sorted(
+            imports, key=lambda entry: entry["self_ms"], reverse=True
+        )[:top],
+        "connection_url": profile_connection_url(),
+    }
@@ -0,0 +1,206 @@
+"""
+Training streaks and weekly consistency.  A streak is a run of consecutive days with at least one exercise log, and a
+consistent week is a week (starting on the user's week_start day) with at least WEEKLY_MILES_THRESHOLD miles.  Streaks
+are stored for each user and updated as logs are written.  The recompute job rebuilds them from the logs table, which
+repairs streaks that drifted and builds them after logs are bulk inserted (such as for seeded users).
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+import time
+from datetime import date, timedelta
+from typing import Iterable, Optional, Sequence, Set, Tuple
+
+from database import db
+
+# The number of miles exercised in a week for it to count as a consistent week.
+WEEKLY_MILES_THRESHOLD = 15.0
+
+
+def extend_streaks(
+    streak: int, longest: int, last_date: Optional[date], days: Iterable[date]
+) -> Tuple[int, int, Optional[date]]:
+    """
+    Walk through days with an exercise log, extending a user's latest streak when a day follows the last day of the
+    streak and starting a new streak otherwise.  Streaks are rebuilt by walking through every day from an empty streak.
+    :param streak: The length of the user's latest streak in days.
+    :param longest: The length of the user's longest streak in days.
+    :param last_date: The last day of the latest streak, or None if the user has no streaks.
+    :param days: Distinct days in ascending order, all after the last day of the latest streak.
+    :return: The length of the latest streak, the length of the longest streak, and the last day of the latest streak.
+    """
+    for day in days:
+        if last_date is not None and day == last_date + timedelta(days=1):
+            streak += 1
+        else:
+            streak = 1
+
+        last_date = day
+        longest = max(longest, streak)
+
+    return streak, longest, last_date
+
+
+def adjacent_runs(days: Set[date], day: date) -> Tuple[int, int]:
+    """
+    Count the consecutive days with an exercise log right before and right after a day.
+    :param days: Days with an exercise log around the day.
+    :param day: The day to count runs around.
+    :return: The number of consecutive days before the day and the number of consecutive days after the day.
+    """
+    before = 0
+    while day - timedelta(days=before + 1) in days:
+        before += 1
+
+    after = 0
+    while day + timedelta(days=after + 1) in days:
+        after += 1
+
+    return before, after
+
+
+def add_day(
+    streak: int, longest: int, last_date: Optional[date], day: date, days: Set[date]
+) -> Tuple[int, int, Optional[date]]:
+    """
+    Add a day with an exercise log to a user's streaks.  The day can join the streaks before and after it, so the days
+    around it must reach at least one day past the longest streak on either side.
+    :param streak: The length of the user's latest streak in days.
+    :param longest: The length of the user's longest streak in days.
+    :param last_date: The last day of the latest streak, or None if the user has no streaks.
+    :param day: A day which didn't have an exercise log before.
+    :param days: Days with an exercise log around the day, not including the day.
+    :return: The length of the latest streak, the length of the longest streak, and the last day of the latest streak.
+    """
+    before, after = adjacent_runs(days, day)
+    joined = before + 1 + after
+    longest = max(longest, joined)
+
+    if last_date is None or day > last_date:
+        return joined, longest, day
+
+    if day + timedelta(days=after) == last_date:
+        return joined, longest, last_date
+
+    return streak, longest, last_date
+
+
+def remove_day(
+    streak: int, longest: int, last_date: Optional[date], day: date, days: Set[date]
+) -> Optional[Tuple[int, int, Optional[date]]]:
+    """
+    Remove a day which no longer has an exercise log from a user's streaks.  The days around it must reach at least
+    one day past the longest streak on either side.  If the day was in a streak as long as the longest streak, or it
+    was the last day of the latest streak, the new streaks depend on days further away.
+    :param streak: The length of the user's latest streak in days.
+    :param longest: The length of the user's longest streak in days.
+    :param last_date: The last day of the latest streak.
+    :param day: A day which had an exercise log before.
+    :param days: Days with an exercise log around the day, not including the day.
+    :return: The length of the latest streak, the length of the longest streak, and the last day of the latest streak,
+    or None if the streaks must be rebuilt from every day.
+    """
+    before, after = adjacent_runs(days, day)
+
+    if before + 1 + after >= longest or day == last_date:
+        return None
+
+    if day + timedelta(days=after) == last_date:
+        return after, longest, last_date
+
+    return streak, longest, last_date
+
+
+def current_streak(streak: int, last_date: Optional[date], today: date) -> int:
+    """
+    Get the length of a user's current streak.  A streak stays current until a full day passes without a log, so a
+    user who hasn't exercised yet today doesn't lose their streak.
+    :param streak: The length of the user's latest streak in days.
+    :param last_date: The last day of the latest streak.
+    :param today: The current date.
+    :return: The length of the current streak in days, or zero if the latest streak ended.
+    """
+    if last_date is None or last_date < today - timedelta(days=1):
+        return 0
+
+    return streak
+
+
+def streak_summary(streak, today: Optional[date] = None) -> dict:
+    """
+    Describe a user's streaks for a response body.
+    :param streak: A row from the streaks table, or None if the user doesn't have streaks yet.
+    :param today: The current date.
+    :return: A dictionary with the current streak, longest streak, and consistent weeks.
+    """
+    today = today or date.today()
+
+    if streak is None:
+        return {
+            "current_streak": 0,
+            "longest_streak": 0,
+            "last_date": None,
+            "weeks_over_threshold": 0,
+            "weekly_miles_threshold": WEEKLY_MILES_THRESHOLD,
+        }
+
+    return {
+        "current_streak": current_streak(
+            streak.current_streak, streak.last_date, today
+        ),
+        "longest_streak": streak.longest_streak,
+        "last_date": None if streak.last_date is None else str(streak.last_date),
+        "weeks_over_threshold": streak.weeks_over,
+        "weekly_miles_threshold": WEEKLY_MILES_THRESHOLD,
+    }
+
+
+def recompute(
+    usernames: Optional[Sequence[str]] = None, batch_size: int = 100, pause: float = 0.0
+) -> int:
+    """
+    Rebuild the streaks of users from their exercise logs.  Users are rebuilt in batches, each in its own transaction.
+    :param usernames: Users to rebuild streaks for.  Defaults to every user.
+    :param batch_size: The number of users rebuilt in each transaction.
+    :param pause: Seconds to wait between batches.
+    :return: The number of users whose streaks were rebuilt.
+    """
+    # Imported here since the DAO depends on the ORM models, which can't be imported when the commands are loaded.
+    # pylint: disable=import-outside-toplevel
+    from dao.streakDao import StreakDao
+
+    count = 0
+    after = ""
+
+    while True:
+        if usernames:
+            batch = sorted(usernames)[count : count + batch_size]
+        else:
+            result = db.session.execute(  # pylint: disable=no-member
+                "SELECT username FROM users WHERE username > :after ORDER BY username LIMIT :limit",
+                {"after": after, "limit": batch_size},
+            )
+            batch = [row[0] for row in result]
+
+        if not batch:
+            return count
+
+        try:
+            for username in batch:
+                StreakDao.rebuild_streak(username)
+
+            # pylint: disable=no-member
+            db.session.commit()
+        except Exception:
+            # pylint: disable=no-member
+            db.session.rollback()
+            raise
+
+        count += len(batch)
+        after = batch[-1]
+
+        if len(batch) < batch_size:
+            return count
+
+        if pause > 0:
+            time.sleep(pause)
@@ -0,0 +1,96 @@
+"""
+Stand-in versions of the authentication and function services the API depends on.  They allow benchmarks and load
+tests to run against a local API instance without network access to the real services.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+import base64
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def make_token(username: str) -> str:
+    """
+    Create an unsigned JWT for a user.  The API only reads the claims of a JWT, leaving signature verification to the
+    authentication service, so an unsigned token is sufficient when the stand-in authentication service is used.
+    :param username: The username placed in the 'sub' claim.
+    :return: A JWT string.
+    """
+
+    def encode(part: dict) -> str:
+        return base64.b64encode(json.dumps(part).encode()).decode().rstrip("=")
+
+    header = encode({"alg": "none", "typ": "JWT"})
+    payload = encode({"sub": username, "iss": "saints-xctf-stub"})
+    return f"{header}.{payload}.stub"
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    def do_POST(self) -> None:
+        """
+        Handle a POST request.  Token requests receive a JWT for the requested client, and every other request
+        succeeds.
+        """
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+
+        if self.path == "/token":
+            result = make_token(body.get("clientId"))
+        else:
+            result = True
+
+        response = json.dumps({"result": result}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, *args) -> None:
+        """
+        Silence the per-request logging of the HTTP server.
+        """
+
+
+class StubService:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """
+        Create a stand-in service which listens on a local port.
+        :param host: The interface to bind to.
+        :param port: The port to listen on.  The default of 0 picks an open port.
+        """
+        self.server = ThreadingHTTPServer((host, port), StubRequestHandler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """
+        The base URL of the stand-in service.
+        :return: A URL such as 'http://127.0.0.1:51234'.
+        """
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubService":
+        """
+        Start serving requests on a background thread.
+        :return: The running service.
+        """
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop serving requests and release the port.
+        """
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> "StubService":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
@@ -0,0 +1,148 @@
+"""
+Open API (Swagger) documentation configuration.  The API specification is compiled ahead of time with the
+'flask swagger-build' command, so workers serve a static file instead of parsing every route's YAML documentation.
+Author: Andrew Jarombek
+Date: 10/19/2026
+"""
+
+import functools
+import hashlib
+import json
+import os
+
+from flask import Flask, Response, current_app, request
+from flasgger import Swagger
+
+SPEC_ENDPOINT = "apispec_1"
+
+# Location of the compiled specification, relative to the application root.
+SPEC_PATH = os.path.join("build", f"{SPEC_ENDPOINT}.json")
+
+# Seconds that clients and proxies may cache the specification.
+SPEC_MAX_AGE = 86400
+
+swagger_config = {
+    "headers": [],
+    "specs": [
+        {
+            "endpoint": SPEC_ENDPOINT,
+            "route": f"/{SPEC_ENDPOINT}.json",
+            "rule_filter": lambda rule: True,
+            "model_filter": lambda tag: True,
+        }
+    ],
+    "static_url_path": "/flasgger_static",
+    "swagger_ui": True,
+    "specs_route": "/swagger",
+}
+
+swagger_template = {
+    "swagger": "2.0",
+    "info": {
+        "title": "SaintsXCTF API",
+        "description": "Documentation for the second version of the SaintsXCTF API",
+        "contact": {
+            "responsibleDeveloper": "Andrew Jarombek",
+            "email": "andrew@jarombek.com",
+            "url": "https://jarombek.com",
+        },
+        "version": "2.0.0",
+    },
+    "host": "localhost:5000",
+    "basePath": "/",
+    "securityDefinitions": {
+        "bearerAuth": {"type": "apiKey", "name": "Authorization", "in": "header"}
+    },
+    "schemes": ["http", "https"],
+}
+
+
+def init_swagger(app: Flask) -> Swagger:
+    """
+    Add Swagger documentation routes to the application.
+    :param app: The Flask application.
+    :return: The flasgger extension object.
+    """
+    return Swagger(
+        app,
+        config=swagger_config,
+        template=swagger_template,
+        decorators=[serve_compiled_spec],
+    )
+
+
+def compile_spec(app: Flask) -> dict:
+    """
+    Build the API specification from the YAML documentation of every route.
+    :param app: The Flask application.
+    :return: The API specification.
+    """
+    swagger = getattr(app, "swag", None) or init_swagger(app)
+
+    with app.test_request_context():
+        return swagger.get_apispecs(SPEC_ENDPOINT)
+
+
+def write_spec(app: Flask, path: str = None) -> str:
+    """
+    Compile the API specification and write it to a file.
+    :param app: The Flask application.
+    :param path: The file to write.  Defaults to the file served by the application.
+    :return: The path of the written file.
+    """
+    path = path or os.path.join(app.root_path, SPEC_PATH)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(compile_spec(app), file, sort_keys=True)
+
+    return path
+
+
+def load_spec(live_view) -> dict:
+    """
+    Load the serialized API specification once per application.  The compiled file is used if it exists, otherwise
+    the specification is generated by flasgger.
+    :param live_view: The flasgger view which generates the specification.
+    :return: The serialized specification and its ETag.
+    """
+    cached = current_app.extensions.get("swagger_spec")
+    if cached is not None:
+        return cached
+
+    path = os.path.join(current_app.root_path, SPEC_PATH)
+    if os.path.exists(path):
+        with open(path, "rb") as file:
+            body = file.read()
+    else:
+        current_app.logger.warning(
+            f"No compiled API specification found at {path}.  Run 'flask swagger-build'."
+        )
+        body = live_view().get_data()
+
+    cached = {"body": body, "etag": hashlib.sha256(body).hexdigest()[:32]}
+    current_app.extensions["swagger_spec"] = cached
+    return cached
+
+
+def serve_compiled_spec(view):
+    """
+    Decorator for flasgger views.  The API specification view is replaced with one that serves the compiled
+    specification with an ETag and cache headers.  Other views are unchanged.
+    :param view: A flasgger view function.
+    :return: The view function to register.
+    """
+    if view.__name__ != SPEC_ENDPOINT:
+        return view
+
+    @functools.wraps(view)
+    def spec_view(*args, **kwargs) -> Response:
+        spec = load_spec(functools.partial(view, *args, **kwargs))
+
+        response = current_app.response_class(spec["body"], mimetype="application/json")
+        response.set_etag(spec["etag"])
+        response.cache_control.public = True
+        response.cache_control.max_age = SPEC_MAX_AGE
+        return response.make_conditional(request)
+
+    return spec_view